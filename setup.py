@@ -70,6 +70,14 @@ setup(
             "pytest",
             "scikit-image>=0.21.0",
             "numpy>=2.0.0",
+            "pypdf>=5.0.0",
+            "pyyaml>=6.0",
+        ],
+        "pdf": [
+            "pypdf>=5.0.0",
+        ],
+        "batch": [
+            "pyyaml>=6.0",
         ],
     },
     entry_points={
@@ -77,7 +85,7 @@ setup(
             "SigProfilerPlotting=sigProfilerPlotting.sigProfilerPlotting_CLI:main_function",
         ],
     },
-    package_data={"": ["fonts/*.ttf"]},
+    package_data={"": ["fonts/*.ttf", "calibration.json"]},
     include_package_data=True,
     zip_safe=False,
 )
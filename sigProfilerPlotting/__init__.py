@@ -1,2 +1,15 @@
 from .sigProfilerPlotting import *
+from .cancellation import CancellationToken
+from .streaming import (
+    iter_plotCNV,
+    iter_plotDBS,
+    iter_plotID,
+    iter_plotSBS,
+    iter_plotSV,
+    plotCNV_async,
+    plotDBS_async,
+    plotID_async,
+    plotSBS_async,
+    plotSV_async,
+)
 from .version import short_version as __version__
@@ -0,0 +1,167 @@
+import csv
+
+import numpy as np
+import pandas as pd
+
+from sigProfilerPlotting.errors import MatrixFormatError
+from sigProfilerPlotting.sparse import is_sparse_frame
+
+# Statistics of the samples of a group that aggregate=True and the aggregate
+# names draw. True draws the mean profile, as plotSV and plotCNV do.
+AGGREGATIONS = {"sum": np.nansum, "mean": np.nanmean, "median": np.nanmedian}
+
+# Number of channels (rows) of a matrix read and aggregated at a time
+CHUNK_ROWS = 16
+
+
+def check_aggregate(aggregate):
+    """Returns the statistic of an aggregate argument, or None to plot every sample."""
+    if aggregate is None or aggregate is False:
+        return None
+    if aggregate is True:
+        return "mean"
+    if aggregate in AGGREGATIONS:
+        return aggregate
+    raise ValueError(
+        "ERROR: aggregate must be True, False, 'sum', 'mean' or 'median', not "
+        + repr(aggregate)
+        + "."
+    )
+
+
+def parse_counts(fields):
+    """Returns the counts of a matrix row, with Nans for the empty fields."""
+    try:
+        return np.array(fields, dtype=float)
+    except ValueError:
+        return pd.to_numeric(pd.Series(fields), errors="coerce").to_numpy(float)
+
+
+def iter_file_chunks(matrix_path, samples=None):
+    """Yields the channels and counts of a matrix file CHUNK_ROWS rows at a time.
+
+    The header and rows are split and parsed with csv and numpy rather than
+    pd.read_csv, which is slow for rows of many thousands of samples.
+    """
+    from sigProfilerPlotting.sigProfilerPlotting import select_samples
+
+    with open(matrix_path, newline="") as f:
+        header = next(csv.reader([f.readline().rstrip("\r\n")], delimiter="\t"))[1:]
+        selected = set(select_samples(header, samples))
+        columns = [i for i, name in enumerate(header) if name in selected]
+        names = [header[i] for i in columns]
+        channels, rows = [], []
+        for line in f:
+            fields = line.rstrip("\r\n").split("\t")
+            channels.append(fields[0].replace('"', ""))
+            rows.append(parse_counts(fields[1:])[columns])
+            if len(rows) == CHUNK_ROWS:
+                yield names, channels, np.vstack(rows)
+                channels, rows = [], []
+        if rows:
+            yield names, channels, np.vstack(rows)
+
+
+def iter_channel_chunks(matrix_path, plot_type, samples=None, on_error="raise"):
+    """Yields the sample names, channels and counts of a matrix by chunks of rows.
+
+    Matrix files are read CHUNK_ROWS rows at a time, so that only the counts of
+    these channels are held in memory, for all of the samples. The samples that
+    are all Nans (e.g. the columns of trailing tabs) in the first rows are left
+    out of every chunk, as process_input drops them. In-memory matrices are
+    sliced the same way after being checked by process_input.
+    """
+    from sigProfilerPlotting.sigProfilerPlotting import process_input
+
+    if not isinstance(matrix_path, str):
+        data = process_input(matrix_path, plot_type, samples, on_error)
+        for start in range(0, len(data), CHUNK_ROWS):
+            chunk = data.iloc[start : start + CHUNK_ROWS]
+            if is_sparse_frame(chunk):
+                chunk = chunk.sparse.to_dense()
+            yield list(data.columns), list(chunk.index), chunk.to_numpy(float)
+        return
+
+    keep = None
+    for names, channels, counts in iter_file_chunks(matrix_path, samples):
+        if keep is None:
+            keep = ~np.isnan(counts).all(axis=0)
+        counts = counts[:, keep]
+        if on_error == "raise" and np.isnan(counts).any():
+            raise MatrixFormatError("ERROR: matrix_path contains Nans.")
+        yield [name for name, kept in zip(names, keep) if kept], channels, counts
+
+
+def aggregate_matrix(
+    command,
+    matrix_path,
+    plot_type,
+    project,
+    aggregate=True,
+    groups=None,
+    samples=None,
+    on_error="raise",
+):
+    """Aggregates the samples of a matrix to a profile per group in one pass.
+
+    Every channel is aggregated over all of the samples at once, so the sum,
+    mean or median of a group is exact while only CHUNK_ROWS channels of the
+    matrix are held in memory. Nans are left out of the statistics.
+
+    Args:
+            command: Name of the plotting function.
+            matrix_path, plot_type, samples, on_error: The arguments of the
+                    plotting function.
+            project: Name of the profile when the samples are not grouped.
+            aggregate: True (the mean), "sum", "mean" or "median".
+            groups: Optional mapping (dict or pd.Series) of sample names to groups
+                    (e.g. cancer types). Samples without a group are left out.
+    Returns:
+            DataFrame with the profile of every group as a column, in the order
+            in which the groups first appear in the matrix.
+    """
+    from sigProfilerPlotting.streaming import PER_SAMPLE_PLOT_TYPES
+
+    statistic = AGGREGATIONS[check_aggregate(aggregate)]
+    if str(plot_type) not in PER_SAMPLE_PLOT_TYPES[command]:
+        raise ValueError(
+            "ERROR: "
+            + command
+            + " cannot aggregate plot_type "
+            + str(plot_type)
+            + ". Use one of "
+            + ", ".join(PER_SAMPLE_PLOT_TYPES[command])
+            + "."
+        )
+
+    members = None
+    index, profiles = [], []
+    for names, channels, counts in iter_channel_chunks(
+        matrix_path, plot_type, samples, on_error
+    ):
+        if members is None:
+            if groups is None:
+                keys = pd.Series(project, index=names)
+            else:
+                keys = pd.Series(groups).reindex(names)
+            # the columns of the samples of every group
+            members = {
+                group: np.flatnonzero((keys == group).to_numpy())
+                for group in keys.dropna().unique()
+            }
+            if not members:
+                raise ValueError(
+                    "ERROR: none of the samples of the matrix are in groups."
+                )
+        index += channels
+        profiles.append(
+            np.column_stack(
+                [statistic(counts[:, columns], axis=1) for columns in members.values()]
+            )
+        )
+
+    return pd.DataFrame(
+        np.vstack(profiles),
+        index=pd.Index(index, name="MutationType"),
+        columns=list(members),
+    )
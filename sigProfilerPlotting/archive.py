@@ -0,0 +1,301 @@
+import contextlib
+import io
+import os
+import struct
+import tarfile
+import time
+import zipfile
+
+try:
+    import fcntl
+except ImportError:
+    # archives are not locked on platforms without fcntl (Windows)
+    fcntl = None
+
+# Archive formats, by the file name extensions that select them
+ARCHIVE_FORMATS = {
+    ".zip": "zip",
+    ".tar": "tar",
+    ".tar.gz": "tar.gz",
+    ".tgz": "tar.gz",
+}
+
+# savefig_format values that write all png plots of a run to one archive
+PNG_ARCHIVE_FORMATS = {"png_zip": "zip", "png_tar": "tar"}
+
+# Columns of the index written next to a png archive
+INDEX_COLUMNS = ["Sample", "Member", "Offset", "Size"]
+
+
+def archive_format_of(file_name, default="tar"):
+    """Returns the archive format selected by the extension of a file name."""
+    for ext, archive_format in ARCHIVE_FORMATS.items():
+        if file_name.lower().endswith(ext):
+            return archive_format
+    return default
+
+
+class PlotArchive:
+    """Writes rendered plots as the members of a single tar or zip archive.
+
+    Members are written as they are added, so the archive can be a stream that
+    does not support seeking, such as stdout or a pipe.
+
+    Args:
+            target: Path of the archive file, or a binary file object to write to.
+            archive_format: "tar", "tar.gz" or "zip". By default the format is
+                    chosen from the extension of target, or "tar" for a file object.
+            compresslevel: Compression level of "tar.gz" (0-9) and "zip" (0-9,
+                    where 0 stores the members uncompressed).
+    """
+
+    def __init__(self, target, archive_format=None, compresslevel=None):
+        if archive_format is None:
+            archive_format = (
+                archive_format_of(target) if isinstance(target, str) else "tar"
+            )
+        if archive_format not in ARCHIVE_FORMATS.values():
+            raise ValueError(
+                "ERROR: archive_format must be 'tar', 'tar.gz', or 'zip', not "
+                + str(archive_format)
+                + "."
+            )
+        self.archive_format = archive_format
+        if archive_format == "zip":
+            self.archive = zipfile.ZipFile(
+                target,
+                "w",
+                compression=zipfile.ZIP_STORED
+                if compresslevel == 0
+                else zipfile.ZIP_DEFLATED,
+                compresslevel=compresslevel,
+            )
+        else:
+            mode = "w|gz" if archive_format == "tar.gz" else "w|"
+            kwargs = {}
+            if archive_format == "tar.gz" and compresslevel is not None:
+                kwargs["compresslevel"] = compresslevel
+            if isinstance(target, str):
+                self.archive = tarfile.open(target, mode, **kwargs)
+            else:
+                self.archive = tarfile.open(fileobj=target, mode=mode, **kwargs)
+        self.names = []
+
+    def add(self, name, data):
+        """Adds the bytes of a file to the archive under name."""
+        if self.archive_format == "zip":
+            self.archive.writestr(name, data)
+        else:
+            info = tarfile.TarInfo(name)
+            info.size = len(data)
+            info.mtime = int(time.time())
+            info.mode = 0o644
+            self.archive.addfile(info, io.BytesIO(data))
+        self.names.append(name)
+
+    def close(self):
+        self.archive.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+def png_archive_path(output_path, project, context_type, savefig_format):
+    """Returns the path of the png archive of a project and context."""
+    ext = PNG_ARCHIVE_FORMATS[savefig_format.lower()]
+    return os.path.join(output_path, f"{context_type}_plots_{project}.{ext}")
+
+
+def index_path(archive_path):
+    return archive_path + ".index.tsv"
+
+
+def read_png_archive_index(archive_path):
+    """Reads the index of a png archive.
+
+    Returns:
+            Dictionary of (member, offset, size) by sample, where offset and size
+            locate the data of the member in the archive file: the png bytes,
+            unless the zip members are compressed. A sample that was written more
+            than once maps to its last member.
+    """
+    index = {}
+    if not os.path.exists(index_path(archive_path)):
+        return index
+    with open(index_path(archive_path)) as f:
+        next(f, None)
+        for line in f:
+            sample, member, offset, size = line.rstrip("\n").split("\t")
+            index[sample] = (member, int(offset), int(size))
+    return index
+
+
+@contextlib.contextmanager
+def locked_index(archive_path, append):
+    """Holds an exclusive lock on the index of a png archive.
+
+    The index is truncated once it is locked unless append is set, and is
+    yielded as an open file positioned at its end.
+    """
+    # opened without truncating, which would empty the index of a writer that
+    # holds the lock
+    with open(index_path(archive_path), "a+") as f:
+        if fcntl is not None:
+            fcntl.flock(f, fcntl.LOCK_EX)
+        try:
+            if not append:
+                f.seek(0)
+                f.truncate()
+            f.seek(0, os.SEEK_END)
+            if f.tell() == 0:
+                f.write("\t".join(INDEX_COLUMNS) + "\n")
+            yield f
+            f.flush()
+        finally:
+            if fcntl is not None:
+                fcntl.flock(f, fcntl.LOCK_UN)
+
+
+def zip_data_offsets(archive_path, infos):
+    """Returns the offsets of the data of zip members in the archive file."""
+    offsets = []
+    # the data of a zip member follows its local header, whose file name and
+    # extra field lengths are the last fields of the header
+    with open(archive_path, "rb") as f:
+        for info in infos:
+            f.seek(info.header_offset)
+            header = f.read(30)
+            name_length, extra_length = struct.unpack("<HH", header[26:30])
+            offsets.append(info.header_offset + 30 + name_length + extra_length)
+    return offsets
+
+
+def replace_zip_members(archive_path, replacements_path):
+    """Rewrites a zip archive with the members of another one in place of the
+    members of the same name.
+
+    The archive is written next to the original and renamed once complete.
+    """
+    tmp_path = archive_path + ".tmp"
+    with zipfile.ZipFile(archive_path) as old, zipfile.ZipFile(
+        replacements_path
+    ) as new, zipfile.ZipFile(tmp_path, "w") as archive:
+        replaced = set(new.namelist())
+        names = set()
+        for info in old.infolist():
+            if info.filename in names:
+                continue
+            names.add(info.filename)
+            source = new if info.filename in replaced else old
+            archive.writestr(source.getinfo(info.filename), source.read(info.filename))
+    os.replace(tmp_path, archive_path)
+
+
+def write_png_archive(archive_path, pngs, compresslevel=None, append=False):
+    """Writes png plots to a zip or uncompressed tar archive and indexes them.
+
+    The archive and its index are locked while they are written, so that
+    parallel workers can append the plots of their samples to the same archive.
+    The pngs are all produced before the lock is taken, so that the workers only
+    wait for each other's writes, not for each other's rendering. The members of
+    a zip archive are unique: a member that is written again replaces the
+    existing one in place, which rewrites the archive and its index.
+
+    Args:
+            archive_path: Path of the .zip or .tar archive.
+            pngs: Iterable of (sample, member name, png bytes).
+            compresslevel: Deflate level (1-9) of the zip members. By default the
+                    members are stored as they are, since png is already compressed.
+            append: Add the plots to an existing archive instead of overwriting it.
+                    Without append, the archive and its index are replaced, also
+                    when other runs have written to them, so every run that
+                    shares an archive must append to it.
+    """
+    pngs = list(pngs)
+    archive_format = archive_format_of(archive_path)
+    with locked_index(archive_path, append) as index:
+        mode = "a" if append and os.path.exists(archive_path) else "w"
+        written = []
+        if archive_format == "zip":
+            compression = {
+                "compression": zipfile.ZIP_DEFLATED
+                if compresslevel
+                else zipfile.ZIP_STORED,
+                "compresslevel": compresslevel or None,
+            }
+            existing = set()
+            if mode == "a":
+                with zipfile.ZipFile(archive_path) as archive:
+                    existing = set(archive.namelist())
+            # members of the archive that are written again, in a zip of their own
+            # until the archive is rewritten with them
+            replacements_path = archive_path + ".replace.tmp"
+            replacements = {}
+            try:
+                with zipfile.ZipFile(
+                    archive_path, mode, **compression
+                ) as archive, contextlib.ExitStack() as stack:
+                    for sample, name, data in pngs:
+                        if name not in existing:
+                            archive.writestr(name, data)
+                            written.append((sample, archive.getinfo(name)))
+                            continue
+                        if not replacements:
+                            replacement_archive = stack.enter_context(
+                                zipfile.ZipFile(replacements_path, "w", **compression)
+                            )
+                        replacement_archive.writestr(name, data)
+                        replacements[name] = sample
+                if replacements:
+                    replace_zip_members(archive_path, replacements_path)
+            finally:
+                if os.path.exists(replacements_path):
+                    os.remove(replacements_path)
+            if replacements:
+                # the offsets of all members change, so the index is rewritten
+                index.seek(0)
+                next(index, None)
+                samples = {}
+                for line in index:
+                    sample, member = line.rstrip("\n").split("\t")[:2]
+                    samples[member] = sample
+                samples.update(replacements)
+                samples.update((info.filename, sample) for sample, info in written)
+                with zipfile.ZipFile(archive_path) as archive:
+                    infos = [
+                        info for info in archive.infolist() if info.filename in samples
+                    ]
+                written = [
+                    (samples[info.filename], info.filename, offset, info.compress_size)
+                    for info, offset in zip(
+                        infos, zip_data_offsets(archive_path, infos)
+                    )
+                ]
+                index.seek(0)
+                index.truncate()
+                index.write("\t".join(INDEX_COLUMNS) + "\n")
+            else:
+                infos = [info for sample, info in written]
+                written = [
+                    (sample, info.filename, offset, info.compress_size)
+                    for (sample, info), offset in zip(
+                        written, zip_data_offsets(archive_path, infos)
+                    )
+                ]
+        else:
+            with tarfile.open(archive_path, mode, format=tarfile.PAX_FORMAT) as archive:
+                for sample, name, data in pngs:
+                    info = tarfile.TarInfo(name)
+                    info.size = len(data)
+                    info.mtime = int(time.time())
+                    info.mode = 0o644
+                    archive.addfile(info, io.BytesIO(data))
+                    # the data ends at the current offset, padded to a full block
+                    blocks = -(-len(data) // tarfile.BLOCKSIZE)
+                    offset = archive.offset - blocks * tarfile.BLOCKSIZE
+                    written.append((sample, name, offset, len(data)))
+        for entry in written:
+            index.write("\t".join(map(str, entry)) + "\n")
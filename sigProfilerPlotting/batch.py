@@ -0,0 +1,161 @@
+import json
+import signal
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from sigProfilerPlotting import sigProfilerPlotting as spp
+from sigProfilerPlotting.errors import RunCancelled, SampleErrors
+
+# Plotting functions that can be run as batch jobs
+PLOT_FUNCTIONS = {
+    "plotSBS": spp.plotSBS,
+    "plotID": spp.plotID,
+    "plotDBS": spp.plotDBS,
+    "plotSV": spp.plotSV,
+    "plotCNV": spp.plotCNV,
+}
+
+# CancellationToken of the running batch, in the process running its jobs
+_CANCEL = None
+
+
+def load_jobs(manifest_path):
+    """Reads the jobs of a batch manifest.
+
+    A manifest is either a JSON lines file with one job per line, or a YAML file
+    (requires PyYAML) holding a list of jobs or a mapping with a "jobs" list.
+    Every job is a mapping with the plotting "command" (plotSBS, plotID, plotDBS,
+    plotSV or plotCNV) and the keyword arguments of that plotting function, e.g.
+
+        {"command": "plotSBS", "matrix_path": "BRCA.SBS96.all",
+         "output_path": "plots/", "project": "BRCA", "plot_type": "96"}
+    """
+    if manifest_path.endswith((".yaml", ".yml")):
+        try:
+            import yaml
+        except ImportError:
+            raise ImportError(
+                "ERROR: reading a yaml manifest requires PyYAML. Please install it "
+                + "with 'pip install sigProfilerPlotting[batch]' or provide a jsonl "
+                + "manifest."
+            )
+        with open(manifest_path) as f:
+            jobs = yaml.safe_load(f) or []
+        if isinstance(jobs, dict):
+            jobs = jobs.get("jobs", [])
+    else:
+        with open(manifest_path) as f:
+            jobs = [json.loads(line) for line in f if line.strip()]
+
+    for i, job in enumerate(jobs):
+        if not isinstance(job, dict) or job.get("command") not in PLOT_FUNCTIONS:
+            raise ValueError(
+                "ERROR: job "
+                + str(i + 1)
+                + " of "
+                + manifest_path
+                + " must be a mapping with a command in "
+                + ", ".join(PLOT_FUNCTIONS)
+                + "."
+            )
+    return jobs
+
+
+def init_worker(cancel=None):
+    """Prepares a process to run the jobs of a batch."""
+    global _CANCEL
+    _CANCEL = cancel
+    spp.load_custom_fonts()
+
+
+def init_pool_worker(cancel=None):
+    """Prepares a worker process of a batch."""
+    # the batch is interrupted through its token, not in every worker
+    if cancel is not None:
+        signal.signal(signal.SIGINT, signal.SIG_IGN)
+    init_worker(cancel)
+
+
+def run_job(job):
+    """Runs a single job and returns its entry of the batch summary."""
+    kwargs = dict(job)
+    command = kwargs.pop("command")
+    result = {
+        "command": command,
+        "matrix_path": kwargs.get("matrix_path"),
+        "project": kwargs.get("project"),
+        "plot_type": kwargs.get("plot_type"),
+        "savefig_format": kwargs.get("savefig_format", "pdf"),
+    }
+    if _CANCEL is not None:
+        if _CANCEL.cancelled:
+            result["status"] = "cancelled"
+            result["elapsed"] = 0.0
+            return result
+        kwargs["cancel"] = _CANCEL
+    start = time.time()
+    try:
+        if result["savefig_format"].lower() == "pil_image":
+            raise ValueError("ERROR: batch jobs cannot return PIL_Image output.")
+        PLOT_FUNCTIONS[command](**kwargs)
+        result["status"] = "ok"
+    except SampleErrors as e:
+        # with on_error="collect", the other samples of the job were written
+        result["status"] = "error"
+        result["error"] = str(e)
+        result["failed_samples"] = {
+            str(sample): str(error.error) for sample, error in e.errors.items()
+        }
+    except RunCancelled as e:
+        # the samples drawn before the cancellation were written
+        result["status"] = "cancelled"
+        result["error"] = str(e)
+    except Exception as e:
+        result["status"] = "error"
+        result["error"] = str(e)
+    result["elapsed"] = round(time.time() - start, 3)
+    return result
+
+
+def run_batch(jobs, workers=1, sample_timeout=None, cancel=None):
+    """Runs plotting jobs in this process, or in a pool of worker processes.
+
+    Fonts and plot templates are loaded once per process and shared by all of
+    the jobs it runs.
+
+    Args:
+            jobs: List of jobs as returned by load_jobs.
+            workers: Number of worker processes. With 1, the jobs run in this process.
+            sample_timeout: Time limit of every sample in seconds, for the jobs
+                    that do not set their own sample_timeout (see plotSBS).
+            cancel: CancellationToken of the batch. Once it is cancelled, the
+                    running jobs stop after their current sample and the jobs
+                    that have not started are not run. Both have the status
+                    "cancelled".
+    Returns:
+            Summary of the batch with the status and run time of every job.
+    """
+    global _CANCEL
+    start = time.time()
+    spp.load_custom_fonts()
+    if sample_timeout is not None:
+        jobs = [dict({"sample_timeout": sample_timeout}, **job) for job in jobs]
+    if workers > 1:
+        with ProcessPoolExecutor(
+            max_workers=workers, initializer=init_pool_worker, initargs=(cancel,)
+        ) as executor:
+            results = list(executor.map(run_job, jobs))
+    else:
+        _CANCEL = cancel
+        try:
+            results = [run_job(job) for job in jobs]
+        finally:
+            _CANCEL = None
+
+    return {
+        "jobs": results,
+        "succeeded": sum(result["status"] == "ok" for result in results),
+        "failed": sum(result["status"] == "error" for result in results),
+        "cancelled": sum(result["status"] == "cancelled" for result in results),
+        "elapsed": round(time.time() - start, 3),
+    }
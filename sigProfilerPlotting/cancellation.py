@@ -0,0 +1,87 @@
+import multiprocessing
+import signal
+import threading
+import time
+
+from sigProfilerPlotting.errors import SampleTimeout
+
+
+def check_sample_timeout(sample_timeout):
+    if sample_timeout is not None and not sample_timeout > 0:
+        raise ValueError("ERROR: sample_timeout must be a positive number of seconds.")
+
+
+class CancellationToken:
+    """Cancels plotting runs cooperatively.
+
+    A plotting run given the token through its cancel argument checks it before
+    every sample. Once cancel is called, the run draws no further samples,
+    writes the output of the samples drawn so far and raises RunCancelled. The
+    token can be shared with worker processes that are started after it was
+    created (e.g. the workers of a batch).
+    """
+
+    def __init__(self):
+        self.event = multiprocessing.Event()
+
+    def cancel(self):
+        self.event.set()
+
+    @property
+    def cancelled(self):
+        return self.event.is_set()
+
+
+class SampleTimer:
+    """Limits the time spent drawing a single sample.
+
+    In the main thread of platforms with SIGALRM (i.e. not Windows), a sample
+    is interrupted with SampleTimeout as soon as its time is up and Python code
+    runs again (a single call into matplotlib's C renderer is not interrupted).
+    Elsewhere, the time limit is checked once the sample is drawn.
+
+    Args:
+            seconds: Time limit of every sample in seconds.
+    """
+
+    def __init__(self, seconds):
+        check_sample_timeout(seconds)
+        self.seconds = seconds
+        self.sample = None
+        self.started = None
+        self.previous_handler = None
+
+    @staticmethod
+    def interrupts():
+        return (
+            hasattr(signal, "setitimer")
+            and threading.current_thread() is threading.main_thread()
+        )
+
+    def expired(self, signum, frame):
+        # stop raises it again if the drawing code catches it
+        if self.sample is not None:
+            raise SampleTimeout(self.sample, self.seconds)
+
+    def start(self, sample):
+        self.cancel()
+        self.sample = sample
+        self.started = time.monotonic()
+        if self.interrupts():
+            self.previous_handler = signal.signal(signal.SIGALRM, self.expired)
+            signal.setitimer(signal.ITIMER_REAL, self.seconds)
+
+    def cancel(self):
+        """Ends the time limit of the current sample without checking it."""
+        if self.previous_handler is not None:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+            signal.signal(signal.SIGALRM, self.previous_handler)
+            self.previous_handler = None
+        sample, self.sample = self.sample, None
+        return sample
+
+    def stop(self):
+        """Ends the time limit of the current sample."""
+        sample = self.cancel()
+        if sample is not None and time.monotonic() - self.started > self.seconds:
+            raise SampleTimeout(sample, self.seconds)
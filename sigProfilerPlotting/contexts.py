@@ -0,0 +1,287 @@
+import itertools
+import os
+from dataclasses import dataclass
+from types import MappingProxyType
+
+import numpy as np
+
+SPP_REFERENCE = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "reference_formats"
+)
+
+
+def rgb(*colors):
+    return tuple((r / 256, g / 256, b / 256) for r, g, b in colors)
+
+
+# Colors of the six SBS mutation classes
+SBS_COLORS = rgb(
+    (3, 189, 239),
+    (1, 1, 1),
+    (228, 41, 38),
+    (203, 202, 202),
+    (162, 207, 99),
+    (236, 199, 197),
+)
+
+# Colors of the sixteen ID83 indel classes
+ID_COLORS = rgb(
+    (253, 190, 111),
+    (255, 128, 2),
+    (176, 221, 139),
+    (54, 161, 46),
+    (253, 202, 181),
+    (252, 138, 106),
+    (241, 68, 50),
+    (188, 25, 26),
+    (208, 225, 242),
+    (148, 196, 223),
+    (74, 152, 201),
+    (23, 100, 171),
+    (226, 226, 239),
+    (182, 182, 216),
+    (134, 131, 189),
+    (98, 64, 155),
+)
+
+# Colors of the ten DBS reference dinucleotides
+DBS_COLORS = rgb(
+    (3, 189, 239),
+    (3, 102, 204),
+    (162, 207, 99),
+    (1, 102, 1),
+    (255, 153, 153),
+    (228, 41, 38),
+    (255, 178, 102),
+    (255, 128, 1),
+    (204, 153, 255),
+    (76, 1, 153),
+)
+
+SBS_CLASSES = ("C>A", "C>G", "C>T", "T>A", "T>C", "T>G")
+
+ID_CLASSES = (
+    "1DelC",
+    "1DelT",
+    "1InsC",
+    "1InsT",
+    "2DelR",
+    "3DelR",
+    "4DelR",
+    "5DelR",
+    "2InsR",
+    "3InsR",
+    "4InsR",
+    "5InsR",
+    "2DelM",
+    "3DelM",
+    "4DelM",
+    "5DelM",
+)
+
+# ID96 adds microhomology insertions, and complex and non matching indels
+ID96_CLASSES = ID_CLASSES + (
+    "2InsM",
+    "3InsM",
+    "4InsM",
+    "5InsM",
+    "complex",
+    "non_matching",
+)
+ID96_COLORS = ID_COLORS + ID_COLORS[12:] + rgb((130, 130, 130), (190, 190, 190))
+
+# The ID28 plot colors the four single base classes, and the four classes of
+# longer indels alike
+ID28_CLASSES = (
+    "1DelC",
+    "1DelT",
+    "1InsC",
+    "1InsT",
+    "long_Del",
+    "long_Ins",
+    "MH",
+    "complex",
+)
+ID28_COLORS = ID_COLORS[:4] + ID_COLORS[11:12] * 4
+
+# Pyrimidine dinucleotides, which have a transcriptional strand
+DBS_STRANDED_CLASSES = ("CC", "CT", "TC", "TT")
+
+_CONTEXT_SPECS = {}
+
+
+@dataclass(frozen=True)
+class ContextSpec:
+    """Layout of the plots of a mutational context.
+
+    The specs are built once per process by get_context_spec and shared by all
+    plotting runs. They are immutable: the fields are tuples, read-only arrays
+    and read-only mappings.
+
+    Attributes:
+            name: Name of the context (e.g. "SBS96").
+            labels: The channels of the context, in the order they are drawn.
+            palette: RGB colors of the classes of channels.
+            groups: (class, start, stop) of every run of consecutive channels of
+                    the same class, which share a color.
+            colors: Array with the RGB color of every channel.
+            positions: Array with the x position of the bar of every channel.
+            xlabels: Tick label of every channel.
+            color_index: Mapping of every channel to its color in palette.
+            strands: Strand prefixes of the stranded channels of the context.
+            stranded_labels: The channels of every strand (e.g. "T:A[C>A]A").
+    """
+
+    name: str
+    labels: tuple
+    palette: tuple
+    groups: tuple
+    colors: np.ndarray
+    positions: np.ndarray
+    xlabels: tuple
+    color_index: MappingProxyType
+    strands: tuple = ()
+    stranded_labels: tuple = ()
+
+    def colors_of(self, labels):
+        """Returns the colors of the channels in labels, in that order."""
+        if tuple(labels) == self.labels:
+            return self.colors
+        return read_only(
+            np.array([self.palette[self.color_index[label]] for label in labels])
+        )
+
+
+def read_only(array):
+    array.setflags(write=False)
+    return array
+
+
+def make_context_spec(
+    name, labels, palette, class_of, classes=None, xlabel_of=str, strands=()
+):
+    """Builds the ContextSpec of a context.
+
+    Args:
+            name: Name of the context.
+            labels: The channels of the context, in the order they are drawn.
+            palette: RGB colors of the classes.
+            class_of: Function returning the class of a channel.
+            classes: The classes in the order of their colors. By default, the
+                    order in which they first appear in labels.
+            xlabel_of: Function returning the tick label of a channel.
+            strands: Strand prefixes of the stranded channels, if any.
+    """
+    labels = tuple(labels)
+    channel_classes = [class_of(label) for label in labels]
+    if classes is None:
+        classes = list(dict.fromkeys(channel_classes))
+    color_index = {
+        label: classes.index(channel_class)
+        for label, channel_class in zip(labels, channel_classes)
+    }
+    groups = []
+    start = 0
+    for channel_class, run in itertools.groupby(channel_classes):
+        stop = start + len(list(run))
+        groups.append((channel_class, start, stop))
+        start = stop
+    return ContextSpec(
+        name=name,
+        labels=labels,
+        palette=tuple(palette),
+        groups=tuple(groups),
+        colors=read_only(np.array([palette[color_index[label]] for label in labels])),
+        positions=read_only(np.arange(len(labels)) + 0.4),
+        xlabels=tuple(xlabel_of(label) for label in labels),
+        color_index=MappingProxyType(color_index),
+        strands=tuple(strands),
+        stranded_labels=tuple(
+            strand + ":" + label for label in labels for strand in strands
+        ),
+    )
+
+
+def read_reference(file_name):
+    with open(os.path.join(SPP_REFERENCE, file_name)) as f:
+        return [line.split()[0] for line in f if line.strip()]
+
+
+def sbs96_labels():
+    flanks = list(itertools.product("ACGT", "ACGT"))
+    return [
+        flanks[i % 16][0] + "[" + SBS_CLASSES[i // 16] + "]" + flanks[i % 16][1]
+        for i in range(96)
+    ]
+
+
+def build_context_spec(name):
+    if name in ("SBS96", "SBS288"):
+        return make_context_spec(
+            name,
+            sbs96_labels(),
+            SBS_COLORS,
+            lambda label: label[2:5],
+            SBS_CLASSES,
+            lambda label: label[0] + label[2] + label[6],
+            ("T", "U", "N") if name == "SBS288" else (),
+        )
+    if name == "ID96":
+        return make_context_spec(
+            name,
+            read_reference("ID96.txt"),
+            ID96_COLORS,
+            lambda label: "".join(label.split(":")[:3]),
+            ID96_CLASSES,
+            lambda label: label.split(":")[-1],
+        )
+    if name in ("ID83", "ID415"):
+        return make_context_spec(
+            name,
+            read_reference("ID83.txt"),
+            ID_COLORS,
+            lambda label: "".join(label.split(":")[:3]),
+            ID_CLASSES,
+            lambda label: label.split(":")[3],
+            ("T", "U", "N", "B", "Q") if name == "ID415" else (),
+        )
+    if name == "ID28":
+        labels = [
+            "1:" + indel + ":" + str(size)
+            for indel in ("Del:C", "Del:T", "Ins:C", "Ins:T")
+            for size in range(6)
+        ]
+        return make_context_spec(
+            name,
+            labels + ["long_Del", "long_Ins", "MH", "complex"],
+            ID28_COLORS,
+            lambda label: "".join(label.split(":")[:3]),
+            ID28_CLASSES,
+            lambda label: label.split(":")[-1],
+        )
+    if name in ("DBS78", "DBS186"):
+        labels = sorted(read_reference("DBS78.txt"))
+        classes = list(dict.fromkeys(label[:2] for label in labels))
+        if name == "DBS186":
+            labels = [label for label in labels if label[:2] in DBS_STRANDED_CLASSES]
+        return make_context_spec(
+            name,
+            labels,
+            DBS_COLORS,
+            lambda label: label[:2],
+            classes,
+            lambda label: label[3:],
+            ("T", "U") if name == "DBS186" else (),
+        )
+    raise ValueError("ERROR: there is no context spec for the context " + name + ".")
+
+
+def get_context_spec(name):
+    """Returns the ContextSpec of a context, e.g. "SBS96", "ID83" or "DBS78".
+
+    Specs are available for SBS96, SBS288, ID28, ID83, ID96, ID415, DBS78 and
+    DBS186.
+    """
+    if name not in _CONTEXT_SPECS:
+        _CONTEXT_SPECS[name] = build_context_spec(name)
+    return _CONTEXT_SPECS[name]
@@ -1,6 +1,28 @@
 import argparse
+import contextlib
+import json
+import os
+import shutil
+import signal
+import sys
+import tempfile
 from typing import List
+
+import pandas as pd
+
 import sigProfilerPlotting as sigPlt
+from sigProfilerPlotting import batch, server
+from sigProfilerPlotting.archive import PlotArchive, archive_format_of
+from sigProfilerPlotting.cancellation import CancellationToken
+from sigProfilerPlotting.progress import ProgressBar
+
+# Plot types that are drawn from a DataFrame. The matrix of the other plot
+# types is read from a file, so a matrix on stdin is copied to a temporary file.
+IN_MEMORY_PLOT_TYPES = {
+    "plotSBS": ["96", "288"],
+    "plotID": ["94", "ID94", "94ID", "83"],
+    "plotDBS": ["78", "78DBS", "DBS78"],
+}
 
 
 def str2bool(v):
@@ -14,11 +36,30 @@ def str2bool(v):
         raise argparse.ArgumentTypeError("Boolean value expected.")
 
 
+# A single --samples value may be a glob or regular expression, several are names
+def sample_selection(samples):
+    if samples is not None and len(samples) == 1:
+        return samples[0]
+    return samples
+
+
+# The --groups file has a header line, then the sample name and group of every
+# sample, separated by a tab
+def read_groups(path):
+    if path is None:
+        return None
+    return pd.read_csv(path, sep="\t", index_col=0).iloc[:, 0]
+
+
 # Common parser setup for shared arguments
 def common_plotting_arguments(parser):
-    parser.add_argument("matrix_path", help="The path to the input matrix file.")
     parser.add_argument(
-        "output_path", help="The directory where the plots will be saved."
+        "matrix_path", help="The path to the input matrix file, or - to read stdin."
+    )
+    parser.add_argument(
+        "output_path",
+        help="The directory where the plots will be saved, a .tar, .tar.gz or .zip "
+        + "archive to write them to, or - to stream a tar archive to stdout.",
     )
     parser.add_argument("project", help="The name of the project.")
     parser.add_argument("plot_type", help="The type of plot to generate.")
@@ -42,7 +83,7 @@ def common_plotting_arguments(parser):
     parser.add_argument(
         "--savefig_format",
         default="pdf",
-        choices=["pdf", "png", "pil_image"],
+        choices=["pdf", "pdf_per_sample", "png", "png_zip", "png_tar", "pil_image"],
         help="The file format for saving the plot.",
     )
     parser.add_argument("--volume", help="Specify a volume for Docker container usage.")
@@ -52,6 +93,68 @@ def common_plotting_arguments(parser):
         default=100,
         help="The resolution of the plot in dots per inch.",
     )
+    parser.add_argument(
+        "--cache",
+        help="A render cache directory used to reuse the per-sample plots of unchanged samples.",
+    )
+    parser.add_argument(
+        "--append",
+        nargs="?",
+        const="skip",
+        default=False,
+        choices=["skip", "replace"],
+        help="Add pages to an existing pdf, skipping (default) or replacing samples that already have a page.",
+    )
+    parser.add_argument(
+        "--samples",
+        nargs="+",
+        help="The samples to plot: sample names, a glob pattern such as 'TCGA-*', or a regular expression prefixed with 're:'.",
+    )
+    parser.add_argument(
+        "--aggregate",
+        nargs="?",
+        const="mean",
+        default=False,
+        choices=["sum", "mean", "median"],
+        help="Plot the sum, mean (default) or median profile of the samples instead of every sample.",
+    )
+    parser.add_argument(
+        "--groups",
+        help="A tab-separated file of sample names and groups (e.g. cancer types), with a header line, to aggregate every group separately.",
+    )
+    parser.add_argument(
+        "--archive_format",
+        choices=["tar", "tar.gz", "zip"],
+        help="The archive format of the output, chosen from the output_path extension by default.",
+    )
+    parser.add_argument(
+        "--compresslevel",
+        type=int,
+        choices=range(1, 10),
+        metavar="1-9",
+        help="Compress the members of a png_zip archive with this deflate level.",
+    )
+    parser.add_argument(
+        "--dry_run",
+        action="store_true",
+        help="Print the estimated pages, output bytes, peak memory and run time instead of plotting.",
+    )
+    parser.add_argument(
+        "--progress",
+        action="store_true",
+        help="Show a progress bar with the throughput and ETA on stderr.",
+    )
+    parser.add_argument(
+        "--on_error",
+        choices=["raise", "skip", "collect"],
+        default="raise",
+        help="Stop at the first sample that cannot be plotted (raise), go on without it (skip), or go on and fail with all errors at the end (collect).",
+    )
+    parser.add_argument(
+        "--report",
+        help="Write a json report of the run, with the status, timing and output of "
+        + "every sample, to this path.",
+    )
 
 
 def parse_arguments_sbs(args: List[str]) -> argparse.Namespace:
@@ -82,9 +185,13 @@ def parse_arguments_sv(args: List[str]) -> argparse.Namespace:
     parser = argparse.ArgumentParser(
         prog="SigProfilerPlotting plotSV", description="Generate SV plots."
     )
-    parser.add_argument("matrix_path", help="The path to the input matrix file.")
     parser.add_argument(
-        "output_path", help="The directory where the plots will be saved."
+        "matrix_path", help="The path to the input matrix file, or - to read stdin."
+    )
+    parser.add_argument(
+        "output_path",
+        help="The directory where the plots will be saved, a .tar, .tar.gz or .zip "
+        + "archive to write them to, or - to stream a tar archive to stdout.",
     )
     parser.add_argument("project", help="The name of the project.")
     parser.add_argument(
@@ -106,7 +213,7 @@ def parse_arguments_sv(args: List[str]) -> argparse.Namespace:
     parser.add_argument(
         "--savefig_format",
         default="pdf",
-        choices=["pdf", "png", "pil_image"],
+        choices=["pdf", "pdf_per_sample", "png", "png_zip", "png_tar", "pil_image"],
         help="The file format for saving the plot.",
     )
     parser.add_argument(
@@ -115,6 +222,56 @@ def parse_arguments_sv(args: List[str]) -> argparse.Namespace:
         default=100,
         help="The resolution of the plot in dots per inch.",
     )
+    parser.add_argument(
+        "--cache",
+        help="A render cache directory used to reuse the per-sample plots of unchanged samples.",
+    )
+    parser.add_argument(
+        "--append",
+        nargs="?",
+        const="skip",
+        default=False,
+        choices=["skip", "replace"],
+        help="Add pages to an existing pdf, skipping (default) or replacing samples that already have a page.",
+    )
+    parser.add_argument(
+        "--samples",
+        nargs="+",
+        help="The samples to plot: sample names, a glob pattern such as 'TCGA-*', or a regular expression prefixed with 're:'.",
+    )
+    parser.add_argument(
+        "--archive_format",
+        choices=["tar", "tar.gz", "zip"],
+        help="The archive format of the output, chosen from the output_path extension by default.",
+    )
+    parser.add_argument(
+        "--compresslevel",
+        type=int,
+        choices=range(1, 10),
+        metavar="1-9",
+        help="Compress the members of a png_zip archive with this deflate level.",
+    )
+    parser.add_argument(
+        "--dry_run",
+        action="store_true",
+        help="Print the estimated pages, output bytes, peak memory and run time instead of plotting.",
+    )
+    parser.add_argument(
+        "--progress",
+        action="store_true",
+        help="Show a progress bar with the throughput and ETA on stderr.",
+    )
+    parser.add_argument(
+        "--on_error",
+        choices=["raise", "skip", "collect"],
+        default="raise",
+        help="Stop at the first sample that cannot be plotted (raise), go on without it (skip), or go on and fail with all errors at the end (collect).",
+    )
+    parser.add_argument(
+        "--report",
+        help="Write a json report of the run, with the status, timing and output of "
+        + "every sample, to this path.",
+    )
     return parser.parse_args(args)
 
 
@@ -122,9 +279,13 @@ def parse_arguments_cnv(args: List[str]) -> argparse.Namespace:
     parser = argparse.ArgumentParser(
         prog="SigProfilerPlotting plotCNV", description="Generate CNV plots."
     )
-    parser.add_argument("matrix_path", help="The path to the input matrix file.")
     parser.add_argument(
-        "output_path", help="The directory where the plots will be saved."
+        "matrix_path", help="The path to the input matrix file, or - to read stdin."
+    )
+    parser.add_argument(
+        "output_path",
+        help="The directory where the plots will be saved, a .tar, .tar.gz or .zip "
+        + "archive to write them to, or - to stream a tar archive to stdout.",
     )
     parser.add_argument("project", help="The name of the project.")
     parser.add_argument(
@@ -154,7 +315,7 @@ def parse_arguments_cnv(args: List[str]) -> argparse.Namespace:
     parser.add_argument(
         "--savefig_format",
         default="pdf",
-        choices=["pdf", "png", "pil_image"],
+        choices=["pdf", "pdf_per_sample", "png", "png_zip", "png_tar", "pil_image"],
         help="The file format for saving the plot.",
     )
     parser.add_argument(
@@ -163,13 +324,169 @@ def parse_arguments_cnv(args: List[str]) -> argparse.Namespace:
         default=100,
         help="The resolution of the plot in dots per inch.",
     )
+    parser.add_argument(
+        "--cache",
+        help="A render cache directory used to reuse the per-sample plots of unchanged samples.",
+    )
+    parser.add_argument(
+        "--append",
+        nargs="?",
+        const="skip",
+        default=False,
+        choices=["skip", "replace"],
+        help="Add pages to an existing pdf, skipping (default) or replacing samples that already have a page.",
+    )
+    parser.add_argument(
+        "--samples",
+        nargs="+",
+        help="The samples to plot: sample names, a glob pattern such as 'TCGA-*', or a regular expression prefixed with 're:'.",
+    )
+    parser.add_argument(
+        "--archive_format",
+        choices=["tar", "tar.gz", "zip"],
+        help="The archive format of the output, chosen from the output_path extension by default.",
+    )
+    parser.add_argument(
+        "--compresslevel",
+        type=int,
+        choices=range(1, 10),
+        metavar="1-9",
+        help="Compress the members of a png_zip archive with this deflate level.",
+    )
+    parser.add_argument(
+        "--dry_run",
+        action="store_true",
+        help="Print the estimated pages, output bytes, peak memory and run time instead of plotting.",
+    )
+    parser.add_argument(
+        "--progress",
+        action="store_true",
+        help="Show a progress bar with the throughput and ETA on stderr.",
+    )
+    parser.add_argument(
+        "--on_error",
+        choices=["raise", "skip", "collect"],
+        default="raise",
+        help="Stop at the first sample that cannot be plotted (raise), go on without it (skip), or go on and fail with all errors at the end (collect).",
+    )
+    parser.add_argument(
+        "--report",
+        help="Write a json report of the run, with the status, timing and output of "
+        + "every sample, to this path.",
+    )
+    return parser.parse_args(args)
+
+
+def parse_arguments_batch(args: List[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog="SigProfilerPlotting batch",
+        description="Run the plotting jobs of a manifest in a single process.",
+    )
+    parser.add_argument(
+        "manifest",
+        help="A jsonl or yaml file listing the jobs (yaml requires sigProfilerPlotting[batch]). Every job holds a command (plotSBS, plotID, plotDBS, plotSV or plotCNV) and the arguments of that plotting function.",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="The number of worker processes running the jobs.",
+    )
+    parser.add_argument(
+        "--summary",
+        help="The path of the json summary of the results. Printed when not provided.",
+    )
+    parser.add_argument(
+        "--sample_timeout",
+        type=float,
+        help="The number of seconds a single sample may take. Samples that take longer are recorded as failed and their job goes on with the next sample.",
+    )
     return parser.parse_args(args)
 
 
+def parse_arguments_serve(args: List[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog="SigProfilerPlotting serve",
+        description="Run a local render server with a pool of warm workers.",
+    )
+    parser.add_argument(
+        "--host", default="127.0.0.1", help="The address of the http server."
+    )
+    parser.add_argument(
+        "--port", type=int, default=8000, help="The port of the http server."
+    )
+    parser.add_argument(
+        "--socket", help="Serve on this unix socket instead of http over tcp."
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=2,
+        help="The number of worker processes rendering plots concurrently.",
+    )
+    parser.add_argument(
+        "--max_queue",
+        type=int,
+        default=16,
+        help="The number of requests that may wait for a free worker.",
+    )
+    return parser.parse_args(args)
+
+
+# Runs a plotting function on the matrix and output of the command line. A
+# matrix_path of - reads the matrix from stdin. An output_path of - streams the
+# plots as an archive to stdout, and an archive output_path writes them to that
+# single archive file.
+def run_plot(plot_function, parsed_args, in_memory=True, **kwargs):
+    matrix_path = parsed_args.matrix_path
+    output_path = parsed_args.output_path
+    archive_format = parsed_args.archive_format
+    if output_path != "-" and archive_format is None:
+        archive_format = archive_format_of(output_path, default=None)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        if matrix_path == "-":
+            if in_memory:
+                matrix_path = pd.read_csv(sys.stdin.buffer, sep="\t", index_col=0)
+            else:
+                matrix_path = os.path.join(tmp_dir, "matrix.all")
+                with open(matrix_path, "wb") as f:
+                    shutil.copyfileobj(sys.stdin.buffer, f)
+        if parsed_args.dry_run:
+            print(
+                json.dumps(
+                    plot_function(matrix_path, output_path, dry_run=True, **kwargs),
+                    indent=2,
+                )
+            )
+            return
+        if output_path != "-" and archive_format is None:
+            return plot_function(matrix_path, output_path, **kwargs)
+
+        stdout = sys.stdout.buffer
+        plot_path = os.path.join(tmp_dir, "output") + os.sep
+        with contextlib.ExitStack() as stack:
+            if output_path == "-":
+                # keep the messages of the plotting functions out of the stream
+                stack.enter_context(contextlib.redirect_stdout(sys.stderr))
+                archive = PlotArchive(stdout, archive_format or "tar")
+            else:
+                archive = PlotArchive(output_path, archive_format)
+            stack.enter_context(archive)
+            plot_function(matrix_path, plot_path, archive=archive, **kwargs)
+            # the plot types drawn from matrix files write their pdf to plot_path
+            if os.path.isdir(plot_path):
+                for name in sorted(os.listdir(plot_path)):
+                    with open(os.path.join(plot_path, name), "rb") as f:
+                        archive.add(name, f.read())
+        stdout.flush()
+
+
 def dispatch_plot_sbs(parsed_args: argparse.Namespace) -> None:
-    sigPlt.plotSBS(
-        matrix_path=parsed_args.matrix_path,
-        output_path=parsed_args.output_path,
+    run_plot(
+        sigPlt.plotSBS,
+        parsed_args,
+        in_memory=parsed_args.plot_type in IN_MEMORY_PLOT_TYPES["plotSBS"],
         project=parsed_args.project,
         plot_type=parsed_args.plot_type,
         percentage=parsed_args.percentage,
@@ -179,13 +496,23 @@ def dispatch_plot_sbs(parsed_args: argparse.Namespace) -> None:
         savefig_format=parsed_args.savefig_format,
         volume=parsed_args.volume,
         dpi=parsed_args.dpi,
+        cache=parsed_args.cache,
+        append=parsed_args.append,
+        samples=sample_selection(parsed_args.samples),
+        compresslevel=parsed_args.compresslevel,
+        progress_callback=ProgressBar() if parsed_args.progress else None,
+        report=parsed_args.report,
+        on_error=parsed_args.on_error,
+        aggregate=parsed_args.aggregate,
+        groups=read_groups(parsed_args.groups),
     )
 
 
 def dispatch_plot_id(parsed_args: argparse.Namespace) -> None:
-    sigPlt.plotID(
-        matrix_path=parsed_args.matrix_path,
-        output_path=parsed_args.output_path,
+    run_plot(
+        sigPlt.plotID,
+        parsed_args,
+        in_memory=parsed_args.plot_type in IN_MEMORY_PLOT_TYPES["plotID"],
         project=parsed_args.project,
         plot_type=parsed_args.plot_type,
         percentage=parsed_args.percentage,
@@ -195,13 +522,23 @@ def dispatch_plot_id(parsed_args: argparse.Namespace) -> None:
         savefig_format=parsed_args.savefig_format,
         volume=parsed_args.volume,
         dpi=parsed_args.dpi,
+        cache=parsed_args.cache,
+        append=parsed_args.append,
+        samples=sample_selection(parsed_args.samples),
+        compresslevel=parsed_args.compresslevel,
+        progress_callback=ProgressBar() if parsed_args.progress else None,
+        report=parsed_args.report,
+        on_error=parsed_args.on_error,
+        aggregate=parsed_args.aggregate,
+        groups=read_groups(parsed_args.groups),
     )
 
 
 def dispatch_plot_dbs(parsed_args: argparse.Namespace) -> None:
-    sigPlt.plotDBS(
-        matrix_path=parsed_args.matrix_path,
-        output_path=parsed_args.output_path,
+    run_plot(
+        sigPlt.plotDBS,
+        parsed_args,
+        in_memory=parsed_args.plot_type in IN_MEMORY_PLOT_TYPES["plotDBS"],
         project=parsed_args.project,
         plot_type=parsed_args.plot_type,
         percentage=parsed_args.percentage,
@@ -211,31 +548,91 @@ def dispatch_plot_dbs(parsed_args: argparse.Namespace) -> None:
         savefig_format=parsed_args.savefig_format,
         volume=parsed_args.volume,
         dpi=parsed_args.dpi,
+        cache=parsed_args.cache,
+        append=parsed_args.append,
+        samples=sample_selection(parsed_args.samples),
+        compresslevel=parsed_args.compresslevel,
+        progress_callback=ProgressBar() if parsed_args.progress else None,
+        report=parsed_args.report,
+        on_error=parsed_args.on_error,
+        aggregate=parsed_args.aggregate,
+        groups=read_groups(parsed_args.groups),
     )
 
 
 def dispatch_plot_sv(parsed_args: argparse.Namespace) -> None:
-    sigPlt.plotSV(
-        matrix_path=parsed_args.matrix_path,
-        output_path=parsed_args.output_path,
+    run_plot(
+        sigPlt.plotSV,
+        parsed_args,
         project=parsed_args.project,
         percentage=parsed_args.percentage,
         aggregate=parsed_args.aggregate,
         savefig_format=parsed_args.savefig_format,
         dpi=parsed_args.dpi,
+        cache=parsed_args.cache,
+        append=parsed_args.append,
+        samples=sample_selection(parsed_args.samples),
+        compresslevel=parsed_args.compresslevel,
+        progress_callback=ProgressBar() if parsed_args.progress else None,
+        report=parsed_args.report,
+        on_error=parsed_args.on_error,
     )
 
 
 def dispatch_plot_cnv(parsed_args: argparse.Namespace) -> None:
-    sigPlt.plotCNV(
-        matrix_path=parsed_args.matrix_path,
-        output_path=parsed_args.output_path,
+    run_plot(
+        sigPlt.plotCNV,
+        parsed_args,
         project=parsed_args.project,
         percentage=parsed_args.percentage,
         aggregate=parsed_args.aggregate,
-        read_from_file=parsed_args.read_from_file,
+        read_from_file=parsed_args.read_from_file and parsed_args.matrix_path != "-",
         savefig_format=parsed_args.savefig_format,
         dpi=parsed_args.dpi,
+        cache=parsed_args.cache,
+        append=parsed_args.append,
+        samples=sample_selection(parsed_args.samples),
+        compresslevel=parsed_args.compresslevel,
+        progress_callback=ProgressBar() if parsed_args.progress else None,
+        report=parsed_args.report,
+        on_error=parsed_args.on_error,
+    )
+
+
+def dispatch_batch(parsed_args: argparse.Namespace) -> None:
+    jobs = batch.load_jobs(parsed_args.manifest)
+    # interrupting the batch cancels it, so that the summary is still written
+    cancel = CancellationToken()
+    handlers = {
+        signum: signal.signal(signum, lambda signum, frame: cancel.cancel())
+        for signum in (signal.SIGINT, signal.SIGTERM)
+    }
+    try:
+        summary = batch.run_batch(
+            jobs,
+            workers=parsed_args.workers,
+            sample_timeout=parsed_args.sample_timeout,
+            cancel=cancel,
+        )
+    finally:
+        for signum, handler in handlers.items():
+            signal.signal(signum, handler)
+    if parsed_args.summary:
+        with open(parsed_args.summary, "w") as f:
+            json.dump(summary, f, indent=2)
+    else:
+        print(json.dumps(summary, indent=2))
+    if summary["failed"] or summary["cancelled"]:
+        sys.exit(1)
+
+
+def dispatch_serve(parsed_args: argparse.Namespace) -> None:
+    server.serve(
+        host=parsed_args.host,
+        port=parsed_args.port,
+        socket_path=parsed_args.socket,
+        workers=parsed_args.workers,
+        max_queue=parsed_args.max_queue,
     )
 
 
@@ -256,14 +653,18 @@ class CliController:
         elif "plotCNV" in user_args:
             parsed_args = parse_arguments_cnv(user_args[1:])
             dispatch_plot_cnv(parsed_args)
+        elif "batch" in user_args:
+            parsed_args = parse_arguments_batch(user_args[1:])
+            dispatch_batch(parsed_args)
+        elif "serve" in user_args:
+            parsed_args = parse_arguments_serve(user_args[1:])
+            dispatch_serve(parsed_args)
         else:
             print(
-                "Unknown command. Available commands: plotSBS, plotID, plotDBS, plotSV, plotCNV."
+                "Unknown command. Available commands: plotSBS, plotID, plotDBS, plotSV, plotCNV, batch, serve."
             )
 
 
 if __name__ == "__main__":
-    import sys
-
     controller = CliController()
     controller.dispatch(sys.argv)
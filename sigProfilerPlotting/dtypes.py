@@ -0,0 +1,119 @@
+import numpy as np
+import pandas as pd
+
+# Integer dtypes of the counts, from the narrowest
+COMPACT_INTS = (np.dtype(np.int8), np.dtype(np.int16), np.dtype(np.int32))
+
+# Size of the int64 or float64 counts that read_counts parses at a time
+CHUNK_BYTES = 64 * 2**20
+
+
+def compact_dtypes(data):
+    """Returns the narrowest dtype of every column of data that holds its counts.
+
+    Integer columns get the narrowest of int8, int16 and int32 that holds their
+    lowest and highest count, and float64 columns float32 when all of their
+    counts keep their exact value. The other columns keep their dtype.
+    """
+    dtypes = list(data.dtypes)
+    for dtype in set(dtypes):
+        # sparse columns are not made dense to be compacted
+        if not isinstance(dtype, np.dtype) or not (
+            dtype.kind == "i" or dtype == np.float64
+        ):
+            continue
+        positions = [i for i, column in enumerate(data.dtypes) if column == dtype]
+        values = data.iloc[:, positions].to_numpy()
+        if dtype.kind == "i":
+            # the position in choices of the narrowest dtype of every column
+            choices = COMPACT_INTS + (dtype,)
+            narrowest = np.full(len(positions), len(COMPACT_INTS))
+            lows = values.min(axis=0, initial=0)
+            highs = values.max(axis=0, initial=0)
+            for i in reversed(range(len(COMPACT_INTS))):
+                info = np.iinfo(COMPACT_INTS[i])
+                narrowest[(info.min <= lows) & (highs <= info.max)] = i
+            for position, i in zip(positions, narrowest):
+                dtypes[position] = choices[i]
+        else:
+            with np.errstate(over="ignore"):
+                compact = values.astype(np.float32)
+            exact = ((compact == values) | np.isnan(values)).all(axis=0)
+            for i in np.flatnonzero(exact):
+                dtypes[positions[i]] = np.dtype(np.float32)
+    return dtypes
+
+
+def compact_counts(data, dtype="compact"):
+    """Returns a DataFrame of counts with a compact dtype.
+
+    Args:
+            data: DataFrame of counts with a column per sample.
+            dtype: "compact" stores every column of data in the narrowest dtype
+                    that holds its counts exactly (see compact_dtypes). None keeps
+                    the dtype of data, and any other dtype is used as given.
+    Returns:
+            DataFrame like data.
+    """
+    if dtype is None:
+        return data
+    if not (isinstance(dtype, str) and dtype == "compact"):
+        return data.astype(dtype)
+    dtypes = compact_dtypes(data)
+    if dtypes == list(data.dtypes):
+        return data
+    # the columns of every dtype are converted together, by position so that
+    # samples with the same name are kept apart
+    positions = {}
+    for position, compact in enumerate(dtypes):
+        positions.setdefault(compact, []).append(position)
+    blocks = [
+        data.iloc[:, columns].astype(compact) for compact, columns in positions.items()
+    ]
+    order = np.argsort(np.concatenate(list(positions.values())), kind="stable")
+    return pd.concat(blocks, axis=1).iloc[:, order]
+
+
+def read_counts(path, usecols=None, dtype="compact"):
+    """Reads a tab-separated matrix file of counts, with the channels as its index.
+
+    With "compact", the rows are parsed a few at a time and the counts of every
+    chunk are stored in their compact dtypes before the next chunk is parsed,
+    so that the int64 or float64 counts of the whole matrix are never held in
+    memory. Any other dtype is applied by compact_counts once the matrix is read.
+
+    Args:
+            path: Path of the matrix file.
+            usecols: The columns to read (see pd.read_csv), all by default.
+            dtype: The dtype argument of compact_counts.
+    Returns:
+            DataFrame with a column per sample.
+    """
+    if not (isinstance(dtype, str) and dtype == "compact"):
+        return pd.read_csv(path, sep="\t", index_col=0, usecols=usecols)
+    header = pd.read_csv(path, sep="\t", nrows=0, usecols=usecols).columns
+    rows = max(1, CHUNK_BYTES // (8 * max(len(header), 1)))
+    chunks = [
+        compact_counts(chunk)
+        for chunk in pd.read_csv(
+            path, sep="\t", index_col=0, usecols=usecols, chunksize=rows
+        )
+    ]
+    if len(chunks) == 1:
+        return chunks[0]
+    # the columns of chunks with different dtypes are widened by concat, and
+    # narrowed again if they can be
+    return compact_counts(pd.concat(chunks))
+
+
+def widened(values):
+    """Returns an array of counts as int64 or float64.
+
+    The counts of a sample are drawn and summed in these dtypes whatever the
+    dtype of the matrix, so that compact matrices are drawn the same.
+    """
+    if values.dtype.kind in "iu":
+        return values.astype(np.int64, copy=False)
+    if values.dtype.kind == "f":
+        return values.astype(np.float64, copy=False)
+    return values
@@ -0,0 +1,161 @@
+from collections import OrderedDict
+
+# Error policies of the plotting functions (the on_error argument)
+ON_ERROR = ("raise", "skip", "collect")
+
+
+class PlottingError(ValueError):
+    """Base class of the errors raised by the plotting functions."""
+
+
+class MatrixFormatError(PlottingError):
+    """The matrix does not match the format of the plot type."""
+
+
+class SampleSelectionError(PlottingError):
+    """The samples argument selects samples that are not in the matrix, or none."""
+
+
+class SampleError(PlottingError):
+    """A single sample of the matrix could not be plotted.
+
+    Attributes:
+            sample: Name of the sample.
+            error: The exception raised while the sample was read or plotted.
+    """
+
+    def __init__(self, sample, error):
+        self.sample = sample
+        self.error = error
+        super().__init__(f"ERROR: sample {sample} could not be plotted: {error}")
+
+
+class SampleTimeout(SampleError):
+    """Drawing a single sample took longer than the sample_timeout of the run."""
+
+    def __init__(self, sample, seconds):
+        self.seconds = seconds
+        super().__init__(sample, f"it took longer than {seconds} seconds")
+
+
+class RunCancelled(PlottingError):
+    """The run was cancelled through its CancellationToken.
+
+    The output of the samples drawn before the cancellation was written before
+    it was raised.
+
+    Attributes:
+            samples: The samples that were not drawn.
+            result: The return value of the plotting function.
+    """
+
+    def __init__(self, samples, result=None):
+        self.samples = samples
+        self.result = result
+        super().__init__(
+            f"ERROR: the run was cancelled before {len(samples)} samples were plotted."
+        )
+
+
+class SampleErrors(PlottingError):
+    """Samples of a run with on_error="collect" could not be plotted.
+
+    The output of all other samples was written before it was raised.
+
+    Attributes:
+            errors: Dictionary of the SampleError of every failed sample.
+            result: The return value of the plotting function (e.g. the images of
+                    PIL_Image output).
+    """
+
+    def __init__(self, errors, result=None):
+        self.errors = errors
+        self.result = result
+        super().__init__(
+            f"ERROR: {len(errors)} samples could not be plotted: "
+            + ", ".join(str(sample) for sample in errors)
+        )
+
+
+def check_on_error(on_error):
+    if on_error not in ON_ERROR:
+        raise ValueError("ERROR: on_error must be 'raise', 'skip', or 'collect'.")
+
+
+class ErrorPolicy:
+    """Applies the on_error policy of a plotting run to failed samples.
+
+    With "raise", the first failed sample raises a SampleError. With "skip" or
+    "collect", failed samples are reported (and recorded as errors in the run
+    report) and the run goes on with the next sample; "collect" raises a
+    SampleErrors once the output of the other samples is written.
+
+    The drawing of every sample is enclosed in start and stop, which apply the
+    time limit of the run and check its cancellation token. Samples that time
+    out are left out like failed samples whatever the policy, and only "skip"
+    does not raise them at the end. Once the run is cancelled, the remaining
+    samples are left out and finish raises RunCancelled.
+
+    Args:
+            on_error: "raise", "skip" or "collect".
+            progress: The PlotProgress of the run, if it is known yet.
+            sample_timeout: Time limit of every sample in seconds, or None.
+            cancel: The CancellationToken of the run, or None.
+    """
+
+    def __init__(
+        self, on_error="raise", progress=None, sample_timeout=None, cancel=None
+    ):
+        from sigProfilerPlotting.cancellation import SampleTimer
+
+        check_on_error(on_error)
+        self.on_error = on_error
+        self.progress = progress
+        self.errors = OrderedDict()
+        self.timer = SampleTimer(sample_timeout) if sample_timeout else None
+        self.cancel = cancel
+        self.cancelled = []
+
+    def __contains__(self, sample):
+        return sample in self.errors
+
+    def start(self, sample):
+        """Starts drawing a sample, unless the run was cancelled."""
+        if self.cancel is not None and self.cancel.cancelled:
+            raise RunCancelled([sample])
+        if self.timer is not None:
+            self.timer.start(sample)
+
+    def stop(self):
+        """Ends the time limit of the sample being drawn."""
+        if self.timer is not None:
+            self.timer.stop()
+
+    def failed(self, sample, error):
+        if self.timer is not None:
+            self.timer.cancel()
+        if isinstance(error, RunCancelled):
+            self.cancelled.append(sample)
+            if self.progress is not None:
+                self.progress(sample, "error", reason="cancelled")
+            return
+        if not isinstance(error, SampleError):
+            cause, error = error, SampleError(sample, error)
+            error.__cause__ = cause
+        if self.on_error == "raise" and not isinstance(error, SampleTimeout):
+            raise error
+        if sample in self.errors:
+            return
+        self.errors[sample] = error
+        print(str(error))
+        if self.progress is not None:
+            self.progress(sample, "error", reason=str(error.error))
+
+    def finish(self, result=None):
+        """Returns the result of the run, or raises the collected errors."""
+        if self.cancelled:
+            raise RunCancelled(self.cancelled, result)
+        # with "raise", only the samples that timed out are left to raise
+        if self.on_error != "skip" and self.errors:
+            raise SampleErrors(dict(self.errors), result)
+        return result
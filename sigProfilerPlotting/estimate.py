@@ -0,0 +1,213 @@
+import json
+import os
+
+import numpy as np
+import pandas as pd
+
+from sigProfilerPlotting.sparse import is_sparse_matrix
+from sigProfilerPlotting.version import short_version
+
+# Benchmark calibration data, written by tools/calibrate_estimates.py
+CALIBRATION_PATH = os.path.join(os.path.dirname(__file__), "calibration.json")
+
+# Output context of every plot_type of the plotting functions
+CONTEXTS = {
+    "plotSBS": {
+        "96": "SBS_96",
+        "288": "SBS_288",
+        "192": "SBS_384",
+        "96SB": "SBS_384",
+        "384": "SBS_384",
+        "192_extended": "SBS_384_extended",
+        "96SB_extended": "SBS_384_extended",
+        "384_extended": "SBS_384_extended",
+        "6": "SBS_6",
+        "12": "SBS_24",
+        "6SB": "SBS_24",
+        "24": "SBS_24",
+        "1536": "SBS_1536",
+        "4608": "SBS_4608",
+        "288_Normalized": "SBS_288_Normalized",
+        "6144": "SBS_6144",
+        "SBS6144": "SBS_6144",
+    },
+    "plotID": {
+        "94": "ID_83",
+        "ID94": "ID_83",
+        "94ID": "ID_83",
+        "83": "ID_83",
+        "INDEL_simple": "ID_simple",
+        "simple_INDEL": "ID_simple",
+        "ID_simple": "ID_simple",
+        "simple_ID": "ID_simple",
+        "28": "ID_simple",
+        "IDSB": "ID_TSB",
+        "415": "ID_TSB",
+        "ID96": "ID_96",
+        "332": "ID_332",
+        "ID332": "ID_332",
+        "8628": "ID_8628",
+        "ID8628": "ID_8628",
+    },
+    "plotDBS": {
+        "78": "DBS_78",
+        "78DBS": "DBS_78",
+        "DBS78": "DBS_78",
+        "312": "DBS_186",
+        "78SB": "DBS_186",
+        "SB78": "DBS_186",
+        "186": "DBS_186",
+        "1248": "DBS_1248",
+        "DBS1248": "DBS_1248",
+        "2400": "DBS_2400",
+        "DBS2400": "DBS_2400",
+        "2976": "DBS_2976",
+        "DBS2976": "DBS_2976",
+    },
+    "plotSV": {"32": "SV_32"},
+    "plotCNV": {"48": "CNV_48"},
+}
+
+# Calibrated output format of every savefig_format. The archive and PIL_Image
+# formats render the same pngs as png.
+CALIBRATED_FORMATS = {
+    "pdf": "pdf",
+    "pdf_per_sample": "pdf_per_sample",
+    "png": "png",
+    "png_zip": "png",
+    "png_tar": "png",
+    "pil_image": "png",
+}
+
+_CALIBRATION = None
+
+
+def load_calibration():
+    """Returns the benchmark calibration data shipped with the package."""
+    global _CALIBRATION
+    if _CALIBRATION is None:
+        with open(CALIBRATION_PATH) as f:
+            _CALIBRATION = json.load(f)
+    return _CALIBRATION
+
+
+def read_matrix_shape(matrix_path):
+    """Returns the sample names and the number of rows of a matrix.
+
+    Only the header of a matrix file is parsed; the rows are counted without
+    being split into columns.
+    """
+    if isinstance(matrix_path, pd.DataFrame):
+        samples = [sample for sample in matrix_path.columns if sample != "MutationType"]
+        return samples, matrix_path.shape[0]
+    if isinstance(matrix_path, np.ndarray) or is_sparse_matrix(matrix_path):
+        return list(range(matrix_path.shape[1])), matrix_path.shape[0]
+    if not isinstance(matrix_path, str):
+        raise ValueError(
+            "ERROR: matrix_path requires pd.DataFrame, path to file, np.ndarray or "
+            + f"scipy.sparse matrix, not {type(matrix_path)}."
+        )
+    rows = 0
+    with open(matrix_path, "rb") as f:
+        header = f.readline().decode("utf-8").rstrip("\r\n")
+        last = b"\n"
+        for block in iter(lambda: f.read(1 << 20), b""):
+            rows += block.count(b"\n")
+            last = block[-1:]
+    if last != b"\n":
+        rows += 1
+    separator = "\t" if "\t" in header else ","
+    samples = [sample.replace('"', "") for sample in header.split(separator)[1:]]
+    return samples, rows
+
+
+def estimate_run(
+    command,
+    matrix_path,
+    plot_type,
+    savefig_format="pdf",
+    dpi=100,
+    samples=None,
+    aggregate=False,
+    groups=None,
+):
+    """Estimates the output, memory and run time of a plotting run.
+
+    Only the header and the row count of the matrix are read. The estimate is
+    a linear model in the number of plotted samples, fitted to benchmarks of
+    every context and output format (see tools/calibrate_estimates.py). Png
+    output is modelled as a function of the pixel count, i.e. of dpi squared.
+
+    Args:
+            command: Name of the plotting function (plotSBS, plotID, plotDBS, plotSV
+                    or plotCNV).
+            matrix_path, plot_type, savefig_format, dpi, samples, aggregate,
+                    groups: The arguments of the plotting run.
+    Returns:
+            Dictionary with the context, the number of samples, pages and files,
+            and the expected output bytes, peak memory (bytes) and wall time
+            (seconds) of the run.
+    """
+    from sigProfilerPlotting.sigProfilerPlotting import select_samples
+
+    context = CONTEXTS.get(command, {}).get(str(plot_type))
+    calibration = load_calibration()
+    if context is None or context not in calibration["contexts"]:
+        raise ValueError(
+            "ERROR: there is no calibration data to estimate "
+            + command
+            + " with plot_type "
+            + str(plot_type)
+            + "."
+        )
+    formats = calibration["contexts"][context]
+    savefig_format = savefig_format.lower()
+    if savefig_format not in CALIBRATED_FORMATS:
+        raise ValueError(
+            "ERROR: savefig_format must be 'pdf', 'pdf_per_sample', 'png', 'png_zip', "
+            + "'png_tar', or 'PIL_Image'."
+        )
+    output_format = CALIBRATED_FORMATS[savefig_format]
+    # the plot types drawn directly from matrix files only write a pdf
+    if output_format not in formats:
+        savefig_format = output_format = "pdf"
+    model = formats[output_format]
+
+    names, rows = read_matrix_shape(matrix_path)
+    selected = select_samples(names, samples)
+    n_samples = len(selected)
+    pages = n_samples
+    if aggregate and groups is not None:
+        groups = pd.Series(groups)
+        pages = groups[groups.index.isin(selected)].nunique()
+    elif aggregate:
+        pages = 1
+    if savefig_format in ("pdf", "png_zip", "png_tar"):
+        files = 1
+    elif savefig_format == "pil_image":
+        files = 0
+    else:
+        files = pages
+
+    scale = (dpi / calibration["dpi"]) ** 2 if output_format == "png" else 1
+
+    def predict(name):
+        fixed, per_sample, per_pixel = model[name]
+        return fixed + pages * (per_sample + per_pixel * scale)
+
+    return {
+        "command": command,
+        "context": context,
+        "plot_type": str(plot_type),
+        "savefig_format": savefig_format,
+        "dpi": dpi,
+        "rows": rows,
+        "samples": n_samples,
+        "pages": pages,
+        "files": files,
+        "output_bytes": 0 if files == 0 else int(predict("bytes")),
+        "peak_memory_bytes": int(predict("memory")),
+        "wall_time_seconds": round(predict("seconds"), 2),
+        "calibration_version": calibration["version"],
+        "version": short_version,
+    }
@@ -0,0 +1,582 @@
+import functools
+import itertools
+import re
+from dataclasses import dataclass
+
+import matplotlib.pyplot as plt
+import numpy as np
+from matplotlib.collections import PolyCollection
+from matplotlib.colors import ListedColormap
+from matplotlib.font_manager import FontProperties
+from matplotlib.textpath import text_to_path
+from matplotlib.ticker import MaxNLocator
+from matplotlib.transforms import blended_transform_factory
+
+from sigProfilerPlotting.contexts import get_context_spec, read_only, read_reference
+
+# Context drawn by the heatmap plots of every plot_type of the plotting functions
+HEATMAP_PLOT_TYPES = {
+    "plotSBS": {"6144": "SBS6144", "SBS6144": "SBS6144"},
+    "plotID": {
+        "ID96": "ID96",
+        "332": "ID332",
+        "ID332": "ID332",
+        "8628": "ID8628",
+        "ID8628": "ID8628",
+    },
+    "plotDBS": {
+        "1248": "DBS1248",
+        "DBS1248": "DBS1248",
+        "2400": "DBS2400",
+        "DBS2400": "DBS2400",
+        "2976": "DBS2976",
+        "DBS2976": "DBS2976",
+    },
+}
+
+# Count unit and axis label of the mutations of every mutation type
+MUTATION_TYPES = {
+    "SBS": ("subs", "Single Base Substitutions"),
+    "DBS": ("double subs", "Double Base Substitutions"),
+    "ID": ("indels", "Indels"),
+}
+
+# Smallest font size of the labels of the plots. The rows and columns of a
+# heatmap that are too narrow for it are labelled by group, and narrow groups
+# share a label or are left out.
+MIN_FONTSIZE = 6
+
+# Height of a line of text and the margin around a group label, relative to
+# the font size
+LINE_HEIGHT = 1.2
+LABEL_MARGIN = 1
+
+_HEATMAP_LAYOUTS = {}
+
+
+@dataclass(frozen=True)
+class HeatmapLayout:
+    """Layout of the plots of a high-dimensional context.
+
+    A sample is drawn as the bars of its counts collapsed to a smaller context
+    (e.g. SBS6144 to SBS96) above a heatmap of all of its channels. The arrays
+    map every channel of the context, in the order of its reference format, to
+    its bar and its heatmap cell, so that the counts of a sample are collapsed
+    and laid out without a loop over the channels.
+
+    Attributes:
+            name: Name of the context (e.g. "SBS6144").
+            mutation_type: "SBS", "DBS" or "ID".
+            labels: The channels of the context, in reference format order.
+            spec: ContextSpec of the collapsed context drawn as bars.
+            marginal_index: Array with the bar of every channel in spec.labels.
+            rows, columns: Labels of the rows and columns of the heatmap, which
+                    are empty for the contexts drawn as bars only.
+            row_index, column_index: Arrays with the heatmap cell of every channel.
+            row_groups, column_groups: (group, start, stop) of the runs of rows
+                    and columns that are separated by lines in the heatmap. Without
+                    groups, all rows (or columns) are a single group None.
+            column_labels: Tick label of every column.
+    """
+
+    name: str
+    mutation_type: str
+    labels: tuple
+    spec: object
+    marginal_index: np.ndarray
+    rows: tuple
+    columns: tuple
+    row_index: np.ndarray
+    column_index: np.ndarray
+    row_groups: tuple
+    column_groups: tuple
+    column_labels: tuple
+
+    def collapse(self, counts):
+        """Returns the counts of the channels of spec, summed over a sample."""
+        return np.bincount(
+            self.marginal_index, weights=counts, minlength=len(self.spec.labels)
+        )
+
+    def grid(self, counts):
+        """Returns the counts of a sample as a heatmap, with Nans in empty cells."""
+        grid = np.full((len(self.rows), len(self.columns)), np.nan)
+        grid[self.row_index, self.column_index] = counts
+        return grid
+
+    def row_totals(self, counts):
+        return np.bincount(self.row_index, weights=counts, minlength=len(self.rows))
+
+
+def group_runs(labels, group_of):
+    groups = []
+    start = 0
+    for group, run in itertools.groupby(labels, group_of):
+        stop = start + len(list(run))
+        groups.append((group, start, stop))
+        start = stop
+    return tuple(groups)
+
+
+def positions(values, order):
+    index = {value: i for i, value in enumerate(order)}
+    return read_only(np.array([index[value] for value in values], dtype=np.intp))
+
+
+def make_heatmap_layout(
+    name,
+    spec_name,
+    marginal_of,
+    cell_of=None,
+    row_group_of=None,
+    column_group_of=None,
+    columns=None,
+    column_label_of=str,
+):
+    """Builds the HeatmapLayout of a context.
+
+    Args:
+            name: Name of the context, whose channels are read from its reference
+                    format.
+            spec_name: Name of the collapsed context drawn as bars.
+            marginal_of: Function returning the channel of spec_name a channel is
+                    collapsed to.
+            cell_of: Function returning the (row, column) of a channel in the
+                    heatmap, or None to draw the bars only.
+            row_group_of, column_group_of: Functions returning the group of a row
+                    or column. By default, all rows (or columns) are one group.
+            columns: The columns of the heatmap in the order they are drawn. By
+                    default, the order in which they first appear in the channels.
+            column_label_of: Function returning the tick label of a column.
+    """
+    labels = tuple(read_reference(name + ".txt"))
+    spec = get_context_spec(spec_name)
+    rows = ()
+    row_index = column_index = read_only(np.zeros(0, dtype=np.intp))
+    row_groups = column_groups = ()
+    if cell_of is not None:
+        cells = [cell_of(label) for label in labels]
+        rows = tuple(dict.fromkeys(row for row, _ in cells))
+        if columns is None:
+            columns = dict.fromkeys(column for _, column in cells)
+        columns = tuple(columns)
+        row_index = positions([row for row, _ in cells], rows)
+        column_index = positions([column for _, column in cells], columns)
+        row_groups = group_runs(rows, row_group_of or (lambda row: None))
+        column_groups = group_runs(columns, column_group_of or (lambda column: None))
+    return HeatmapLayout(
+        name=name,
+        mutation_type=name.rstrip("0123456789"),
+        labels=labels,
+        spec=spec,
+        marginal_index=positions([marginal_of(label) for label in labels], spec.labels),
+        rows=rows,
+        columns=tuple(columns or ()),
+        row_index=row_index,
+        column_index=column_index,
+        row_groups=row_groups,
+        column_groups=column_groups,
+        column_labels=tuple(column_label_of(column) for column in columns or ()),
+    )
+
+
+def sbs_channel(label):
+    # e.g. "T:AC[C>A]GT": strand, 5' flanks, substitution and 3' flanks
+    strand, channel = label.split(":")
+    return strand, channel[:2], channel[2:7], channel[7:]
+
+
+def dbs_channel(label):
+    # e.g. "T:A[CC>AA]C", or "A[CC>AA]C" without a strand
+    strand, _, channel = label.rpartition(":")
+    return strand, channel[0], channel[2:7], channel[-1]
+
+
+def dbs_row(label):
+    strand, five, _, three = dbs_channel(label)
+    flanks = five + ".." + three
+    return strand + ":" + flanks if strand else flanks
+
+
+def id8628_marginal(label):
+    # the repeats of every motif collapse to the repeat channels of ID83
+    size, indel, motif, repeats = label.split(":")
+    if size != "1":
+        motif = "R"
+    return ":".join([size, indel, motif, repeats])
+
+
+def build_heatmap_layout(name):
+    if name == "SBS6144":
+        return make_heatmap_layout(
+            name,
+            "SBS96",
+            lambda label: "".join(sbs_channel(label)[1:])[1:-1],
+            lambda label: (
+                sbs_channel(label)[0] + ":" + sbs_channel(label)[1],
+                sbs_channel(label)[2][1:-1] + ":" + sbs_channel(label)[3],
+            ),
+            lambda row: row.split(":")[0],
+            lambda column: column.split(":")[0],
+            column_label_of=lambda column: column.split(":")[1],
+        )
+    if name in ("DBS1248", "DBS2400", "DBS2976"):
+        spec = get_context_spec("DBS78")
+        return make_heatmap_layout(
+            name,
+            "DBS78",
+            lambda label: dbs_channel(label)[2],
+            lambda label: (dbs_row(label), dbs_channel(label)[2]),
+            (lambda row: row.split(":")[0]) if name != "DBS1248" else None,
+            lambda column: column[:2],
+            spec.labels,
+            lambda column: column[3:],
+        )
+    if name == "ID332":
+        return make_heatmap_layout(
+            name,
+            "ID83",
+            lambda label: label[2:],
+            lambda label: (label[0], label[2:]),
+            column_group_of=lambda column: "".join(column.split(":")[:3]),
+            columns=get_context_spec("ID83").labels,
+            column_label_of=lambda column: column.split(":")[-1],
+        )
+    if name == "ID8628":
+        return make_heatmap_layout(
+            name,
+            "ID83",
+            id8628_marginal,
+            lambda label: (
+                ":".join(label.split(":")[1::2]),
+                ":".join(label.split(":")[0::2][:2]),
+            ),
+            lambda row: row.split(":")[0],
+            lambda column: column.split(":")[0] + "bp",
+            column_label_of=lambda column: column.split(":")[1],
+        )
+    if name == "ID96":
+        return make_heatmap_layout(name, "ID96", lambda label: label)
+    raise ValueError("ERROR: there is no heatmap layout for the context " + name + ".")
+
+
+def get_heatmap_layout(name):
+    """Returns the HeatmapLayout of a context, e.g. "SBS6144" or "ID8628".
+
+    Layouts are available for SBS6144, ID96, ID332, ID8628, DBS1248, DBS2400 and
+    DBS2976. They are built once per process.
+    """
+    if name not in _HEATMAP_LAYOUTS:
+        _HEATMAP_LAYOUTS[name] = build_heatmap_layout(name)
+    return _HEATMAP_LAYOUTS[name]
+
+
+def style_axes(ax):
+    for spine in ax.spines.values():
+        spine.set_color("lightgray")
+    ax.tick_params(colors="black", length=0)
+
+
+def axes_points(ax):
+    """Returns the width and height of ax in points."""
+    width, height = ax.figure.get_size_inches() * 72
+    position = ax.get_position()
+    return position.width * width, position.height * height
+
+
+@functools.lru_cache(maxsize=None)
+def label_width(label):
+    """Returns the width of a bold label at font size 1, in points."""
+    prop = FontProperties(size=100, weight="bold")
+    return text_to_path.get_text_width_height_descent(label, prop, False)[0] / 100
+
+
+def fit_fontsize(label, width, fontsize):
+    """Returns the largest font size up to fontsize at which label fits width.
+
+    Returns None if the label does not fit at MIN_FONTSIZE.
+    """
+    fontsize = min(fontsize, width / (label_width(label) + LABEL_MARGIN))
+    return fontsize if fontsize >= MIN_FONTSIZE else None
+
+
+def fit_group_labels(groups, pitch, fontsize):
+    """Returns the (label, center, fontsize) of the groups whose labels fit.
+
+    Consecutive groups whose labels do not fit at fontsize and only differ by
+    their numbers share a label (e.g. "2-3DelM" for 2DelM and 3DelM). Labels
+    that do not fit at fontsize are drawn smaller, down to MIN_FONTSIZE, and
+    otherwise left out.
+
+    Args:
+            groups: (label, start, stop) of runs of channels, rows or columns.
+            pitch: Width of a channel, row or column, in points.
+            fontsize: Largest font size of the labels.
+    """
+    fitted = []
+    narrow = []
+
+    def add(label, start, stop):
+        size = fit_fontsize(label, (stop - start) * pitch, fontsize)
+        if size is not None:
+            fitted.append((label, (start + stop - 1) / 2, size))
+
+    def add_narrow():
+        if len(narrow) > 1:
+            label = re.match(r"\d*", narrow[0][0]).group() + "-" + narrow[-1][0]
+            add(label, narrow[0][1], narrow[-1][2])
+        elif narrow:
+            add(*narrow[0])
+        narrow.clear()
+
+    for label, start, stop in groups:
+        if label is None:
+            continue
+        label = str(label)
+        if fit_fontsize(label, (stop - start) * pitch, fontsize) == fontsize:
+            add_narrow()
+            add(label, start, stop)
+            continue
+        if narrow and (
+            not re.match(r"\d", label)
+            or re.sub(r"\d+", "", label) != re.sub(r"\d+", "", narrow[0][0])
+        ):
+            add_narrow()
+        narrow.append((label, start, stop))
+    add_narrow()
+    return fitted
+
+
+def is_dark(color):
+    r, g, b = color[:3]
+    return 0.299 * r + 0.587 * g + 0.114 * b < 0.5
+
+
+def label_axis(ax, axis, positions, labels, fontsize, rotation=0, weight="normal"):
+    """Labels the x or y axis of ax with a text at every position.
+
+    The labels are plain texts of the figure rather than ticks, which
+    matplotlib builds from several artists each, and are not clipped to the
+    axes, which keeps plots with many labels fast.
+    """
+    if axis == "x":
+        ax.set_xticks([])
+        transform = blended_transform_factory(ax.transData, ax.transAxes)
+        place = dict(x=0, y=-0.01, ha="center", va="top")
+    else:
+        ax.set_yticks([])
+        transform = blended_transform_factory(ax.transAxes, ax.transData)
+        place = dict(x=-0.005, y=0, ha="right", va="center")
+    for position, label in zip(positions, labels):
+        place["x" if axis == "x" else "y"] = position
+        ax.figure.text(
+            s=label,
+            transform=transform,
+            fontsize=fontsize,
+            rotation=rotation,
+            weight=weight,
+            color="black",
+            **place,
+        )
+
+
+def bar_collection(ax, heights, width, colors, horizontal=False):
+    """Draws bars of the given heights at 0, 1, 2... as a single collection."""
+    starts = np.arange(len(heights)) - width / 2
+    stops = starts + width
+    zeros = np.zeros(len(heights))
+    if horizontal:
+        corners = [(zeros, starts), (heights, starts), (heights, stops), (zeros, stops)]
+    else:
+        corners = [(starts, zeros), (starts, heights), (stops, heights), (stops, zeros)]
+    vertices = np.stack([np.column_stack(corner) for corner in corners], axis=1)
+    ax.add_collection(
+        PolyCollection(vertices, facecolors=colors, edgecolors="none", zorder=1000)
+    )
+
+
+def draw_class_band(fig, rect, spec):
+    band = fig.add_axes(rect)
+    classes = np.array([spec.color_index[label] for label in spec.labels])
+    band.imshow(
+        classes[np.newaxis],
+        cmap=ListedColormap(spec.palette),
+        vmin=-0.5,
+        vmax=len(spec.palette) - 0.5,
+        aspect="auto",
+        interpolation="nearest",
+        extent=(-0.5, len(classes) - 0.5, 0, 1),
+    )
+    pitch = axes_points(band)[0] / len(classes)
+    for group, center, fontsize in fit_group_labels(spec.groups, pitch, 12):
+        color = spec.palette[classes[int(center)]]
+        band.text(
+            center,
+            0.5,
+            group,
+            ha="center",
+            va="center",
+            fontsize=fontsize,
+            weight="bold",
+            color="white" if is_dark(color) else "black",
+        )
+    band.set_axis_off()
+
+
+def draw_heatmap_panels(fig, rect, layout, counts, percentage):
+    left, bottom, width, height = rect
+    heat = fig.add_axes([left, bottom, width * 0.86, height])
+    side = fig.add_axes([left + width * 0.875, bottom, width * 0.1, height])
+    colorbar = fig.add_axes([left + width * 0.99, bottom, width * 0.01, height])
+
+    grid = layout.grid(counts)
+    vmax = np.nanmax(grid)
+    cmap = plt.get_cmap("Blues").with_extremes(bad="white")
+    image = heat.imshow(
+        grid,
+        cmap=cmap,
+        vmin=0,
+        vmax=vmax if vmax > 0 else 1,
+        aspect="auto",
+        interpolation="nearest",
+    )
+    fig.colorbar(
+        image, cax=colorbar, ticks=None if percentage else MaxNLocator(integer=True)
+    )
+    colorbar.set_ylabel("Percentage" if percentage else "Count", fontsize=12)
+
+    n_rows, n_columns = grid.shape
+    heat.hlines(
+        [start - 0.5 for _, start, _ in layout.row_groups[1:]],
+        -0.5,
+        n_columns - 0.5,
+        color="black",
+        linewidth=1,
+    )
+    heat.vlines(
+        [start - 0.5 for _, start, _ in layout.column_groups[1:]],
+        -0.5,
+        n_rows - 0.5,
+        color="black",
+        linewidth=1,
+    )
+    width, height = axes_points(heat)
+    row_fontsize = min(12, height / n_rows / LINE_HEIGHT)
+    if row_fontsize >= MIN_FONTSIZE:
+        label_axis(heat, "y", range(n_rows), layout.rows, row_fontsize)
+    else:
+        for group, center, fontsize in fit_group_labels(
+            layout.row_groups, height / n_rows, 12
+        ):
+            label_axis(heat, "y", [center], [group], fontsize)
+    column_groups = []
+    if 1 < len(layout.column_groups) < n_columns:
+        column_groups = fit_group_labels(layout.column_groups, width / n_columns, 12)
+    column_fontsize = min(8, width / n_columns / LINE_HEIGHT)
+    if column_fontsize >= MIN_FONTSIZE:
+        label_axis(
+            heat, "x", range(n_columns), layout.column_labels, column_fontsize, 90
+        )
+        for group, center, fontsize in column_groups:
+            heat.text(
+                center,
+                -0.6,
+                group,
+                ha="center",
+                va="bottom",
+                fontsize=fontsize,
+                weight="bold",
+            )
+    else:
+        for group, center, fontsize in column_groups:
+            label_axis(heat, "x", [center], [group], fontsize, weight="bold")
+    style_axes(heat)
+
+    bar_collection(side, layout.row_totals(counts), 0.8, "gray", horizontal=True)
+    side.set_xlim(0, max(layout.row_totals(counts).max() * 1.05, 1))
+    side.set_ylim(heat.get_ylim())
+    side.set_yticks([])
+    side.set_xlabel("Total", fontsize=12)
+    side.xaxis.grid(True, color=[0.93, 0.93, 0.93])
+    style_axes(side)
+
+
+def draw_heatmap(layout, sample, counts, percentage=False, texts=()):
+    """Draws the plot of a sample of a high-dimensional context.
+
+    The figure has the bars of the counts collapsed to layout.spec and, below,
+    a heatmap of all channels with the totals of its rows on the side. The
+    heatmap is a single image and the bars are single collections, so the
+    time to draw a sample hardly depends on the number of channels.
+
+    Args:
+            layout: HeatmapLayout of the context.
+            sample: Name of the sample.
+            counts: Counts of the sample, in the order of layout.labels.
+            percentage: Draw the counts as percentages of the total of the sample.
+            texts: Custom lines of text drawn at the top right of the plot.
+    Returns:
+            The matplotlib figure.
+    """
+    counts = np.asarray(counts, dtype=float)
+    total = counts.sum()
+    if percentage and total > 0:
+        counts = counts / total * 100
+    unit, description = MUTATION_TYPES[layout.mutation_type]
+    spec = layout.spec
+    n_bars = len(spec.labels)
+
+    if layout.rows:
+        fig = plt.figure(figsize=(20, 11))
+        bars_rect = [0.05, 0.56, 0.9 * 0.86, 0.3]
+        band_rect = [0.05, 0.87, 0.9 * 0.86, 0.025]
+        title_y = 0.925
+    else:
+        fig = plt.figure(figsize=(20, 6))
+        bars_rect = [0.05, 0.15, 0.9, 0.62]
+        band_rect = [0.05, 0.79, 0.9, 0.05]
+        title_y = 0.88
+
+    draw_class_band(fig, band_rect, spec)
+    bars = fig.add_axes(bars_rect)
+    marginal = layout.collapse(counts)
+    bar_collection(bars, marginal, 0.6, spec.colors)
+    bars.set_xlim(-0.5, n_bars - 0.5)
+    bars.set_ylim(0, marginal.max() * 1.1 if marginal.max() > 0 else 1)
+    label_axis(bars, "x", range(n_bars), spec.xlabels, 8, 90)
+    bars.yaxis.grid(True, color=[0.93, 0.93, 0.93], zorder=1)
+    if not percentage:
+        bars.yaxis.set_major_locator(MaxNLocator(integer=True))
+    bars.set_ylabel(
+        ("Percentage of " if percentage else "Number of ") + description,
+        fontsize=14,
+        weight="bold",
+    )
+    style_axes(bars)
+
+    if layout.rows:
+        draw_heatmap_panels(fig, [0.05, 0.06, 0.9, 0.42], layout, counts, percentage)
+
+    title = sample
+    if not percentage:
+        title += ": " + "{:,}".format(int(total)) + " " + unit
+    fig.text(
+        0.05,
+        title_y,
+        title,
+        fontsize=26,
+        weight="bold",
+        color="black",
+        fontname="Arial",
+    )
+    fig.text(
+        band_rect[0] + band_rect[2],
+        title_y,
+        "\n".join([layout.name] + [text for text in texts if text]),
+        fontsize=18,
+        weight="bold",
+        color="black",
+        ha="right",
+        va="bottom",
+    )
+    return fig
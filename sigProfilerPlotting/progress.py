@@ -0,0 +1,77 @@
+import sys
+import time
+
+from sigProfilerPlotting.report import current_report
+
+
+class PlotProgress:
+    """Reports the samples of a plotting run as they are completed.
+
+    A sample is complete once its page or file is written, or when it is
+    skipped (e.g. because it is already in the render cache or in the pdf an
+    append run adds to). Samples reported more than once are counted once.
+    The samples are also recorded in the report of the run, if it writes one.
+
+    Args:
+            progress_callback: Called as progress_callback(done, total, sample,
+                    elapsed) after every completed sample, where elapsed is the
+                    number of seconds since the start of the run. May be None.
+            samples: The samples of the run.
+    """
+
+    def __init__(self, progress_callback, samples):
+        samples = list(samples)
+        self.progress_callback = progress_callback
+        self.total = len(samples)
+        self.done = 0
+        self.reported = set()
+        self.start = time.time()
+        self.report = current_report()
+        if self.report is not None:
+            self.report.expect(samples)
+
+    def __call__(self, sample, status="rendered", path=None, size=None, reason=None):
+        if self.report is not None:
+            self.report.record(sample, status, path=path, size=size, reason=reason)
+        if sample in self.reported:
+            return
+        self.reported.add(sample)
+        self.done += 1
+        if self.progress_callback is not None:
+            self.progress_callback(
+                self.done, self.total, sample, time.time() - self.start
+            )
+
+
+class ProgressBar:
+    """A progress_callback that draws a progress bar with throughput and ETA.
+
+    Args:
+            stream: Text stream of the progress bar (default: stderr).
+            width: Number of characters of the bar.
+    """
+
+    def __init__(self, stream=None, width=30):
+        self.stream = stream or sys.stderr
+        self.width = width
+        self.rate = 0.0
+        self.eta = None
+
+    def __call__(self, done, total, sample, elapsed):
+        # samples per second, and the seconds left at that rate
+        self.rate = done / elapsed if elapsed > 0 else 0.0
+        self.eta = (total - done) / self.rate if self.rate > 0 else None
+        filled = int(self.width * done / total) if total else self.width
+        eta = (
+            time.strftime("%H:%M:%S", time.gmtime(self.eta))
+            if self.eta is not None
+            else "--:--:--"
+        )
+        line = (
+            f"[{'#' * filled}{' ' * (self.width - filled)}] {done}/{total} "
+            + f"{self.rate:.2f} samples/s ETA {eta} {sample}"
+        )
+        self.stream.write("\r" + line[:80].ljust(80))
+        if done >= total:
+            self.stream.write("\n")
+        self.stream.flush()
@@ -0,0 +1,121 @@
+import hashlib
+import os
+import tempfile
+
+import numpy as np
+
+from sigProfilerPlotting.version import short_version
+
+# Default size limit of the cache directory (2 GB)
+DEFAULT_MAX_SIZE = 2 * 1024**3
+
+
+class RenderCache:
+    """A local directory of rendered plots keyed by the content that produced them.
+
+    Every rendered sample is stored under a hash of its count vector, the
+    sample name, the plot context, the plotting options, the output format,
+    the dpi and the package version. Re-plotting an unchanged sample copies
+    the stored bytes instead of drawing the figure again. When the directory
+    grows beyond max_size, the least recently used entries are removed.
+
+    Args:
+            cache_dir: Directory holding the cached plots.
+            max_size: Size limit of the cache directory in bytes. Defaults to
+                    the SIGPROFILERPLOTTING_CACHE_SIZE environmental variable or 2 GB.
+    """
+
+    # Output formats that are rendered one file per sample and can be cached
+    FORMATS = {"png": "png", "pil_image": "png", "pdf_per_sample": "pdf"}
+
+    def __init__(self, cache_dir, max_size=None):
+        if max_size is None:
+            max_size = int(
+                os.getenv("SIGPROFILERPLOTTING_CACHE_SIZE", DEFAULT_MAX_SIZE)
+            )
+        self.cache_dir = cache_dir
+        self.max_size = max_size
+        os.makedirs(cache_dir, exist_ok=True)
+
+    def key(
+        self,
+        counts,
+        sample,
+        context_type,
+        savefig_format,
+        dpi,
+        percentage=False,
+        custom_text=None,
+        scaling=None,
+    ):
+        """Returns the cache key of a single sample plot.
+
+        scaling is the dict of axis overrides of the sample, if it has any.
+        """
+        ext = self.FORMATS[savefig_format.lower()]
+        digest = hashlib.sha256()
+        header = [short_version, context_type, ext, str(dpi), str(bool(percentage))]
+        header += [str(text) for text in (custom_text or ())]
+        if scaling:
+            header.append(str(sorted(scaling.items())))
+        header.append(str(sample))
+        digest.update("\0".join(header).encode("utf-8"))
+        digest.update(np.ascontiguousarray(counts, dtype=np.float64).tobytes())
+        return digest.hexdigest() + "." + ext
+
+    def _path(self, key):
+        return os.path.join(self.cache_dir, key[:2], key)
+
+    def contains(self, key):
+        """Checks for a cached plot and marks it as recently used."""
+        try:
+            os.utime(self._path(key))
+            return True
+        except OSError:
+            return False
+
+    def get(self, key):
+        """Returns the bytes of a cached plot or None if it is not cached."""
+        try:
+            with open(self._path(key), "rb") as f:
+                data = f.read()
+        except OSError:
+            return None
+        os.utime(self._path(key))
+        return data
+
+    def put(self, key, data):
+        """Stores the bytes of a rendered plot."""
+        path = self._path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        # write to a temporary file first so that concurrent runs never read
+        # a partially written plot
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+
+    def evict(self):
+        """Removes the least recently used plots until the cache fits max_size."""
+        entries = []
+        total = 0
+        for shard in os.scandir(self.cache_dir):
+            if not shard.is_dir():
+                continue
+            for entry in os.scandir(shard.path):
+                if entry.name.endswith(".tmp"):
+                    continue
+                stat = entry.stat()
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+                total += stat.st_size
+        if total <= self.max_size:
+            return
+        entries.sort()
+        for _, size, path in entries:
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            total -= size
+            if total <= self.max_size:
+                break
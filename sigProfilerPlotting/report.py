@@ -0,0 +1,190 @@
+import contextvars
+import datetime
+import functools
+import hashlib
+import inspect
+import json
+import os
+import time
+
+import numpy as np
+import pandas as pd
+
+from sigProfilerPlotting.version import short_version
+
+# The RunReport of the plotting run in progress, if it writes a report
+_CURRENT_REPORT = contextvars.ContextVar("current_report", default=None)
+
+
+def current_report():
+    return _CURRENT_REPORT.get()
+
+
+def input_checksum(matrix_path):
+    """Returns the sha256 checksum and size in bytes of the input matrix."""
+    digest = hashlib.sha256()
+    if isinstance(matrix_path, str):
+        size = 0
+        with open(matrix_path, "rb") as f:
+            for block in iter(lambda: f.read(1 << 20), b""):
+                digest.update(block)
+                size += len(block)
+        return digest.hexdigest(), size
+    if isinstance(matrix_path, pd.DataFrame):
+        digest.update("\t".join(map(str, matrix_path.columns)).encode("utf-8"))
+        data = pd.util.hash_pandas_object(matrix_path, index=True).values
+    elif isinstance(matrix_path, np.ndarray):
+        data = np.ascontiguousarray(matrix_path)
+    else:
+        return None, None
+    digest.update(data.tobytes())
+    return digest.hexdigest(), None
+
+
+class RunReport:
+    """Collects what happened to every sample of a plotting run.
+
+    Samples are reported by sigProfilerPlotting.progress.PlotProgress as they
+    are written ("rendered") or skipped ("skipped"). Samples that were never
+    reported, or whose output was removed again, have the status "error".
+    """
+
+    def __init__(self, command, matrix_path, arguments):
+        self.command = command
+        self.matrix_path = matrix_path
+        self.arguments = arguments
+        self.samples = {}
+        self.errors = []
+        self.start = time.time()
+        self.last = self.start
+
+    def expect(self, samples):
+        for sample in samples:
+            self.samples.setdefault(str(sample), {"status": "error"})
+
+    def record(self, sample, status, path=None, size=None, reason=None):
+        now = time.time()
+        entry = self.samples.setdefault(str(sample), {})
+        if entry.get("status") not in ("rendered", "skipped"):
+            entry["status"] = status
+            entry["elapsed"] = round(now - self.start, 4)
+            entry["seconds"] = round(now - self.last, 4)
+            self.last = now
+            if reason is not None:
+                entry["reason"] = reason
+        if path is not None:
+            entry["path"] = path
+        if size is not None:
+            entry["bytes"] = size
+
+    def to_dict(self, error=None):
+        if error is not None:
+            self.errors.append(error)
+        sha256, size = input_checksum(self.matrix_path)
+
+        # samples sharing an output file (e.g. the pages of a pdf) have no
+        # byte size of their own
+        paths = {}
+        for entry in self.samples.values():
+            if "path" in entry:
+                paths[entry["path"]] = paths.get(entry["path"], 0) + 1
+        outputs = [
+            {"path": path, "bytes": os.path.getsize(path)}
+            for path in paths
+            if os.path.isfile(path)
+        ]
+        for sample, entry in self.samples.items():
+            path = entry.get("path")
+            if path is not None and not os.path.isfile(path):
+                # the branch removed its output after an error
+                entry["status"] = "error"
+            elif (
+                entry["status"] == "rendered"
+                and path is not None
+                and paths[path] == 1
+                and "bytes" not in entry
+            ):
+                entry["bytes"] = os.path.getsize(path)
+            if entry["status"] == "error" and self.errors:
+                entry.setdefault("error", self.errors[-1])
+
+        counts = {"rendered": 0, "skipped": 0, "error": 0}
+        for entry in self.samples.values():
+            counts[entry["status"]] += 1
+        return {
+            "command": self.command,
+            "version": short_version,
+            "status": "error" if self.errors or counts["error"] else "ok",
+            "errors": self.errors,
+            "started": datetime.datetime.fromtimestamp(self.start).isoformat(),
+            "elapsed": round(time.time() - self.start, 4),
+            "input": {
+                "matrix_path": (
+                    self.matrix_path
+                    if isinstance(self.matrix_path, str)
+                    else type(self.matrix_path).__name__
+                ),
+                "sha256": sha256,
+                "bytes": size,
+            },
+            "arguments": self.arguments,
+            "counts": counts,
+            "samples": self.samples,
+            "outputs": outputs,
+        }
+
+    def write(self, report_path, error=None):
+        """Writes the report as json, through a temporary file."""
+        tmp_path = report_path + ".tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(self.to_dict(error), f, indent=2)
+        os.replace(tmp_path, report_path)
+
+
+def reported_run(plot_function):
+    """Adds the report argument to a plotting function.
+
+    With report set to a file path, a RunReport of the run is written to that
+    path as json once the run ends, also when it ends with an exception or
+    sys.exit. Lazy runs, which return before any sample is drawn, cannot be
+    reported.
+    """
+
+    signature = inspect.signature(plot_function)
+
+    @functools.wraps(plot_function)
+    def wrapper(*args, report=None, **kwargs):
+        if report is None or kwargs.get("dry_run"):
+            return plot_function(*args, **kwargs)
+        arguments = signature.bind(*args, **kwargs)
+        arguments.apply_defaults()
+        arguments = dict(arguments.arguments)
+        if arguments.get("lazy"):
+            # a lazy run returns before any sample is drawn
+            raise ValueError("ERROR: report cannot be used with lazy.")
+        matrix_path = arguments.pop("matrix_path")
+        run_report = RunReport(
+            plot_function.__name__,
+            matrix_path,
+            {
+                name: value
+                for name, value in arguments.items()
+                if value is None or isinstance(value, (str, int, float, bool))
+            },
+        )
+        token = _CURRENT_REPORT.set(run_report)
+        try:
+            result = plot_function(*args, **kwargs)
+        except (Exception, SystemExit) as e:
+            run_report.write(report, error=str(e) or type(e).__name__)
+            raise
+        finally:
+            _CURRENT_REPORT.reset(token)
+        run_report.write(report)
+        return result
+
+    wrapper.__signature__ = signature.replace(
+        parameters=list(signature.parameters.values())
+        + [inspect.Parameter("report", inspect.Parameter.KEYWORD_ONLY, default=None)]
+    )
+    return wrapper
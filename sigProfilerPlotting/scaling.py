@@ -0,0 +1,189 @@
+import numpy as np
+import pandas as pd
+
+from sigProfilerPlotting.dtypes import widened
+from sigProfilerPlotting.sparse import is_sparse_frame
+
+# How the y axis of every context is scaled from its highest bar (ymax):
+# "fit" ends the axis at ymax / 1.025 with a tick every third of it, and
+# "rounded" rounds 1.25 * ymax up to a multiple of four with four ticks
+AXIS_SCALING = {
+    "SBS96": "fit",
+    "SBS288": "fit",
+    "ID83": "rounded",
+    "DBS78": "rounded",
+}
+
+# Strands of the strand panel of the SBS288 plots
+STRANDS = ("T", "U", "N")
+
+# Columns of the statistics that can be overridden through the scaling
+# argument of the plotting functions
+SCALING_COLUMNS = ("ylim", "yticks", "ylabels", "strand_ticks", "strand_labels")
+
+
+def numeric_values(data):
+    """Returns the counts of data as an int64 or float64 array.
+
+    Unreadable counts are Nans.
+    """
+    if (data.dtypes == object).any():
+        data = data.apply(pd.to_numeric, errors="coerce")
+    return widened(data.to_numpy())
+
+
+def column_totals(values):
+    # summed like np.sum over a single column, so that the totals are the
+    # same as the ones of a sample plotted on its own
+    return np.ascontiguousarray(values.T).sum(axis=1)
+
+
+def sparse_statistics(data):
+    """Returns the totals and highest counts of the samples of a sparse DataFrame.
+
+    The statistics are reduced from the stored counts of every column, without
+    making the matrix dense.
+    """
+    return data.sum().to_numpy(), data.max().to_numpy()
+
+
+def normalize_counts(data):
+    """Returns the counts of every sample as percentages of its total.
+
+    Args:
+            data: DataFrame of counts with a column per sample.
+    Returns:
+            DataFrame like data (sparse if data is). The columns of samples
+            without mutations are Nans.
+    """
+    if is_sparse_frame(data):
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return data / data.sum() * 100
+    values = numeric_values(data)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        normalized = values / column_totals(values) * 100
+    return pd.DataFrame(normalized, index=data.index, columns=data.columns)
+
+
+def format_labels(ticks, percentage, formatter):
+    if percentage:
+        return [str(ticks[0])] + [str(tick) + "%" for tick in ticks[1:]]
+    return formatter(list(ticks))
+
+
+def axis_ticks(ylim, scaling, percentage, factor=1.25):
+    """Computes the axis limits and tick offsets of an array of highest bars.
+
+    Returns:
+            The axis limits and the offsets between ticks, as arrays.
+    """
+    if scaling == "fit":
+        ylim = ylim / 1.025
+        return ylim, ylim / 3
+    with np.errstate(invalid="ignore"):
+        ylim = np.trunc(ylim * factor)
+        ylim = np.where(ylim <= 4, ylim + 4, ylim)
+        ylim = np.ceil(ylim / 4) * 4
+    return ylim, ylim // 4
+
+
+def tick_layout(offset, scaling, percentage, formatter):
+    """Returns the tick positions and labels of a single axis."""
+    if not np.isfinite(offset):
+        return None, None
+    offset = float(offset) if scaling == "fit" else int(offset)
+    ticks = [0] + [offset * i for i in range(1, 5)]
+    if percentage:
+        ticks = [0] + [round(tick, 1) for tick in ticks[1:]]
+    return tuple(ticks), tuple(format_labels(ticks, percentage, formatter))
+
+
+def cohort_statistics(data, context, percentage=False, strands=None, ymax=None):
+    """Computes the totals and axis scaling of all samples of a matrix at once.
+
+    The plotting functions compute these statistics before drawing the first
+    sample, and draw every sample from its row.
+
+    Args:
+            data: DataFrame of counts with a column per sample, in plot order.
+            context: "SBS96", "SBS288", "ID83" or "DBS78".
+            percentage: Whether the counts are plotted as percentages of the total
+                    of every sample.
+            strands: The strand matrices of an SBS288 matrix, as returned by
+                    reindex_sbs288, for the statistics of the strand panel.
+            ymax: Highest bar of the y axis of every sample, a number or a Series
+                    indexed by sample, e.g. to draw all samples on the same axis.
+                    By default, the highest bar of every sample.
+    Returns:
+            DataFrame indexed by sample with the total of every sample, its ymax
+            and the limit (ylim), tick positions (yticks) and tick labels (ylabels)
+            of its y axis. With strands, it also holds the totals of every strand
+            (T, U and N) and the ticks of the strand panel (strand_ticks and
+            strand_labels).
+    """
+    from sigProfilerPlotting.sigProfilerPlotting import getxlabels, getylabels
+
+    scaling = AXIS_SCALING[context]
+    if is_sparse_frame(data):
+        totals, maxima = sparse_statistics(data)
+    else:
+        values = numeric_values(data)
+        totals = column_totals(values)
+        maxima = None
+    with np.errstate(divide="ignore", invalid="ignore"):
+        if ymax is None and maxima is not None:
+            ymax = maxima / totals * 100 if percentage else maxima
+            if percentage:
+                ymax = np.where(totals > 0, ymax, 0)
+        elif ymax is None:
+            if percentage:
+                ymax = np.max(values / totals * 100, axis=0, initial=0)
+                ymax = np.where(totals > 0, ymax, 0)
+            else:
+                ymax = np.max(values, axis=0, initial=0)
+        elif isinstance(ymax, pd.Series):
+            ymax = ymax.reindex(data.columns).to_numpy(dtype=float)
+        else:
+            ymax = np.full(len(data.columns), ymax, dtype=float)
+    ylim, offsets = axis_ticks(ymax, scaling, percentage)
+    stats = pd.DataFrame(
+        {"total": totals, "ymax": ymax, "ylim": ylim}, index=data.columns
+    )
+    ticks = [tick_layout(o, scaling, percentage, getylabels) for o in offsets]
+    stats["yticks"] = [yticks for yticks, _ in ticks]
+    stats["ylabels"] = [ylabels for _, ylabels in ticks]
+
+    if strands is not None:
+        strand_totals = np.array(
+            [numeric_values(strands[strand].loc[["All"]])[0] for strand in STRANDS]
+        )
+        strand_max = strand_totals.max(axis=0)
+        if percentage:
+            with np.errstate(divide="ignore", invalid="ignore"):
+                strand_max = np.where(totals > 0, strand_max / totals * 100, 0)
+        _, offsets = axis_ticks(strand_max, "rounded", percentage, 1.1)
+        for strand, strand_total in zip(STRANDS, strand_totals):
+            stats[strand] = strand_total
+        ticks = [tick_layout(o, "rounded", percentage, getxlabels) for o in offsets]
+        stats["strand_ticks"] = [xticks for xticks, _ in ticks]
+        stats["strand_labels"] = [xlabels for _, xlabels in ticks]
+    return stats
+
+
+def sample_scaling(stats, sample, scaling=None):
+    """Returns the statistics of a sample, with the overrides of scaling.
+
+    Args:
+            stats: The cohort_statistics of the matrix.
+            sample: Name of the sample.
+            scaling: DataFrame indexed by sample with the ylim, yticks, ylabels,
+                    strand_ticks or strand_labels to draw instead, or None.
+    """
+    row = stats.loc[sample].to_dict()
+    if scaling is not None and sample in scaling.index:
+        for column, value in scaling.loc[sample].items():
+            if column in SCALING_COLUMNS and not (
+                np.isscalar(value) and pd.isna(value)
+            ):
+                row[column] = value
+    return row
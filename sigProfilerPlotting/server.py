@@ -0,0 +1,315 @@
+import base64
+import json
+import os
+import signal
+import socketserver
+import stat
+import tempfile
+import threading
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from sigProfilerPlotting import sigProfilerPlotting as spp
+from sigProfilerPlotting.batch import PLOT_FUNCTIONS
+
+# Number of recent requests used for the latency statistics
+LATENCY_WINDOW = 1000
+
+# Keyword arguments of the plotting functions that a request may set. The
+# arguments that name files or directories (output_path, volume, cache, archive,
+# report, ...) are left out, so that requests only write to their own
+# temporary directory.
+REQUEST_ARGUMENTS = frozenset(
+    [
+        "project",
+        "plot_type",
+        "percentage",
+        "custom_text_upper",
+        "custom_text_middle",
+        "custom_text_bottom",
+        "savefig_format",
+        "dpi",
+        "samples",
+        "compresslevel",
+        "on_error",
+        "sample_timeout",
+        "scaling",
+        "aggregate",
+        "groups",
+    ]
+)
+
+
+class ServerBusy(Exception):
+    """Raised when the render queue of the server is full."""
+
+
+def warm_up():
+    """Loads the fonts, plot templates and reference formats of a worker process."""
+    # interrupts are handled by the server, which shuts the workers down
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    signal.signal(signal.SIGTERM, signal.SIG_DFL)
+    spp.load_custom_fonts()
+    for plot_type in spp.type_dict:
+        spp.get_context_reference(plot_type)
+    for context in ("SBS96", "SBS288", "ID83", "DBS78"):
+        spp.make_pickle_file(context=context, return_plot_template=True)
+    spp.clear_plotting_memory()
+
+
+def ping():
+    return os.getpid()
+
+
+def check_request(request):
+    """Returns the plotting command, matrix and keyword arguments of a request.
+
+    Raises:
+            ValueError: if the request is not a json object with a known command and
+                    a matrix, or sets an argument outside of REQUEST_ARGUMENTS.
+    """
+    if not isinstance(request, dict):
+        raise ValueError("ERROR: a request must be a json object.")
+    kwargs = dict(request)
+    command = kwargs.pop("command", None)
+    matrix = kwargs.pop("matrix", None)
+    if command not in PLOT_FUNCTIONS or not isinstance(matrix, str):
+        raise ValueError(
+            "ERROR: a request requires a command in "
+            + ", ".join(PLOT_FUNCTIONS)
+            + " and a matrix."
+        )
+    unknown = sorted(set(kwargs) - REQUEST_ARGUMENTS)
+    if unknown:
+        raise ValueError("ERROR: requests cannot set " + ", ".join(unknown) + ".")
+    return command, matrix, kwargs
+
+
+def render(request):
+    """Renders the plots of a request in a worker process.
+
+    Args:
+            request: Mapping with the plotting "command", the "matrix" as tab separated
+                    text, an optional "project" and the keyword arguments of the
+                    plotting function in REQUEST_ARGUMENTS (plot_type, percentage,
+                    savefig_format, dpi, ...).
+    Returns:
+            Dictionary of the rendered files, keyed by file name.
+    """
+    command, matrix, kwargs = check_request(request)
+    kwargs.setdefault("project", "plot")
+    kwargs.setdefault("savefig_format", "png")
+    if kwargs["savefig_format"].lower() == "pil_image":
+        raise ValueError("ERROR: requests cannot return PIL_Image output.")
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        kwargs["matrix_path"] = os.path.join(tmp_dir, "matrix.all")
+        kwargs["output_path"] = os.path.join(tmp_dir, "output") + os.sep
+        with open(kwargs["matrix_path"], "w") as f:
+            f.write(matrix)
+        PLOT_FUNCTIONS[command](**kwargs)
+        files = {}
+        if os.path.isdir(kwargs["output_path"]):
+            for name in sorted(os.listdir(kwargs["output_path"])):
+                with open(os.path.join(kwargs["output_path"], name), "rb") as f:
+                    files[name] = f.read()
+    if not files:
+        raise ValueError("ERROR: no plots were generated for this matrix.")
+    return files
+
+
+class PlotServer:
+    """A pool of warm worker processes that render plots on demand.
+
+    Args:
+            workers: Number of worker processes, i.e. the number of concurrent renders.
+            max_queue: Number of requests that may wait for a free worker. Further
+                    requests are rejected with ServerBusy.
+    """
+
+    def __init__(self, workers=2, max_queue=16):
+        self.workers = workers
+        self.max_queue = max_queue
+        self.executor = ProcessPoolExecutor(max_workers=workers, initializer=warm_up)
+        # start every worker now, so that the first requests do not pay for it
+        for future in [self.executor.submit(ping) for _ in range(workers)]:
+            future.result()
+        self.slots = threading.BoundedSemaphore(workers + max_queue)
+        self.lock = threading.Lock()
+        self.pending = 0
+        self.requests = 0
+        self.errors = 0
+        self.rejected = 0
+        self.latencies = deque(maxlen=LATENCY_WINDOW)
+        self.started = time.time()
+
+    def render(self, request):
+        """Renders a request in the worker pool and returns its files."""
+        check_request(request)
+        if not self.slots.acquire(blocking=False):
+            with self.lock:
+                self.rejected += 1
+            raise ServerBusy("ERROR: the render queue is full.")
+        start = time.time()
+        with self.lock:
+            self.pending += 1
+        try:
+            return self.executor.submit(render, request).result()
+        except Exception:
+            with self.lock:
+                self.errors += 1
+            raise
+        finally:
+            with self.lock:
+                self.pending -= 1
+                self.requests += 1
+                self.latencies.append(time.time() - start)
+            self.slots.release()
+
+    def health(self):
+        """Returns the state and latency statistics of the server."""
+        with self.lock:
+            latencies = sorted(self.latencies)
+            stats = {
+                "status": "ok",
+                "workers": self.workers,
+                "max_queue": self.max_queue,
+                "in_flight": min(self.pending, self.workers),
+                "queued": max(self.pending - self.workers, 0),
+                "requests": self.requests,
+                "errors": self.errors,
+                "rejected": self.rejected,
+                "uptime": round(time.time() - self.started, 3),
+            }
+        if latencies:
+            stats["latency"] = {
+                "mean": round(sum(latencies) / len(latencies), 4),
+                "p50": round(latencies[int(0.5 * (len(latencies) - 1))], 4),
+                "p95": round(latencies[int(0.95 * (len(latencies) - 1))], 4),
+                "max": round(latencies[-1], 4),
+            }
+        return stats
+
+    def shutdown(self):
+        self.executor.shutdown()
+
+
+class PlotRequestHandler(BaseHTTPRequestHandler):
+    """Serves GET /health and POST /plot with a json request (see render).
+
+    Requests to /plot must have an application/json Content-Type.
+
+    The response of /plot is a json mapping of file names to base64 encoded files.
+    """
+
+    def address_string(self):
+        # requests over a unix socket have no client address
+        return str(self.client_address[0]) if self.client_address else "unix"
+
+    def send_json(self, status, body):
+        data = json.dumps(body).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def do_GET(self):
+        if self.path == "/health":
+            self.send_json(200, self.server.plot_server.health())
+        else:
+            self.send_json(404, {"error": "ERROR: unknown path " + self.path})
+
+    def do_POST(self):
+        if self.path != "/plot":
+            self.send_json(404, {"error": "ERROR: unknown path " + self.path})
+            return
+        # a json content type cannot be sent by a form of a web page without a
+        # CORS preflight, which the server does not answer
+        content_type = self.headers.get("Content-Type", "")
+        if content_type.split(";")[0].strip().lower() != "application/json":
+            self.send_json(
+                415, {"error": "ERROR: requests must be sent as application/json."}
+            )
+            return
+        try:
+            length = int(self.headers.get("Content-Length", 0))
+            request = json.loads(self.rfile.read(length))
+            files = self.server.plot_server.render(request)
+        except ServerBusy as e:
+            self.send_json(503, {"error": str(e)})
+        except Exception as e:
+            self.send_json(400, {"error": str(e)})
+        else:
+            self.send_json(
+                200,
+                {
+                    "files": {
+                        name: base64.b64encode(data).decode("ascii")
+                        for name, data in files.items()
+                    }
+                },
+            )
+
+    def log_message(self, format, *args):
+        pass
+
+
+class ThreadingUnixHTTPServer(
+    socketserver.ThreadingMixIn, socketserver.UnixStreamServer
+):
+    daemon_threads = True
+
+
+def is_socket(path):
+    """Returns whether path is a unix socket (and not e.g. a regular file)."""
+    try:
+        return stat.S_ISSOCK(os.lstat(path).st_mode)
+    except FileNotFoundError:
+        return False
+
+
+def serve(host="127.0.0.1", port=8000, socket_path=None, workers=2, max_queue=16):
+    """Runs the render server until it is interrupted.
+
+    Args:
+            host: Address of the http server. Only used without socket_path.
+            port: Port of the http server. Only used without socket_path.
+            socket_path: Path of a unix socket to serve on instead of http over tcp.
+                    The socket of a previous server at this path is replaced, but
+                    any other file raises a ValueError.
+            workers: Number of worker processes.
+            max_queue: Number of requests that may wait for a free worker.
+    """
+    if socket_path and os.path.lexists(socket_path):
+        # only the socket of a previous server is replaced, never another file
+        if not is_socket(socket_path):
+            raise ValueError(
+                "ERROR: " + socket_path + " already exists and is not a unix socket."
+            )
+        os.remove(socket_path)
+    plot_server = PlotServer(workers=workers, max_queue=max_queue)
+    if socket_path:
+        httpd = ThreadingUnixHTTPServer(socket_path, PlotRequestHandler)
+        print("Serving plots on unix socket " + socket_path)
+    else:
+        httpd = ThreadingHTTPServer((host, port), PlotRequestHandler)
+        print("Serving plots on http://" + host + ":" + str(httpd.server_address[1]))
+    httpd.plot_server = plot_server
+
+    # stop on SIGTERM the same way as on an interrupt
+    def stop(signum, frame):
+        raise KeyboardInterrupt
+
+    signal.signal(signal.SIGTERM, stop)
+    try:
+        httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        httpd.server_close()
+        plot_server.shutdown()
+        if socket_path and is_socket(socket_path):
+            os.remove(socket_path)
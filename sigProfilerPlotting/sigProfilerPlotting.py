@@ -7,6 +7,7 @@
 import argparse
 import copy
 import errno
+import fnmatch
 import io
 import itertools
 import logging
@@ -14,7 +15,6 @@ import os
 import pickle
 import re
 import string
-import sys
 import warnings
 from bdb import set_trace
 from collections import OrderedDict
@@ -32,9 +32,45 @@ import sklearn
 from matplotlib.backends.backend_pdf import PdfPages
 from matplotlib.ticker import LinearLocator
 from PIL import Image
-from sklearn.preprocessing import LabelEncoder
 
 import sigProfilerPlotting as spplt
+from sigProfilerPlotting.aggregate import aggregate_matrix, check_aggregate
+from sigProfilerPlotting.archive import (
+    PNG_ARCHIVE_FORMATS,
+    png_archive_path,
+    read_png_archive_index,
+    write_png_archive,
+)
+from sigProfilerPlotting.cancellation import check_sample_timeout
+from sigProfilerPlotting.contexts import get_context_spec
+from sigProfilerPlotting.dtypes import compact_counts, read_counts, widened
+from sigProfilerPlotting.errors import (
+    ErrorPolicy,
+    MatrixFormatError,
+    PlottingError,
+    SampleSelectionError,
+    check_on_error,
+)
+from sigProfilerPlotting.estimate import estimate_run
+from sigProfilerPlotting.heatmaps import (
+    HEATMAP_PLOT_TYPES,
+    draw_heatmap,
+    get_heatmap_layout,
+)
+from sigProfilerPlotting.progress import PlotProgress
+from sigProfilerPlotting.render_cache import RenderCache
+from sigProfilerPlotting.report import reported_run
+from sigProfilerPlotting.scaling import (
+    cohort_statistics,
+    normalize_counts,
+    sample_scaling,
+)
+from sigProfilerPlotting.sparse import (
+    is_sparse_matrix,
+    sample_counts,
+    sparse_frame,
+    zero_filled,
+)
 
 matplotlib.use("Agg")
 
@@ -47,6 +83,16 @@ SPP_REFERENCE = os.path.join(SPP_PATH, "reference_formats/")
 
 _FONTS_LOADED = False
 
+# Plot templates read in this process, keyed by path, so that repeated plots
+# (e.g. the jobs of a batch) do not read the template files again
+_TEMPLATES = {}
+
+# Reference formats read in this process, keyed by reference file
+_REFERENCES = {}
+
+# pdf metadata entry listing the sample of every page, used to append to a pdf
+PDF_SAMPLES_KEY = "SigProfilerPlottingSamples"
+
 logging.getLogger("matplotlib.font_manager").disabled = False
 warnings.filterwarnings("ignore")
 
@@ -60,6 +106,12 @@ type_dict = {
     "1536": "SBS1536.txt",
     "sbs6144": "SBS6144.txt",
     "6144": "SBS6144.txt",
+    "1248": "DBS1248.txt",
+    "dbs1248": "DBS1248.txt",
+    "2400": "DBS2400.txt",
+    "dbs2400": "DBS2400.txt",
+    "2976": "DBS2976.txt",
+    "dbs2976": "DBS2976.txt",
     "78": "DBS78.txt",
     "dbs": "DBS78.txt",
     "dbs78": "DBS78.txt",
@@ -67,6 +119,11 @@ type_dict = {
     "83": "ID83.txt",
     "id": "ID83.txt",
     "id83": "ID83.txt",
+    "id96": "ID96.txt",
+    "332": "ID332.txt",
+    "id332": "ID332.txt",
+    "8628": "ID8628.txt",
+    "id8628": "ID8628.txt",
     "cnv48": "CNV48.txt",
     "48": "CNV48.txt",
     "sv32": "SV32.txt",
@@ -101,51 +158,439 @@ def clear_plotting_memory():
         matplotlib.pyplot.close(fig)
 
 
+# Renders a figure to the bytes of the file that output_results would write
+def render_figure(fig, savefig_format, context_type, dpi=100):
+    tmp_buffer = io.BytesIO()
+    if context_type in ("CNV_48", "SV_32"):
+        fig.savefig(tmp_buffer, format=savefig_format, bbox_inches="tight", dpi=dpi)
+    else:
+        fig.savefig(tmp_buffer, format=savefig_format, dpi=dpi)
+    return tmp_buffer.getvalue()
+
+
+# Renders the figure of a sample like render_figure, within the time limit and
+# cancellation token of the run's ErrorPolicy. Returns None when the sample
+# failed or the run was cancelled, in which case it is left out of the output.
+def render_sample_figure(errors, sample, fig, savefig_format, context_type, dpi=100):
+    if errors is None:
+        return render_figure(fig, savefig_format, context_type, dpi)
+    try:
+        errors.start(sample)
+        data = render_figure(fig, savefig_format, context_type, dpi)
+        errors.stop()
+    except Exception as e:
+        errors.failed(sample, e)
+        return None
+    return data
+
+
+# Writes the bytes of an output file through a temporary file, so that readers
+# never see a partially written file
+def write_output_file(file_path, data):
+    tmp_path = file_path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(data)
+    os.replace(tmp_path, file_path)
+
+
+# Returns the RenderCache for the cache argument of the plotting functions,
+# which is either None, a cache directory or a RenderCache
+def get_render_cache(cache):
+    if cache is None or isinstance(cache, RenderCache):
+        return cache
+    return RenderCache(cache)
+
+
+# Computes the render cache key of every sample (column) in data and collects
+# the samples that are already cached, so that only the remaining samples are
+# drawn. Returns (None, set()) when no cache is used or the output format is
+# not cached.
+def lookup_render_cache(
+    cache,
+    data,
+    context_type,
+    savefig_format,
+    dpi=100,
+    percentage=False,
+    custom_text_upper=None,
+    custom_text_middle=None,
+    custom_text_bottom=None,
+    scaling=None,
+):
+    if cache is None or savefig_format.lower() not in RenderCache.FORMATS:
+        return None, set()
+
+    def custom_text(texts, sample_count):
+        try:
+            return texts[sample_count]
+        except:
+            return None
+
+    cache_keys = OrderedDict()
+    cached = set()
+    for sample_count, sample in enumerate(data.columns):
+        cache_keys[sample] = cache.key(
+            sample_counts(data, sample),
+            sample,
+            context_type,
+            savefig_format,
+            dpi,
+            percentage=percentage,
+            custom_text=[
+                custom_text(custom_text_upper, sample_count),
+                custom_text(custom_text_middle, sample_count),
+                custom_text(custom_text_bottom, sample_count),
+            ],
+            scaling=(
+                scaling.loc[sample].to_dict()
+                if scaling is not None and sample in scaling.index
+                else None
+            ),
+        )
+        if cache.contains(cache_keys[sample]):
+            cached.add(sample)
+    return cache_keys, cached
+
+
+# Imports pypdf, which is only required to append to an existing pdf
+def import_pypdf():
+    try:
+        import pypdf
+    except ImportError:
+        raise ImportError(
+            "ERROR: appending to a pdf requires pypdf. Please install it with "
+            + "'pip install pypdf'."
+        )
+    return pypdf
+
+
+# Returns the samples of the pages of a pdf written by output_results
+def read_pdf_samples(file_path):
+    pypdf = import_pypdf()
+    metadata = pypdf.PdfReader(file_path).metadata or {}
+    samples = metadata.get("/" + PDF_SAMPLES_KEY)
+    if samples is None:
+        raise ValueError(
+            "ERROR: "
+            + file_path
+            + " does not list the samples of its pages and cannot be appended to. "
+            + "Please regenerate it without append once."
+        )
+    return samples.split("\t") if samples else []
+
+
+# Returns the samples that already have a page in the pdf, or a png in the
+# archive, that an append run adds to. These samples are not drawn again
+# unless append is "replace".
+def lookup_appended_samples(
+    append, savefig_format, output_path, project, context_type
+):
+    if not append or append == "replace":
+        return set()
+    if savefig_format.lower() in PNG_ARCHIVE_FORMATS:
+        return set(
+            read_png_archive_index(
+                png_archive_path(output_path, project, context_type, savefig_format)
+            )
+        )
+    if savefig_format.lower() != "pdf":
+        return set()
+    file_path = os.path.join(output_path, f"{context_type}_plots_{project}.pdf")
+    if not os.path.exists(file_path):
+        return set()
+    return set(read_pdf_samples(file_path))
+
+
+# Closes and removes the pdf of a run that failed. The pdf is closed first,
+# so that its file is not left open; an open file cannot be removed on Windows.
+def discard_pdf(pp, pdf_path):
+    try:
+        pp.close()
+    except Exception:
+        # the pages are discarded whatever state the pdf was left in
+        pass
+    if os.path.isfile(pdf_path):
+        os.remove(pdf_path)
+
+
+# Raises a ValueError when append is used with a plot type that is drawn
+# straight from the matrix file to a new pdf, which would overwrite the pages
+# that the run was meant to keep
+def check_append(command, plot_type, append):
+    from sigProfilerPlotting.streaming import PER_SAMPLE_PLOT_TYPES
+
+    if append and str(plot_type) not in PER_SAMPLE_PLOT_TYPES[command]:
+        raise ValueError(
+            "ERROR: "
+            + command
+            + " cannot append plot_type "
+            + str(plot_type)
+            + " to existing output. Use one of "
+            + ", ".join(PER_SAMPLE_PLOT_TYPES[command])
+            + "."
+        )
+
+
+# Saves the figures as pdf pages to a file or buffer, recording the sample of
+# every page in the pdf metadata
+def save_pdf_pages(file_path, figs, context_type, progress=None):
+    progress = progress or PlotProgress(None, figs)
+    pp = PdfPages(file_path)
+    # set in the info dictionary rather than through metadata, which only
+    # accepts the standard pdf keys without a warning
+    pp.infodict()[PDF_SAMPLES_KEY] = "\t".join(map(str, figs))
+    for fig in figs:
+        if context_type in ("CNV_48", "SV_32"):
+            figs[fig].savefig(pp, format="pdf", bbox_inches="tight")
+        else:
+            figs[fig].savefig(pp, format="pdf")
+        progress(fig, path=file_path if isinstance(file_path, str) else None)
+    pp.close()
+
+
+# Adds the figures to an existing pdf. The pages already in the file are
+# copied as they are, without being redrawn. The page of a sample that is
+# already in the pdf is replaced in place.
+def append_pdf_results(file_path, figs, context_type, progress=None):
+    if not figs:
+        return
+    pypdf = import_pypdf()
+    samples = read_pdf_samples(file_path)
+    pages = {sample: i for i, sample in enumerate(samples)}
+
+    new_pdf = io.BytesIO()
+    save_pdf_pages(new_pdf, figs, context_type, progress)
+    new_pages = pypdf.PdfReader(new_pdf).pages
+
+    writer = pypdf.PdfWriter(clone_from=file_path)
+    for sample, page in zip(map(str, figs), new_pages):
+        if sample in pages:
+            writer.insert_page(page, pages[sample])
+            writer.remove_page(pages[sample] + 1)
+        else:
+            pages[sample] = len(samples)
+            samples.append(sample)
+            writer.add_page(page)
+    writer.add_metadata({"/" + PDF_SAMPLES_KEY: "\t".join(samples)})
+
+    # write next to the original first so that an interrupted run never
+    # leaves a truncated pdf behind
+    tmp_path = file_path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        writer.write(f)
+    os.replace(tmp_path, file_path)
+
+
+# Adds the figures to a PlotArchive under the file names output_results would
+# write them to
+def archive_results(
+    archive,
+    savefig_format,
+    project,
+    figs,
+    context_type,
+    dpi=100,
+    progress=None,
+    errors=None,
+):
+    progress = progress or PlotProgress(None, figs)
+    if savefig_format.lower() == "pdf":
+        pdf = io.BytesIO()
+        save_pdf_pages(pdf, figs, context_type, progress)
+        archive.add(f"{context_type}_plots_{project}.pdf", pdf.getvalue())
+    elif savefig_format.lower() in ("png", "pdf_per_sample"):
+        ext = "png" if savefig_format.lower() == "png" else "pdf"
+        for fig in figs:
+            data = render_sample_figure(errors, fig, figs[fig], ext, context_type, dpi)
+            if data is None:
+                continue
+            archive.add(f"{context_type}_plots_{fig}.{ext}", data)
+            progress(fig, size=len(data))
+    else:
+        raise ValueError(
+            "ERROR: savefig_format must be 'pdf', 'pdf_per_sample', or 'png' when "
+            + "writing to an archive."
+        )
+    clear_plotting_memory()
+    return None
+
+
 # Saves figures to files, unless savefig_format is "PIL_Image", in which case
-# the figures are saved to a dictionary of buffers
-def output_results(savefig_format, output_path, project, figs, context_type, dpi=100):
+# the figures are saved to a dictionary of buffers. When cache_keys is given,
+# samples without a figure are copied from the render cache and newly drawn
+# samples are added to it. With append, pdf pages are added to an existing
+# file instead of overwriting it. With archive, the files are added to the
+# PlotArchive instead of output_path. png_zip and png_tar write all pngs to one
+# indexed archive in output_path, which append adds to. Every written sample
+# is reported to progress. With errors, the ErrorPolicy of the run, every
+# sample written to its own file is rendered within the time limit of the run
+# (pdf pages are not).
+def output_results(
+    savefig_format,
+    output_path,
+    project,
+    figs,
+    context_type,
+    dpi=100,
+    cache=None,
+    cache_keys=None,
+    append=False,
+    archive=None,
+    compresslevel=None,
+    progress=None,
+    errors=None,
+):
+    progress = progress or PlotProgress(None, figs)
+    if cache_keys is not None:
+        return output_cached_results(
+            savefig_format,
+            output_path,
+            figs,
+            context_type,
+            dpi,
+            cache,
+            cache_keys,
+            archive=archive,
+            progress=progress,
+            errors=errors,
+        )
+    if archive is not None:
+        return archive_results(
+            archive,
+            savefig_format,
+            project,
+            figs,
+            context_type,
+            dpi,
+            progress,
+            errors,
+        )
     if savefig_format.lower() == "pdf":
         file_path = os.path.join(output_path, f"{context_type}_plots_{project}.pdf")
-        pp = PdfPages(file_path)
-        for fig in figs:
-            if context_type in ("CNV_48", "SV_32"):
-                figs[fig].savefig(pp, format="pdf", bbox_inches="tight")
-            else:
-                figs[fig].savefig(pp, format="pdf")
-        pp.close()
+        if append and os.path.exists(file_path):
+            append_pdf_results(file_path, figs, context_type, progress)
+        else:
+            save_pdf_pages(file_path, figs, context_type, progress)
         clear_plotting_memory()
     elif savefig_format.lower() == "png":
         for fig in figs:
-            if context_type in ("CNV_48", "SV_32"):
-                figs[fig].savefig(
-                    output_path + context_type + "_plots_" + fig + ".png",
-                    dpi=dpi,
-                    bbox_inches="tight",
-                )
-            else:
-                figs[fig].savefig(
-                    output_path + context_type + "_plots_" + fig + ".png", dpi=dpi
-                )
+            data = render_sample_figure(
+                errors, fig, figs[fig], "png", context_type, dpi
+            )
+            if data is None:
+                continue
+            file_path = output_path + context_type + "_plots_" + fig + ".png"
+            with open(file_path, "wb") as f:
+                f.write(data)
+            progress(fig, path=file_path)
+        clear_plotting_memory()
+    elif savefig_format.lower() == "pdf_per_sample":
+        # one independent pdf per sample, which can be read as soon as it is
+        # written
+        for fig in figs:
+            data = render_sample_figure(
+                errors, fig, figs[fig], "pdf", context_type, dpi
+            )
+            if data is None:
+                continue
+            file_path = os.path.join(output_path, f"{context_type}_plots_{fig}.pdf")
+            write_output_file(file_path, data)
+            progress(fig, path=file_path)
+        clear_plotting_memory()
+    elif savefig_format.lower() in PNG_ARCHIVE_FORMATS:
+
+        archive_path = png_archive_path(
+            output_path, project, context_type, savefig_format
+        )
+
+        # rendered before the archive is locked, so that parallel runs only
+        # wait for each other's writes
+        pngs = []
+        for fig in figs:
+            data = render_sample_figure(errors, fig, figs[fig], "png", context_type, dpi)
+            if data is not None:
+                pngs.append((fig, f"{context_type}_plots_{fig}.png", data))
+        write_png_archive(
+            archive_path,
+            pngs,
+            compresslevel=compresslevel,
+            append=append,
+        )
+        for fig, name, data in pngs:
+            progress(fig, path=archive_path, size=len(data))
         clear_plotting_memory()
     elif savefig_format.lower() == "pil_image":
         image_list = {}
         for fig in figs:
-            tmp_buffer = io.BytesIO()
-            if context_type in ("CNV_48", "SV_32"):
-                figs[fig].savefig(
-                    tmp_buffer, format="png", bbox_inches="tight", dpi=dpi
-                )
-            else:
-                figs[fig].savefig(tmp_buffer, format="png", dpi=dpi)
-            # convert tmp_buffer to a PIL and close buffer
-            tmp_buffer.seek(0)
+            data = render_sample_figure(
+                errors, fig, figs[fig], "png", context_type, dpi
+            )
+            if data is None:
+                continue
+            tmp_buffer = io.BytesIO(data)
+            # convert tmp_buffer to a PIL
             tmp_image = Image.open(tmp_buffer)
             # add the image to the image list for return
             image_list[fig] = tmp_image
+            progress(fig)
         clear_plotting_memory()
         return image_list
     else:
-        raise ValueError("ERROR: savefig_format must be 'pdf', 'png', or 'PIL_Image'.")
+        raise ValueError(
+            "ERROR: savefig_format must be 'pdf', 'pdf_per_sample', 'png', 'png_zip', "
+            + "'png_tar', or 'PIL_Image'."
+        )
+    return None
+
+
+# Writes per-sample results in the order of cache_keys, reusing the cached
+# bytes of samples that were not drawn in this run
+def output_cached_results(
+    savefig_format,
+    output_path,
+    figs,
+    context_type,
+    dpi,
+    cache,
+    cache_keys,
+    archive=None,
+    progress=None,
+    errors=None,
+):
+    progress = progress or PlotProgress(None, cache_keys)
+    image_list = {}
+    ext = RenderCache.FORMATS[savefig_format.lower()]
+    for sample, key in cache_keys.items():
+        if sample in figs:
+            data = render_sample_figure(
+                errors, sample, figs[sample], ext, context_type, dpi
+            )
+            if data is None:
+                continue
+            cache.put(key, data)
+        else:
+            data = cache.get(key)
+            if data is None:
+                raise RuntimeError(
+                    "ERROR: the cached plot of sample "
+                    + str(sample)
+                    + " was removed from the render cache during plotting."
+                )
+        file_path = None
+        if savefig_format.lower() == "pil_image":
+            image_list[sample] = Image.open(io.BytesIO(data))
+        elif archive is not None:
+            archive.add(f"{context_type}_plots_{sample}.{ext}", data)
+        else:
+            file_path = os.path.join(
+                output_path, f"{context_type}_plots_{sample}.{ext}"
+            )
+            write_output_file(file_path, data)
+        progress(sample, path=file_path, size=len(data))
+    clear_plotting_memory()
+    cache.evict()
+    if savefig_format.lower() == "pil_image":
+        return image_list
     return None
 
 
@@ -159,13 +604,88 @@ def get_context_reference(plot_type):
             "ERROR: SigProfilerPlotting is currently not supporting this input plot_type."
         )
 
-    ref_index = pd.read_csv(SPP_REFERENCE + SPP_TYPE, sep="\t", header=None)
-    ref_index = ref_index.iloc[:, 0].tolist()
+    if SPP_TYPE not in _REFERENCES:
+        ref_index = pd.read_csv(SPP_REFERENCE + SPP_TYPE, sep="\t", header=None)
+        _REFERENCES[SPP_TYPE] = ref_index.iloc[:, 0].tolist()
+
+    return list(_REFERENCES[SPP_TYPE])
+
+
+# Select the samples to plot from the sample names of a matrix
+def select_samples(names, samples=None):
+    """Returns the names matching a sample selection, in matrix order.
+
+    Args:
+            names: Sample names of the matrix.
+            samples: None for all of the samples, a list of sample names, a glob
+                    pattern such as "TCGA-*", or a regular expression given either
+                    as a compiled pattern or as a string prefixed with "re:".
+    Raises:
+            SampleSelectionError: if listed samples are not in the matrix, or no
+                    sample matches the selection.
+    """
+    names = list(names)
+    if samples is None:
+        return names
+    if isinstance(samples, str) and samples.startswith("re:"):
+        samples = re.compile(samples[3:])
+    if isinstance(samples, re.Pattern):
+        selected = [name for name in names if samples.search(str(name))]
+    elif isinstance(samples, str):
+        selected = [name for name in names if fnmatch.fnmatchcase(str(name), samples)]
+    else:
+        samples = list(samples)
+        missing = [sample for sample in samples if sample not in names]
+        if missing:
+            raise SampleSelectionError(
+                "ERROR: the following samples are not in the matrix: "
+                + ", ".join(str(sample) for sample in missing)
+            )
+        samples = set(samples)
+        selected = [name for name in names if name in samples]
+    if not selected:
+        raise SampleSelectionError(
+            "ERROR: no samples of the matrix match " + str(samples) + "."
+        )
+    return selected
+
+
+# Map the selected samples of a matrix header to their column in each line
+def select_sample_columns(samples, selection, offset):
+    columns = OrderedDict((sample, i + offset) for i, sample in enumerate(samples))
+    return OrderedDict(
+        (sample, columns[sample]) for sample in select_samples(samples, selection)
+    )
+
+
+# Reads a value of a matrix file: a mutation count, or a float with percentage.
+# A value that cannot be read fails its sample under the error policy of the
+# run, and is read as 0.
+def read_mutation_count(line, sample_index, sample, percentage, errors):
+    try:
+        return float(line[sample_index]) if percentage else int(line[sample_index])
+    except (IndexError, ValueError):
+        errors.failed(
+            sample,
+            MatrixFormatError(
+                "ERROR: the matrix does not contain a mutation count of "
+                + line[0]
+                + ". If you have provided a signature activity matrix, please "
+                + "change the percentage parameter to True."
+            ),
+        )
+        return 0
+
 
-    return ref_index
+# Checks the counts of a sample of an input matrix before it is plotted
+def check_sample_counts(counts):
+    if counts.isnull().any():
+        raise MatrixFormatError("ERROR: the counts of the sample contain Nans.")
 
 
-def process_input(matrix_path, plot_type):
+def process_input(
+    matrix_path, plot_type, samples=None, on_error="raise", dtype="compact"
+):
     # input data is a DataFrame
     if isinstance(matrix_path, pd.DataFrame):
         # copy dataframe with deepcopy
@@ -187,7 +707,13 @@ def process_input(matrix_path, plot_type):
             data.index.name = MUTTYPE
     # input data is a file path
     elif isinstance(matrix_path, str):
-        data = pd.read_csv(matrix_path, sep="\t", index_col=0)
+        usecols = None
+        if samples is not None:
+            # only parse the columns of the selected samples
+            header = pd.read_csv(matrix_path, sep="\t", nrows=0).columns
+            usecols = [header[0]] + select_samples(header[1:], samples)
+        # compact counts are stored as the file is parsed
+        data = read_counts(matrix_path, usecols, dtype)
         data = data.dropna(axis=1, how="all")
         data.index.name = MUTTYPE
     # input data is a numpy array
@@ -197,14 +723,31 @@ def process_input(matrix_path, plot_type):
         # add index of mutation type to the dataframe
         if plot_type.lower() in type_dict:
             data.index = get_context_reference(plot_type)
+    # input data is a scipy.sparse matrix, which stays sparse until the samples
+    # are drawn
+    elif is_sparse_matrix(matrix_path):
+        data = sparse_frame(matrix_path)
+        if plot_type.lower() in type_dict:
+            data.index = get_context_reference(plot_type)
+        data.index.name = MUTTYPE
     else:
         raise ValueError(
-            "ERROR: matrix_path requires pd.DataFrame, path to file, or np.ndarray, not "
-            + f"{type(matrix_path)}."
+            "ERROR: matrix_path requires pd.DataFrame, path to file, np.ndarray or "
+            + f"scipy.sparse matrix, not {type(matrix_path)}."
         )
 
-    if data.isnull().values.any():
-        raise ValueError("ERROR: matrix_path contains Nans.")
+    # the counts that sparse DataFrames do not store are zeros
+    data = zero_filled(data)
+
+    if samples is not None:
+        data = data[select_samples(data.columns, samples)]
+
+    # with the skip and collect error policies, only the samples with Nans fail
+    if on_error == "raise" and data.isnull().any().any():
+        raise MatrixFormatError("ERROR: matrix_path contains Nans.")
+
+    # the counts are held in the narrowest dtypes that fit them
+    data = compact_counts(data, dtype)
 
     def order_input_context(plot_type, input_data):
         if plot_type.lower() in type_dict:
@@ -226,19 +769,7 @@ def process_input(matrix_path, plot_type):
 
 
 def get_default_96labels():
-    first = ["A", "C", "G", "T"]
-    inner_bracket = [[x] * 16 for x in ["C>A", "C>G", "C>T", "T>A", "T>C", "T>G"]]
-    inner_bracket = [item for sublist in inner_bracket for item in sublist]
-    outter_bracket = [x for x in list(itertools.product(first, first))]
-    result = [
-        outter_bracket[f % 16][0]
-        + "["
-        + inner_bracket[f]
-        + "]"
-        + outter_bracket[f % 16][1]
-        for f in range(0, 96)
-    ]
-    return result
+    return list(get_context_spec("SBS96").labels)
 
 
 def make_pickle_file(context="SBS96", return_plot_template=False, volume=None):
@@ -254,8 +785,12 @@ def make_pickle_file(context="SBS96", return_plot_template=False, volume=None):
     path = os.path.join(volume, context + ".pkl")
 
     # if the pickle file already exists, return the template
+    if path in _TEMPLATES:
+        return pickle.loads(_TEMPLATES[path])
     if os.path.exists(path):
-        return pickle.load(open(path, "rb"))
+        with open(path, "rb") as f:
+            _TEMPLATES[path] = f.read()
+        return pickle.loads(_TEMPLATES[path])
 
     # check if the template directory exists, create if not
     if not os.path.exists(volume):
@@ -272,117 +807,12 @@ def make_pickle_file(context="SBS96", return_plot_template=False, volume=None):
         plot1 = plt.figure(figsize=(43.93, 9.92))
         plt.rc("axes", edgecolor="lightgray")
         panel1 = plt.axes([0.04, 0.09, 0.95, 0.77])
-        seq96 = [
-            "A[C>A]A",
-            "A[C>A]C",
-            "A[C>A]G",
-            "A[C>A]T",
-            "C[C>A]A",
-            "C[C>A]C",
-            "C[C>A]G",
-            "C[C>A]T",
-            "G[C>A]A",
-            "G[C>A]C",
-            "G[C>A]G",
-            "G[C>A]T",
-            "T[C>A]A",
-            "T[C>A]C",
-            "T[C>A]G",
-            "T[C>A]T",
-            "A[C>G]A",
-            "A[C>G]C",
-            "A[C>G]G",
-            "A[C>G]T",
-            "C[C>G]A",
-            "C[C>G]C",
-            "C[C>G]G",
-            "C[C>G]T",
-            "G[C>G]A",
-            "G[C>G]C",
-            "G[C>G]G",
-            "G[C>G]T",
-            "T[C>G]A",
-            "T[C>G]C",
-            "T[C>G]G",
-            "T[C>G]T",
-            "A[C>T]A",
-            "A[C>T]C",
-            "A[C>T]G",
-            "A[C>T]T",
-            "C[C>T]A",
-            "C[C>T]C",
-            "C[C>T]G",
-            "C[C>T]T",
-            "G[C>T]A",
-            "G[C>T]C",
-            "G[C>T]G",
-            "G[C>T]T",
-            "T[C>T]A",
-            "T[C>T]C",
-            "T[C>T]G",
-            "T[C>T]T",
-            "A[T>A]A",
-            "A[T>A]C",
-            "A[T>A]G",
-            "A[T>A]T",
-            "C[T>A]A",
-            "C[T>A]C",
-            "C[T>A]G",
-            "C[T>A]T",
-            "G[T>A]A",
-            "G[T>A]C",
-            "G[T>A]G",
-            "G[T>A]T",
-            "T[T>A]A",
-            "T[T>A]C",
-            "T[T>A]G",
-            "T[T>A]T",
-            "A[T>C]A",
-            "A[T>C]C",
-            "A[T>C]G",
-            "A[T>C]T",
-            "C[T>C]A",
-            "C[T>C]C",
-            "C[T>C]G",
-            "C[T>C]T",
-            "G[T>C]A",
-            "G[T>C]C",
-            "G[T>C]G",
-            "G[T>C]T",
-            "T[T>C]A",
-            "T[T>C]C",
-            "T[T>C]G",
-            "T[T>C]T",
-            "A[T>G]A",
-            "A[T>G]C",
-            "A[T>G]G",
-            "A[T>G]T",
-            "C[T>G]A",
-            "C[T>G]C",
-            "C[T>G]G",
-            "C[T>G]T",
-            "G[T>G]A",
-            "G[T>G]C",
-            "G[T>G]G",
-            "G[T>G]T",
-            "T[T>G]A",
-            "T[T>G]C",
-            "T[T>G]G",
-            "T[T>G]T",
-        ]
         xlabels = []
 
         x = 0.4
         ymax = 0
-        colors = [
-            [3 / 256, 189 / 256, 239 / 256],
-            [1 / 256, 1 / 256, 1 / 256],
-            [228 / 256, 41 / 256, 38 / 256],
-            [203 / 256, 202 / 256, 202 / 256],
-            [162 / 256, 207 / 256, 99 / 256],
-            [236 / 256, 199 / 256, 197 / 256],
-        ]
-        xlabels = [seq[0] + seq[2] + seq[6] for seq in seq96]
+        colors = get_context_spec("SBS96").palette
+        xlabels = list(get_context_spec("SBS96").xlabels)
         i = 0
 
         x = 0.043
@@ -556,17 +986,9 @@ def make_pickle_file(context="SBS96", return_plot_template=False, volume=None):
 
         x = 0.4
         ymax = 0
-        colors = [
-            [3 / 256, 189 / 256, 239 / 256],
-            [1 / 256, 1 / 256, 1 / 256],
-            [228 / 256, 41 / 256, 38 / 256],
-            [203 / 256, 202 / 256, 202 / 256],
-            [162 / 256, 207 / 256, 99 / 256],
-            [236 / 256, 199 / 256, 197 / 256],
-        ]
+        colors = get_context_spec("SBS96").palette
         i = 0
-        result = get_default_96labels()
-        xlabels = [seq[0] + seq[2] + seq[6] for seq in result]
+        xlabels = list(get_context_spec("SBS288").xlabels)
         x = 0.043
         y3 = 0.87
         y = int(ymax * 1.25)
@@ -762,18 +1184,7 @@ def make_pickle_file(context="SBS96", return_plot_template=False, volume=None):
 
         x = 0.4
         ymax = 0
-        colors = [
-            [3 / 256, 189 / 256, 239 / 256],
-            [3 / 256, 102 / 256, 204 / 256],
-            [162 / 256, 207 / 256, 99 / 256],
-            [1 / 256, 102 / 256, 1 / 256],
-            [255 / 256, 153 / 256, 153 / 256],
-            [228 / 256, 41 / 256, 38 / 256],
-            [255 / 256, 178 / 256, 102 / 256],
-            [255 / 256, 128 / 256, 1 / 256],
-            [204 / 256, 153 / 256, 255 / 256],
-            [76 / 256, 1 / 256, 153 / 256],
-        ]
+        colors = get_context_spec("DBS78").palette
 
         x = 0.043
         y3 = 0.87
@@ -1031,24 +1442,7 @@ def make_pickle_file(context="SBS96", return_plot_template=False, volume=None):
 
         x = 0.4
         ymax = 0
-        colors = [
-            [253 / 256, 190 / 256, 111 / 256],
-            [255 / 256, 128 / 256, 2 / 256],
-            [176 / 256, 221 / 256, 139 / 256],
-            [54 / 256, 161 / 256, 46 / 256],
-            [253 / 256, 202 / 256, 181 / 256],
-            [252 / 256, 138 / 256, 106 / 256],
-            [241 / 256, 68 / 256, 50 / 256],
-            [188 / 256, 25 / 256, 26 / 256],
-            [208 / 256, 225 / 256, 242 / 256],
-            [148 / 256, 196 / 256, 223 / 256],
-            [74 / 256, 152 / 256, 201 / 256],
-            [23 / 256, 100 / 256, 171 / 256],
-            [226 / 256, 226 / 256, 239 / 256],
-            [182 / 256, 182 / 256, 216 / 256],
-            [134 / 256, 131 / 256, 189 / 256],
-            [98 / 256, 64 / 256, 155 / 256],
-        ]
+        colors = get_context_spec("ID83").palette
 
         x = 0.0475
         y_top = 0.827
@@ -1583,49 +1977,37 @@ def getxlabels(xlabels):
 
 
 def reindex_sbs96(data_f):
-    first = ["A", "C", "G", "T"]
-    inner_bracket = [[x] * 16 for x in ["C>A", "C>G", "C>T", "T>A", "T>C", "T>G"]]
-    inner_bracket = [item for sublist in inner_bracket for item in sublist]
-    outter_bracket = [x for x in list(itertools.product(first, first))]
-    result = [
-        outter_bracket[f % 16][0]
-        + "["
-        + inner_bracket[f]
-        + "]"
-        + outter_bracket[f % 16][1]
-        for f in range(0, 96)
-    ]
-    data_f = data_f.reindex(result)
-    return data_f
+    return data_f.reindex(get_default_96labels())
 
 
 def reindex_sbs288(data_f):
     result = get_default_96labels()
-    mutations_df = pd.DataFrame(index=result, columns=data_f.columns)
-    T_mutations_df = pd.DataFrame(index=result, columns=data_f.columns)
-    U_mutations_df = pd.DataFrame(index=result, columns=data_f.columns)
-    N_mutations_df = pd.DataFrame(index=result, columns=data_f.columns)
-
-    for row in result:
-        T_mutations_df.loc[row] = data_f.loc["T:" + row]
-        U_mutations_df.loc[row] = data_f.loc["U:" + row]
-        N_mutations_df.loc[row] = data_f.loc["N:" + row]
-        mutations_df.loc[row] = (
-            data_f.loc["T:" + row] + data_f.loc["U:" + row] + data_f.loc["N:" + row]
+    # the counts of every strand, and of all strands, by SBS96 channel. The
+    # strand totals are widened so that compact matrices sum the same.
+    strands = {
+        strand: widened(data_f.loc[[strand + ":" + row for row in result]].to_numpy())
+        for strand in "TUN"
+    }
+    mutations_df = compact_counts(
+        pd.DataFrame(
+            strands["T"] + strands["U"] + strands["N"],
+            index=result,
+            columns=data_f.columns,
         )
+    )
 
     mutations_TSB_df_T = pd.DataFrame(
-        T_mutations_df.values.reshape((-1, 16, len(data_f.columns))).sum(axis=1),
+        strands["T"].reshape((-1, 16, len(data_f.columns))).sum(axis=1),
         index=["C>A", "C>G", "C>T", "T>A", "T>C", "T>G"],
         columns=data_f.columns,
     )
     mutations_TSB_df_U = pd.DataFrame(
-        U_mutations_df.values.reshape((-1, 16, len(data_f.columns))).sum(axis=1),
+        strands["U"].reshape((-1, 16, len(data_f.columns))).sum(axis=1),
         index=["C>A", "C>G", "C>T", "T>A", "T>C", "T>G"],
         columns=data_f.columns,
     )
     mutations_TSB_df_N = pd.DataFrame(
-        N_mutations_df.values.reshape((-1, 16, len(data_f.columns))).sum(axis=1),
+        strands["N"].reshape((-1, 16, len(data_f.columns))).sum(axis=1),
         index=["C>A", "C>G", "C>T", "T>A", "T>C", "T>G"],
         columns=data_f.columns,
     )
@@ -1660,6 +2042,7 @@ def reindex_sbs288(data_f):
     )
 
 
+@reported_run
 def plotSV(
     matrix_path,
     output_path,
@@ -1668,6 +2051,16 @@ def plotSV(
     aggregate=False,
     savefig_format="pdf",
     dpi=100,
+    cache=None,
+    append=False,
+    samples=None,
+    archive=None,
+    compresslevel=None,
+    dry_run=False,
+    progress_callback=None,
+    on_error="raise",
+    sample_timeout=None,
+    cancel=None,
 ):
     """Outputs a pdf containing Rearrangement signature plots
 
@@ -1677,6 +2070,17 @@ def plotSV(
     :param plot_type: output type of plot (default:pdf)
     :param percentage: True if y-axis is displayed as percentage of CNV events, False if displayed as counts (default:False)
     :param aggregate: True if output is a single pdf of counts aggregated across samples(e.g for a given cancer type, y-axis will be counts per sample), False if output is a multi-page pdf of counts for each sample
+    :param cache: render cache directory (or RenderCache) used to reuse the per-sample (png, pdf_per_sample, PIL_Image) plots of unchanged samples across runs (default:None)
+    :param append: add pages to an existing pdf instead of overwriting it; samples that already have a page are skipped ("skip" or True) or replaced ("replace"). Requires pypdf (default:False)
+    :param samples: samples to plot, as a list of sample names, a glob pattern (e.g. "TCGA-*") or a regular expression (a compiled pattern, or a string prefixed with "re:") (default:None, all samples)
+    :param archive: PlotArchive that the pdf, pdf_per_sample or png files are added to instead of output_path (default:None)
+    :param compresslevel: deflate level (1-9) of the png_zip members, which are stored uncompressed by default (default:None)
+    :param dry_run: return the estimated pages, output bytes, peak memory and wall time of the run instead of plotting (default:False)
+    :param progress_callback: called as progress_callback(done, total, sample, elapsed) whenever a sample is written or skipped (default:None)
+    :param on_error: 'raise' to stop at the first sample that cannot be plotted, 'skip' to go on without it, or 'collect' to go on and raise the collected errors at the end (default:'raise')
+    :param sample_timeout: seconds after which a sample that is still being drawn is recorded as failed and the run goes on with the next sample (default:None, no limit)
+    :param cancel: CancellationToken; once it is cancelled, no further samples are drawn and RunCancelled is raised after the output of the others is written (default:None)
+    :param report: path of a json report of the run with the status, timing and output of every sample, written when the run ends (keyword only, default:None)
 
     # >>> plotSV()
 
@@ -2098,12 +2502,30 @@ def plotSV(
 
         return fig
 
+    check_on_error(on_error)
+    check_sample_timeout(sample_timeout)
+    if dry_run:
+        return estimate_run(
+            "plotSV", matrix_path, "32", savefig_format, dpi, samples, aggregate
+        )
+
     # create the output directory if it doesn't exist
     if not os.path.exists(output_path) and savefig_format.lower() != "pil_image":
         os.makedirs(output_path)
 
     # To reindex the input data
-    df = process_input(matrix_path, "32")
+    df = process_input(matrix_path, "32", samples, on_error, dtype=None)
+    cache = get_render_cache(cache)
+    cache_keys, skipped = None, set()
+    if not aggregate:
+        cache_keys, skipped = lookup_render_cache(
+            cache, df, "SV_32", savefig_format, dpi, percentage
+        )
+        skipped |= lookup_appended_samples(
+            append, savefig_format, output_path, project, "SV_32"
+        )
+    progress = PlotProgress(progress_callback, [""] if aggregate else df.columns)
+    errors = ErrorPolicy(on_error, progress, sample_timeout, cancel)
     df.reset_index(inplace=True)
     label = df.columns[0]
     labels = df[label]
@@ -2121,16 +2543,46 @@ def plotSV(
         # each column vector in dataframe contains counts for a specific sample
         samples = list(df)[1:]
         for i, (col, sample) in enumerate(zip(df.columns[1:], samples)):
-            counts = list(df[col])
-            if percentage and sum(counts) != 0:
-                counts = [(x / sum(counts)) * 100 for x in counts]
-            assert (len(counts)) == 32
-            assert (len(labels)) == 32
-            figs[sample] = plot(counts, labels, sample, project, percentage)
-
-    return output_results(savefig_format, output_path, project, figs, "SV_32", dpi=dpi)
+            if sample in skipped:
+                progress(
+                    sample, "skipped", reason="already in the output or render cache"
+                )
+                continue
+            try:
+                errors.start(sample)
+                check_sample_counts(df[col])
+                counts = list(df[col])
+                if percentage and sum(counts) != 0:
+                    counts = [(x / sum(counts)) * 100 for x in counts]
+                assert (len(counts)) == 32
+                assert (len(labels)) == 32
+                figs[sample] = plot(counts, labels, sample, project, percentage)
+                errors.stop()
+            except Exception as e:
+                errors.failed(sample, e)
+                if sample in figs:
+                    plt.close(figs.pop(sample))
+
+    return errors.finish(
+        output_results(
+            savefig_format,
+            output_path,
+            project,
+            figs,
+            "SV_32",
+            dpi=dpi,
+            cache=cache,
+            cache_keys=cache_keys,
+            append=append,
+            archive=archive,
+            compresslevel=compresslevel,
+            progress=progress,
+            errors=errors,
+        )
+    )
 
 
+@reported_run
 def plotCNV(
     matrix_path,
     output_path,
@@ -2140,6 +2592,16 @@ def plotCNV(
     read_from_file=True,
     savefig_format="pdf",
     dpi=100,
+    cache=None,
+    append=False,
+    samples=None,
+    archive=None,
+    compresslevel=None,
+    dry_run=False,
+    progress_callback=None,
+    on_error="raise",
+    sample_timeout=None,
+    cancel=None,
 ):
     """Outputs a pdf containing CNV signature plots
 
@@ -2148,6 +2610,17 @@ def plotCNV(
     :param project: name of project
     :param percentage: True if y-axis is displayed as percentage of CNV events, False if displayed as counts (default:False)
     :param aggregate: True if output is a single pdf of counts aggregated across samples(e.g for a given cancer type, y-axis will be counts per sample), False if output is a multi-page pdf of counts for each sample
+    :param cache: render cache directory (or RenderCache) used to reuse the per-sample (png, pdf_per_sample, PIL_Image) plots of unchanged samples across runs (default:None)
+    :param append: add pages to an existing pdf instead of overwriting it; samples that already have a page are skipped ("skip" or True) or replaced ("replace"). Requires pypdf (default:False)
+    :param samples: samples to plot, as a list of sample names, a glob pattern (e.g. "TCGA-*") or a regular expression (a compiled pattern, or a string prefixed with "re:") (default:None, all samples)
+    :param archive: PlotArchive that the pdf, pdf_per_sample or png files are added to instead of output_path (default:None)
+    :param compresslevel: deflate level (1-9) of the png_zip members, which are stored uncompressed by default (default:None)
+    :param dry_run: return the estimated pages, output bytes, peak memory and wall time of the run instead of plotting (default:False)
+    :param progress_callback: called as progress_callback(done, total, sample, elapsed) whenever a sample is written or skipped (default:None)
+    :param on_error: 'raise' to stop at the first sample that cannot be plotted, 'skip' to go on without it, or 'collect' to go on and raise the collected errors at the end (default:'raise')
+    :param sample_timeout: seconds after which a sample that is still being drawn is recorded as failed and the run goes on with the next sample (default:None, no limit)
+    :param cancel: CancellationToken; once it is cancelled, no further samples are drawn and RunCancelled is raised after the output of the others is written (default:None)
+    :param report: path of a json report of the run with the status, timing and output of every sample, written when the run ends (keyword only, default:None)
     >>> plotCNV()
 
     """
@@ -2634,6 +3107,13 @@ def plotCNV(
 
         return fig
 
+    check_on_error(on_error)
+    check_sample_timeout(sample_timeout)
+    if dry_run:
+        return estimate_run(
+            "plotCNV", matrix_path, "48", savefig_format, dpi, samples, aggregate
+        )
+
     # create the output directory if it doesn't exist
     if not os.path.exists(output_path) and savefig_format.lower() != "pil_image":
         os.makedirs(output_path)
@@ -2651,7 +3131,18 @@ def plotCNV(
         df = matrix_path
 
     # To reindex the input data
-    df = process_input(matrix_path, "48")
+    df = process_input(matrix_path, "48", samples, on_error, dtype=None)
+    cache = get_render_cache(cache)
+    cache_keys, skipped = None, set()
+    if not aggregate:
+        cache_keys, skipped = lookup_render_cache(
+            cache, df, "CNV_48", savefig_format, dpi, percentage
+        )
+        skipped |= lookup_appended_samples(
+            append, savefig_format, output_path, project, "CNV_48"
+        )
+    progress = PlotProgress(progress_callback, [""] if aggregate else df.columns)
+    errors = ErrorPolicy(on_error, progress, sample_timeout, cancel)
     df.reset_index(inplace=True)
     label = df.columns[0]
     labels = df[label]
@@ -2675,18 +3166,147 @@ def plotCNV(
         # each column vector in dataframe contains counts for a specific sample
         samples = list(df)[1:]
         for i, (col, sample) in enumerate(zip(df.columns[1:], samples)):
-            counts = list(df[col])
-            if percentage and sum(counts) != 0:
-                counts = [(x / sum(counts)) * 100 for x in counts]
-            assert len(counts) == 48
-            assert len(labels) == 48
-            figs[sample] = plot(
-                counts, labels, sample, project, percentage, aggregate=False
-            )
+            if sample in skipped:
+                progress(
+                    sample, "skipped", reason="already in the output or render cache"
+                )
+                continue
+            try:
+                errors.start(sample)
+                check_sample_counts(df[col])
+                counts = list(df[col])
+                if percentage and sum(counts) != 0:
+                    counts = [(x / sum(counts)) * 100 for x in counts]
+                assert len(counts) == 48
+                assert len(labels) == 48
+                figs[sample] = plot(
+                    counts, labels, sample, project, percentage, aggregate=False
+                )
+                errors.stop()
+            except Exception as e:
+                errors.failed(sample, e)
+                if sample in figs:
+                    plt.close(figs.pop(sample))
+
+    return errors.finish(
+        output_results(
+            savefig_format,
+            output_path,
+            project,
+            figs,
+            "CNV_48",
+            dpi=dpi,
+            cache=cache,
+            cache_keys=cache_keys,
+            append=append,
+            archive=archive,
+            compresslevel=compresslevel,
+            progress=progress,
+            errors=errors,
+        )
+    )
+
+
+# Draws the plots of the high-dimensional contexts (e.g. SBS6144, ID8628,
+# DBS2976), whose samples are drawn as the bars of a collapsed context above a
+# heatmap of all channels. Shared by plotSBS, plotID and plotDBS.
+def plot_heatmap_context(
+    command,
+    matrix_path,
+    output_path,
+    project,
+    plot_type,
+    percentage=False,
+    custom_text_upper=None,
+    custom_text_middle=None,
+    custom_text_bottom=None,
+    savefig_format="pdf",
+    dpi=100,
+    cache=None,
+    append=False,
+    samples=None,
+    archive=None,
+    compresslevel=None,
+    progress_callback=None,
+    on_error="raise",
+    sample_timeout=None,
+    cancel=None,
+    dtype="compact",
+):
+    layout = get_heatmap_layout(HEATMAP_PLOT_TYPES[command][plot_type])
+    context_type = layout.mutation_type + "_" + layout.name[len(layout.mutation_type) :]
+    data = process_input(matrix_path, layout.name, samples, on_error, dtype)
+    cache_keys, skipped = lookup_render_cache(
+        cache,
+        data,
+        context_type,
+        savefig_format,
+        dpi,
+        percentage,
+        custom_text_upper,
+        custom_text_middle,
+        custom_text_bottom,
+    )
+    skipped |= lookup_appended_samples(
+        append, savefig_format, output_path, project, context_type
+    )
+    progress = PlotProgress(progress_callback, data.columns)
+    errors = ErrorPolicy(on_error, progress, sample_timeout, cancel)
+
+    def custom_text(texts, sample_count):
+        try:
+            return texts[sample_count]
+        except:
+            return None
 
-    return output_results(savefig_format, output_path, project, figs, "CNV_48", dpi=dpi)
+    figs = {}
+    for sample_count, sample in enumerate(data.columns):
+        if sample in skipped:
+            progress(sample, "skipped", reason="already in the output or render cache")
+            continue
+        try:
+            errors.start(sample)
+            check_sample_counts(data[sample])
+            figs[sample] = draw_heatmap(
+                layout,
+                sample,
+                sample_counts(data, sample),
+                percentage,
+                [
+                    custom_text(texts, sample_count)
+                    for texts in (
+                        custom_text_upper,
+                        custom_text_middle,
+                        custom_text_bottom,
+                    )
+                ],
+            )
+            errors.stop()
+        except Exception as e:
+            errors.failed(sample, e)
+            if sample in figs:
+                plt.close(figs.pop(sample))
+
+    return errors.finish(
+        output_results(
+            savefig_format,
+            output_path,
+            project,
+            figs,
+            context_type,
+            dpi=dpi,
+            cache=cache,
+            cache_keys=cache_keys,
+            append=append,
+            archive=archive,
+            compresslevel=compresslevel,
+            progress=progress,
+            errors=errors,
+        )
+    )
 
 
+@reported_run
 def plotSBS(
     matrix_path,
     output_path,
@@ -2699,16 +3319,112 @@ def plotSBS(
     savefig_format="pdf",
     volume=None,
     dpi=100,
+    cache=None,
+    append=False,
+    samples=None,
+    archive=None,
+    compresslevel=None,
+    dry_run=False,
+    progress_callback=None,
+    on_error="raise",
+    sample_timeout=None,
+    cancel=None,
+    scaling=None,
+    aggregate=False,
+    groups=None,
+    dtype="compact",
+    lazy=False,
 ):
     """Use an input matrix to create a SBS plot.
 
     Args:
-            matrix_path: The path to a text file or a pandas DataFrame.
+            matrix_path: The path to a text file, a pandas DataFrame (dense or
+                    sparse), a numpy array or a scipy.sparse matrix.
             output_path: Path to a directory for saving the output.
             project: Name of unique sample set
             plot_type: Context of the mutational matrix (ie. 96, 288, 384, 1536)
-            savefig_format: Format of the output plot (pdf, png, or PIL_Image)
+            savefig_format: Format of the output plot (pdf, pdf_per_sample, png,
+                    png_zip, png_tar, or PIL_Image). png_zip and png_tar write the pngs
+                    of all samples to a single <context>_plots_<project>.zip or .tar
+                    archive with a <archive>.index.tsv index of the samples, which
+                    parallel runs can append to (all of them with append, since
+                    a run without append replaces the archive).
             volume: Path to the .pkl file containing the plot template. For Docker.
+            dpi: Resolution of the png and PIL_Image output.
+            cache: Render cache directory (or RenderCache) used to reuse the plots of
+                    unchanged samples across runs. Only per-sample output (png,
+                    pdf_per_sample and PIL_Image) is cached.
+            append: Add pages to an existing pdf instead of overwriting it. Samples that
+                    already have a page are skipped ("skip" or True) or redrawn and
+                    replaced in place ("replace"). Requires pypdf. Only the plot
+                    types drawn one sample at a time can be appended to.
+            samples: Samples to plot, as a list of sample names, a glob pattern such as
+                    "TCGA-*", or a regular expression (a compiled pattern, or a string
+                    prefixed with "re:"). All samples are plotted by default.
+            archive: A PlotArchive that the pdf, pdf_per_sample or png files are added
+                    to instead of being written to output_path. Plot types that are
+                    drawn directly from a matrix file still write their pdf to
+                    output_path.
+            compresslevel: Deflate level (1-9) of the png_zip members, which are
+                    stored uncompressed by default.
+            dry_run: Do not plot. Only read the header and row count of the matrix
+                    and return the estimated pages, output bytes, peak memory and
+                    wall time of the run (see sigProfilerPlotting.estimate).
+            progress_callback: Called as progress_callback(done, total, sample, elapsed)
+                    whenever the page or file of a sample is written, or a sample is
+                    skipped. elapsed is the number of seconds since the start of the
+                    run. sigProfilerPlotting.progress.ProgressBar draws a progress bar
+                    with the throughput and ETA.
+            report: Path of a json report of the run, written when the run ends
+                    (also when it fails). It lists the status ("rendered", "skipped"
+                    or "error"), timing, output path and bytes of every sample,
+                    the sha256 of the input and the package version. Keyword only,
+                    and cannot be used with lazy.
+            on_error: What to do when a sample cannot be read or plotted. "raise"
+                    (default) raises a SampleError and writes nothing; "skip" prints
+                    the error and goes on with the next sample; "collect" goes on as
+                    well, then raises a SampleErrors listing the failed samples once
+                    the output of all other samples is written. Errors that concern
+                    the whole matrix always raise a MatrixFormatError. The errors
+                    are defined in sigProfilerPlotting.errors.
+            sample_timeout: Number of seconds a single sample may take to be drawn
+                    and written. A sample that takes longer is recorded as failed
+                    (a SampleTimeout) and the run goes on with the next sample, then
+                    raises a SampleErrors at the end unless on_error="skip". The
+                    sample is interrupted in the main thread on platforms with
+                    SIGALRM, and checked once it is drawn elsewhere. The pages of
+                    the multi-page pdf are written without a limit. Default: None.
+            cancel: A sigProfilerPlotting.cancellation.CancellationToken. Once it is
+                    cancelled (e.g. from another thread or a signal handler), no
+                    further samples are drawn, the output of the samples drawn so
+                    far is written and RunCancelled is raised.
+            scaling: DataFrame indexed by sample that overrides the y axis of the
+                    SBS96 and SBS288 plots of some samples, with ylim, yticks and
+                    ylabels columns (and strand_ticks and strand_labels for the
+                    strand panel of SBS288). The default axes of all samples are
+                    computed before the first sample is drawn (see
+                    sigProfilerPlotting.scaling.cohort_statistics), which is how
+                    e.g. all samples can be drawn on the same axis.
+            aggregate: Plot the "sum", "mean" (or True) or "median" profile of the
+                    samples instead of every sample, titled with the project name.
+                    The matrix is aggregated a few channels at a time (see
+                    sigProfilerPlotting.aggregate.aggregate_matrix). Only the plot
+                    types drawn one sample at a time can be aggregated.
+            groups: Mapping (dict or pd.Series) of sample names to groups, e.g.
+                    cancer types, to plot the aggregate profile of every group
+                    instead. Samples without a group are left out.
+            dtype: dtype of the counts held in memory. By default ("compact"),
+                    the counts of every sample are held as the narrowest of int8,
+                    int16 and int32 that holds them, or as float32 when all of them
+                    keep their exact value, already while a matrix file is parsed.
+                    None keeps the dtype of the input. Every sample is drawn from
+                    int64 or float64 counts, so the plots are the same.
+            lazy: Return a generator of (sample, image) pairs that draws every sample
+                    only when it is requested, so that memory does not grow with the
+                    number of samples (see sigProfilerPlotting.streaming.iter_plot).
+                    The images are PIL images with savefig_format="PIL_Image", and the
+                    bytes of the png or pdf file of the sample with "png" or "pdf".
+                    Only the plot types drawn one sample at a time can be lazy.
     Returns:
             Plot of the given input matrix.
     """
@@ -2716,16 +3432,87 @@ def plotSBS(
     sig_probs = False
     pcawg = False
 
+    check_on_error(on_error)
+    check_sample_timeout(sample_timeout)
+    aggregate = check_aggregate(aggregate)
+    check_append("plotSBS", plot_type, append)
+    if dry_run:
+        return estimate_run(
+            "plotSBS",
+            matrix_path,
+            plot_type,
+            savefig_format,
+            dpi,
+            samples,
+            aggregate,
+            groups,
+        )
+    if aggregate:
+        matrix_path = aggregate_matrix(
+            "plotSBS",
+            matrix_path,
+            plot_type,
+            project,
+            aggregate,
+            groups,
+            samples,
+            on_error,
+        )
+        samples = None
+    if lazy:
+        from sigProfilerPlotting.streaming import iter_plot
+
+        return iter_plot(
+            "plotSBS",
+            matrix_path,
+            project,
+            plot_type,
+            savefig_format=savefig_format,
+            samples=samples,
+            on_error=on_error,
+            sample_timeout=sample_timeout,
+            cancel=cancel,
+            scaling=scaling,
+            percentage=percentage,
+            custom_text_upper=custom_text_upper,
+            custom_text_middle=custom_text_middle,
+            custom_text_bottom=custom_text_bottom,
+            volume=volume,
+            dpi=dpi,
+            cache=cache,
+            dtype=dtype,
+        )
+
     # load custom fonts for plotting
     load_custom_fonts()
+    cache = get_render_cache(cache)
+    # the file based plot types reuse samples for the sample names of the matrix
+    sample_selection = samples
 
     # create the output directory if it doesn't exist
     if not os.path.exists(output_path) and savefig_format.lower() != "pil_image":
         os.makedirs(output_path)
 
     if plot_type == "96":
-        data = process_input(matrix_path, plot_type)
+        data = process_input(matrix_path, plot_type, sample_selection, on_error, dtype)
         data = reindex_sbs96(data)
+        cache_keys, skipped = lookup_render_cache(
+            cache,
+            data,
+            "SBS_96",
+            savefig_format,
+            dpi,
+            percentage,
+            custom_text_upper,
+            custom_text_middle,
+            custom_text_bottom,
+            scaling,
+        )
+        skipped |= lookup_appended_samples(
+            append, savefig_format, output_path, project, "SBS_96"
+        )
+        progress = PlotProgress(progress_callback, data.columns)
+        errors = ErrorPolicy(on_error, progress, sample_timeout, cancel)
         sample_count = 0
 
         buf = io.BytesIO()
@@ -2737,217 +3524,138 @@ def plotSBS(
         figs = {}
         buff_list = {}
         ctx = data.index  # [seq[0]+seq[2]+seq[6] for seq in data.index]
-        colors = [
-            [3 / 256, 189 / 256, 239 / 256],
-            [1 / 256, 1 / 256, 1 / 256],
-            [228 / 256, 41 / 256, 38 / 256],
-            [203 / 256, 202 / 256, 202 / 256],
-            [162 / 256, 207 / 256, 99 / 256],
-            [236 / 256, 199 / 256, 197 / 256],
-        ]
-        colorsall = [
-            [colors[j] for i in range(int(len(ctx) / 6))] for j in range(6)
-        ]
-        colors_flat_list = [item for sublist in colorsall for item in sublist]
+        colors_flat_list = get_context_spec("SBS96").colors
+        stats = cohort_statistics(data, "SBS96", percentage)
+        normalized = normalize_counts(data) if percentage else None
 
         for sample in data.columns:
-            buf.seek(0)
-            figs[sample] = pickle.load(buf)
-            panel1 = figs[sample].axes[0]
-
-            total_count = np.sum(data[sample].values)
-            x = 0.4
-            ymax = 0
-            i = 0
-            muts = data[sample].values
-            if percentage:
-                if total_count > 0:
+            if sample in skipped:
+                progress(
+                    sample, "skipped", reason="already in the output or render cache"
+                )
+                sample_count += 1
+                continue
+            try:
+                errors.start(sample)
+                check_sample_counts(data[sample])
+                buf.seek(0)
+                figs[sample] = pickle.load(buf)
+                panel1 = figs[sample].axes[0]
+
+                scale = sample_scaling(stats, sample, scaling)
+                total_count = scale["total"]
+                x = 0.4
+                muts = sample_counts(data, sample)
+                if percentage:
+                    if total_count > 0:
+                        plt.bar(
+                            np.arange(len(ctx)) + x,
+                            sample_counts(normalized, sample),
+                            width=0.4,
+                            color=colors_flat_list,
+                            align="center",
+                            zorder=1000,
+                        )
+                    sig_probs = True
+                else:
                     plt.bar(
                         np.arange(len(ctx)) + x,
-                        muts / total_count * 100,
+                        muts,
                         width=0.4,
                         color=colors_flat_list,
                         align="center",
                         zorder=1000,
                     )
-                    ymax = np.max(muts / total_count * 100)
-                sig_probs = True
-            else:
-                plt.bar(
-                    np.arange(len(ctx)) + x,
-                    muts,
-                    width=0.4,
-                    color=colors_flat_list,
-                    align="center",
-                    zorder=1000,
-                )
-                ymax = np.max(muts)
-
-            x = 0.043
-            y3 = 0.87
-            y = int(ymax * 1.25)
-            y2 = y + 2
-
-            if y <= 4:
-                y += 4
-
-            while y % 4 != 0:
-                y += 1
-
-            y = ymax / 1.025
-            ytick_offest = float(y / 3)
-
-            if percentage:
-                ylabs = [
-                    0,
-                    round(ytick_offest, 1),
-                    round(ytick_offest * 2, 1),
-                    round(ytick_offest * 3, 1),
-                    round(ytick_offest * 4, 1),
-                ]
-                ylabels = [
-                    str(0),
-                    str(round(ytick_offest, 1)) + "%",
-                    str(round(ytick_offest * 2, 1)) + "%",
-                    str(round(ytick_offest * 3, 1)) + "%",
-                    str(round(ytick_offest * 4, 1)) + "%",
-                ]
-            else:
-                ylabs = [
-                    0,
-                    ytick_offest,
-                    ytick_offest * 2,
-                    ytick_offest * 3,
-                    ytick_offest * 4,
-                ]
-                ylabels = [
-                    0,
-                    ytick_offest,
-                    ytick_offest * 2,
-                    ytick_offest * 3,
-                    ytick_offest * 4,
-                ]
-
-            labs = np.arange(0.375, 96.375, 1)
 
-            font_label_size = 30
-            if not percentage:
-                if int(ylabels[3]) >= 1000:
-                    font_label_size = 20
+                y = scale["ylim"]
+                ylabs = list(scale["yticks"])
+                ylabels = list(scale["ylabels"])
+                labs = np.arange(0.375, 96.375, 1)
 
-            if percentage:
-                if len(ylabels) > 2:
+                font_label_size = 30
+                if percentage or any(int(tick) >= 1000 for tick in ylabs[:4]):
                     font_label_size = 20
 
-            if not percentage:
-                ylabels = getylabels(ylabels)
-
-            panel1.set_xlim([0, 96])
-            panel1.set_ylim([0, y])
-            panel1.set_yticks(ylabs)
-            if sig_probs:
-                plt.text(
-                    0.045,
-                    0.75,
-                    sample,
-                    fontsize=60,
-                    weight="bold",
-                    color="black",
-                    fontname="Arial",
-                    transform=plt.gcf().transFigure,
-                )
-            else:
-                plt.text(
-                    0.045,
-                    0.75,
-                    sample + ": " + "{:,}".format(int(total_count)) + " subs",
-                    fontsize=60,
-                    weight="bold",
-                    color="black",
-                    fontname="Arial",
-                    transform=plt.gcf().transFigure,
-                )
-
-            panel1.set_yticklabels(ylabels, fontsize=font_label_size)
-            plt.gca().yaxis.grid(True)
-            plt.gca().grid(
-                which="major", axis="y", color=[0.93, 0.93, 0.93], zorder=1
-            )
-            panel1.set_xlabel("")
-            panel1.set_ylabel("")
-
-            custom_text_upper_plot = ""
-            try:
-                custom_text_upper[sample_count]
-            except:
-                custom_text_upper = False
-            try:
-                custom_text_middle[sample_count]
-            except:
-                custom_text_middle = False
-            try:
-                custom_text_bottom[sample_count]
-            except:
-                custom_text_bottom = False
-
-            if custom_text_upper:
-                plot_custom_text = True
-                if len(custom_text_upper[sample_count]) > 40:
-                    print(
-                        "To add a custom text, please limit the string to <40 characters including spaces."
-                    )
-                    plot_custom_text = False
-            if custom_text_middle:
-                if len(custom_text_middle[sample_count]) > 40:
-                    print(
-                        "To add a custom text, please limit the string to <40 characters including spaces."
-                    )
-                    plot_custom_text = False
-
-            if plot_custom_text:
-                x_pos_custom = 0.98
-                if custom_text_upper and custom_text_middle:
-                    custom_text_upper_plot = (
-                        custom_text_upper[sample_count]
-                        + "\n"
-                        + custom_text_middle[sample_count]
+                panel1.set_xlim([0, 96])
+                panel1.set_ylim([0, y])
+                panel1.set_yticks(ylabs)
+                if sig_probs:
+                    plt.text(
+                        0.045,
+                        0.75,
+                        sample,
+                        fontsize=60,
+                        weight="bold",
+                        color="black",
+                        fontname="Arial",
+                        transform=plt.gcf().transFigure,
                     )
-                    if custom_text_bottom:
-                        custom_text_upper_plot += (
-                            "\n" + custom_text_bottom[sample_count]
-                        )
-
-                if custom_text_upper and not custom_text_middle:
-                    custom_text_upper_plot = custom_text_upper[sample_count]
-                    panel1.text(
-                        x_pos_custom,
-                        0.78,
-                        custom_text_upper_plot,
-                        fontsize=40,
+                else:
+                    plt.text(
+                        0.045,
+                        0.75,
+                        sample + ": " + "{:,}".format(int(total_count)) + " subs",
+                        fontsize=60,
                         weight="bold",
                         color="black",
                         fontname="Arial",
                         transform=plt.gcf().transFigure,
-                        ha="right",
                     )
 
-                elif custom_text_upper and custom_text_middle:
-                    if not custom_text_bottom:
-                        panel1.text(
-                            x_pos_custom,
-                            0.72,
-                            custom_text_upper_plot,
-                            fontsize=40,
-                            weight="bold",
-                            color="black",
-                            fontname="Arial",
-                            transform=plt.gcf().transFigure,
-                            ha="right",
+                panel1.set_yticklabels(ylabels, fontsize=font_label_size)
+                plt.gca().yaxis.grid(True)
+                plt.gca().grid(
+                    which="major", axis="y", color=[0.93, 0.93, 0.93], zorder=1
+                )
+                panel1.set_xlabel("")
+                panel1.set_ylabel("")
+
+                custom_text_upper_plot = ""
+                try:
+                    custom_text_upper[sample_count]
+                except:
+                    custom_text_upper = False
+                try:
+                    custom_text_middle[sample_count]
+                except:
+                    custom_text_middle = False
+                try:
+                    custom_text_bottom[sample_count]
+                except:
+                    custom_text_bottom = False
+
+                if custom_text_upper:
+                    plot_custom_text = True
+                    if len(custom_text_upper[sample_count]) > 40:
+                        print(
+                            "To add a custom text, please limit the string to <40 characters including spaces."
                         )
-                    else:
+                        plot_custom_text = False
+                if custom_text_middle:
+                    if len(custom_text_middle[sample_count]) > 40:
+                        print(
+                            "To add a custom text, please limit the string to <40 characters including spaces."
+                        )
+                        plot_custom_text = False
+
+                if plot_custom_text:
+                    x_pos_custom = 0.98
+                    if custom_text_upper and custom_text_middle:
+                        custom_text_upper_plot = (
+                            custom_text_upper[sample_count]
+                            + "\n"
+                            + custom_text_middle[sample_count]
+                        )
+                        if custom_text_bottom:
+                            custom_text_upper_plot += (
+                                "\n" + custom_text_bottom[sample_count]
+                            )
+
+                    if custom_text_upper and not custom_text_middle:
+                        custom_text_upper_plot = custom_text_upper[sample_count]
                         panel1.text(
                             x_pos_custom,
-                            0.68,
+                            0.78,
                             custom_text_upper_plot,
                             fontsize=40,
                             weight="bold",
@@ -2957,57 +3665,102 @@ def plotSBS(
                             ha="right",
                         )
 
-                elif not custom_text_upper and custom_text_middle:
-                    custom_text_upper_plot = custom_text_middle[sample_count]
-                    panel1.text(
-                        x_pos_custom,
-                        0.78,
-                        custom_text_upper_plot,
-                        fontsize=40,
+                    elif custom_text_upper and custom_text_middle:
+                        if not custom_text_bottom:
+                            panel1.text(
+                                x_pos_custom,
+                                0.72,
+                                custom_text_upper_plot,
+                                fontsize=40,
+                                weight="bold",
+                                color="black",
+                                fontname="Arial",
+                                transform=plt.gcf().transFigure,
+                                ha="right",
+                            )
+                        else:
+                            panel1.text(
+                                x_pos_custom,
+                                0.68,
+                                custom_text_upper_plot,
+                                fontsize=40,
+                                weight="bold",
+                                color="black",
+                                fontname="Arial",
+                                transform=plt.gcf().transFigure,
+                                ha="right",
+                            )
+
+                    elif not custom_text_upper and custom_text_middle:
+                        custom_text_upper_plot = custom_text_middle[sample_count]
+                        panel1.text(
+                            x_pos_custom,
+                            0.78,
+                            custom_text_upper_plot,
+                            fontsize=40,
+                            weight="bold",
+                            color="black",
+                            fontname="Arial",
+                            transform=plt.gcf().transFigure,
+                            ha="right",
+                        )
+
+                if percentage:
+                    plt.ylabel(
+                        "Percentage of Single Base Substitutions",
+                        fontsize=35,
+                        fontname="Times New Roman",
+                        weight="bold",
+                    )
+                else:
+                    plt.ylabel(
+                        "Number of Single Base Substitutions",
+                        fontsize=35,
+                        fontname="Times New Roman",
                         weight="bold",
-                        color="black",
-                        fontname="Arial",
-                        transform=plt.gcf().transFigure,
-                        ha="right",
                     )
 
-            if percentage:
-                plt.ylabel(
-                    "Percentage of Single Base Substitutions",
-                    fontsize=35,
-                    fontname="Times New Roman",
-                    weight="bold",
-                )
-            else:
-                plt.ylabel(
-                    "Number of Single Base Substitutions",
-                    fontsize=35,
-                    fontname="Times New Roman",
-                    weight="bold",
+                panel1.tick_params(
+                    axis="both",
+                    which="both",
+                    bottom=False,
+                    labelbottom=False,
+                    left=True,
+                    labelleft=True,
+                    right=True,
+                    labelright=False,
+                    top=False,
+                    labeltop=False,
+                    direction="in",
+                    length=25,
+                    colors="lightgray",
+                    width=2,
                 )
 
-            panel1.tick_params(
-                axis="both",
-                which="both",
-                bottom=False,
-                labelbottom=False,
-                left=True,
-                labelleft=True,
-                right=True,
-                labelright=False,
-                top=False,
-                labeltop=False,
-                direction="in",
-                length=25,
-                colors="lightgray",
-                width=2,
-            )
-
-            [i.set_color("black") for i in plt.gca().get_yticklabels()]
+                [i.set_color("black") for i in plt.gca().get_yticklabels()]
+                errors.stop()
+            except Exception as e:
+                errors.failed(sample, e)
+                if sample in figs:
+                    plt.close(figs.pop(sample))
             sample_count += 1
 
-        return output_results(
-            savefig_format, output_path, project, figs, "SBS_96", dpi=dpi
+        return errors.finish(
+            output_results(
+                savefig_format,
+                output_path,
+                project,
+                figs,
+                "SBS_96",
+                dpi=dpi,
+                cache=cache,
+                cache_keys=cache_keys,
+                append=append,
+                archive=archive,
+                compresslevel=compresslevel,
+                progress=progress,
+                errors=errors,
+            )
         )
 
     elif plot_type == "192" or plot_type == "96SB" or plot_type == "384":
@@ -3022,8 +3775,8 @@ def plotSBS(
                 and first_line[0][6] != ">"
                 and first_line[0][3] != ">"
             ):
-                sys.exit(
-                    "The matrix does not match the correct SBS192 format. Please check you formatting and rerun this plotting function."
+                raise MatrixFormatError(
+                    "ERROR: The matrix does not match the correct SBS192 format. Please check you formatting and rerun this plotting function."
                 )
         file_path = os.path.join(output_path, f"SBS_384_plots_{project}.pdf")
         pp = PdfPages(file_path)
@@ -3039,6 +3792,12 @@ def plotSBS(
                     samples = first_line.strip().split("\t")
                     samples = samples[1:]
 
+                sample_columns = select_sample_columns(
+                    samples, sample_selection, 3 if pcawg else 1
+                )
+                samples = list(sample_columns)
+                progress = PlotProgress(progress_callback, samples)
+                errors = ErrorPolicy(on_error, progress, sample_timeout, cancel)
                 for sample in samples:
                     mutations[sample] = OrderedDict()
                     mutations[sample]["C>A"] = OrderedDict()
@@ -3069,20 +3828,12 @@ def plotSBS(
                             sample_index = 1
 
                         for sample in samples:
-                            if percentage:
-                                mutCount = float(line[sample_index])
-                                if mutCount < 1 and mutCount > 0:
-                                    sig_probs = True
-                            else:
-                                try:
-                                    mutCount = int(line[sample_index])
-                                except:
-                                    print(
-                                        "It appears that the provided matrix does not contain mutation counts.\n\tIf you have provided a signature activity matrix, please change the percentage parameter to True.\n\tOtherwise, ",
-                                        end="",
-                                    )
-
-                                # mutCount = int(line[sample_index])
+                            sample_index = sample_columns[sample]
+                            mutCount = read_mutation_count(
+                                line, sample_index, sample, percentage, errors
+                            )
+                            if percentage and mutCount < 1 and mutCount > 0:
+                                sig_probs = True
                             if nuc not in mutations[sample][mut_type].keys():
                                 mutations[sample][mut_type][nuc] = [0, 0]
                             if bias == "T":
@@ -3093,35 +3844,80 @@ def plotSBS(
 
             sample_count = 0
             for sample in mutations.keys():
-                total_count = sum(
-                    sum(sum(tsb) for tsb in nuc.values())
-                    for nuc in mutations[sample].values()
-                )
-                plt.rcParams["axes.linewidth"] = 2
-                plot1 = plt.figure(figsize=(43.93, 9.92))
-                plt.rc("axes", edgecolor="lightgray")
-                panel1 = plt.axes([0.04, 0.09, 0.95, 0.77])
-                xlabels = []
-
-                x = 0.7
-                ymax = 0
-                colors = [
-                    [3 / 256, 189 / 256, 239 / 256],
-                    [1 / 256, 1 / 256, 1 / 256],
-                    [228 / 256, 41 / 256, 38 / 256],
-                    [203 / 256, 202 / 256, 202 / 256],
-                    [162 / 256, 207 / 256, 99 / 256],
-                    [236 / 256, 199 / 256, 197 / 256],
-                ]
-                i = 0
-                for key in mutations[sample]:
-                    for seq in mutations[sample][key]:
-                        xlabels.append(seq[0] + seq[2] + seq[6])
-                        if percentage:
-                            if total_count > 0:
+                if sample in errors:
+                    continue
+                try:
+                    errors.start(sample)
+                    total_count = sum(
+                        sum(sum(tsb) for tsb in nuc.values())
+                        for nuc in mutations[sample].values()
+                    )
+                    plt.rcParams["axes.linewidth"] = 2
+                    plot1 = plt.figure(figsize=(43.93, 9.92))
+                    plt.rc("axes", edgecolor="lightgray")
+                    panel1 = plt.axes([0.04, 0.09, 0.95, 0.77])
+                    xlabels = []
+
+                    x = 0.7
+                    ymax = 0
+                    colors = get_context_spec("SBS96").palette
+                    i = 0
+                    for key in mutations[sample]:
+                        for seq in mutations[sample][key]:
+                            xlabels.append(seq[0] + seq[2] + seq[6])
+                            if percentage:
+                                if total_count > 0:
+                                    trans = plt.bar(
+                                        x,
+                                        mutations[sample][key][seq][0]
+                                        / total_count
+                                        * 100,
+                                        width=0.75,
+                                        color=[1 / 256, 70 / 256, 102 / 256],
+                                        align="center",
+                                        zorder=1000,
+                                        label="Genic-transcribed Strand",
+                                    )
+                                    x += 0.75
+                                    untrans = plt.bar(
+                                        x,
+                                        mutations[sample][key][seq][1]
+                                        / total_count
+                                        * 100,
+                                        width=0.75,
+                                        color=[228 / 256, 41 / 256, 38 / 256],
+                                        align="center",
+                                        zorder=1000,
+                                        label="Genic-untranscribed Strand",
+                                    )
+                                    x += 0.2475
+                                    if (
+                                        mutations[sample][key][seq][0]
+                                        / total_count
+                                        * 100
+                                        > ymax
+                                    ):
+                                        ymax = (
+                                            mutations[sample][key][seq][0]
+                                            / total_count
+                                            * 100
+                                        )
+                                    if (
+                                        mutations[sample][key][seq][1]
+                                        / total_count
+                                        * 100
+                                        > ymax
+                                    ):
+                                        ymax = (
+                                            mutations[sample][key][seq][1]
+                                            / total_count
+                                            * 100
+                                        )
+
+                            else:
                                 trans = plt.bar(
                                     x,
-                                    mutations[sample][key][seq][0] / total_count * 100,
+                                    mutations[sample][key][seq][0],
                                     width=0.75,
                                     color=[1 / 256, 70 / 256, 102 / 256],
                                     align="center",
@@ -3131,7 +3927,7 @@ def plotSBS(
                                 x += 0.75
                                 untrans = plt.bar(
                                     x,
-                                    mutations[sample][key][seq][1] / total_count * 100,
+                                    mutations[sample][key][seq][1],
                                     width=0.75,
                                     color=[228 / 256, 41 / 256, 38 / 256],
                                     align="center",
@@ -3139,388 +3935,359 @@ def plotSBS(
                                     label="Genic-untranscribed Strand",
                                 )
                                 x += 0.2475
-                                if (
-                                    mutations[sample][key][seq][0] / total_count * 100
-                                    > ymax
-                                ):
-                                    ymax = (
-                                        mutations[sample][key][seq][0]
-                                        / total_count
-                                        * 100
-                                    )
-                                if (
-                                    mutations[sample][key][seq][1] / total_count * 100
-                                    > ymax
-                                ):
-                                    ymax = (
-                                        mutations[sample][key][seq][1]
-                                        / total_count
-                                        * 100
-                                    )
-
-                        else:
-                            trans = plt.bar(
-                                x,
-                                mutations[sample][key][seq][0],
-                                width=0.75,
-                                color=[1 / 256, 70 / 256, 102 / 256],
-                                align="center",
-                                zorder=1000,
-                                label="Genic-transcribed Strand",
-                            )
-                            x += 0.75
-                            untrans = plt.bar(
-                                x,
-                                mutations[sample][key][seq][1],
-                                width=0.75,
-                                color=[228 / 256, 41 / 256, 38 / 256],
-                                align="center",
-                                zorder=1000,
-                                label="Genic-untranscribed Strand",
-                            )
-                            x += 0.2475
-                            if mutations[sample][key][seq][0] > ymax:
-                                ymax = mutations[sample][key][seq][0]
-                            if mutations[sample][key][seq][1] > ymax:
-                                ymax = mutations[sample][key][seq][1]
-                        x += 1
-                    i += 1
+                                if mutations[sample][key][seq][0] > ymax:
+                                    ymax = mutations[sample][key][seq][0]
+                                if mutations[sample][key][seq][1] > ymax:
+                                    ymax = mutations[sample][key][seq][1]
+                            x += 1
+                        i += 1
 
-                x = 0.0415
-                y3 = 0.87
-                y = int(ymax * 1.25)
-                x_plot = 0
+                    x = 0.0415
+                    y3 = 0.87
+                    y = int(ymax * 1.25)
+                    x_plot = 0
 
-                yText = y3 + 0.06
-                plt.text(
-                    0.1,
-                    yText,
-                    "C>A",
-                    fontsize=55,
-                    fontweight="bold",
-                    fontname="Arial",
-                    transform=plt.gcf().transFigure,
-                )
-                plt.text(
-                    0.255,
-                    yText,
-                    "C>G",
-                    fontsize=55,
-                    fontweight="bold",
-                    fontname="Arial",
-                    transform=plt.gcf().transFigure,
-                )
-                plt.text(
-                    0.415,
-                    yText,
-                    "C>T",
-                    fontsize=55,
-                    fontweight="bold",
-                    fontname="Arial",
-                    transform=plt.gcf().transFigure,
-                )
-                plt.text(
-                    0.575,
-                    yText,
-                    "T>A",
-                    fontsize=55,
-                    fontweight="bold",
-                    fontname="Arial",
-                    transform=plt.gcf().transFigure,
-                )
-                plt.text(
-                    0.735,
-                    yText,
-                    "T>C",
-                    fontsize=55,
-                    fontweight="bold",
-                    fontname="Arial",
-                    transform=plt.gcf().transFigure,
-                )
-                plt.text(
-                    0.89,
-                    yText,
-                    "T>G",
-                    fontsize=55,
-                    fontweight="bold",
-                    fontname="Arial",
-                    transform=plt.gcf().transFigure,
-                )
+                    yText = y3 + 0.06
+                    plt.text(
+                        0.1,
+                        yText,
+                        "C>A",
+                        fontsize=55,
+                        fontweight="bold",
+                        fontname="Arial",
+                        transform=plt.gcf().transFigure,
+                    )
+                    plt.text(
+                        0.255,
+                        yText,
+                        "C>G",
+                        fontsize=55,
+                        fontweight="bold",
+                        fontname="Arial",
+                        transform=plt.gcf().transFigure,
+                    )
+                    plt.text(
+                        0.415,
+                        yText,
+                        "C>T",
+                        fontsize=55,
+                        fontweight="bold",
+                        fontname="Arial",
+                        transform=plt.gcf().transFigure,
+                    )
+                    plt.text(
+                        0.575,
+                        yText,
+                        "T>A",
+                        fontsize=55,
+                        fontweight="bold",
+                        fontname="Arial",
+                        transform=plt.gcf().transFigure,
+                    )
+                    plt.text(
+                        0.735,
+                        yText,
+                        "T>C",
+                        fontsize=55,
+                        fontweight="bold",
+                        fontname="Arial",
+                        transform=plt.gcf().transFigure,
+                    )
+                    plt.text(
+                        0.89,
+                        yText,
+                        "T>G",
+                        fontsize=55,
+                        fontweight="bold",
+                        fontname="Arial",
+                        transform=plt.gcf().transFigure,
+                    )
 
-                if y <= 4:
-                    y += 4
+                    if y <= 4:
+                        y += 4
 
-                while y % 4 != 0:
-                    y += 1
+                    while y % 4 != 0:
+                        y += 1
 
-                y = ymax / 1.025
+                    y = ymax / 1.025
 
-                ytick_offest = float(y / 3)
-                for i in range(0, 6, 1):
-                    panel1.add_patch(
-                        plt.Rectangle(
-                            (x, y3),
-                            0.155,
-                            0.05,
-                            facecolor=colors[i],
-                            clip_on=False,
-                            transform=plt.gcf().transFigure,
+                    ytick_offest = float(y / 3)
+                    for i in range(0, 6, 1):
+                        panel1.add_patch(
+                            plt.Rectangle(
+                                (x, y3),
+                                0.155,
+                                0.05,
+                                facecolor=colors[i],
+                                clip_on=False,
+                                transform=plt.gcf().transFigure,
+                            )
                         )
-                    )
-                    panel1.add_patch(
-                        plt.Rectangle(
-                            (x_plot, 0),
-                            32,
-                            round(ytick_offest * 4, 1),
-                            facecolor=colors[i],
-                            zorder=0,
-                            alpha=0.25,
-                            edgecolor="grey",
+                        panel1.add_patch(
+                            plt.Rectangle(
+                                (x_plot, 0),
+                                32,
+                                round(ytick_offest * 4, 1),
+                                facecolor=colors[i],
+                                zorder=0,
+                                alpha=0.25,
+                                edgecolor="grey",
+                            )
                         )
-                    )
-                    x += 0.1585
-                    x_plot += 32
-
-                if percentage:
-                    ylabs = [
-                        0,
-                        round(ytick_offest, 1),
-                        round(ytick_offest * 2, 1),
-                        round(ytick_offest * 3, 1),
-                        round(ytick_offest * 4, 1),
-                    ]
-                    ylabels = [
-                        str(0),
-                        str(round(ytick_offest, 1)) + "%",
-                        str(round(ytick_offest * 2, 1)) + "%",
-                        str(round(ytick_offest * 3, 1)) + "%",
-                        str(round(ytick_offest * 4, 1)) + "%",
-                    ]
-                else:
-                    ylabs = [
-                        0,
-                        ytick_offest,
-                        ytick_offest * 2,
-                        ytick_offest * 3,
-                        ytick_offest * 4,
-                    ]
-                    ylabels = [
-                        0,
-                        ytick_offest,
-                        ytick_offest * 2,
-                        ytick_offest * 3,
-                        ytick_offest * 4,
-                    ]
-
-                labs = np.arange(0.750, 192.750, 1)
-
-                font_label_size = 30
-                if not percentage:
-                    if int(ylabels[3]) >= 1000:
-                        font_label_size = 20
-
-                if percentage:
-                    if len(ylabels) > 2:
-                        font_label_size = 20
+                        x += 0.1585
+                        x_plot += 32
 
-                if not percentage:
-                    ylabels = getylabels(ylabels)
-
-                panel1.set_xlim([0, 96])
-                panel1.set_ylim([0, y])
-                panel1.set_xticks(labs)
-                panel1.set_yticks(ylabs)
-                count = 0
-                m = 0
-                for i in range(0, 96, 1):
-                    plt.text(
-                        i / 101 + 0.0415,
-                        0.02,
-                        xlabels[i][0],
-                        fontsize=30,
-                        color="gray",
-                        rotation="vertical",
-                        verticalalignment="center",
-                        fontname="Courier New",
-                        transform=plt.gcf().transFigure,
-                    )
-                    plt.text(
-                        i / 101 + 0.0415,
-                        0.044,
-                        xlabels[i][1],
-                        fontsize=30,
-                        color=colors[m],
-                        rotation="vertical",
-                        verticalalignment="center",
-                        fontname="Courier New",
-                        fontweight="bold",
-                        transform=plt.gcf().transFigure,
-                    )
-                    plt.text(
-                        i / 101 + 0.0415,
-                        0.071,
-                        xlabels[i][2],
-                        fontsize=30,
-                        color="gray",
-                        rotation="vertical",
-                        verticalalignment="center",
-                        fontname="Courier New",
-                        transform=plt.gcf().transFigure,
-                    )
-                    count += 1
-                    if count == 16:
-                        count = 0
-                        m += 1
+                    if percentage:
+                        ylabs = [
+                            0,
+                            round(ytick_offest, 1),
+                            round(ytick_offest * 2, 1),
+                            round(ytick_offest * 3, 1),
+                            round(ytick_offest * 4, 1),
+                        ]
+                        ylabels = [
+                            str(0),
+                            str(round(ytick_offest, 1)) + "%",
+                            str(round(ytick_offest * 2, 1)) + "%",
+                            str(round(ytick_offest * 3, 1)) + "%",
+                            str(round(ytick_offest * 4, 1)) + "%",
+                        ]
+                    else:
+                        ylabs = [
+                            0,
+                            ytick_offest,
+                            ytick_offest * 2,
+                            ytick_offest * 3,
+                            ytick_offest * 4,
+                        ]
+                        ylabels = [
+                            0,
+                            ytick_offest,
+                            ytick_offest * 2,
+                            ytick_offest * 3,
+                            ytick_offest * 4,
+                        ]
 
-                if sig_probs:
-                    plt.text(
-                        0.045,
-                        0.75,
-                        sample,
-                        fontsize=60,
-                        weight="bold",
-                        color="black",
-                        fontname="Arial",
-                        transform=plt.gcf().transFigure,
-                    )
-                else:
-                    plt.text(
-                        0.045,
-                        0.75,
-                        sample
-                        + ": "
-                        + "{:,}".format(int(total_count))
-                        + " transcribed subs",
-                        fontsize=60,
-                        weight="bold",
-                        color="black",
-                        fontname="Arial",
-                        transform=plt.gcf().transFigure,
-                    )
+                    labs = np.arange(0.750, 192.750, 1)
 
-                custom_text_upper_plot = ""
-                try:
-                    custom_text_upper[sample_count]
-                except:
-                    custom_text_upper = False
-                try:
-                    custom_text_bottom[sample_count]
-                except:
-                    custom_text_bottom = False
+                    font_label_size = 30
+                    if not percentage:
+                        if int(ylabels[3]) >= 1000:
+                            font_label_size = 20
 
-                if custom_text_upper:
-                    plot_custom_text = True
-                    if len(custom_text_upper[sample_count]) > 40:
-                        print(
-                            "To add a custom text, please limit the string to <40 characters including spaces."
-                        )
-                        plot_custom_text = False
-                if custom_text_bottom:
-                    if len(custom_text_bottom[sample_count]) > 40:
-                        print(
-                            "To add a custom text, please limit the string to <40 characters including spaces."
+                    if percentage:
+                        if len(ylabels) > 2:
+                            font_label_size = 20
+
+                    if not percentage:
+                        ylabels = getylabels(ylabels)
+
+                    panel1.set_xlim([0, 96])
+                    panel1.set_ylim([0, y])
+                    panel1.set_xticks(labs)
+                    panel1.set_yticks(ylabs)
+                    count = 0
+                    m = 0
+                    for i in range(0, 96, 1):
+                        plt.text(
+                            i / 101 + 0.0415,
+                            0.02,
+                            xlabels[i][0],
+                            fontsize=30,
+                            color="gray",
+                            rotation="vertical",
+                            verticalalignment="center",
+                            fontname="Courier New",
+                            transform=plt.gcf().transFigure,
                         )
-                        plot_custom_text = False
-
-                if plot_custom_text:
-                    x_pos_custom = 0.84
-                    if custom_text_upper and custom_text_bottom:
-                        custom_text_upper_plot = (
-                            custom_text_upper[sample_count]
-                            + "\n"
-                            + custom_text_bottom[sample_count]
+                        plt.text(
+                            i / 101 + 0.0415,
+                            0.044,
+                            xlabels[i][1],
+                            fontsize=30,
+                            color=colors[m],
+                            rotation="vertical",
+                            verticalalignment="center",
+                            fontname="Courier New",
+                            fontweight="bold",
+                            transform=plt.gcf().transFigure,
                         )
-
-                    if custom_text_upper and not custom_text_bottom:
-                        custom_text_upper_plot = custom_text_upper[sample_count]
-                        panel1.text(
-                            x_pos_custom,
-                            0.78,
-                            custom_text_upper_plot,
-                            fontsize=40,
-                            weight="bold",
-                            color="black",
-                            fontname="Arial",
+                        plt.text(
+                            i / 101 + 0.0415,
+                            0.071,
+                            xlabels[i][2],
+                            fontsize=30,
+                            color="gray",
+                            rotation="vertical",
+                            verticalalignment="center",
+                            fontname="Courier New",
                             transform=plt.gcf().transFigure,
-                            ha="right",
                         )
+                        count += 1
+                        if count == 16:
+                            count = 0
+                            m += 1
 
-                    elif custom_text_upper and custom_text_bottom:
-                        panel1.text(
-                            x_pos_custom,
-                            0.72,
-                            custom_text_upper_plot,
-                            fontsize=40,
+                    if sig_probs:
+                        plt.text(
+                            0.045,
+                            0.75,
+                            sample,
+                            fontsize=60,
                             weight="bold",
                             color="black",
                             fontname="Arial",
                             transform=plt.gcf().transFigure,
-                            ha="right",
                         )
-
-                    elif not custom_text_upper and custom_text_bottom:
-                        custom_text_upper_plot = custom_text_bottom[sample_count]
-                        panel1.text(
-                            x_pos_custom,
-                            0.78,
-                            custom_text_upper_plot,
-                            fontsize=40,
+                    else:
+                        plt.text(
+                            0.045,
+                            0.75,
+                            sample
+                            + ": "
+                            + "{:,}".format(int(total_count))
+                            + " transcribed subs",
+                            fontsize=60,
                             weight="bold",
                             color="black",
                             fontname="Arial",
                             transform=plt.gcf().transFigure,
-                            ha="right",
                         )
 
-                panel1.set_yticklabels(ylabels, fontsize=font_label_size)
-                plt.gca().yaxis.grid(True)
-                plt.gca().grid(which="major", axis="y", color=[0.6, 0.6, 0.6], zorder=1)
-                panel1.set_xlabel("")
-                panel1.set_ylabel("")
-                plt.legend(handles=[trans, untrans], prop={"size": 30})
-                if percentage:
-                    plt.ylabel(
-                        "Percentage of Single Base Substitutions",
-                        fontsize=35,
-                        fontname="Times New Roman",
-                        weight="bold",
-                    )
-                else:
-                    plt.ylabel(
-                        "Number of Single Base Substitutions",
-                        fontsize=35,
-                        fontname="Times New Roman",
-                        weight="bold",
-                    )
+                    custom_text_upper_plot = ""
+                    try:
+                        custom_text_upper[sample_count]
+                    except:
+                        custom_text_upper = False
+                    try:
+                        custom_text_bottom[sample_count]
+                    except:
+                        custom_text_bottom = False
+
+                    if custom_text_upper:
+                        plot_custom_text = True
+                        if len(custom_text_upper[sample_count]) > 40:
+                            print(
+                                "To add a custom text, please limit the string to <40 characters including spaces."
+                            )
+                            plot_custom_text = False
+                    if custom_text_bottom:
+                        if len(custom_text_bottom[sample_count]) > 40:
+                            print(
+                                "To add a custom text, please limit the string to <40 characters including spaces."
+                            )
+                            plot_custom_text = False
+
+                    if plot_custom_text:
+                        x_pos_custom = 0.84
+                        if custom_text_upper and custom_text_bottom:
+                            custom_text_upper_plot = (
+                                custom_text_upper[sample_count]
+                                + "\n"
+                                + custom_text_bottom[sample_count]
+                            )
 
-                panel1.tick_params(
-                    axis="both",
-                    which="both",
-                    bottom=False,
-                    labelbottom=False,
-                    left=False,
-                    labelleft=True,
-                    right=False,
-                    labelright=False,
-                    top=False,
-                    labeltop=False,
-                    direction="in",
-                    length=25,
-                    colors=[0.6, 0.6, 0.6],
-                )
+                        if custom_text_upper and not custom_text_bottom:
+                            custom_text_upper_plot = custom_text_upper[sample_count]
+                            panel1.text(
+                                x_pos_custom,
+                                0.78,
+                                custom_text_upper_plot,
+                                fontsize=40,
+                                weight="bold",
+                                color="black",
+                                fontname="Arial",
+                                transform=plt.gcf().transFigure,
+                                ha="right",
+                            )
 
-                [i.set_color("black") for i in plt.gca().get_yticklabels()]
+                        elif custom_text_upper and custom_text_bottom:
+                            panel1.text(
+                                x_pos_custom,
+                                0.72,
+                                custom_text_upper_plot,
+                                fontsize=40,
+                                weight="bold",
+                                color="black",
+                                fontname="Arial",
+                                transform=plt.gcf().transFigure,
+                                ha="right",
+                            )
+
+                        elif not custom_text_upper and custom_text_bottom:
+                            custom_text_upper_plot = custom_text_bottom[sample_count]
+                            panel1.text(
+                                x_pos_custom,
+                                0.78,
+                                custom_text_upper_plot,
+                                fontsize=40,
+                                weight="bold",
+                                color="black",
+                                fontname="Arial",
+                                transform=plt.gcf().transFigure,
+                                ha="right",
+                            )
+
+                    panel1.set_yticklabels(ylabels, fontsize=font_label_size)
+                    plt.gca().yaxis.grid(True)
+                    plt.gca().grid(
+                        which="major", axis="y", color=[0.6, 0.6, 0.6], zorder=1
+                    )
+                    panel1.set_xlabel("")
+                    panel1.set_ylabel("")
+                    plt.legend(handles=[trans, untrans], prop={"size": 30})
+                    if percentage:
+                        plt.ylabel(
+                            "Percentage of Single Base Substitutions",
+                            fontsize=35,
+                            fontname="Times New Roman",
+                            weight="bold",
+                        )
+                    else:
+                        plt.ylabel(
+                            "Number of Single Base Substitutions",
+                            fontsize=35,
+                            fontname="Times New Roman",
+                            weight="bold",
+                        )
 
-                pp.savefig(plot1)
-                plt.close()
+                    panel1.tick_params(
+                        axis="both",
+                        which="both",
+                        bottom=False,
+                        labelbottom=False,
+                        left=False,
+                        labelleft=True,
+                        right=False,
+                        labelright=False,
+                        top=False,
+                        labeltop=False,
+                        direction="in",
+                        length=25,
+                        colors=[0.6, 0.6, 0.6],
+                    )
+
+                    [i.set_color("black") for i in plt.gca().get_yticklabels()]
+
+                    errors.stop()
+                    pp.savefig(plot1)
+                    plt.close()
+
+                    progress(sample, path=file_path)
+                except Exception as e:
+                    errors.failed(sample, e)
+                    plt.close()
                 sample_count += 1
             pp.close()
 
-        except:
-            print("There may be an issue with the formatting of your matrix file.")
-            pdf_path = output_path + "SBS_384_plots_" + project + ".pdf"
-            if os.path.isfile(pdf_path):
-                os.remove(pdf_path)
+        except Exception as e:
+            discard_pdf(pp, output_path + "SBS_384_plots_" + project + ".pdf")
+            if isinstance(e, PlottingError):
+                raise
+            raise MatrixFormatError(
+                "ERROR: there may be an issue with the formatting of your matrix file."
+            ) from e
+        errors.finish()
 
     elif (
         plot_type == "192_extended"
@@ -3538,8 +4305,8 @@ def plotSBS(
                 and first_line[0][6] != ">"
                 and first_line[0][3] != ">"
             ):
-                sys.exit(
-                    "The matrix does not match the correct SBS288 format. Please check you formatting and rerun this plotting function."
+                raise MatrixFormatError(
+                    "ERROR: The matrix does not match the correct SBS288 format. Please check you formatting and rerun this plotting function."
                 )
 
         file_path = os.path.join(output_path, f"SBS_384_extended_plots_{project}.pdf")
@@ -3556,6 +4323,12 @@ def plotSBS(
                     samples = first_line.strip().split("\t")
                     samples = samples[1:]
 
+                sample_columns = select_sample_columns(
+                    samples, sample_selection, 3 if pcawg else 1
+                )
+                samples = list(sample_columns)
+                progress = PlotProgress(progress_callback, samples)
+                errors = ErrorPolicy(on_error, progress, sample_timeout, cancel)
                 for sample in samples:
                     mutations[sample] = OrderedDict()
                     mutations[sample]["C>A"] = OrderedDict()
@@ -3584,20 +4357,12 @@ def plotSBS(
                         sample_index = 1
 
                     for sample in samples:
-                        if percentage:
-                            mutCount = float(line[sample_index])
-                            if mutCount < 1 and mutCount > 0:
-                                sig_probs = True
-                        else:
-                            try:
-                                mutCount = int(line[sample_index])
-                            except:
-                                print(
-                                    "It appears that the provided matrix does not contain mutation counts.\n\tIf you have provided a signature activity matrix, please change the percentage parameter to True.\n\tOtherwise, ",
-                                    end="",
-                                )
-
-                            # mutCount = int(line[sample_index])
+                        sample_index = sample_columns[sample]
+                        mutCount = read_mutation_count(
+                            line, sample_index, sample, percentage, errors
+                        )
+                        if percentage and mutCount < 1 and mutCount > 0:
+                            sig_probs = True
                         if nuc not in mutations[sample][mut_type].keys():
                             mutations[sample][mut_type][nuc] = [0, 0, 0]
                         if bias == "T":
@@ -3610,43 +4375,111 @@ def plotSBS(
 
             sample_count = 0
             for sample in mutations.keys():
-                total_count = sum(
-                    sum(sum(tsb) for tsb in nuc.values())
-                    for nuc in mutations[sample].values()
-                )
-                total_trans = sum(
-                    sum(sum(tsb[:-1]) for tsb in nuc.values())
-                    for nuc in mutations[sample].values()
-                )
-                total_nontrans = sum(
-                    sum(tsb[-1] for tsb in nuc.values())
-                    for nuc in mutations[sample].values()
-                )
-                plt.rcParams["axes.linewidth"] = 2
-                plot1 = plt.figure(figsize=(43.93, 9.92))
-                plt.rc("axes", edgecolor="lightgray")
-                panel1 = plt.axes([0.04, 0.09, 0.95, 0.77])
-                xlabels = []
-
-                x = 0.7
-                ymax = 0
-                colors = [
-                    [3 / 256, 189 / 256, 239 / 256],
-                    [1 / 256, 1 / 256, 1 / 256],
-                    [228 / 256, 41 / 256, 38 / 256],
-                    [203 / 256, 202 / 256, 202 / 256],
-                    [162 / 256, 207 / 256, 99 / 256],
-                    [236 / 256, 199 / 256, 197 / 256],
-                ]
-                i = 0
-                for key in mutations[sample]:
-                    for seq in mutations[sample][key]:
-                        xlabels.append(seq[0] + seq[2] + seq[6])
-                        if percentage:
-                            if total_count > 0:
+                if sample in errors:
+                    continue
+                try:
+                    errors.start(sample)
+                    total_count = sum(
+                        sum(sum(tsb) for tsb in nuc.values())
+                        for nuc in mutations[sample].values()
+                    )
+                    total_trans = sum(
+                        sum(sum(tsb[:-1]) for tsb in nuc.values())
+                        for nuc in mutations[sample].values()
+                    )
+                    total_nontrans = sum(
+                        sum(tsb[-1] for tsb in nuc.values())
+                        for nuc in mutations[sample].values()
+                    )
+                    plt.rcParams["axes.linewidth"] = 2
+                    plot1 = plt.figure(figsize=(43.93, 9.92))
+                    plt.rc("axes", edgecolor="lightgray")
+                    panel1 = plt.axes([0.04, 0.09, 0.95, 0.77])
+                    xlabels = []
+
+                    x = 0.7
+                    ymax = 0
+                    colors = get_context_spec("SBS96").palette
+                    i = 0
+                    for key in mutations[sample]:
+                        for seq in mutations[sample][key]:
+                            xlabels.append(seq[0] + seq[2] + seq[6])
+                            if percentage:
+                                if total_count > 0:
+                                    trans = plt.bar(
+                                        x,
+                                        mutations[sample][key][seq][0]
+                                        / total_count
+                                        * 100,
+                                        width=0.75,
+                                        color=[1 / 256, 70 / 256, 102 / 256],
+                                        align="center",
+                                        zorder=1000,
+                                        label="Genic-transcribed Strand",
+                                    )
+                                    x += 0.75
+                                    untrans = plt.bar(
+                                        x,
+                                        mutations[sample][key][seq][1]
+                                        / total_count
+                                        * 100,
+                                        width=0.75,
+                                        color=[228 / 256, 41 / 256, 38 / 256],
+                                        align="center",
+                                        zorder=1000,
+                                        label="Genic-untranscribed Strand",
+                                    )
+                                    x += 0.75
+                                    nontrans = plt.bar(
+                                        x,
+                                        mutations[sample][key][seq][2]
+                                        / total_count
+                                        * 100,
+                                        width=0.75,
+                                        color="green",
+                                        align="center",
+                                        zorder=1000,
+                                        label="Intergenic",
+                                    )
+                                    x += 0.2475
+                                    if (
+                                        mutations[sample][key][seq][0]
+                                        / total_count
+                                        * 100
+                                        > ymax
+                                    ):
+                                        ymax = (
+                                            mutations[sample][key][seq][0]
+                                            / total_count
+                                            * 100
+                                        )
+                                    if (
+                                        mutations[sample][key][seq][1]
+                                        / total_count
+                                        * 100
+                                        > ymax
+                                    ):
+                                        ymax = (
+                                            mutations[sample][key][seq][1]
+                                            / total_count
+                                            * 100
+                                        )
+                                    if (
+                                        mutations[sample][key][seq][2]
+                                        / total_count
+                                        * 100
+                                        > ymax
+                                    ):
+                                        ymax = (
+                                            mutations[sample][key][seq][2]
+                                            / total_count
+                                            * 100
+                                        )
+
+                            else:
                                 trans = plt.bar(
                                     x,
-                                    mutations[sample][key][seq][0] / total_count * 100,
+                                    mutations[sample][key][seq][0],
                                     width=0.75,
                                     color=[1 / 256, 70 / 256, 102 / 256],
                                     align="center",
@@ -3656,7 +4489,7 @@ def plotSBS(
                                 x += 0.75
                                 untrans = plt.bar(
                                     x,
-                                    mutations[sample][key][seq][1] / total_count * 100,
+                                    mutations[sample][key][seq][1],
                                     width=0.75,
                                     color=[228 / 256, 41 / 256, 38 / 256],
                                     align="center",
@@ -3666,7 +4499,7 @@ def plotSBS(
                                 x += 0.75
                                 nontrans = plt.bar(
                                     x,
-                                    mutations[sample][key][seq][2] / total_count * 100,
+                                    mutations[sample][key][seq][2],
                                     width=0.75,
                                     color="green",
                                     align="center",
@@ -3674,424 +4507,376 @@ def plotSBS(
                                     label="Intergenic",
                                 )
                                 x += 0.2475
-                                if (
-                                    mutations[sample][key][seq][0] / total_count * 100
-                                    > ymax
-                                ):
-                                    ymax = (
-                                        mutations[sample][key][seq][0]
-                                        / total_count
-                                        * 100
-                                    )
-                                if (
-                                    mutations[sample][key][seq][1] / total_count * 100
-                                    > ymax
-                                ):
-                                    ymax = (
-                                        mutations[sample][key][seq][1]
-                                        / total_count
-                                        * 100
-                                    )
-                                if (
-                                    mutations[sample][key][seq][2] / total_count * 100
-                                    > ymax
-                                ):
-                                    ymax = (
-                                        mutations[sample][key][seq][2]
-                                        / total_count
-                                        * 100
-                                    )
-
-                        else:
-                            trans = plt.bar(
-                                x,
-                                mutations[sample][key][seq][0],
-                                width=0.75,
-                                color=[1 / 256, 70 / 256, 102 / 256],
-                                align="center",
-                                zorder=1000,
-                                label="Genic-transcribed Strand",
-                            )
-                            x += 0.75
-                            untrans = plt.bar(
-                                x,
-                                mutations[sample][key][seq][1],
-                                width=0.75,
-                                color=[228 / 256, 41 / 256, 38 / 256],
-                                align="center",
-                                zorder=1000,
-                                label="Genic-untranscribed Strand",
-                            )
-                            x += 0.75
-                            nontrans = plt.bar(
-                                x,
-                                mutations[sample][key][seq][2],
-                                width=0.75,
-                                color="green",
-                                align="center",
-                                zorder=1000,
-                                label="Intergenic",
-                            )
-                            x += 0.2475
-                            if mutations[sample][key][seq][0] > ymax:
-                                ymax = mutations[sample][key][seq][0]
-                            if mutations[sample][key][seq][1] > ymax:
-                                ymax = mutations[sample][key][seq][1]
-                            if mutations[sample][key][seq][2] > ymax:
-                                ymax = mutations[sample][key][seq][2]
-                        x += 1
-                    i += 1
-
-                x = 0.0415
-                y3 = 0.87
-                y = int(ymax * 1.25)
-                x_plot = 0
-
-                yText = y3 + 0.06
-                plt.text(
-                    0.1,
-                    yText,
-                    "C>A",
-                    fontsize=55,
-                    fontweight="bold",
-                    fontname="Arial",
-                    transform=plt.gcf().transFigure,
-                )
-                plt.text(
-                    0.255,
-                    yText,
-                    "C>G",
-                    fontsize=55,
-                    fontweight="bold",
-                    fontname="Arial",
-                    transform=plt.gcf().transFigure,
-                )
-                plt.text(
-                    0.415,
-                    yText,
-                    "C>T",
-                    fontsize=55,
-                    fontweight="bold",
-                    fontname="Arial",
-                    transform=plt.gcf().transFigure,
-                )
-                plt.text(
-                    0.575,
-                    yText,
-                    "T>A",
-                    fontsize=55,
-                    fontweight="bold",
-                    fontname="Arial",
-                    transform=plt.gcf().transFigure,
-                )
-                plt.text(
-                    0.735,
-                    yText,
-                    "T>C",
-                    fontsize=55,
-                    fontweight="bold",
-                    fontname="Arial",
-                    transform=plt.gcf().transFigure,
-                )
-                plt.text(
-                    0.89,
-                    yText,
-                    "T>G",
-                    fontsize=55,
-                    fontweight="bold",
-                    fontname="Arial",
-                    transform=plt.gcf().transFigure,
-                )
-
-                if y <= 4:
-                    y += 4
-
-                while y % 4 != 0:
-                    y += 1
+                                if mutations[sample][key][seq][0] > ymax:
+                                    ymax = mutations[sample][key][seq][0]
+                                if mutations[sample][key][seq][1] > ymax:
+                                    ymax = mutations[sample][key][seq][1]
+                                if mutations[sample][key][seq][2] > ymax:
+                                    ymax = mutations[sample][key][seq][2]
+                            x += 1
+                        i += 1
 
-                y = ymax / 1.025
+                    x = 0.0415
+                    y3 = 0.87
+                    y = int(ymax * 1.25)
+                    x_plot = 0
 
-                ytick_offest = float(y / 3)
-                for i in range(0, 6, 1):
-                    panel1.add_patch(
-                        plt.Rectangle(
-                            (x, y3),
-                            0.155,
-                            0.05,
-                            facecolor=colors[i],
-                            clip_on=False,
-                            transform=plt.gcf().transFigure,
-                        )
-                    )
-                    panel1.add_patch(
-                        plt.Rectangle(
-                            (x_plot, 0),
-                            44.1,
-                            round(ytick_offest * 4, 1),
-                            facecolor=colors[i],
-                            zorder=0,
-                            alpha=0.25,
-                            edgecolor="grey",
-                        )
+                    yText = y3 + 0.06
+                    plt.text(
+                        0.1,
+                        yText,
+                        "C>A",
+                        fontsize=55,
+                        fontweight="bold",
+                        fontname="Arial",
+                        transform=plt.gcf().transFigure,
                     )
-                    x += 0.1585
-                    x_plot += 44.1
-
-                if percentage:
-                    ylabs = [
-                        0,
-                        round(ytick_offest, 1),
-                        round(ytick_offest * 2, 1),
-                        round(ytick_offest * 3, 1),
-                        round(ytick_offest * 4, 1),
-                    ]
-                    ylabels = [
-                        str(0),
-                        str(round(ytick_offest, 1)) + "%",
-                        str(round(ytick_offest * 2, 1)) + "%",
-                        str(round(ytick_offest * 3, 1)) + "%",
-                        str(round(ytick_offest * 4, 1)) + "%",
-                    ]
-                else:
-                    ylabs = [
-                        0,
-                        ytick_offest,
-                        ytick_offest * 2,
-                        ytick_offest * 3,
-                        ytick_offest * 4,
-                    ]
-                    ylabels = [
-                        0,
-                        ytick_offest,
-                        ytick_offest * 2,
-                        ytick_offest * 3,
-                        ytick_offest * 4,
-                    ]
-
-                labs = np.arange(0.750, 192.750, 1)
-
-                font_label_size = 30
-                if not percentage:
-                    if int(ylabels[3]) >= 1000:
-                        font_label_size = 20
-
-                if percentage:
-                    if len(ylabels) > 2:
-                        font_label_size = 20
-
-                if not percentage:
-                    ylabels = getylabels(ylabels)
-
-                panel1.set_xlim([0, 264])
-                panel1.set_ylim([0, y])
-                panel1.set_xticks(labs)
-                panel1.set_yticks(ylabs)
-                count = 0
-                m = 0
-                for i in range(0, 96, 1):
                     plt.text(
-                        i / 101 + 0.0415,
-                        0.02,
-                        xlabels[i][0],
-                        fontsize=30,
-                        color="gray",
-                        rotation="vertical",
-                        verticalalignment="center",
-                        fontname="Courier New",
+                        0.255,
+                        yText,
+                        "C>G",
+                        fontsize=55,
+                        fontweight="bold",
+                        fontname="Arial",
                         transform=plt.gcf().transFigure,
                     )
                     plt.text(
-                        i / 101 + 0.0415,
-                        0.044,
-                        xlabels[i][1],
-                        fontsize=30,
-                        color=colors[m],
-                        rotation="vertical",
-                        verticalalignment="center",
-                        fontname="Courier New",
+                        0.415,
+                        yText,
+                        "C>T",
+                        fontsize=55,
                         fontweight="bold",
+                        fontname="Arial",
                         transform=plt.gcf().transFigure,
                     )
                     plt.text(
-                        i / 101 + 0.0415,
-                        0.071,
-                        xlabels[i][2],
-                        fontsize=30,
-                        color="gray",
-                        rotation="vertical",
-                        verticalalignment="center",
-                        fontname="Courier New",
+                        0.575,
+                        yText,
+                        "T>A",
+                        fontsize=55,
+                        fontweight="bold",
+                        fontname="Arial",
                         transform=plt.gcf().transFigure,
                     )
-                    count += 1
-                    if count == 16:
-                        count = 0
-                        m += 1
-
-                if sig_probs:
                     plt.text(
-                        0.045,
-                        0.75,
-                        sample,
-                        fontsize=60,
-                        weight="bold",
-                        color="black",
+                        0.735,
+                        yText,
+                        "T>C",
+                        fontsize=55,
+                        fontweight="bold",
                         fontname="Arial",
                         transform=plt.gcf().transFigure,
                     )
-                else:
                     plt.text(
-                        0.045,
-                        0.75,
-                        sample
-                        + ": "
-                        + "{:,}".format(int(total_nontrans))
-                        + " non-trans & "
-                        + "{:,}".format(int(total_trans))
-                        + " trans subs",
-                        fontsize=60,
-                        weight="bold",
-                        color="black",
+                        0.89,
+                        yText,
+                        "T>G",
+                        fontsize=55,
+                        fontweight="bold",
                         fontname="Arial",
                         transform=plt.gcf().transFigure,
                     )
 
-                custom_text_upper_plot = ""
-                try:
-                    custom_text_upper[sample_count]
-                except:
-                    custom_text_upper = False
-                try:
-                    custom_text_bottom[sample_count]
-                except:
-                    custom_text_bottom = False
+                    if y <= 4:
+                        y += 4
 
-                if custom_text_upper:
-                    plot_custom_text = True
-                    if len(custom_text_upper[sample_count]) > 40:
-                        print(
-                            "To add a custom text, please limit the string to <40 characters including spaces."
+                    while y % 4 != 0:
+                        y += 1
+
+                    y = ymax / 1.025
+
+                    ytick_offest = float(y / 3)
+                    for i in range(0, 6, 1):
+                        panel1.add_patch(
+                            plt.Rectangle(
+                                (x, y3),
+                                0.155,
+                                0.05,
+                                facecolor=colors[i],
+                                clip_on=False,
+                                transform=plt.gcf().transFigure,
+                            )
                         )
-                        plot_custom_text = False
-                if custom_text_bottom:
-                    if len(custom_text_bottom[sample_count]) > 40:
-                        print(
-                            "To add a custom text, please limit the string to <40 characters including spaces."
+                        panel1.add_patch(
+                            plt.Rectangle(
+                                (x_plot, 0),
+                                44.1,
+                                round(ytick_offest * 4, 1),
+                                facecolor=colors[i],
+                                zorder=0,
+                                alpha=0.25,
+                                edgecolor="grey",
+                            )
                         )
-                        plot_custom_text = False
+                        x += 0.1585
+                        x_plot += 44.1
 
-                if plot_custom_text:
-                    x_pos_custom = 0.84
-                    if custom_text_upper and custom_text_bottom:
-                        custom_text_upper_plot = (
-                            custom_text_upper[sample_count]
-                            + "\n"
-                            + custom_text_bottom[sample_count]
-                        )
+                    if percentage:
+                        ylabs = [
+                            0,
+                            round(ytick_offest, 1),
+                            round(ytick_offest * 2, 1),
+                            round(ytick_offest * 3, 1),
+                            round(ytick_offest * 4, 1),
+                        ]
+                        ylabels = [
+                            str(0),
+                            str(round(ytick_offest, 1)) + "%",
+                            str(round(ytick_offest * 2, 1)) + "%",
+                            str(round(ytick_offest * 3, 1)) + "%",
+                            str(round(ytick_offest * 4, 1)) + "%",
+                        ]
+                    else:
+                        ylabs = [
+                            0,
+                            ytick_offest,
+                            ytick_offest * 2,
+                            ytick_offest * 3,
+                            ytick_offest * 4,
+                        ]
+                        ylabels = [
+                            0,
+                            ytick_offest,
+                            ytick_offest * 2,
+                            ytick_offest * 3,
+                            ytick_offest * 4,
+                        ]
 
-                    if custom_text_upper and not custom_text_bottom:
-                        custom_text_upper_plot = custom_text_upper[sample_count]
-                        panel1.text(
-                            x_pos_custom,
-                            0.78,
-                            custom_text_upper_plot,
-                            fontsize=40,
-                            weight="bold",
-                            color="black",
-                            fontname="Arial",
+                    labs = np.arange(0.750, 192.750, 1)
+
+                    font_label_size = 30
+                    if not percentage:
+                        if int(ylabels[3]) >= 1000:
+                            font_label_size = 20
+
+                    if percentage:
+                        if len(ylabels) > 2:
+                            font_label_size = 20
+
+                    if not percentage:
+                        ylabels = getylabels(ylabels)
+
+                    panel1.set_xlim([0, 264])
+                    panel1.set_ylim([0, y])
+                    panel1.set_xticks(labs)
+                    panel1.set_yticks(ylabs)
+                    count = 0
+                    m = 0
+                    for i in range(0, 96, 1):
+                        plt.text(
+                            i / 101 + 0.0415,
+                            0.02,
+                            xlabels[i][0],
+                            fontsize=30,
+                            color="gray",
+                            rotation="vertical",
+                            verticalalignment="center",
+                            fontname="Courier New",
                             transform=plt.gcf().transFigure,
-                            ha="right",
                         )
+                        plt.text(
+                            i / 101 + 0.0415,
+                            0.044,
+                            xlabels[i][1],
+                            fontsize=30,
+                            color=colors[m],
+                            rotation="vertical",
+                            verticalalignment="center",
+                            fontname="Courier New",
+                            fontweight="bold",
+                            transform=plt.gcf().transFigure,
+                        )
+                        plt.text(
+                            i / 101 + 0.0415,
+                            0.071,
+                            xlabels[i][2],
+                            fontsize=30,
+                            color="gray",
+                            rotation="vertical",
+                            verticalalignment="center",
+                            fontname="Courier New",
+                            transform=plt.gcf().transFigure,
+                        )
+                        count += 1
+                        if count == 16:
+                            count = 0
+                            m += 1
 
-                    elif custom_text_upper and custom_text_bottom:
-                        panel1.text(
-                            x_pos_custom,
-                            0.72,
-                            custom_text_upper_plot,
-                            fontsize=40,
+                    if sig_probs:
+                        plt.text(
+                            0.045,
+                            0.75,
+                            sample,
+                            fontsize=60,
                             weight="bold",
                             color="black",
                             fontname="Arial",
                             transform=plt.gcf().transFigure,
-                            ha="right",
                         )
-
-                    elif not custom_text_upper and custom_text_bottom:
-                        custom_text_upper_plot = custom_text_bottom[sample_count]
-                        panel1.text(
-                            x_pos_custom,
-                            0.78,
-                            custom_text_upper_plot,
-                            fontsize=40,
+                    else:
+                        plt.text(
+                            0.045,
+                            0.75,
+                            sample
+                            + ": "
+                            + "{:,}".format(int(total_nontrans))
+                            + " non-trans & "
+                            + "{:,}".format(int(total_trans))
+                            + " trans subs",
+                            fontsize=60,
                             weight="bold",
                             color="black",
                             fontname="Arial",
                             transform=plt.gcf().transFigure,
-                            ha="right",
                         )
 
-                panel1.set_yticklabels(ylabels, fontsize=font_label_size)
-                plt.gca().yaxis.grid(True)
-                plt.gca().grid(which="major", axis="y", color=[0.6, 0.6, 0.6], zorder=1)
-                panel1.set_xlabel("")
-                panel1.set_ylabel("")
-                plt.legend(
-                    handles=[trans, untrans, nontrans],
-                    prop={"size": 20},
-                    loc="upper right",
-                )
-                if percentage:
-                    plt.ylabel(
-                        "Percentage of Single Base Substitutions",
-                        fontsize=35,
-                        fontname="Times New Roman",
-                        weight="bold",
-                    )
-                else:
-                    plt.ylabel(
-                        "Number of Single Base Substitutions",
-                        fontsize=35,
-                        fontname="Times New Roman",
-                        weight="bold",
-                    )
-
-                panel1.tick_params(
-                    axis="both",
-                    which="both",
-                    bottom=False,
-                    labelbottom=False,
-                    left=False,
-                    labelleft=True,
-                    right=False,
-                    labelright=False,
-                    top=False,
-                    labeltop=False,
-                    direction="in",
-                    length=25,
-                    colors=[0.6, 0.6, 0.6],
-                )
-
-                [i.set_color("black") for i in plt.gca().get_yticklabels()]
+                    custom_text_upper_plot = ""
+                    try:
+                        custom_text_upper[sample_count]
+                    except:
+                        custom_text_upper = False
+                    try:
+                        custom_text_bottom[sample_count]
+                    except:
+                        custom_text_bottom = False
+
+                    if custom_text_upper:
+                        plot_custom_text = True
+                        if len(custom_text_upper[sample_count]) > 40:
+                            print(
+                                "To add a custom text, please limit the string to <40 characters including spaces."
+                            )
+                            plot_custom_text = False
+                    if custom_text_bottom:
+                        if len(custom_text_bottom[sample_count]) > 40:
+                            print(
+                                "To add a custom text, please limit the string to <40 characters including spaces."
+                            )
+                            plot_custom_text = False
+
+                    if plot_custom_text:
+                        x_pos_custom = 0.84
+                        if custom_text_upper and custom_text_bottom:
+                            custom_text_upper_plot = (
+                                custom_text_upper[sample_count]
+                                + "\n"
+                                + custom_text_bottom[sample_count]
+                            )
 
-                pp.savefig(plot1)
-                plt.close()
-                sample_count += 1
-            pp.close()
+                        if custom_text_upper and not custom_text_bottom:
+                            custom_text_upper_plot = custom_text_upper[sample_count]
+                            panel1.text(
+                                x_pos_custom,
+                                0.78,
+                                custom_text_upper_plot,
+                                fontsize=40,
+                                weight="bold",
+                                color="black",
+                                fontname="Arial",
+                                transform=plt.gcf().transFigure,
+                                ha="right",
+                            )
 
-        except:
-            print("There may be an issue with the formatting of your matrix file.")
-            pdf_path = output_path + "SBS_384_extended_plots_" + project + ".pdf"
-            if os.path.isfile(pdf_path):
-                os.remove(pdf_path)
+                        elif custom_text_upper and custom_text_bottom:
+                            panel1.text(
+                                x_pos_custom,
+                                0.72,
+                                custom_text_upper_plot,
+                                fontsize=40,
+                                weight="bold",
+                                color="black",
+                                fontname="Arial",
+                                transform=plt.gcf().transFigure,
+                                ha="right",
+                            )
 
-    elif plot_type == "6":
+                        elif not custom_text_upper and custom_text_bottom:
+                            custom_text_upper_plot = custom_text_bottom[sample_count]
+                            panel1.text(
+                                x_pos_custom,
+                                0.78,
+                                custom_text_upper_plot,
+                                fontsize=40,
+                                weight="bold",
+                                color="black",
+                                fontname="Arial",
+                                transform=plt.gcf().transFigure,
+                                ha="right",
+                            )
+
+                    panel1.set_yticklabels(ylabels, fontsize=font_label_size)
+                    plt.gca().yaxis.grid(True)
+                    plt.gca().grid(
+                        which="major", axis="y", color=[0.6, 0.6, 0.6], zorder=1
+                    )
+                    panel1.set_xlabel("")
+                    panel1.set_ylabel("")
+                    plt.legend(
+                        handles=[trans, untrans, nontrans],
+                        prop={"size": 20},
+                        loc="upper right",
+                    )
+                    if percentage:
+                        plt.ylabel(
+                            "Percentage of Single Base Substitutions",
+                            fontsize=35,
+                            fontname="Times New Roman",
+                            weight="bold",
+                        )
+                    else:
+                        plt.ylabel(
+                            "Number of Single Base Substitutions",
+                            fontsize=35,
+                            fontname="Times New Roman",
+                            weight="bold",
+                        )
+
+                    panel1.tick_params(
+                        axis="both",
+                        which="both",
+                        bottom=False,
+                        labelbottom=False,
+                        left=False,
+                        labelleft=True,
+                        right=False,
+                        labelright=False,
+                        top=False,
+                        labeltop=False,
+                        direction="in",
+                        length=25,
+                        colors=[0.6, 0.6, 0.6],
+                    )
+
+                    [i.set_color("black") for i in plt.gca().get_yticklabels()]
+
+                    errors.stop()
+                    pp.savefig(plot1)
+                    plt.close()
+
+                    progress(sample, path=file_path)
+                except Exception as e:
+                    errors.failed(sample, e)
+                    plt.close()
+                sample_count += 1
+            pp.close()
+
+        except Exception as e:
+            discard_pdf(pp, output_path + "SBS_384_extended_plots_" + project + ".pdf")
+            if isinstance(e, PlottingError):
+                raise
+            raise MatrixFormatError(
+                "ERROR: there may be an issue with the formatting of your matrix file."
+            ) from e
+        errors.finish()
+
+    elif plot_type == "6":
         with open(matrix_path) as f:
             next(f)
             first_line = f.readline()
             first_line = first_line.strip().split()
             if len(first_line[0]) > 3:
-                sys.exit(
-                    "The matrix does not match the correct SBS6 format. Please check you formatting and rerun this plotting function."
+                raise MatrixFormatError(
+                    "ERROR: The matrix does not match the correct SBS6 format. Please check you formatting and rerun this plotting function."
                 )
         file_path = os.path.join(output_path, f"SBS_6_plots_{project}.pdf")
         pp = PdfPages(file_path)
@@ -4103,6 +4888,10 @@ def plotSBS(
                 first_line = f.readline()
                 samples = first_line.strip().split("\t")
                 samples = samples[1:]
+                sample_columns = select_sample_columns(samples, sample_selection, 1)
+                samples = list(sample_columns)
+                progress = PlotProgress(progress_callback, samples)
+                errors = ErrorPolicy(on_error, progress, sample_timeout, cancel)
                 for sample in samples:
                     mutations[sample] = OrderedDict()
                     mutations[sample]["C>A"] = 0
@@ -4119,205 +4908,203 @@ def plotSBS(
                     sample_index = 1
 
                     for sample in samples:
-                        if percentage:
-                            mutCount = float(line[sample_index])
-                            if mutCount < 1 and mutCount > 0:
-                                sig_probs = True
-                        else:
-                            try:
-                                mutCount = int(line[sample_index])
-                            except:
-                                print(
-                                    "It appears that the provided matrix does not contain mutation counts.\n\tIf you have provided a signature activity matrix, please change the percentage parameter to True.\n\tOtherwise, ",
-                                    end="",
-                                )
-
-                            # mutCount = int(line[sample_index])
+                        sample_index = sample_columns[sample]
+                        mutCount = read_mutation_count(
+                            line, sample_index, sample, percentage, errors
+                        )
+                        if percentage and mutCount < 1 and mutCount > 0:
+                            sig_probs = True
                         mutations[sample][mut_type] = mutCount
                         sample_index += 1
 
             for sample in mutations:
-                total_count = sum(mutations[sample].values())
-                plt.rcParams["axes.linewidth"] = 2
-                plot1 = plt.figure(figsize=(15, 10))
-                plt.rc("axes", edgecolor="lightgray")
-                panel1 = plt.axes([0.12, 0.12, 0.8, 0.77])
-                xlabels = []
-
-                y = -0.5
-                xmax = 0
-                colors = [
-                    [3 / 256, 189 / 256, 239 / 256],
-                    [1 / 256, 1 / 256, 1 / 256],
-                    [228 / 256, 41 / 256, 38 / 256],
-                    [203 / 256, 202 / 256, 202 / 256],
-                    [162 / 256, 207 / 256, 99 / 256],
-                    [236 / 256, 199 / 256, 197 / 256],
-                ]
-                i = 0
-                for key in mutations[sample]:
-                    xlabels.append(key)
-                    if percentage:
-                        if total_count > 0:
+                if sample in errors:
+                    continue
+                try:
+                    errors.start(sample)
+                    total_count = sum(mutations[sample].values())
+                    plt.rcParams["axes.linewidth"] = 2
+                    plot1 = plt.figure(figsize=(15, 10))
+                    plt.rc("axes", edgecolor="lightgray")
+                    panel1 = plt.axes([0.12, 0.12, 0.8, 0.77])
+                    xlabels = []
+
+                    y = -0.5
+                    xmax = 0
+                    colors = get_context_spec("SBS96").palette
+                    i = 0
+                    for key in mutations[sample]:
+                        xlabels.append(key)
+                        if percentage:
+                            if total_count > 0:
+                                plt.barh(
+                                    y,
+                                    mutations[sample][key] / total_count * 100,
+                                    height=0.7,
+                                    color=colors[i],
+                                    align="center",
+                                    zorder=1000,
+                                )
+                                if mutations[sample][key] / total_count * 100 > xmax:
+                                    xmax = mutations[sample][key] / total_count * 100
+                        else:
                             plt.barh(
                                 y,
-                                mutations[sample][key] / total_count * 100,
+                                mutations[sample][key],
                                 height=0.7,
                                 color=colors[i],
                                 align="center",
                                 zorder=1000,
                             )
-                            if mutations[sample][key] / total_count * 100 > xmax:
-                                xmax = mutations[sample][key] / total_count * 100
-                    else:
-                        plt.barh(
-                            y,
-                            mutations[sample][key],
-                            height=0.7,
-                            color=colors[i],
-                            align="center",
-                            zorder=1000,
-                        )
-                        if mutations[sample][key] > xmax:
-                            xmax = mutations[sample][key]
-                    y -= 1
-                    i += 1
-
-                y = 0.043
-                x3 = 0.87
-                x = int(xmax * 1.1)
-
-                while x % 4 != 0:
-                    x += 1
-                xtick_offest = int(x / 4)
-
-                if percentage:
-                    xlabs = [
-                        0,
-                        round(xtick_offest, 1),
-                        round(xtick_offest * 2, 1),
-                        round(xtick_offest * 3, 1),
-                        round(xtick_offest * 4, 1),
-                    ]
-                    xlabels = [
-                        str(0),
-                        str(round(xtick_offest, 1)) + "%",
-                        str(round(xtick_offest * 2, 1)) + "%",
-                        str(round(xtick_offest * 3, 1)) + "%",
-                        str(round(xtick_offest * 4, 1)) + "%",
-                    ]
-                else:
-                    xlabs = [
-                        0,
-                        xtick_offest,
-                        xtick_offest * 2,
-                        xtick_offest * 3,
-                        xtick_offest * 4,
-                    ]
-                    xlabels = [
-                        0,
-                        xtick_offest,
-                        xtick_offest * 2,
-                        xtick_offest * 3,
-                        xtick_offest * 4,
-                    ]
+                            if mutations[sample][key] > xmax:
+                                xmax = mutations[sample][key]
+                        y -= 1
+                        i += 1
 
-                # if not percentage:
-                #   xlabels = ['{:,}'.format(int(x)) for x in xlabels]
-
-                if not percentage:
-                    xlabels = ["{:,}".format(int(x)) for x in xlabels]
-                    if len(xlabels[-1]) > 3:
-                        xlabels_temp = []
-                        if len(xlabels[-1]) > 7:
-                            for label in xlabels:
-                                if len(label) > 7:
-                                    xlabels_temp.append(label[0:-8] + "m")
-                                elif len(label) > 3:
-                                    xlabels_temp.append(label[0:-4] + "k")
-                                else:
-                                    xlabels_temp.append(label)
+                    y = 0.043
+                    x3 = 0.87
+                    x = int(xmax * 1.1)
 
-                        else:
-                            for label in xlabels:
-                                if len(label) > 3:
-                                    xlabels_temp.append(label[0:-4] + "k")
-                                else:
-                                    xlabels_temp.append(label)
-                        xlabels = xlabels_temp
-
-                ylabs = np.arange(-5.5, 0.5, 1)
-                ylabels = ["T>G", "T>C", "T>A", "C>T", "C>G", "C>A"]
-                panel1.set_xlim([0, x])
-                panel1.set_ylim([-6, 0])
-                panel1.set_xticks(xlabs)
-                panel1.set_yticks(ylabs)
-                panel1.set_xticklabels(xlabels, fontsize=30)
-                panel1.set_yticklabels(ylabels, fontsize=30)
-                panel1.spines["right"].set_visible(False)
-                panel1.spines["top"].set_visible(False)
+                    while x % 4 != 0:
+                        x += 1
+                    xtick_offest = int(x / 4)
 
-                if sig_probs:
-                    plt.text(
-                        0.125,
-                        0.9,
-                        sample,
-                        fontsize=40,
-                        fontweight="bold",
-                        fontname="Arial",
-                        transform=plt.gcf().transFigure,
-                    )
-                else:
-                    plt.text(
-                        0.125,
-                        0.9,
-                        sample + ": " + "{:,}".format(int(total_count)) + " subs",
-                        fontsize=40,
-                        fontweight="bold",
-                        fontname="Arial",
-                        transform=plt.gcf().transFigure,
-                    )
+                    if percentage:
+                        xlabs = [
+                            0,
+                            round(xtick_offest, 1),
+                            round(xtick_offest * 2, 1),
+                            round(xtick_offest * 3, 1),
+                            round(xtick_offest * 4, 1),
+                        ]
+                        xlabels = [
+                            str(0),
+                            str(round(xtick_offest, 1)) + "%",
+                            str(round(xtick_offest * 2, 1)) + "%",
+                            str(round(xtick_offest * 3, 1)) + "%",
+                            str(round(xtick_offest * 4, 1)) + "%",
+                        ]
+                    else:
+                        xlabs = [
+                            0,
+                            xtick_offest,
+                            xtick_offest * 2,
+                            xtick_offest * 3,
+                            xtick_offest * 4,
+                        ]
+                        xlabels = [
+                            0,
+                            xtick_offest,
+                            xtick_offest * 2,
+                            xtick_offest * 3,
+                            xtick_offest * 4,
+                        ]
 
-                if percentage:
-                    plt.xlabel(
-                        "Percentage of Single Base Substitutions",
-                        fontsize=35,
-                        fontname="Times New Roman",
-                        weight="bold",
-                    )
-                else:
-                    plt.xlabel(
-                        "Number of Single Base Substitutions",
-                        fontsize=35,
-                        fontname="Times New Roman",
-                        weight="bold",
-                    )
+                    # if not percentage:
+                    #   xlabels = ['{:,}'.format(int(x)) for x in xlabels]
+
+                    if not percentage:
+                        xlabels = ["{:,}".format(int(x)) for x in xlabels]
+                        if len(xlabels[-1]) > 3:
+                            xlabels_temp = []
+                            if len(xlabels[-1]) > 7:
+                                for label in xlabels:
+                                    if len(label) > 7:
+                                        xlabels_temp.append(label[0:-8] + "m")
+                                    elif len(label) > 3:
+                                        xlabels_temp.append(label[0:-4] + "k")
+                                    else:
+                                        xlabels_temp.append(label)
 
-                panel1.set_ylabel("")
+                            else:
+                                for label in xlabels:
+                                    if len(label) > 3:
+                                        xlabels_temp.append(label[0:-4] + "k")
+                                    else:
+                                        xlabels_temp.append(label)
+                            xlabels = xlabels_temp
+
+                    ylabs = np.arange(-5.5, 0.5, 1)
+                    ylabels = ["T>G", "T>C", "T>A", "C>T", "C>G", "C>A"]
+                    panel1.set_xlim([0, x])
+                    panel1.set_ylim([-6, 0])
+                    panel1.set_xticks(xlabs)
+                    panel1.set_yticks(ylabs)
+                    panel1.set_xticklabels(xlabels, fontsize=30)
+                    panel1.set_yticklabels(ylabels, fontsize=30)
+                    panel1.spines["right"].set_visible(False)
+                    panel1.spines["top"].set_visible(False)
+
+                    if sig_probs:
+                        plt.text(
+                            0.125,
+                            0.9,
+                            sample,
+                            fontsize=40,
+                            fontweight="bold",
+                            fontname="Arial",
+                            transform=plt.gcf().transFigure,
+                        )
+                    else:
+                        plt.text(
+                            0.125,
+                            0.9,
+                            sample + ": " + "{:,}".format(int(total_count)) + " subs",
+                            fontsize=40,
+                            fontweight="bold",
+                            fontname="Arial",
+                            transform=plt.gcf().transFigure,
+                        )
 
-                panel1.tick_params(
-                    axis="both",
-                    which="both",
-                    bottom=True,
-                    labelbottom=True,
-                    left=False,
-                    labelleft=True,
-                    right=False,
-                    labelright=False,
-                    top=False,
-                    labeltop=False,
-                    width=2,
-                )
+                    if percentage:
+                        plt.xlabel(
+                            "Percentage of Single Base Substitutions",
+                            fontsize=35,
+                            fontname="Times New Roman",
+                            weight="bold",
+                        )
+                    else:
+                        plt.xlabel(
+                            "Number of Single Base Substitutions",
+                            fontsize=35,
+                            fontname="Times New Roman",
+                            weight="bold",
+                        )
 
-                pp.savefig(plot1)
-                plt.close()
+                    panel1.set_ylabel("")
+
+                    panel1.tick_params(
+                        axis="both",
+                        which="both",
+                        bottom=True,
+                        labelbottom=True,
+                        left=False,
+                        labelleft=True,
+                        right=False,
+                        labelright=False,
+                        top=False,
+                        labeltop=False,
+                        width=2,
+                    )
+
+                    errors.stop()
+                    pp.savefig(plot1)
+                    plt.close()
+
+                    progress(sample, path=file_path)
+                except Exception as e:
+                    errors.failed(sample, e)
+                    plt.close()
             pp.close()
 
-        except:
-            print("There may be an issue with the formatting of your matrix file.")
-            pdf_path = output_path + "SBS_6_plots_" + project + ".pdf"
-            if os.path.isfile(pdf_path):
-                os.remove(pdf_path)
+        except Exception as e:
+            discard_pdf(pp, output_path + "SBS_6_plots_" + project + ".pdf")
+            if isinstance(e, PlottingError):
+                raise
+            raise MatrixFormatError(
+                "ERROR: there may be an issue with the formatting of your matrix file."
+            ) from e
+        errors.finish()
 
     elif plot_type == "12" or plot_type == "6SB" or plot_type == "24":
         with open(matrix_path) as f:
@@ -4325,8 +5112,8 @@ def plotSBS(
             first_line = f.readline()
             first_line = first_line.strip().split()
             if first_line[0][1] != ":" or len(first_line[0]) != 5:
-                sys.exit(
-                    "The matrix does not match the correct SBS192 format. Please check you formatting and rerun this plotting function."
+                raise MatrixFormatError(
+                    "ERROR: The matrix does not match the correct SBS192 format. Please check you formatting and rerun this plotting function."
                 )
         file_path = os.path.join(output_path, f"SBS_24_plots_{project}.pdf")
         pp = PdfPages(file_path)
@@ -4337,6 +5124,10 @@ def plotSBS(
                 first_line = f.readline()
                 samples = first_line.strip().split("\t")
                 samples = samples[1:]
+                sample_columns = select_sample_columns(samples, sample_selection, 1)
+                samples = list(sample_columns)
+                progress = PlotProgress(progress_callback, samples)
+                errors = ErrorPolicy(on_error, progress, sample_timeout, cancel)
                 for sample in samples:
                     mutations[sample] = OrderedDict()
                     mutations[sample]["C>A"] = [0, 0]
@@ -4355,40 +5146,62 @@ def plotSBS(
                     else:
                         sample_index = 1
                         for sample in samples:
-                            if percentage:
-                                mutCount = float(line[sample_index])
-                                if mutCount < 1 and mutCount > 0:
-                                    sig_probs = True
-                            else:
-                                try:
-                                    mutCount = int(line[sample_index])
-                                except:
-                                    print(
-                                        "It appears that the provided matrix does not contain mutation counts.\n\tIf you have provided a signature activity matrix, please change the percentage parameter to True.\n\tOtherwise, ",
-                                        end="",
-                                    )
-
-                                # mutCount = int(line[sample_index])
+                            sample_index = sample_columns[sample]
+                            mutCount = read_mutation_count(
+                                line, sample_index, sample, percentage, errors
+                            )
+                            if percentage and mutCount < 1 and mutCount > 0:
+                                sig_probs = True
                             if bias == "T":
                                 mutations[sample][nuc][0] = mutCount
                             else:
                                 mutations[sample][nuc][1] = mutCount
                             sample_index += 1
             for sample in mutations:
-                total_count = sum(sum(tsb) for tsb in mutations[sample].values())
-                plt.rcParams["axes.linewidth"] = 2
-                plot1 = plt.figure(figsize=(15, 10))
-                plt.rc("axes", edgecolor="lightgray")
-                panel1 = plt.axes([0.12, 0.12, 0.8, 0.77])
-
-                y = 12.485
-                xmax = 0
-                for key in mutations[sample]:
-                    if percentage:
-                        if total_count > 0:
+                if sample in errors:
+                    continue
+                try:
+                    errors.start(sample)
+                    total_count = sum(sum(tsb) for tsb in mutations[sample].values())
+                    plt.rcParams["axes.linewidth"] = 2
+                    plot1 = plt.figure(figsize=(15, 10))
+                    plt.rc("axes", edgecolor="lightgray")
+                    panel1 = plt.axes([0.12, 0.12, 0.8, 0.77])
+
+                    y = 12.485
+                    xmax = 0
+                    for key in mutations[sample]:
+                        if percentage:
+                            if total_count > 0:
+                                trans = plt.barh(
+                                    y,
+                                    mutations[sample][key][0] / total_count * 100,
+                                    height=0.75,
+                                    color=[1 / 256, 70 / 256, 102 / 256],
+                                    align="center",
+                                    zorder=1000,
+                                    label="Genic-transcribed Strand",
+                                )
+                                y -= 0.75
+                                untrans = plt.barh(
+                                    y,
+                                    mutations[sample][key][1] / total_count * 100,
+                                    height=0.75,
+                                    color=[228 / 256, 41 / 256, 38 / 256],
+                                    align="center",
+                                    zorder=1000,
+                                    label="Genic-untranscribed Strand",
+                                )
+                                y -= 0.2475
+                                if mutations[sample][key][0] / total_count * 100 > xmax:
+                                    xmax = mutations[sample][key][0] / total_count * 100
+                                if mutations[sample][key][1] / total_count * 100 > xmax:
+                                    xmax = mutations[sample][key][1] / total_count * 100
+
+                        else:
                             trans = plt.barh(
                                 y,
-                                mutations[sample][key][0] / total_count * 100,
+                                mutations[sample][key][0],
                                 height=0.75,
                                 color=[1 / 256, 70 / 256, 102 / 256],
                                 align="center",
@@ -4398,7 +5211,7 @@ def plotSBS(
                             y -= 0.75
                             untrans = plt.barh(
                                 y,
-                                mutations[sample][key][1] / total_count * 100,
+                                mutations[sample][key][1],
                                 height=0.75,
                                 color=[228 / 256, 41 / 256, 38 / 256],
                                 align="center",
@@ -4406,188 +5219,171 @@ def plotSBS(
                                 label="Genic-untranscribed Strand",
                             )
                             y -= 0.2475
-                            if mutations[sample][key][0] / total_count * 100 > xmax:
-                                xmax = mutations[sample][key][0] / total_count * 100
-                            if mutations[sample][key][1] / total_count * 100 > xmax:
-                                xmax = mutations[sample][key][1] / total_count * 100
+                            if mutations[sample][key][0] > xmax:
+                                xmax = mutations[sample][key][0]
+                            if mutations[sample][key][1] > xmax:
+                                xmax = mutations[sample][key][1]
+                        y -= 1
+
+                    x = int(xmax * 1.1)
+
+                    while x % 4 != 0:
+                        x += 1
+
+                    xtick_offest = int(x / 4)
 
+                    if percentage:
+                        xlabs = [
+                            0,
+                            round(xtick_offest, 1),
+                            round(xtick_offest * 2, 1),
+                            round(xtick_offest * 3, 1),
+                            round(xtick_offest * 4, 1),
+                        ]
+                        xlabels = [
+                            str(0),
+                            str(round(xtick_offest, 1)) + "%",
+                            str(round(xtick_offest * 2, 1)) + "%",
+                            str(round(xtick_offest * 3, 1)) + "%",
+                            str(round(xtick_offest * 4, 1)) + "%",
+                        ]
                     else:
-                        trans = plt.barh(
-                            y,
-                            mutations[sample][key][0],
-                            height=0.75,
-                            color=[1 / 256, 70 / 256, 102 / 256],
-                            align="center",
-                            zorder=1000,
-                            label="Genic-transcribed Strand",
+                        xlabs = [
+                            0,
+                            xtick_offest,
+                            xtick_offest * 2,
+                            xtick_offest * 3,
+                            xtick_offest * 4,
+                        ]
+                        xlabels = [
+                            0,
+                            xtick_offest,
+                            xtick_offest * 2,
+                            xtick_offest * 3,
+                            xtick_offest * 4,
+                        ]
+                    if not percentage:
+                        xlabels = ["{:,}".format(int(x)) for x in xlabels]
+                        if len(xlabels[-1]) > 3:
+                            xlabels_temp = []
+                            if len(xlabels[-1]) > 7:
+                                for label in xlabels:
+                                    if len(label) > 7:
+                                        xlabels_temp.append(label[0:-8] + "m")
+                                    elif len(label) > 3:
+                                        xlabels_temp.append(label[0:-4] + "k")
+                                    else:
+                                        xlabels_temp.append(label)
+
+                            else:
+                                for label in xlabels:
+                                    if len(label) > 3:
+                                        xlabels_temp.append(label[0:-4] + "k")
+                                    else:
+                                        xlabels_temp.append(label)
+                            xlabels = xlabels_temp
+
+                    ylabs = np.arange(2.15, 13, 2)
+                    ylabels = ["T>G", "T>C", "T>A", "C>T", "C>G", "C>A"]
+                    panel1.set_xlim([0, x])
+                    panel1.set_ylim([1.2524, 13.235])
+                    panel1.set_yticks(ylabs)
+                    panel1.set_xticks(xlabs)
+                    panel1.set_xticklabels(xlabels, fontsize=30)
+                    panel1.set_yticklabels(ylabels, fontsize=30)
+                    panel1.set_xlabel("")
+                    panel1.set_ylabel("")
+                    panel1.spines["right"].set_visible(False)
+                    panel1.spines["top"].set_visible(False)
+
+                    if sig_probs:
+                        plt.text(
+                            0.125,
+                            0.9,
+                            sample,
+                            fontsize=40,
+                            fontweight="bold",
+                            fontname="Arial",
+                            transform=plt.gcf().transFigure,
                         )
-                        y -= 0.75
-                        untrans = plt.barh(
-                            y,
-                            mutations[sample][key][1],
-                            height=0.75,
-                            color=[228 / 256, 41 / 256, 38 / 256],
-                            align="center",
-                            zorder=1000,
-                            label="Genic-untranscribed Strand",
+                    else:
+                        plt.text(
+                            0.125,
+                            0.9,
+                            sample
+                            + ": "
+                            + "{:,}".format(int(total_count))
+                            + " transcribed subs",
+                            fontsize=40,
+                            fontweight="bold",
+                            fontname="Arial",
+                            transform=plt.gcf().transFigure,
                         )
-                        y -= 0.2475
-                        if mutations[sample][key][0] > xmax:
-                            xmax = mutations[sample][key][0]
-                        if mutations[sample][key][1] > xmax:
-                            xmax = mutations[sample][key][1]
-                    y -= 1
 
-                x = int(xmax * 1.1)
-
-                while x % 4 != 0:
-                    x += 1
-
-                xtick_offest = int(x / 4)
+                    if percentage:
+                        plt.xlabel(
+                            "Percentage of Single Base Substitutions",
+                            fontsize=35,
+                            fontname="Times New Roman",
+                            weight="bold",
+                        )
+                    else:
+                        plt.xlabel(
+                            "Number of Single Base Substitutions",
+                            fontsize=35,
+                            fontname="Times New Roman",
+                            weight="bold",
+                        )
 
-                if percentage:
-                    xlabs = [
-                        0,
-                        round(xtick_offest, 1),
-                        round(xtick_offest * 2, 1),
-                        round(xtick_offest * 3, 1),
-                        round(xtick_offest * 4, 1),
-                    ]
-                    xlabels = [
-                        str(0),
-                        str(round(xtick_offest, 1)) + "%",
-                        str(round(xtick_offest * 2, 1)) + "%",
-                        str(round(xtick_offest * 3, 1)) + "%",
-                        str(round(xtick_offest * 4, 1)) + "%",
-                    ]
-                else:
-                    xlabs = [
-                        0,
-                        xtick_offest,
-                        xtick_offest * 2,
-                        xtick_offest * 3,
-                        xtick_offest * 4,
-                    ]
-                    xlabels = [
-                        0,
-                        xtick_offest,
-                        xtick_offest * 2,
-                        xtick_offest * 3,
-                        xtick_offest * 4,
-                    ]
-                if not percentage:
-                    xlabels = ["{:,}".format(int(x)) for x in xlabels]
-                    if len(xlabels[-1]) > 3:
-                        xlabels_temp = []
-                        if len(xlabels[-1]) > 7:
-                            for label in xlabels:
-                                if len(label) > 7:
-                                    xlabels_temp.append(label[0:-8] + "m")
-                                elif len(label) > 3:
-                                    xlabels_temp.append(label[0:-4] + "k")
-                                else:
-                                    xlabels_temp.append(label)
+                    panel1.tick_params(
+                        axis="both",
+                        which="both",
+                        bottom=True,
+                        labelbottom=True,
+                        left=False,
+                        labelleft=True,
+                        right=False,
+                        labelright=False,
+                        top=False,
+                        labeltop=False,
+                        width=2,
+                    )
+
+                    plt.legend(handles=[trans, untrans], prop={"size": 25})
+
+                    errors.stop()
+                    pp.savefig(plot1)
+                    plt.close()
+
+                    progress(sample, path=file_path)
+                except Exception as e:
+                    errors.failed(sample, e)
+                    plt.close()
+            pp.close()
 
-                        else:
-                            for label in xlabels:
-                                if len(label) > 3:
-                                    xlabels_temp.append(label[0:-4] + "k")
-                                else:
-                                    xlabels_temp.append(label)
-                        xlabels = xlabels_temp
-
-                ylabs = np.arange(2.15, 13, 2)
-                ylabels = ["T>G", "T>C", "T>A", "C>T", "C>G", "C>A"]
-                panel1.set_xlim([0, x])
-                panel1.set_ylim([1.2524, 13.235])
-                panel1.set_yticks(ylabs)
-                panel1.set_xticks(xlabs)
-                panel1.set_xticklabels(xlabels, fontsize=30)
-                panel1.set_yticklabels(ylabels, fontsize=30)
-                panel1.set_xlabel("")
-                panel1.set_ylabel("")
-                panel1.spines["right"].set_visible(False)
-                panel1.spines["top"].set_visible(False)
+        except Exception as e:
+            discard_pdf(pp, output_path + "SBS_24_plots_" + project + ".pdf")
+            if isinstance(e, PlottingError):
+                raise
+            raise MatrixFormatError(
+                "ERROR: there may be an issue with the formatting of your matrix file."
+            ) from e
+        errors.finish()
 
-                if sig_probs:
-                    plt.text(
-                        0.125,
-                        0.9,
-                        sample,
-                        fontsize=40,
-                        fontweight="bold",
-                        fontname="Arial",
-                        transform=plt.gcf().transFigure,
-                    )
-                else:
-                    plt.text(
-                        0.125,
-                        0.9,
-                        sample
-                        + ": "
-                        + "{:,}".format(int(total_count))
-                        + " transcribed subs",
-                        fontsize=40,
-                        fontweight="bold",
-                        fontname="Arial",
-                        transform=plt.gcf().transFigure,
-                    )
+    elif plot_type == "1536":
+        with open(matrix_path) as f:
+            next(f)
+            first_line = f.readline()
+            first_line = first_line.strip().split()
+            if first_line[0][1] == ">":
+                pcawg = True
+            if first_line[0][6] != "]" and first_line[0][1] != ">":
+                raise MatrixFormatError(
+                    "ERROR: The matrix does not match the correct SBS1536 format. Please check you formatting and rerun this plotting function."
+                )
 
-                if percentage:
-                    plt.xlabel(
-                        "Percentage of Single Base Substitutions",
-                        fontsize=35,
-                        fontname="Times New Roman",
-                        weight="bold",
-                    )
-                else:
-                    plt.xlabel(
-                        "Number of Single Base Substitutions",
-                        fontsize=35,
-                        fontname="Times New Roman",
-                        weight="bold",
-                    )
-
-                panel1.tick_params(
-                    axis="both",
-                    which="both",
-                    bottom=True,
-                    labelbottom=True,
-                    left=False,
-                    labelleft=True,
-                    right=False,
-                    labelright=False,
-                    top=False,
-                    labeltop=False,
-                    width=2,
-                )
-
-                plt.legend(handles=[trans, untrans], prop={"size": 25})
-
-                pp.savefig(plot1)
-                plt.close()
-            pp.close()
-
-        except:
-            print("There may be an issue with the formatting of your matrix file.")
-            pdf_path = output_path + "SBS_24_plots_" + project + ".pdf"
-            if os.path.isfile(pdf_path):
-                os.remove(pdf_path)
-
-    elif plot_type == "1536":
-        with open(matrix_path) as f:
-            next(f)
-            first_line = f.readline()
-            first_line = first_line.strip().split()
-            if first_line[0][1] == ">":
-                pcawg = True
-            if first_line[0][6] != "]" and first_line[0][1] != ">":
-                sys.exit(
-                    "The matrix does not match the correct SBS1536 format. Please check you formatting and rerun this plotting function."
-                )
-
-        file_path = os.path.join(output_path, f"SBS_1536_plots_{project}.pdf")
-        pp = PdfPages(file_path)
+        file_path = os.path.join(output_path, f"SBS_1536_plots_{project}.pdf")
+        pp = PdfPages(file_path)
 
         mutations_96 = OrderedDict()
         path_list = matrix_path.split("/")
@@ -4640,6 +5436,12 @@ def plotSBS(
                     samples = first_line.strip().split("\t")
                     samples = samples[1:]
 
+                sample_columns = select_sample_columns(
+                    samples, sample_selection, 2 if pcawg else 1
+                )
+                samples = list(sample_columns)
+                progress = PlotProgress(progress_callback, samples)
+                errors = ErrorPolicy(on_error, progress, sample_timeout, cancel)
                 for sample in samples:
                     max_all[sample] = 0
                     max_5[sample] = 0
@@ -4902,27 +5704,17 @@ def plotSBS(
                         tri = line[0][1:8]
 
                     for sample in samples:
+                        sample_index = sample_columns[sample]
                         if tri not in mutations_96[sample][mut_type]:
                             mutations_96[sample][mut_type][tri] = 0
-                        if percentage:
-                            mutCount = float(line[sample_index])
-                            if mutCount < 1 and mutCount > 0:
-                                sig_probs = True
-                        else:
-                            try:
-                                mutCount = int(line[sample_index])
-                            except:
-                                print(
-                                    "It appears that the provided matrix does not contain mutation counts.\n\tIf you have provided a signature activity matrix, please change the percentage parameter to True.\n\tOtherwise, ",
-                                    end="",
-                                )
+                        mutCount = read_mutation_count(
+                            line, sample_index, sample, percentage, errors
+                        )
+                        if percentage and mutCount < 1 and mutCount > 0:
+                            sig_probs = True
 
-                        if pcawg:
-                            sample_ref = sample_index - 2
-                        else:
-                            sample_ref = sample_index - 1
-                        if mutCount > max_count[samples[sample_ref]]:
-                            max_count[samples[sample_ref]] = mutCount
+                        if mutCount > max_count[sample]:
+                            max_count[sample] = mutCount
 
                         if mutCount > max_all[sample]:
                             max_all[sample] = mutCount
@@ -4939,800 +5731,788 @@ def plotSBS(
 
             sample_count = 0
             for sample in mutations.keys():
-                total_count_sample = sum(
-                    sum(nuc.values()) for nuc in mutations_96[sample].values()
-                )
-                if total_count_sample == 0:
+                if sample in errors:
                     continue
-                total_count = max_all[sample] * 1.1
-                ratio = total_count / total_count_sample
-                plt.rcParams["axes.linewidth"] = 2
-                plot1 = plt.figure(figsize=(43.93, 22.5))
-                plt.rc("axes", edgecolor="lightgray")
-                panel1 = plt.axes([0.03, 0.0677, 0.92, 0.267])  # 1536 context panel
-                panel2 = plt.axes([0.03, 0.67, 0.92, 0.247])  # 96 context panel
-                panel3 = plt.axes([0.03, 0.35, 0.92, 0.1335])  # 3' context
-                panel4 = plt.axes([0.03, 0.5, 0.92, 0.1335])  # 5' context
-                xlabels = []
-                ylabels = []
-                ylabels_5 = []
-                ylabels_3 = []
-
-                # Set up all of the color maps
-                colors = [
-                    [3 / 256, 189 / 256, 239 / 256],
-                    [1 / 256, 1 / 256, 1 / 256],
-                    [228 / 256, 41 / 256, 38 / 256],
-                    [203 / 256, 202 / 256, 202 / 256],
-                    [162 / 256, 207 / 256, 99 / 256],
-                    [236 / 256, 199 / 256, 197 / 256],
-                ]
-                colors_heat = [
-                    np.linspace(56 / 255, 255 / 255, 5),
-                    np.linspace(66 / 255, 225 / 255, 5),
-                    np.linspace(157 / 255, 40 / 255, 5),
-                ]
-                colors_heat_compact = [
-                    np.linspace(56 / 255, 255 / 255, 5),
-                    np.linspace(66 / 255, 225 / 255, 5),
-                    np.linspace(157 / 255, 40 / 255, 5),
-                ]
+                try:
+                    errors.start(sample)
+                    total_count_sample = sum(
+                        sum(nuc.values()) for nuc in mutations_96[sample].values()
+                    )
+                    if total_count_sample == 0:
+                        errors.stop()
+                        progress(sample, "skipped", reason="no mutations")
+                        continue
+                    total_count = max_all[sample] * 1.1
+                    ratio = total_count / total_count_sample
+                    plt.rcParams["axes.linewidth"] = 2
+                    plot1 = plt.figure(figsize=(43.93, 22.5))
+                    plt.rc("axes", edgecolor="lightgray")
+                    panel1 = plt.axes([0.03, 0.0677, 0.92, 0.267])  # 1536 context panel
+                    panel2 = plt.axes([0.03, 0.67, 0.92, 0.247])  # 96 context panel
+                    panel3 = plt.axes([0.03, 0.35, 0.92, 0.1335])  # 3' context
+                    panel4 = plt.axes([0.03, 0.5, 0.92, 0.1335])  # 5' context
+                    xlabels = []
+                    ylabels = []
+                    ylabels_5 = []
+                    ylabels_3 = []
+
+                    # Set up all of the color maps
+                    colors = get_context_spec("SBS96").palette
+                    colors_heat = [
+                        np.linspace(56 / 255, 255 / 255, 5),
+                        np.linspace(66 / 255, 225 / 255, 5),
+                        np.linspace(157 / 255, 40 / 255, 5),
+                    ]
+                    colors_heat_compact = [
+                        np.linspace(56 / 255, 255 / 255, 5),
+                        np.linspace(66 / 255, 225 / 255, 5),
+                        np.linspace(157 / 255, 40 / 255, 5),
+                    ]
+
+                    # Plot the 1536 matrix and collect the relevant info for the 96, 5' and 3' plots
+                    i = 0
+                    x_pos = 0
+                    x_inter = 0
+                    for key in mutations[sample]:
+                        y_pos = 15
+                        for penta in mutations[sample][key]:
+                            key_5 = penta[0]
+                            key_3 = penta[1]
+                            ylabels.append(penta[0] + "---" + penta[1])
+                            for tri in mutations[sample][key][penta]:
+                                tri_nuc = tri[0] + "[" + key + "]" + tri[1]
+                                normalized = mutations_96[sample][key][tri_nuc]
+                                try:
+                                    mut_count = int(
+                                        int(
+                                            20
+                                            * round(
+                                                float(
+                                                    mutations[sample][key][penta][tri]
+                                                    / total_count_sample
+                                                    / ratio
+                                                    * 100
+                                                )
+                                            )
+                                            / 20
+                                        )
+                                        / 20
+                                    )
+                                    mutations_5[sample][key][key_5][tri] += float(
+                                        mutations[sample][key][penta][tri]
+                                    )
+                                    mutations_3[sample][key][key_3][tri] += float(
+                                        mutations[sample][key][penta][tri]
+                                    )
+                                    if (
+                                        mutations_5[sample][key][key_5][tri]
+                                        > max_5[sample]
+                                    ):
+                                        max_5[sample] = mutations_5[sample][key][key_5][
+                                            tri
+                                        ]
+                                    if (
+                                        mutations_3[sample][key][key_3][tri]
+                                        > max_3[sample]
+                                    ):
+                                        max_3[sample] = mutations_3[sample][key][key_3][
+                                            tri
+                                        ]
+                                except:
+                                    mut_count = 0
+                                xlabels.append(tri[0] + "-" + tri[1])
+                                rectangle = mplpatches.Rectangle(
+                                    (x_pos, y_pos),
+                                    1,
+                                    1,
+                                    linewidth=1,
+                                    facecolor=(
+                                        colors_heat[0][mut_count],
+                                        colors_heat[1][mut_count],
+                                        colors_heat[2][mut_count],
+                                    ),
+                                )
+                                panel1.add_patch(rectangle)
+                                x_pos += 1
+                            y_pos -= 1
+                            x_pos = x_inter
 
-                # Plot the 1536 matrix and collect the relevant info for the 96, 5' and 3' plots
-                i = 0
-                x_pos = 0
-                x_inter = 0
-                for key in mutations[sample]:
-                    y_pos = 15
-                    for penta in mutations[sample][key]:
-                        key_5 = penta[0]
-                        key_3 = penta[1]
-                        ylabels.append(penta[0] + "---" + penta[1])
-                        for tri in mutations[sample][key][penta]:
-                            tri_nuc = tri[0] + "[" + key + "]" + tri[1]
-                            normalized = mutations_96[sample][key][tri_nuc]
-                            try:
+                        x_inter += 17
+                        x_pos = x_inter
+                        i += 1
+
+                    # Plot 5' and 3' context matrices
+                    x_pos = 0
+                    x_inter = 0
+                    total_count_5 = max_5[sample] * 1.1
+                    total_count_3 = max_3[sample] * 1.1
+                    ratio_5 = total_count_5 / total_count_sample
+                    ratio_3 = total_count_3 / total_count_sample
+                    ratio_total = max(ratio_5, ratio_3)
+                    for key in mutations_5[sample]:
+                        y_pos = 3
+                        for penta in mutations_5[sample][key]:
+                            ylabels_5.append(penta + "---N")
+                            ylabels_3.append("N---" + penta)
+                            for tri in mutations_5[sample][key][penta]:
                                 mut_count = int(
                                     int(
                                         20
                                         * round(
-                                            float(
-                                                mutations[sample][key][penta][tri]
-                                                / total_count_sample
-                                                / ratio
-                                                * 100
-                                            )
+                                            float(mutations_5[sample][key][penta][tri])
+                                            / total_count_sample
+                                            / ratio_total
+                                            * 100
+                                        )
+                                        / 20
+                                    )
+                                    / 20
+                                )
+                                mut_count_3 = int(
+                                    int(
+                                        20
+                                        * round(
+                                            float(mutations_3[sample][key][penta][tri])
+                                            / total_count_sample
+                                            / ratio_total
+                                            * 100
                                         )
                                         / 20
                                     )
                                     / 20
                                 )
-                                mutations_5[sample][key][key_5][tri] += float(
-                                    mutations[sample][key][penta][tri]
+                                rectangle = mplpatches.Rectangle(
+                                    (x_pos, y_pos),
+                                    1,
+                                    1,
+                                    linewidth=1,
+                                    facecolor=(
+                                        colors_heat_compact[0][mut_count],
+                                        colors_heat_compact[1][mut_count],
+                                        colors_heat_compact[2][mut_count],
+                                    ),
                                 )
-                                mutations_3[sample][key][key_3][tri] += float(
-                                    mutations[sample][key][penta][tri]
+
+                                panel4.add_patch(rectangle)
+                                rectangle = mplpatches.Rectangle(
+                                    (x_pos, y_pos),
+                                    1,
+                                    1,
+                                    linewidth=1,
+                                    facecolor=(
+                                        colors_heat[0][mut_count_3],
+                                        colors_heat[1][mut_count_3],
+                                        colors_heat[2][mut_count_3],
+                                    ),
                                 )
-                                if mutations_5[sample][key][key_5][tri] > max_5[sample]:
-                                    max_5[sample] = mutations_5[sample][key][key_5][tri]
-                                if mutations_3[sample][key][key_3][tri] > max_3[sample]:
-                                    max_3[sample] = mutations_3[sample][key][key_3][tri]
-                            except:
-                                mut_count = 0
-                            xlabels.append(tri[0] + "-" + tri[1])
-                            rectangle = mplpatches.Rectangle(
-                                (x_pos, y_pos),
-                                1,
-                                1,
-                                linewidth=1,
-                                facecolor=(
-                                    colors_heat[0][mut_count],
-                                    colors_heat[1][mut_count],
-                                    colors_heat[2][mut_count],
-                                ),
-                            )
-                            panel1.add_patch(rectangle)
-                            x_pos += 1
-                        y_pos -= 1
+                                panel3.add_patch(rectangle)
+                                x_pos += 1
+                            y_pos -= 1
+                            x_pos = x_inter
+                        x_inter += 17
                         x_pos = x_inter
+                        i += 1
+
+                    # Plot the 96 bar plot
+                    x = 0.5
+                    ymax = 0
+                    colors = get_context_spec("SBS96").palette
+                    i = 0
 
-                    x_inter += 17
-                    x_pos = x_inter
-                    i += 1
-
-                # Plot 5' and 3' context matrices
-                x_pos = 0
-                x_inter = 0
-                total_count_5 = max_5[sample] * 1.1
-                total_count_3 = max_3[sample] * 1.1
-                ratio_5 = total_count_5 / total_count_sample
-                ratio_3 = total_count_3 / total_count_sample
-                ratio_total = max(ratio_5, ratio_3)
-                for key in mutations_5[sample]:
-                    y_pos = 3
-                    for penta in mutations_5[sample][key]:
-                        ylabels_5.append(penta + "---N")
-                        ylabels_3.append("N---" + penta)
-                        for tri in mutations_5[sample][key][penta]:
-                            mut_count = int(
-                                int(
-                                    20
-                                    * round(
-                                        float(mutations_5[sample][key][penta][tri])
+                    for key in mutations_96[sample]:
+                        for seq in mutations_96[sample][key]:
+                            xlabels.append(seq[0] + seq[2] + seq[6])
+                            if percentage:
+                                if total_count_sample > 0:
+                                    panel2.bar(
+                                        x,
+                                        mutations_96[sample][key][seq]
                                         / total_count_sample
-                                        / ratio_total
-                                        * 100
+                                        * 100,
+                                        width=0.5,
+                                        color=colors[i],
+                                        align="center",
+                                        zorder=1000,
                                     )
-                                    / 20
-                                )
-                                / 20
-                            )
-                            mut_count_3 = int(
-                                int(
-                                    20
-                                    * round(
-                                        float(mutations_3[sample][key][penta][tri])
+                                    if (
+                                        mutations_96[sample][key][seq]
                                         / total_count_sample
-                                        / ratio_total
                                         * 100
-                                    )
-                                    / 20
-                                )
-                                / 20
-                            )
-                            rectangle = mplpatches.Rectangle(
-                                (x_pos, y_pos),
-                                1,
-                                1,
-                                linewidth=1,
-                                facecolor=(
-                                    colors_heat_compact[0][mut_count],
-                                    colors_heat_compact[1][mut_count],
-                                    colors_heat_compact[2][mut_count],
-                                ),
-                            )
-
-                            panel4.add_patch(rectangle)
-                            rectangle = mplpatches.Rectangle(
-                                (x_pos, y_pos),
-                                1,
-                                1,
-                                linewidth=1,
-                                facecolor=(
-                                    colors_heat[0][mut_count_3],
-                                    colors_heat[1][mut_count_3],
-                                    colors_heat[2][mut_count_3],
-                                ),
-                            )
-                            panel3.add_patch(rectangle)
-                            x_pos += 1
-                        y_pos -= 1
-                        x_pos = x_inter
-                    x_inter += 17
-                    x_pos = x_inter
-                    i += 1
-
-                # Plot the 96 bar plot
-                x = 0.5
-                ymax = 0
-                colors = [
-                    [3 / 256, 189 / 256, 239 / 256],
-                    [1 / 256, 1 / 256, 1 / 256],
-                    [228 / 256, 41 / 256, 38 / 256],
-                    [203 / 256, 202 / 256, 202 / 256],
-                    [162 / 256, 207 / 256, 99 / 256],
-                    [236 / 256, 199 / 256, 197 / 256],
-                ]
-                i = 0
-
-                for key in mutations_96[sample]:
-                    for seq in mutations_96[sample][key]:
-                        xlabels.append(seq[0] + seq[2] + seq[6])
-                        if percentage:
-                            if total_count_sample > 0:
+                                        > ymax
+                                    ):
+                                        ymax = (
+                                            mutations_96[sample][key][seq]
+                                            / total_count_sample
+                                            * 100
+                                        )
+                            else:
                                 panel2.bar(
                                     x,
-                                    mutations_96[sample][key][seq]
-                                    / total_count_sample
-                                    * 100,
+                                    mutations_96[sample][key][seq],
                                     width=0.5,
                                     color=colors[i],
                                     align="center",
                                     zorder=1000,
                                 )
-                                if (
-                                    mutations_96[sample][key][seq]
-                                    / total_count_sample
-                                    * 100
-                                    > ymax
-                                ):
-                                    ymax = (
-                                        mutations_96[sample][key][seq]
-                                        / total_count_sample
-                                        * 100
-                                    )
-                        else:
-                            panel2.bar(
-                                x,
-                                mutations_96[sample][key][seq],
-                                width=0.5,
-                                color=colors[i],
-                                align="center",
-                                zorder=1000,
-                            )
-                            if mutations_96[sample][key][seq] > ymax:
-                                ymax = mutations_96[sample][key][seq]
+                                if mutations_96[sample][key][seq] > ymax:
+                                    ymax = mutations_96[sample][key][seq]
+                            x += 1
                         x += 1
-                    x += 1
-                    i += 1
-
-                # scale bar for bottom 1536 plot
-                y_grad = 0.267 / len(colors_heat[0])
-                y_start = 0.0677
-                for l in range(0, len(colors_heat[0]), 1):
-                    rectangle = mplpatches.Rectangle(
-                        (0.96, y_start),
-                        0.02,
-                        y_grad,
-                        linewidth=1,
-                        facecolor=(
-                            colors_heat[0][l],
-                            colors_heat[1][l],
-                            colors_heat[2][l],
-                        ),
-                        transform=plt.gcf().transFigure,
-                        clip_on=False,
-                        edgecolor=(
-                            colors_heat[0][l],
-                            colors_heat[1][l],
-                            colors_heat[2][l],
-                        ),
-                    )
-                    panel1.add_patch(rectangle)
-                    y_start += y_grad
-
-                # scale bar for top 1536 plot
-                y_grad = 0.1335 / len(colors_heat_compact[0])
-                y_start = 0.5
-                for l in range(0, len(colors_heat_compact[0]), 1):
-                    rectangle = mplpatches.Rectangle(
-                        (0.96, y_start),
-                        0.02,
-                        y_grad,
-                        linewidth=1,
-                        facecolor=(
-                            colors_heat_compact[0][l],
-                            colors_heat_compact[1][l],
-                            colors_heat_compact[2][l],
-                        ),
-                        transform=plt.gcf().transFigure,
-                        clip_on=False,
-                        edgecolor=(
-                            colors_heat_compact[0][l],
-                            colors_heat_compact[1][l],
-                            colors_heat_compact[2][l],
-                        ),
-                    )
-                    panel1.add_patch(rectangle)
-                    y_start += y_grad
-
-                # scale bar for middle 1536 plot
-                y_grad = 0.1335 / len(colors_heat_compact[0])
-                y_start = 0.35
-                for l in range(0, len(colors_heat_compact[0]), 1):
-                    rectangle = mplpatches.Rectangle(
-                        (0.96, y_start),
-                        0.02,
-                        y_grad,
-                        linewidth=1,
-                        facecolor=(
-                            colors_heat_compact[0][l],
-                            colors_heat_compact[1][l],
-                            colors_heat_compact[2][l],
-                        ),
-                        transform=plt.gcf().transFigure,
-                        clip_on=False,
-                        edgecolor=(
-                            colors_heat_compact[0][l],
-                            colors_heat_compact[1][l],
-                            colors_heat_compact[2][l],
-                        ),
-                    )
-                    panel1.add_patch(rectangle)
-                    y_start += y_grad
-                y_tick_grad = max_count[sample] / 2
-
-                # scale numbers for bottom 1536 plot
-                plt.text(
-                    0.9825,
-                    0.0677,
-                    "0",
-                    fontsize=15,
-                    fontweight="bold",
-                    transform=plt.gcf().transFigure,
-                )
-                plt.text(
-                    0.9825,
-                    0.2012,
-                    str(ratio / 2)[:5],
-                    fontsize=15,
-                    fontweight="bold",
-                    transform=plt.gcf().transFigure,
-                )
-                plt.text(
-                    0.9825,
-                    0.325,
-                    str(ratio)[:5],
-                    fontsize=15,
-                    fontweight="bold",
-                    transform=plt.gcf().transFigure,
-                )
-
-                # scale numbers for top 1536 plot
-                plt.text(
-                    0.9825,
-                    0.5,
-                    "0",
-                    fontsize=20,
-                    fontweight="bold",
-                    transform=plt.gcf().transFigure,
-                )
-                plt.text(
-                    0.9825,
-                    0.56675,
-                    str(ratio_total / 2)[:5],
-                    fontsize=15,
-                    fontweight="bold",
-                    transform=plt.gcf().transFigure,
-                )
-                plt.text(
-                    0.9825,
-                    0.625,
-                    str(ratio_total)[:5],
-                    fontsize=15,
-                    fontweight="bold",
-                    transform=plt.gcf().transFigure,
-                )
-
-                # scale numbers for middle 1536 plot
-                plt.text(
-                    0.9825,
-                    0.35,
-                    "0",
-                    fontsize=20,
-                    fontweight="bold",
-                    transform=plt.gcf().transFigure,
-                )
-                plt.text(
-                    0.9825,
-                    0.41675,
-                    str(ratio_total / 2)[:5],
-                    fontsize=15,
-                    fontweight="bold",
-                    transform=plt.gcf().transFigure,
-                )
-                plt.text(
-                    0.9825,
-                    0.475,
-                    str(ratio_total)[:5],
-                    fontsize=15,
-                    fontweight="bold",
-                    transform=plt.gcf().transFigure,
-                )
-                y = int(ymax * 1.25)
+                        i += 1
 
-                x = 0.033
-                y3 = 0.92
-                for i in range(0, 6, 1):
-                    panel1.add_patch(
-                        plt.Rectangle(
-                            (x, y3),
-                            0.143,
-                            0.03,
-                            facecolor=colors[i],
+                    # scale bar for bottom 1536 plot
+                    y_grad = 0.267 / len(colors_heat[0])
+                    y_start = 0.0677
+                    for l in range(0, len(colors_heat[0]), 1):
+                        rectangle = mplpatches.Rectangle(
+                            (0.96, y_start),
+                            0.02,
+                            y_grad,
+                            linewidth=1,
+                            facecolor=(
+                                colors_heat[0][l],
+                                colors_heat[1][l],
+                                colors_heat[2][l],
+                            ),
+                            transform=plt.gcf().transFigure,
                             clip_on=False,
+                            edgecolor=(
+                                colors_heat[0][l],
+                                colors_heat[1][l],
+                                colors_heat[2][l],
+                            ),
+                        )
+                        panel1.add_patch(rectangle)
+                        y_start += y_grad
+
+                    # scale bar for top 1536 plot
+                    y_grad = 0.1335 / len(colors_heat_compact[0])
+                    y_start = 0.5
+                    for l in range(0, len(colors_heat_compact[0]), 1):
+                        rectangle = mplpatches.Rectangle(
+                            (0.96, y_start),
+                            0.02,
+                            y_grad,
+                            linewidth=1,
+                            facecolor=(
+                                colors_heat_compact[0][l],
+                                colors_heat_compact[1][l],
+                                colors_heat_compact[2][l],
+                            ),
                             transform=plt.gcf().transFigure,
+                            clip_on=False,
+                            edgecolor=(
+                                colors_heat_compact[0][l],
+                                colors_heat_compact[1][l],
+                                colors_heat_compact[2][l],
+                            ),
                         )
-                    )
-                    x += 0.154
-
-                # Plot the labels for above the SBS96 bar plot
-                y3 = 0.9
-                yText = y3 + 0.06
-                plt.text(
-                    0.085,
-                    yText,
-                    "C>A",
-                    fontsize=55,
-                    fontweight="bold",
-                    fontname="Arial",
-                    transform=plt.gcf().transFigure,
-                )
-                plt.text(
-                    0.24,
-                    yText,
-                    "C>G",
-                    fontsize=55,
-                    fontweight="bold",
-                    fontname="Arial",
-                    transform=plt.gcf().transFigure,
-                )
-                plt.text(
-                    0.395,
-                    yText,
-                    "C>T",
-                    fontsize=55,
-                    fontweight="bold",
-                    fontname="Arial",
-                    transform=plt.gcf().transFigure,
-                )
-                plt.text(
-                    0.552,
-                    yText,
-                    "T>A",
-                    fontsize=55,
-                    fontweight="bold",
-                    fontname="Arial",
-                    transform=plt.gcf().transFigure,
-                )
-                plt.text(
-                    0.705,
-                    yText,
-                    "T>C",
-                    fontsize=55,
-                    fontweight="bold",
-                    fontname="Arial",
-                    transform=plt.gcf().transFigure,
-                )
-                plt.text(
-                    0.86,
-                    yText,
-                    "T>G",
-                    fontsize=55,
-                    fontweight="bold",
-                    fontname="Arial",
-                    transform=plt.gcf().transFigure,
-                )
-
-                # Set up the parameters for the yscale ticks and labels
-                y = ymax / 1.025
-                ytick_offest = float(y / 3)
-
-                ylabels_96 = []
-                if percentage:
-                    ylabs = [
-                        0,
-                        round(ytick_offest, 1),
-                        round(ytick_offest * 2, 1),
-                        round(ytick_offest * 3, 1),
-                        round(ytick_offest * 4, 1),
-                    ]
-                    ylabels_96 = [
-                        str(0),
-                        str(round(ytick_offest, 1)) + "%",
-                        str(round(ytick_offest * 2, 1)) + "%",
-                        str(round(ytick_offest * 3, 1)) + "%",
-                        str(round(ytick_offest * 4, 1)) + "%",
-                    ]
-                else:
-                    ylabs = [
-                        0,
-                        ytick_offest,
-                        ytick_offest * 2,
-                        ytick_offest * 3,
-                        ytick_offest * 4,
-                    ]
-                    ylabels_96 = [
-                        0,
-                        ytick_offest,
-                        ytick_offest * 2,
-                        ytick_offest * 3,
-                        ytick_offest * 4,
-                    ]
-
-                # Adjust fontsize if required due to large numbers on y-axis
-                font_label_size = 25
-                if not percentage:
-                    if int(ylabels_96[3]) >= 1000:
-                        font_label_size = 20
+                        panel1.add_patch(rectangle)
+                        y_start += y_grad
+
+                    # scale bar for middle 1536 plot
+                    y_grad = 0.1335 / len(colors_heat_compact[0])
+                    y_start = 0.35
+                    for l in range(0, len(colors_heat_compact[0]), 1):
+                        rectangle = mplpatches.Rectangle(
+                            (0.96, y_start),
+                            0.02,
+                            y_grad,
+                            linewidth=1,
+                            facecolor=(
+                                colors_heat_compact[0][l],
+                                colors_heat_compact[1][l],
+                                colors_heat_compact[2][l],
+                            ),
+                            transform=plt.gcf().transFigure,
+                            clip_on=False,
+                            edgecolor=(
+                                colors_heat_compact[0][l],
+                                colors_heat_compact[1][l],
+                                colors_heat_compact[2][l],
+                            ),
+                        )
+                        panel1.add_patch(rectangle)
+                        y_start += y_grad
+                    y_tick_grad = max_count[sample] / 2
 
-                if percentage:
-                    if len(ylabels_96) > 2:
-                        font_label_size = 20
-
-                if not percentage:
-                    ylabels_96 = getylabels(ylabels_96)
-
-                # Set all panel limits
-                panel1.set_xlim([0, 101])
-                panel1.set_ylim([0, 16])
-                panel2.set_xlim([0, 101])
-                panel2.set_yticks(ylabs)
-                panel1.set_yticks([])
-                panel1.set_xticks([])
-                panel2.set_xticks([])
-                panel4.set_xlim([0, 101])
-                panel4.set_ylim([0, 4])
-                panel3.set_xlim([0, 101])
-                panel3.set_ylim([0, 4])
-                panel4.set_yticks([])
-                panel3.set_yticks([])
-                panel3.set_xticks([])
-                panel4.set_xticks([])
-
-                m = 0
-                count = 0
-                x_letter = 0
-                for i in range(0, 96, 1):
-                    # Bottom labels
+                    # scale numbers for bottom 1536 plot
                     plt.text(
-                        x_letter / 101 + 0.032,
-                        0.04,
-                        xlabels[i][0],
-                        fontsize=25,
-                        color="black",
-                        rotation="vertical",
-                        verticalalignment="center",
-                        fontname="Courier New",
+                        0.9825,
+                        0.0677,
+                        "0",
+                        fontsize=15,
+                        fontweight="bold",
                         transform=plt.gcf().transFigure,
                     )
                     plt.text(
-                        x_letter / 101 + 0.032,
-                        0.05,
-                        xlabels[i][1],
-                        fontsize=25,
-                        color="black",
-                        rotation="vertical",
-                        verticalalignment="center",
-                        fontname="Courier New",
+                        0.9825,
+                        0.2012,
+                        str(ratio / 2)[:5],
+                        fontsize=15,
                         fontweight="bold",
                         transform=plt.gcf().transFigure,
                     )
                     plt.text(
-                        x_letter / 101 + 0.032,
-                        0.06,
-                        xlabels[i][2],
-                        fontsize=25,
-                        color="black",
-                        rotation="vertical",
-                        verticalalignment="center",
-                        fontname="Courier New",
+                        0.9825,
+                        0.325,
+                        str(ratio)[:5],
+                        fontsize=15,
+                        fontweight="bold",
                         transform=plt.gcf().transFigure,
                     )
 
-                    # Top labels
+                    # scale numbers for top 1536 plot
                     plt.text(
-                        x_letter / 101 + 0.032,
-                        0.64,
-                        xlabels[i][0],
-                        fontsize=25,
-                        color="black",
-                        rotation="vertical",
-                        verticalalignment="center",
-                        fontname="Courier New",
+                        0.9825,
+                        0.5,
+                        "0",
+                        fontsize=20,
+                        fontweight="bold",
                         transform=plt.gcf().transFigure,
                     )
                     plt.text(
-                        x_letter / 101 + 0.032,
-                        0.65,
-                        xlabels[i][1],
-                        fontsize=25,
-                        color="black",
-                        rotation="vertical",
-                        verticalalignment="center",
-                        fontname="Courier New",
+                        0.9825,
+                        0.56675,
+                        str(ratio_total / 2)[:5],
+                        fontsize=15,
                         fontweight="bold",
                         transform=plt.gcf().transFigure,
                     )
                     plt.text(
-                        x_letter / 101 + 0.032,
-                        0.66,
-                        xlabels[i][2],
-                        fontsize=25,
-                        color="black",
-                        rotation="vertical",
-                        verticalalignment="center",
-                        fontname="Courier New",
+                        0.9825,
+                        0.625,
+                        str(ratio_total)[:5],
+                        fontsize=15,
+                        fontweight="bold",
                         transform=plt.gcf().transFigure,
                     )
-                    count += 1
-                    x_letter += 0.92
-                    if (i + 1) % 16 == 0 and i != 0:
-                        x_letter += 0.92
-                    if count == 16:
-                        count = 0
-                        m += 1
 
-                # y-axis 1536 bottom plot
-                m = 0
-                count = 0
-                y_letter = 5.2
-                for i in range(0, 16, 1):
+                    # scale numbers for middle 1536 plot
                     plt.text(
-                        0.003,
-                        y_letter / 16,
-                        ylabels[i][0],
-                        fontsize=25,
-                        color="black",
-                        verticalalignment="center",
-                        fontname="Courier New",
+                        0.9825,
+                        0.35,
+                        "0",
+                        fontsize=20,
+                        fontweight="bold",
                         transform=plt.gcf().transFigure,
                     )
                     plt.text(
-                        0.008,
-                        y_letter / 16 + 0,
-                        ylabels[i][1:4],
-                        fontsize=25,
-                        color="black",
-                        verticalalignment="center",
-                        fontname="Courier New",
+                        0.9825,
+                        0.41675,
+                        str(ratio_total / 2)[:5],
+                        fontsize=15,
                         fontweight="bold",
                         transform=plt.gcf().transFigure,
                     )
                     plt.text(
-                        0.022,
-                        y_letter / 16 + 0,
-                        ylabels[i][4],
-                        fontsize=25,
-                        color="black",
-                        verticalalignment="center",
-                        fontname="Courier New",
+                        0.9825,
+                        0.475,
+                        str(ratio_total)[:5],
+                        fontsize=15,
+                        fontweight="bold",
                         transform=plt.gcf().transFigure,
                     )
-                    count += 1
-                    y_letter -= 0.2675
-
-                    if count == 16:
-                        count = 0
-                        m += 1
+                    y = int(ymax * 1.25)
+
+                    x = 0.033
+                    y3 = 0.92
+                    for i in range(0, 6, 1):
+                        panel1.add_patch(
+                            plt.Rectangle(
+                                (x, y3),
+                                0.143,
+                                0.03,
+                                facecolor=colors[i],
+                                clip_on=False,
+                                transform=plt.gcf().transFigure,
+                            )
+                        )
+                        x += 0.154
 
-                # y-axis 1536 top matrix plot
-                m = 0
-                count = 0
-                y_letter = 9.85
-                for i in range(0, 4, 1):
+                    # Plot the labels for above the SBS96 bar plot
+                    y3 = 0.9
+                    yText = y3 + 0.06
                     plt.text(
-                        0.003,
-                        y_letter / 16,
-                        ylabels_5[i][0],
-                        fontsize=25,
-                        color="black",
-                        verticalalignment="center",
-                        fontname="Courier New",
+                        0.085,
+                        yText,
+                        "C>A",
+                        fontsize=55,
+                        fontweight="bold",
+                        fontname="Arial",
                         transform=plt.gcf().transFigure,
                     )
                     plt.text(
-                        0.008,
-                        y_letter / 16 + 0,
-                        ylabels_5[i][1:4],
-                        fontsize=25,
-                        color="black",
-                        verticalalignment="center",
-                        fontname="Courier New",
+                        0.24,
+                        yText,
+                        "C>G",
+                        fontsize=55,
                         fontweight="bold",
+                        fontname="Arial",
                         transform=plt.gcf().transFigure,
                     )
                     plt.text(
-                        0.022,
-                        y_letter / 16 + 0,
-                        ylabels_5[i][4],
-                        fontsize=25,
-                        color="black",
-                        verticalalignment="center",
-                        fontname="Courier New",
+                        0.395,
+                        yText,
+                        "C>T",
+                        fontsize=55,
+                        fontweight="bold",
+                        fontname="Arial",
                         transform=plt.gcf().transFigure,
                     )
-                    count += 1
-                    y_letter -= 0.53
-
-                    if count == 16:
-                        count = 0
-                        m += 1
-
-                # y-axis 1536 middle matrix plot
-                m = 0
-                count = 0
-                y_letter = 7.45
-                for i in range(0, 4, 1):
                     plt.text(
-                        0.003,
-                        y_letter / 16,
-                        ylabels_3[i][0],
-                        fontsize=25,
-                        color="black",
-                        verticalalignment="center",
-                        fontname="Courier New",
+                        0.552,
+                        yText,
+                        "T>A",
+                        fontsize=55,
+                        fontweight="bold",
+                        fontname="Arial",
                         transform=plt.gcf().transFigure,
                     )
                     plt.text(
-                        0.008,
-                        y_letter / 16 + 0,
-                        ylabels_3[i][1:4],
-                        fontsize=25,
-                        color="black",
-                        verticalalignment="center",
-                        fontname="Courier New",
+                        0.705,
+                        yText,
+                        "T>C",
+                        fontsize=55,
                         fontweight="bold",
+                        fontname="Arial",
                         transform=plt.gcf().transFigure,
                     )
                     plt.text(
-                        0.022,
-                        y_letter / 16 + 0,
-                        ylabels_3[i][4],
-                        fontsize=25,
-                        color="black",
-                        verticalalignment="center",
-                        fontname="Courier New",
+                        0.86,
+                        yText,
+                        "T>G",
+                        fontsize=55,
+                        fontweight="bold",
+                        fontname="Arial",
                         transform=plt.gcf().transFigure,
                     )
-                    count += 1
-                    y_letter -= 0.53
 
-                    if count == 16:
-                        count = 0
-                        m += 1
+                    # Set up the parameters for the yscale ticks and labels
+                    y = ymax / 1.025
+                    ytick_offest = float(y / 3)
 
-                # Set up all parameters for custom text in upper righthand corner
-                custom_text_upper_plot = ""
-                try:
-                    custom_text_upper[sample_count]
-                except:
-                    custom_text_upper = False
-                try:
-                    custom_text_middle[sample_count]
-                except:
-                    custom_text_middle = False
-                try:
-                    custom_text_bottom[sample_count]
-                except:
-                    custom_text_bottom = False
+                    ylabels_96 = []
+                    if percentage:
+                        ylabs = [
+                            0,
+                            round(ytick_offest, 1),
+                            round(ytick_offest * 2, 1),
+                            round(ytick_offest * 3, 1),
+                            round(ytick_offest * 4, 1),
+                        ]
+                        ylabels_96 = [
+                            str(0),
+                            str(round(ytick_offest, 1)) + "%",
+                            str(round(ytick_offest * 2, 1)) + "%",
+                            str(round(ytick_offest * 3, 1)) + "%",
+                            str(round(ytick_offest * 4, 1)) + "%",
+                        ]
+                    else:
+                        ylabs = [
+                            0,
+                            ytick_offest,
+                            ytick_offest * 2,
+                            ytick_offest * 3,
+                            ytick_offest * 4,
+                        ]
+                        ylabels_96 = [
+                            0,
+                            ytick_offest,
+                            ytick_offest * 2,
+                            ytick_offest * 3,
+                            ytick_offest * 4,
+                        ]
 
-                if custom_text_upper:
-                    plot_custom_text = True
-                    if len(custom_text_upper[sample_count]) > 40:
-                        print(
-                            "To add a custom text, please limit the string to <40 characters including spaces."
+                    # Adjust fontsize if required due to large numbers on y-axis
+                    font_label_size = 25
+                    if not percentage:
+                        if int(ylabels_96[3]) >= 1000:
+                            font_label_size = 20
+
+                    if percentage:
+                        if len(ylabels_96) > 2:
+                            font_label_size = 20
+
+                    if not percentage:
+                        ylabels_96 = getylabels(ylabels_96)
+
+                    # Set all panel limits
+                    panel1.set_xlim([0, 101])
+                    panel1.set_ylim([0, 16])
+                    panel2.set_xlim([0, 101])
+                    panel2.set_yticks(ylabs)
+                    panel1.set_yticks([])
+                    panel1.set_xticks([])
+                    panel2.set_xticks([])
+                    panel4.set_xlim([0, 101])
+                    panel4.set_ylim([0, 4])
+                    panel3.set_xlim([0, 101])
+                    panel3.set_ylim([0, 4])
+                    panel4.set_yticks([])
+                    panel3.set_yticks([])
+                    panel3.set_xticks([])
+                    panel4.set_xticks([])
+
+                    m = 0
+                    count = 0
+                    x_letter = 0
+                    for i in range(0, 96, 1):
+                        # Bottom labels
+                        plt.text(
+                            x_letter / 101 + 0.032,
+                            0.04,
+                            xlabels[i][0],
+                            fontsize=25,
+                            color="black",
+                            rotation="vertical",
+                            verticalalignment="center",
+                            fontname="Courier New",
+                            transform=plt.gcf().transFigure,
                         )
-                        plot_custom_text = False
-                if custom_text_middle:
-                    if len(custom_text_middle[sample_count]) > 40:
-                        print(
-                            "To add a custom text, please limit the string to <40 characters including spaces."
+                        plt.text(
+                            x_letter / 101 + 0.032,
+                            0.05,
+                            xlabels[i][1],
+                            fontsize=25,
+                            color="black",
+                            rotation="vertical",
+                            verticalalignment="center",
+                            fontname="Courier New",
+                            fontweight="bold",
+                            transform=plt.gcf().transFigure,
                         )
-                        plot_custom_text = False
-
-                if plot_custom_text:
-                    x_pos_custom = 0.94
-                    if custom_text_upper and custom_text_middle:
-                        custom_text_upper_plot = (
-                            custom_text_upper[sample_count]
-                            + "\n"
-                            + custom_text_middle[sample_count]
+                        plt.text(
+                            x_letter / 101 + 0.032,
+                            0.06,
+                            xlabels[i][2],
+                            fontsize=25,
+                            color="black",
+                            rotation="vertical",
+                            verticalalignment="center",
+                            fontname="Courier New",
+                            transform=plt.gcf().transFigure,
                         )
-                        if custom_text_bottom:
-                            custom_text_upper_plot += (
-                                "\n" + custom_text_bottom[sample_count]
-                            )
 
-                    if custom_text_upper and not custom_text_middle:
-                        custom_text_upper_plot = custom_text_upper[sample_count]
-                        panel2.text(
-                            x_pos_custom,
-                            0.78,
-                            custom_text_upper_plot,
-                            fontsize=40,
-                            weight="bold",
+                        # Top labels
+                        plt.text(
+                            x_letter / 101 + 0.032,
+                            0.64,
+                            xlabels[i][0],
+                            fontsize=25,
                             color="black",
-                            fontname="Arial",
+                            rotation="vertical",
+                            verticalalignment="center",
+                            fontname="Courier New",
+                            transform=plt.gcf().transFigure,
+                        )
+                        plt.text(
+                            x_letter / 101 + 0.032,
+                            0.65,
+                            xlabels[i][1],
+                            fontsize=25,
+                            color="black",
+                            rotation="vertical",
+                            verticalalignment="center",
+                            fontname="Courier New",
+                            fontweight="bold",
+                            transform=plt.gcf().transFigure,
+                        )
+                        plt.text(
+                            x_letter / 101 + 0.032,
+                            0.66,
+                            xlabels[i][2],
+                            fontsize=25,
+                            color="black",
+                            rotation="vertical",
+                            verticalalignment="center",
+                            fontname="Courier New",
+                            transform=plt.gcf().transFigure,
+                        )
+                        count += 1
+                        x_letter += 0.92
+                        if (i + 1) % 16 == 0 and i != 0:
+                            x_letter += 0.92
+                        if count == 16:
+                            count = 0
+                            m += 1
+
+                    # y-axis 1536 bottom plot
+                    m = 0
+                    count = 0
+                    y_letter = 5.2
+                    for i in range(0, 16, 1):
+                        plt.text(
+                            0.003,
+                            y_letter / 16,
+                            ylabels[i][0],
+                            fontsize=25,
+                            color="black",
+                            verticalalignment="center",
+                            fontname="Courier New",
+                            transform=plt.gcf().transFigure,
+                        )
+                        plt.text(
+                            0.008,
+                            y_letter / 16 + 0,
+                            ylabels[i][1:4],
+                            fontsize=25,
+                            color="black",
+                            verticalalignment="center",
+                            fontname="Courier New",
+                            fontweight="bold",
+                            transform=plt.gcf().transFigure,
+                        )
+                        plt.text(
+                            0.022,
+                            y_letter / 16 + 0,
+                            ylabels[i][4],
+                            fontsize=25,
+                            color="black",
+                            verticalalignment="center",
+                            fontname="Courier New",
+                            transform=plt.gcf().transFigure,
+                        )
+                        count += 1
+                        y_letter -= 0.2675
+
+                        if count == 16:
+                            count = 0
+                            m += 1
+
+                    # y-axis 1536 top matrix plot
+                    m = 0
+                    count = 0
+                    y_letter = 9.85
+                    for i in range(0, 4, 1):
+                        plt.text(
+                            0.003,
+                            y_letter / 16,
+                            ylabels_5[i][0],
+                            fontsize=25,
+                            color="black",
+                            verticalalignment="center",
+                            fontname="Courier New",
+                            transform=plt.gcf().transFigure,
+                        )
+                        plt.text(
+                            0.008,
+                            y_letter / 16 + 0,
+                            ylabels_5[i][1:4],
+                            fontsize=25,
+                            color="black",
+                            verticalalignment="center",
+                            fontname="Courier New",
+                            fontweight="bold",
+                            transform=plt.gcf().transFigure,
+                        )
+                        plt.text(
+                            0.022,
+                            y_letter / 16 + 0,
+                            ylabels_5[i][4],
+                            fontsize=25,
+                            color="black",
+                            verticalalignment="center",
+                            fontname="Courier New",
+                            transform=plt.gcf().transFigure,
+                        )
+                        count += 1
+                        y_letter -= 0.53
+
+                        if count == 16:
+                            count = 0
+                            m += 1
+
+                    # y-axis 1536 middle matrix plot
+                    m = 0
+                    count = 0
+                    y_letter = 7.45
+                    for i in range(0, 4, 1):
+                        plt.text(
+                            0.003,
+                            y_letter / 16,
+                            ylabels_3[i][0],
+                            fontsize=25,
+                            color="black",
+                            verticalalignment="center",
+                            fontname="Courier New",
+                            transform=plt.gcf().transFigure,
+                        )
+                        plt.text(
+                            0.008,
+                            y_letter / 16 + 0,
+                            ylabels_3[i][1:4],
+                            fontsize=25,
+                            color="black",
+                            verticalalignment="center",
+                            fontname="Courier New",
+                            fontweight="bold",
+                            transform=plt.gcf().transFigure,
+                        )
+                        plt.text(
+                            0.022,
+                            y_letter / 16 + 0,
+                            ylabels_3[i][4],
+                            fontsize=25,
+                            color="black",
+                            verticalalignment="center",
+                            fontname="Courier New",
                             transform=plt.gcf().transFigure,
-                            ha="right",
                         )
+                        count += 1
+                        y_letter -= 0.53
 
-                    elif custom_text_upper and custom_text_middle:
-                        if not custom_text_bottom:
+                        if count == 16:
+                            count = 0
+                            m += 1
+
+                    # Set up all parameters for custom text in upper righthand corner
+                    custom_text_upper_plot = ""
+                    try:
+                        custom_text_upper[sample_count]
+                    except:
+                        custom_text_upper = False
+                    try:
+                        custom_text_middle[sample_count]
+                    except:
+                        custom_text_middle = False
+                    try:
+                        custom_text_bottom[sample_count]
+                    except:
+                        custom_text_bottom = False
+
+                    if custom_text_upper:
+                        plot_custom_text = True
+                        if len(custom_text_upper[sample_count]) > 40:
+                            print(
+                                "To add a custom text, please limit the string to <40 characters including spaces."
+                            )
+                            plot_custom_text = False
+                    if custom_text_middle:
+                        if len(custom_text_middle[sample_count]) > 40:
+                            print(
+                                "To add a custom text, please limit the string to <40 characters including spaces."
+                            )
+                            plot_custom_text = False
+
+                    if plot_custom_text:
+                        x_pos_custom = 0.94
+                        if custom_text_upper and custom_text_middle:
+                            custom_text_upper_plot = (
+                                custom_text_upper[sample_count]
+                                + "\n"
+                                + custom_text_middle[sample_count]
+                            )
+                            if custom_text_bottom:
+                                custom_text_upper_plot += (
+                                    "\n" + custom_text_bottom[sample_count]
+                                )
+
+                        if custom_text_upper and not custom_text_middle:
+                            custom_text_upper_plot = custom_text_upper[sample_count]
                             panel2.text(
                                 x_pos_custom,
-                                0.86,
+                                0.78,
                                 custom_text_upper_plot,
                                 fontsize=40,
                                 weight="bold",
@@ -5741,10 +6521,38 @@ def plotSBS(
                                 transform=plt.gcf().transFigure,
                                 ha="right",
                             )
-                        else:
+
+                        elif custom_text_upper and custom_text_middle:
+                            if not custom_text_bottom:
+                                panel2.text(
+                                    x_pos_custom,
+                                    0.86,
+                                    custom_text_upper_plot,
+                                    fontsize=40,
+                                    weight="bold",
+                                    color="black",
+                                    fontname="Arial",
+                                    transform=plt.gcf().transFigure,
+                                    ha="right",
+                                )
+                            else:
+                                panel2.text(
+                                    x_pos_custom,
+                                    0.835,
+                                    custom_text_upper_plot,
+                                    fontsize=40,
+                                    weight="bold",
+                                    color="black",
+                                    fontname="Arial",
+                                    transform=plt.gcf().transFigure,
+                                    ha="right",
+                                )
+
+                        elif not custom_text_upper and custom_text_middle:
+                            custom_text_upper_plot = custom_text_middle[sample_count]
                             panel2.text(
                                 x_pos_custom,
-                                0.835,
+                                0.78,
                                 custom_text_upper_plot,
                                 fontsize=40,
                                 weight="bold",
@@ -5754,157 +6562,154 @@ def plotSBS(
                                 ha="right",
                             )
 
-                    elif not custom_text_upper and custom_text_middle:
-                        custom_text_upper_plot = custom_text_middle[sample_count]
+                    # Plot the sample name in upper left corner of plot
+                    if sig_probs:
                         panel2.text(
-                            x_pos_custom,
-                            0.78,
-                            custom_text_upper_plot,
-                            fontsize=40,
+                            0.04,
+                            0.875,
+                            sample,
+                            fontsize=60,
+                            weight="bold",
+                            color="black",
+                            fontname="Arial",
+                            transform=plt.gcf().transFigure,
+                        )
+                    else:
+                        panel2.text(
+                            0.04,
+                            0.875,
+                            sample
+                            + ": "
+                            + "{:,}".format(int(total_count_sample))
+                            + " subs",
+                            fontsize=60,
                             weight="bold",
                             color="black",
                             fontname="Arial",
                             transform=plt.gcf().transFigure,
-                            ha="right",
                         )
 
-                # Plot the sample name in upper left corner of plot
-                if sig_probs:
-                    panel2.text(
-                        0.04,
-                        0.875,
-                        sample,
-                        fontsize=60,
-                        weight="bold",
-                        color="black",
-                        fontname="Arial",
-                        transform=plt.gcf().transFigure,
-                    )
-                else:
-                    panel2.text(
-                        0.04,
-                        0.875,
-                        sample
-                        + ": "
-                        + "{:,}".format(int(total_count_sample))
-                        + " subs",
-                        fontsize=60,
-                        weight="bold",
-                        color="black",
-                        fontname="Arial",
-                        transform=plt.gcf().transFigure,
+                    # Finish setting all axis grids and tick parameters
+                    panel2.grid(
+                        which="major", axis="y", color=[0.93, 0.93, 0.93], zorder=1
                     )
+                    panel1.set_xlabel("")
+                    panel1.set_ylabel("")
+                    panel1.set_yticklabels([])
+                    panel1.set_xticklabels([])
+                    panel2.set_xticklabels([])
 
-                # Finish setting all axis grids and tick parameters
-                panel2.grid(which="major", axis="y", color=[0.93, 0.93, 0.93], zorder=1)
-                panel1.set_xlabel("")
-                panel1.set_ylabel("")
-                panel1.set_yticklabels([])
-                panel1.set_xticklabels([])
-                panel2.set_xticklabels([])
-
-                if percentage:
-                    panel2.set_ylabel(
-                        "Percentage of Single Base Substitutions",
-                        fontsize=28,
-                        fontname="Times New Roman",
-                        weight="bold",
-                    )
-                else:
-                    panel2.set_ylabel(
-                        "Number of Single Base Substitutions",
-                        fontsize=28,
-                        fontname="Times New Roman",
-                        weight="bold",
-                    )
+                    if percentage:
+                        panel2.set_ylabel(
+                            "Percentage of Single Base Substitutions",
+                            fontsize=28,
+                            fontname="Times New Roman",
+                            weight="bold",
+                        )
+                    else:
+                        panel2.set_ylabel(
+                            "Number of Single Base Substitutions",
+                            fontsize=28,
+                            fontname="Times New Roman",
+                            weight="bold",
+                        )
 
-                panel1.axis("off")
-                panel1.tick_params(
-                    axis="both",
-                    which="both",
-                    bottom=False,
-                    labelbottom=False,
-                    left=False,
-                    labelleft=False,
-                    right=False,
-                    labelright=False,
-                    top=False,
-                    labeltop=False,
-                    direction="in",
-                    length=25,
-                    colors="white",
-                    width=2,
-                )
-                panel2.tick_params(
-                    axis="both",
-                    which="both",
-                    bottom=False,
-                    labelbottom=False,
-                    left=True,
-                    labelleft=True,
-                    right=True,
-                    labelright=False,
-                    top=False,
-                    labeltop=False,
-                    direction="in",
-                    length=25,
-                    colors="white",
-                    width=2,
-                )
-                panel3.axis("off")
-                panel3.tick_params(
-                    axis="both",
-                    which="both",
-                    bottom=False,
-                    labelbottom=False,
-                    left=False,
-                    labelleft=False,
-                    right=True,
-                    labelright=False,
-                    top=False,
-                    labeltop=False,
-                    direction="in",
-                    length=25,
-                    colors="white",
-                    width=2,
-                )
-                panel4.axis("off")
-                panel4.tick_params(
-                    axis="both",
-                    which="both",
-                    bottom=False,
-                    labelbottom=False,
-                    left=False,
-                    labelleft=False,
-                    right=True,
-                    labelright=False,
-                    top=False,
-                    labeltop=False,
-                    direction="in",
-                    length=25,
-                    colors="white",
-                    width=2,
-                )
+                    panel1.axis("off")
+                    panel1.tick_params(
+                        axis="both",
+                        which="both",
+                        bottom=False,
+                        labelbottom=False,
+                        left=False,
+                        labelleft=False,
+                        right=False,
+                        labelright=False,
+                        top=False,
+                        labeltop=False,
+                        direction="in",
+                        length=25,
+                        colors="white",
+                        width=2,
+                    )
+                    panel2.tick_params(
+                        axis="both",
+                        which="both",
+                        bottom=False,
+                        labelbottom=False,
+                        left=True,
+                        labelleft=True,
+                        right=True,
+                        labelright=False,
+                        top=False,
+                        labeltop=False,
+                        direction="in",
+                        length=25,
+                        colors="white",
+                        width=2,
+                    )
+                    panel3.axis("off")
+                    panel3.tick_params(
+                        axis="both",
+                        which="both",
+                        bottom=False,
+                        labelbottom=False,
+                        left=False,
+                        labelleft=False,
+                        right=True,
+                        labelright=False,
+                        top=False,
+                        labeltop=False,
+                        direction="in",
+                        length=25,
+                        colors="white",
+                        width=2,
+                    )
+                    panel4.axis("off")
+                    panel4.tick_params(
+                        axis="both",
+                        which="both",
+                        bottom=False,
+                        labelbottom=False,
+                        left=False,
+                        labelleft=False,
+                        right=True,
+                        labelright=False,
+                        top=False,
+                        labeltop=False,
+                        direction="in",
+                        length=25,
+                        colors="white",
+                        width=2,
+                    )
+
+                    # Change axis depending if percentage parameter is selected
+                    if percentage:
+                        panel2.set_yticklabels(
+                            ylabels_96, fontsize=font_label_size - 1, color="black"
+                        )
+                    else:
+                        panel2.set_yticklabels(
+                            ylabels_96, fontsize=font_label_size, color="black"
+                        )
 
-                # Change axis depending if percentage parameter is selected
-                if percentage:
-                    panel2.set_yticklabels(
-                        ylabels_96, fontsize=font_label_size - 1, color="black"
-                    )
-                else:
-                    panel2.set_yticklabels(
-                        ylabels_96, fontsize=font_label_size, color="black"
-                    )
+                    errors.stop()
+                    pp.savefig(plot1)
+                    plt.close()
 
-                pp.savefig(plot1)
-                plt.close()
+                    progress(sample, path=file_path)
+                except Exception as e:
+                    errors.failed(sample, e)
+                    plt.close()
                 sample_count += 1
             pp.close()
-        except:
-            print("There may be an issue with the formatting of your matrix file.")
-            pdf_path = output_path + "SBS_1536_plots_" + project + ".pdf"
-            if os.path.isfile(pdf_path):
-                os.remove(pdf_path)
+        except Exception as e:
+            discard_pdf(pp, output_path + "SBS_1536_plots_" + project + ".pdf")
+            if isinstance(e, PlottingError):
+                raise
+            raise MatrixFormatError(
+                "ERROR: there may be an issue with the formatting of your matrix file."
+            ) from e
+        errors.finish()
 
     elif plot_type == "4608":
         with open(matrix_path) as f:
@@ -5914,8 +6719,8 @@ def plotSBS(
             if first_line[0][1] == ">":
                 pcawg = True
             if first_line[0][8] != "]" and first_line[0][6] != ">":
-                sys.exit(
-                    "The matrix does not match the correct SBS4608 format. Please check you formatting and rerun this plotting function."
+                raise MatrixFormatError(
+                    "ERROR: The matrix does not match the correct SBS4608 format. Please check you formatting and rerun this plotting function."
                 )
 
         file_path = os.path.join(output_path, f"SBS_4608_plots_{project}.pdf")
@@ -5955,8 +6760,7 @@ def plotSBS(
         total_counts_5 = {"T": 0, "G": 0, "C": 0, "A": 0}
         total_counts_3 = {"T": 0, "G": 0, "C": 0, "A": 0}
 
-        # try:
-        if True:
+        try:
             with open(matrix_path) as f:
                 first_line = f.readline()
                 if pcawg:
@@ -5967,6 +6771,12 @@ def plotSBS(
                     samples = first_line.strip().split("\t")
                     samples = samples[1:]
 
+                sample_columns = select_sample_columns(
+                    samples, sample_selection, 2 if pcawg else 1
+                )
+                samples = list(sample_columns)
+                progress = PlotProgress(progress_callback, samples)
+                errors = ErrorPolicy(on_error, progress, sample_timeout, cancel)
                 for sample in samples:
                     max_all[sample] = 0
                     max_5[sample] = 0
@@ -6238,31 +7048,17 @@ def plotSBS(
                         tri = line[0][3:10]
 
                     for sample in samples:
+                        sample_index = sample_columns[sample]
                         if tri not in mutations_96[sample][mut_type]:
                             mutations_96[sample][mut_type][tri] = 0
-                        if percentage:
-                            mutCount = float(line[sample_index])
-                            if mutCount < 1 and mutCount > 0:
-                                sig_probs = True
-                        else:
-                            try:
-                                mutCount = int(line[sample_index])
-                            except:
-                                print(
-                                    "It appears that the provided matrix does not contain mutation counts.\n\tIf you have provided a signature activity matrix, please change the percentage parameter to True.\n\tOtherwise, ",
-                                    end="",
-                                )
-                                print(
-                                    "There may be an issue with the formatting of your matrix file."
-                                )
-                                sys.exit(0)
+                        mutCount = read_mutation_count(
+                            line, sample_index, sample, percentage, errors
+                        )
+                        if percentage and mutCount < 1 and mutCount > 0:
+                            sig_probs = True
 
-                        if pcawg:
-                            sample_ref = sample_index - 2
-                        else:
-                            sample_ref = sample_index - 1
-                        if mutCount > max_count[samples[sample_ref]]:
-                            max_count[samples[sample_ref]] = mutCount
+                        if mutCount > max_count[sample]:
+                            max_count[sample] = mutCount
 
                         if mutCount > max_all[sample]:
                             max_all[sample] = mutCount
@@ -6281,880 +7077,1306 @@ def plotSBS(
 
             sample_count = 0
             for sample in mutations.keys():
-                total_count_sample = sum(
-                    sum(nuc.values()) for nuc in mutations_96[sample].values()
-                )
-                if total_count_sample == 0:
+                if sample in errors:
                     continue
-                total_count = max_all[sample] * 1.1
-                ratio = total_count / total_count_sample
-                plt.rcParams["axes.linewidth"] = 2
-                # plot1 = plt.figure(figsize=(43.93,22.5))
-                plot1 = plt.figure(figsize=(43.93, 18))
-                plt.rc("axes", edgecolor="lightgray")
-                panel1 = plt.axes([0.03, 0.0677, 0.76, 0.267])  # 1536 context panel
-                panel2 = plt.axes([0.03, 0.67, 0.76, 0.247])  # 96 context panel
-                panel3 = plt.axes([0.03, 0.35, 0.76, 0.1335])  # 3' context
-                panel4 = plt.axes([0.03, 0.5, 0.76, 0.1335])  # 5' context
-                panel5 = plt.axes([0.82, 0.67, 0.17, 0.247])  # SBS288 (TSB) context
-                xlabels = []
-                ylabels = []
-                ylabels_5 = []
-                ylabels_3 = []
-
-                # Set up all of the color maps
-                colors = [
-                    [3 / 256, 189 / 256, 239 / 256],
-                    [1 / 256, 1 / 256, 1 / 256],
-                    [228 / 256, 41 / 256, 38 / 256],
-                    [203 / 256, 202 / 256, 202 / 256],
-                    [162 / 256, 207 / 256, 99 / 256],
-                    [236 / 256, 199 / 256, 197 / 256],
-                ]
-                colors_heat = [
-                    np.linspace(56 / 255, 255 / 255, 5),
-                    np.linspace(66 / 255, 225 / 255, 5),
-                    np.linspace(157 / 255, 40 / 255, 5),
-                ]
-                colors_heat_compact = [
-                    np.linspace(56 / 255, 255 / 255, 5),
-                    np.linspace(66 / 255, 225 / 255, 5),
-                    np.linspace(157 / 255, 40 / 255, 5),
-                ]
+                try:
+                    errors.start(sample)
+                    total_count_sample = sum(
+                        sum(nuc.values()) for nuc in mutations_96[sample].values()
+                    )
+                    if total_count_sample == 0:
+                        errors.stop()
+                        progress(sample, "skipped", reason="no mutations")
+                        continue
+                    total_count = max_all[sample] * 1.1
+                    ratio = total_count / total_count_sample
+                    plt.rcParams["axes.linewidth"] = 2
+                    # plot1 = plt.figure(figsize=(43.93,22.5))
+                    plot1 = plt.figure(figsize=(43.93, 18))
+                    plt.rc("axes", edgecolor="lightgray")
+                    panel1 = plt.axes([0.03, 0.0677, 0.76, 0.267])  # 1536 context panel
+                    panel2 = plt.axes([0.03, 0.67, 0.76, 0.247])  # 96 context panel
+                    panel3 = plt.axes([0.03, 0.35, 0.76, 0.1335])  # 3' context
+                    panel4 = plt.axes([0.03, 0.5, 0.76, 0.1335])  # 5' context
+                    panel5 = plt.axes([0.82, 0.67, 0.17, 0.247])  # SBS288 (TSB) context
+                    xlabels = []
+                    ylabels = []
+                    ylabels_5 = []
+                    ylabels_3 = []
+
+                    # Set up all of the color maps
+                    colors = get_context_spec("SBS96").palette
+                    colors_heat = [
+                        np.linspace(56 / 255, 255 / 255, 5),
+                        np.linspace(66 / 255, 225 / 255, 5),
+                        np.linspace(157 / 255, 40 / 255, 5),
+                    ]
+                    colors_heat_compact = [
+                        np.linspace(56 / 255, 255 / 255, 5),
+                        np.linspace(66 / 255, 225 / 255, 5),
+                        np.linspace(157 / 255, 40 / 255, 5),
+                    ]
+
+                    # Plot the 1536 matrix and collect the relevant info for the 96, 5' and 3' plots
+                    i = 0
+                    x_pos = 0
+                    x_inter = 0
+                    for key in mutations[sample]:
+                        y_pos = 15
+                        for penta in mutations[sample][key]:
+                            key_5 = penta[0]
+                            key_3 = penta[1]
+                            ylabels.append(penta[0] + "---" + penta[1])
+                            for tri in mutations[sample][key][penta]:
+                                tri_nuc = tri[0] + "[" + key + "]" + tri[1]
+                                normalized = mutations_96[sample][key][tri_nuc]
+                                try:
+                                    mut_count = int(
+                                        int(
+                                            20
+                                            * round(
+                                                float(
+                                                    mutations[sample][key][penta][tri]
+                                                    / total_count_sample
+                                                    / ratio
+                                                    * 100
+                                                )
+                                            )
+                                            / 20
+                                        )
+                                        / 20
+                                    )
+                                    mutations_5[sample][key][key_5][tri] += float(
+                                        mutations[sample][key][penta][tri]
+                                    )
+                                    mutations_3[sample][key][key_3][tri] += float(
+                                        mutations[sample][key][penta][tri]
+                                    )
+                                    if (
+                                        mutations_5[sample][key][key_5][tri]
+                                        > max_5[sample]
+                                    ):
+                                        max_5[sample] = mutations_5[sample][key][key_5][
+                                            tri
+                                        ]
+                                    if (
+                                        mutations_3[sample][key][key_3][tri]
+                                        > max_3[sample]
+                                    ):
+                                        max_3[sample] = mutations_3[sample][key][key_3][
+                                            tri
+                                        ]
+                                except:
+                                    mut_count = 0
+                                xlabels.append(tri[0] + "-" + tri[1])
+                                rectangle = mplpatches.Rectangle(
+                                    (x_pos, y_pos),
+                                    1,
+                                    1,
+                                    linewidth=1,
+                                    facecolor=(
+                                        colors_heat[0][mut_count],
+                                        colors_heat[1][mut_count],
+                                        colors_heat[2][mut_count],
+                                    ),
+                                )
+                                panel1.add_patch(rectangle)
+                                x_pos += 1
+                            y_pos -= 1
+                            x_pos = x_inter
+
+                        x_inter += 17
+                        x_pos = x_inter
+                        i += 1
 
-                # Plot the 1536 matrix and collect the relevant info for the 96, 5' and 3' plots
-                i = 0
-                x_pos = 0
-                x_inter = 0
-                for key in mutations[sample]:
-                    y_pos = 15
-                    for penta in mutations[sample][key]:
-                        key_5 = penta[0]
-                        key_3 = penta[1]
-                        ylabels.append(penta[0] + "---" + penta[1])
-                        for tri in mutations[sample][key][penta]:
-                            tri_nuc = tri[0] + "[" + key + "]" + tri[1]
-                            normalized = mutations_96[sample][key][tri_nuc]
-                            try:
+                    # Plot 5' and 3' context matrices
+                    x_pos = 0
+                    x_inter = 0
+                    total_count_5 = max_5[sample] * 1.1
+                    total_count_3 = max_3[sample] * 1.1
+                    ratio_5 = total_count_5 / total_count_sample
+                    ratio_3 = total_count_3 / total_count_sample
+                    ratio_total = max(ratio_5, ratio_3)
+                    for key in mutations_5[sample]:
+                        y_pos = 3
+                        for penta in mutations_5[sample][key]:
+                            ylabels_5.append(penta + "---N")
+                            ylabels_3.append("N---" + penta)
+                            for tri in mutations_5[sample][key][penta]:
                                 mut_count = int(
                                     int(
                                         20
                                         * round(
-                                            float(
-                                                mutations[sample][key][penta][tri]
-                                                / total_count_sample
-                                                / ratio
-                                                * 100
-                                            )
+                                            float(mutations_5[sample][key][penta][tri])
+                                            / total_count_sample
+                                            / ratio_total
+                                            * 100
+                                        )
+                                        / 20
+                                    )
+                                    / 20
+                                )
+                                mut_count_3 = int(
+                                    int(
+                                        20
+                                        * round(
+                                            float(mutations_3[sample][key][penta][tri])
+                                            / total_count_sample
+                                            / ratio_total
+                                            * 100
                                         )
                                         / 20
                                     )
                                     / 20
                                 )
-                                mutations_5[sample][key][key_5][tri] += float(
-                                    mutations[sample][key][penta][tri]
+                                rectangle = mplpatches.Rectangle(
+                                    (x_pos, y_pos),
+                                    1,
+                                    1,
+                                    linewidth=1,
+                                    facecolor=(
+                                        colors_heat_compact[0][mut_count],
+                                        colors_heat_compact[1][mut_count],
+                                        colors_heat_compact[2][mut_count],
+                                    ),
                                 )
-                                mutations_3[sample][key][key_3][tri] += float(
-                                    mutations[sample][key][penta][tri]
+
+                                panel4.add_patch(rectangle)
+                                rectangle = mplpatches.Rectangle(
+                                    (x_pos, y_pos),
+                                    1,
+                                    1,
+                                    linewidth=1,
+                                    facecolor=(
+                                        colors_heat[0][mut_count_3],
+                                        colors_heat[1][mut_count_3],
+                                        colors_heat[2][mut_count_3],
+                                    ),
                                 )
-                                if mutations_5[sample][key][key_5][tri] > max_5[sample]:
-                                    max_5[sample] = mutations_5[sample][key][key_5][tri]
-                                if mutations_3[sample][key][key_3][tri] > max_3[sample]:
-                                    max_3[sample] = mutations_3[sample][key][key_3][tri]
-                            except:
-                                mut_count = 0
-                            xlabels.append(tri[0] + "-" + tri[1])
-                            rectangle = mplpatches.Rectangle(
-                                (x_pos, y_pos),
-                                1,
-                                1,
-                                linewidth=1,
-                                facecolor=(
-                                    colors_heat[0][mut_count],
-                                    colors_heat[1][mut_count],
-                                    colors_heat[2][mut_count],
-                                ),
-                            )
-                            panel1.add_patch(rectangle)
-                            x_pos += 1
-                        y_pos -= 1
+                                panel3.add_patch(rectangle)
+                                x_pos += 1
+                            y_pos -= 1
+                            x_pos = x_inter
+                        x_inter += 17
                         x_pos = x_inter
+                        i += 1
+
+                    # Plot the 96 bar plot
+                    x = 0.5
+                    ymax = 0
+                    colors = get_context_spec("SBS96").palette
+                    i = 0
 
-                    x_inter += 17
-                    x_pos = x_inter
-                    i += 1
-
-                # Plot 5' and 3' context matrices
-                x_pos = 0
-                x_inter = 0
-                total_count_5 = max_5[sample] * 1.1
-                total_count_3 = max_3[sample] * 1.1
-                ratio_5 = total_count_5 / total_count_sample
-                ratio_3 = total_count_3 / total_count_sample
-                ratio_total = max(ratio_5, ratio_3)
-                for key in mutations_5[sample]:
-                    y_pos = 3
-                    for penta in mutations_5[sample][key]:
-                        ylabels_5.append(penta + "---N")
-                        ylabels_3.append("N---" + penta)
-                        for tri in mutations_5[sample][key][penta]:
-                            mut_count = int(
-                                int(
-                                    20
-                                    * round(
-                                        float(mutations_5[sample][key][penta][tri])
+                    for key in mutations_96[sample]:
+                        for seq in mutations_96[sample][key]:
+                            xlabels.append(seq[0] + seq[2] + seq[6])
+                            if percentage:
+                                if total_count_sample > 0:
+                                    panel2.bar(
+                                        x,
+                                        mutations_96[sample][key][seq]
                                         / total_count_sample
-                                        / ratio_total
-                                        * 100
+                                        * 100,
+                                        width=0.5,
+                                        color=colors[i],
+                                        align="center",
+                                        zorder=1000,
                                     )
-                                    / 20
-                                )
-                                / 20
-                            )
-                            mut_count_3 = int(
-                                int(
-                                    20
-                                    * round(
-                                        float(mutations_3[sample][key][penta][tri])
+                                    if (
+                                        mutations_96[sample][key][seq]
                                         / total_count_sample
-                                        / ratio_total
                                         * 100
-                                    )
-                                    / 20
-                                )
-                                / 20
-                            )
-                            rectangle = mplpatches.Rectangle(
-                                (x_pos, y_pos),
-                                1,
-                                1,
-                                linewidth=1,
-                                facecolor=(
-                                    colors_heat_compact[0][mut_count],
-                                    colors_heat_compact[1][mut_count],
-                                    colors_heat_compact[2][mut_count],
-                                ),
-                            )
-
-                            panel4.add_patch(rectangle)
-                            rectangle = mplpatches.Rectangle(
-                                (x_pos, y_pos),
-                                1,
-                                1,
-                                linewidth=1,
-                                facecolor=(
-                                    colors_heat[0][mut_count_3],
-                                    colors_heat[1][mut_count_3],
-                                    colors_heat[2][mut_count_3],
-                                ),
-                            )
-                            panel3.add_patch(rectangle)
-                            x_pos += 1
-                        y_pos -= 1
-                        x_pos = x_inter
-                    x_inter += 17
-                    x_pos = x_inter
-                    i += 1
-
-                # Plot the 96 bar plot
-                x = 0.5
-                ymax = 0
-                colors = [
-                    [3 / 256, 189 / 256, 239 / 256],
-                    [1 / 256, 1 / 256, 1 / 256],
-                    [228 / 256, 41 / 256, 38 / 256],
-                    [203 / 256, 202 / 256, 202 / 256],
-                    [162 / 256, 207 / 256, 99 / 256],
-                    [236 / 256, 199 / 256, 197 / 256],
-                ]
-                i = 0
-
-                for key in mutations_96[sample]:
-                    for seq in mutations_96[sample][key]:
-                        xlabels.append(seq[0] + seq[2] + seq[6])
-                        if percentage:
-                            if total_count_sample > 0:
+                                        > ymax
+                                    ):
+                                        ymax = (
+                                            mutations_96[sample][key][seq]
+                                            / total_count_sample
+                                            * 100
+                                        )
+                            else:
                                 panel2.bar(
                                     x,
-                                    mutations_96[sample][key][seq]
-                                    / total_count_sample
-                                    * 100,
+                                    mutations_96[sample][key][seq],
                                     width=0.5,
                                     color=colors[i],
                                     align="center",
                                     zorder=1000,
                                 )
-                                if (
-                                    mutations_96[sample][key][seq]
-                                    / total_count_sample
-                                    * 100
-                                    > ymax
-                                ):
-                                    ymax = (
-                                        mutations_96[sample][key][seq]
-                                        / total_count_sample
-                                        * 100
-                                    )
-                        else:
-                            panel2.bar(
-                                x,
-                                mutations_96[sample][key][seq],
-                                width=0.5,
-                                color=colors[i],
-                                align="center",
-                                zorder=1000,
-                            )
-                            if mutations_96[sample][key][seq] > ymax:
-                                ymax = mutations_96[sample][key][seq]
+                                if mutations_96[sample][key][seq] > ymax:
+                                    ymax = mutations_96[sample][key][seq]
+                            x += 1
                         x += 1
-                    x += 1
-                    i += 1
-
-                # scale bar for bottom 1536 plot
-                y_grad = 0.267 / len(colors_heat[0])
-                y_start = 0.0677
-                for l in range(0, len(colors_heat[0]), 1):
-                    rectangle = mplpatches.Rectangle(
-                        (0.797, y_start),
-                        0.02,
-                        y_grad,
-                        linewidth=1,
-                        facecolor=(
-                            colors_heat[0][l],
-                            colors_heat[1][l],
-                            colors_heat[2][l],
-                        ),
-                        transform=plt.gcf().transFigure,
-                        clip_on=False,
-                        edgecolor=(
-                            colors_heat[0][l],
-                            colors_heat[1][l],
-                            colors_heat[2][l],
-                        ),
-                    )
-                    panel1.add_patch(rectangle)
-                    y_start += y_grad
-
-                # scale bar for top 1536 plot
-                y_grad = 0.1335 / len(colors_heat_compact[0])
-                y_start = 0.5
-                for l in range(0, len(colors_heat_compact[0]), 1):
-                    rectangle = mplpatches.Rectangle(
-                        (0.797, y_start),
-                        0.02,
-                        y_grad,
-                        linewidth=1,
-                        facecolor=(
-                            colors_heat_compact[0][l],
-                            colors_heat_compact[1][l],
-                            colors_heat_compact[2][l],
-                        ),
-                        transform=plt.gcf().transFigure,
-                        clip_on=False,
-                        edgecolor=(
-                            colors_heat_compact[0][l],
-                            colors_heat_compact[1][l],
-                            colors_heat_compact[2][l],
-                        ),
-                    )
-                    panel1.add_patch(rectangle)
-                    y_start += y_grad
-
-                # scale bar for middle 1536 plot
-                y_grad = 0.1335 / len(colors_heat_compact[0])
-                y_start = 0.35
-                for l in range(0, len(colors_heat_compact[0]), 1):
-                    rectangle = mplpatches.Rectangle(
-                        (0.797, y_start),
-                        0.02,
-                        y_grad,
-                        linewidth=1,
-                        facecolor=(
-                            colors_heat_compact[0][l],
-                            colors_heat_compact[1][l],
-                            colors_heat_compact[2][l],
-                        ),
-                        transform=plt.gcf().transFigure,
-                        clip_on=False,
-                        edgecolor=(
-                            colors_heat_compact[0][l],
-                            colors_heat_compact[1][l],
-                            colors_heat_compact[2][l],
-                        ),
-                    )
-                    panel1.add_patch(rectangle)
-                    y_start += y_grad
-                y_tick_grad = max_count[sample] / 2
-
-                # scale numbers for bottom 1536 plot
-                plt.text(
-                    0.82,
-                    0.0677,
-                    "0",
-                    fontsize=15,
-                    fontweight="bold",
-                    transform=plt.gcf().transFigure,
-                )
-                plt.text(
-                    0.82,
-                    0.2012,
-                    str(ratio / 2)[:5],
-                    fontsize=15,
-                    fontweight="bold",
-                    transform=plt.gcf().transFigure,
-                )
-                plt.text(
-                    0.82,
-                    0.325,
-                    str(ratio)[:5],
-                    fontsize=15,
-                    fontweight="bold",
-                    transform=plt.gcf().transFigure,
-                )
-
-                # scale numbers for top 1536 plot
-                plt.text(
-                    0.82,
-                    0.5,
-                    "0",
-                    fontsize=20,
-                    fontweight="bold",
-                    transform=plt.gcf().transFigure,
-                )
-                plt.text(
-                    0.82,
-                    0.56675,
-                    str(ratio_total / 2)[:5],
-                    fontsize=15,
-                    fontweight="bold",
-                    transform=plt.gcf().transFigure,
-                )
-                plt.text(
-                    0.82,
-                    0.625,
-                    str(ratio_total)[:5],
-                    fontsize=15,
-                    fontweight="bold",
-                    transform=plt.gcf().transFigure,
-                )
-
-                # scale numbers for middle 1536 plot
-                plt.text(
-                    0.82,
-                    0.35,
-                    "0",
-                    fontsize=20,
-                    fontweight="bold",
-                    transform=plt.gcf().transFigure,
-                )
-                plt.text(
-                    0.82,
-                    0.41675,
-                    str(ratio_total / 2)[:5],
-                    fontsize=15,
-                    fontweight="bold",
-                    transform=plt.gcf().transFigure,
-                )
-                plt.text(
-                    0.82,
-                    0.475,
-                    str(ratio_total)[:5],
-                    fontsize=15,
-                    fontweight="bold",
-                    transform=plt.gcf().transFigure,
-                )
-                y = int(ymax * 1.25)
+                        i += 1
 
-                x = 0.033
-                y3 = 0.92
-                for i in range(0, 6, 1):
-                    panel1.add_patch(
-                        plt.Rectangle(
-                            (x, y3),
-                            0.117,
-                            0.03,
-                            facecolor=colors[i],
+                    # scale bar for bottom 1536 plot
+                    y_grad = 0.267 / len(colors_heat[0])
+                    y_start = 0.0677
+                    for l in range(0, len(colors_heat[0]), 1):
+                        rectangle = mplpatches.Rectangle(
+                            (0.797, y_start),
+                            0.02,
+                            y_grad,
+                            linewidth=1,
+                            facecolor=(
+                                colors_heat[0][l],
+                                colors_heat[1][l],
+                                colors_heat[2][l],
+                            ),
+                            transform=plt.gcf().transFigure,
                             clip_on=False,
+                            edgecolor=(
+                                colors_heat[0][l],
+                                colors_heat[1][l],
+                                colors_heat[2][l],
+                            ),
+                        )
+                        panel1.add_patch(rectangle)
+                        y_start += y_grad
+
+                    # scale bar for top 1536 plot
+                    y_grad = 0.1335 / len(colors_heat_compact[0])
+                    y_start = 0.5
+                    for l in range(0, len(colors_heat_compact[0]), 1):
+                        rectangle = mplpatches.Rectangle(
+                            (0.797, y_start),
+                            0.02,
+                            y_grad,
+                            linewidth=1,
+                            facecolor=(
+                                colors_heat_compact[0][l],
+                                colors_heat_compact[1][l],
+                                colors_heat_compact[2][l],
+                            ),
                             transform=plt.gcf().transFigure,
+                            clip_on=False,
+                            edgecolor=(
+                                colors_heat_compact[0][l],
+                                colors_heat_compact[1][l],
+                                colors_heat_compact[2][l],
+                            ),
                         )
-                    )
-                    x += 0.1275
-
-                # Plot the labels for above the SBS96 bar plot
-                y3 = 0.9
-                yText = y3 + 0.06
-                plt.text(
-                    0.075,
-                    yText,
-                    "C>A",
-                    fontsize=55,
-                    fontweight="bold",
-                    fontname="Arial",
-                    transform=plt.gcf().transFigure,
-                )
-                plt.text(
-                    0.2025,
-                    yText,
-                    "C>G",
-                    fontsize=55,
-                    fontweight="bold",
-                    fontname="Arial",
-                    transform=plt.gcf().transFigure,
-                )
-                plt.text(
-                    0.33,
-                    yText,
-                    "C>T",
-                    fontsize=55,
-                    fontweight="bold",
-                    fontname="Arial",
-                    transform=plt.gcf().transFigure,
-                )
-                plt.text(
-                    0.455,
-                    yText,
-                    "T>A",
-                    fontsize=55,
-                    fontweight="bold",
-                    fontname="Arial",
-                    transform=plt.gcf().transFigure,
-                )
-                plt.text(
-                    0.585,
-                    yText,
-                    "T>C",
-                    fontsize=55,
-                    fontweight="bold",
-                    fontname="Arial",
-                    transform=plt.gcf().transFigure,
-                )
-                plt.text(
-                    0.71,
-                    yText,
-                    "T>G",
-                    fontsize=55,
-                    fontweight="bold",
-                    fontname="Arial",
-                    transform=plt.gcf().transFigure,
-                )
-
-                # Set up the parameters for the yscale ticks and labels
-                y = ymax / 1.025
-                ytick_offest = float(y / 3)
-
-                ylabels_96 = []
-                if percentage:
-                    ylabs = [
-                        0,
-                        round(ytick_offest, 1),
-                        round(ytick_offest * 2, 1),
-                        round(ytick_offest * 3, 1),
-                        round(ytick_offest * 4, 1),
-                    ]
-                    ylabels_96 = [
-                        str(0),
-                        str(round(ytick_offest, 1)) + "%",
-                        str(round(ytick_offest * 2, 1)) + "%",
-                        str(round(ytick_offest * 3, 1)) + "%",
-                        str(round(ytick_offest * 4, 1)) + "%",
-                    ]
-                else:
-                    ylabs = [
-                        0,
-                        ytick_offest,
-                        ytick_offest * 2,
-                        ytick_offest * 3,
-                        ytick_offest * 4,
-                    ]
-                    ylabels_96 = [
-                        0,
-                        ytick_offest,
-                        ytick_offest * 2,
-                        ytick_offest * 3,
-                        ytick_offest * 4,
-                    ]
-
-                # Adjust fontsize if required due to large numbers on y-axis
-                font_label_size = 25
-                if not percentage:
-                    if int(ylabels_96[3]) >= 1000:
-                        font_label_size = 20
+                        panel1.add_patch(rectangle)
+                        y_start += y_grad
+
+                    # scale bar for middle 1536 plot
+                    y_grad = 0.1335 / len(colors_heat_compact[0])
+                    y_start = 0.35
+                    for l in range(0, len(colors_heat_compact[0]), 1):
+                        rectangle = mplpatches.Rectangle(
+                            (0.797, y_start),
+                            0.02,
+                            y_grad,
+                            linewidth=1,
+                            facecolor=(
+                                colors_heat_compact[0][l],
+                                colors_heat_compact[1][l],
+                                colors_heat_compact[2][l],
+                            ),
+                            transform=plt.gcf().transFigure,
+                            clip_on=False,
+                            edgecolor=(
+                                colors_heat_compact[0][l],
+                                colors_heat_compact[1][l],
+                                colors_heat_compact[2][l],
+                            ),
+                        )
+                        panel1.add_patch(rectangle)
+                        y_start += y_grad
+                    y_tick_grad = max_count[sample] / 2
 
-                if percentage:
-                    if len(ylabels_96) > 2:
-                        font_label_size = 20
-
-                if not percentage:
-                    ylabels_96 = getylabels(ylabels_96)
-
-                # Set all panel limits
-                panel1.set_xlim([0, 101])
-                panel1.set_ylim([0, 16])
-                panel2.set_xlim([0, 101])
-                panel2.set_yticks(ylabs)
-                panel1.set_yticks([])
-                panel1.set_xticks([])
-                panel2.set_xticks([])
-                panel4.set_xlim([0, 101])
-                panel4.set_ylim([0, 4])
-                panel3.set_xlim([0, 101])
-                panel3.set_ylim([0, 4])
-                panel4.set_yticks([])
-                panel3.set_yticks([])
-                panel3.set_xticks([])
-                panel4.set_xticks([])
-
-                # x-axis 1536 bottom plot
-                m = 0
-                count = 0
-                x_letter = 0
-                for i in range(0, 96, 1):
-                    # Bottom labels
+                    # scale numbers for bottom 1536 plot
                     plt.text(
-                        x_letter / 101 + 0.031,
-                        0.04,
-                        xlabels[i][0],
-                        fontsize=25,
-                        color="black",
-                        rotation="vertical",
-                        verticalalignment="center",
-                        fontname="Courier New",
+                        0.82,
+                        0.0677,
+                        "0",
+                        fontsize=15,
+                        fontweight="bold",
                         transform=plt.gcf().transFigure,
                     )
                     plt.text(
-                        x_letter / 101 + 0.031,
-                        0.05,
-                        xlabels[i][1],
-                        fontsize=25,
-                        color="black",
-                        rotation="vertical",
-                        verticalalignment="center",
-                        fontname="Courier New",
+                        0.82,
+                        0.2012,
+                        str(ratio / 2)[:5],
+                        fontsize=15,
                         fontweight="bold",
                         transform=plt.gcf().transFigure,
                     )
                     plt.text(
-                        x_letter / 101 + 0.031,
-                        0.06,
-                        xlabels[i][2],
-                        fontsize=25,
-                        color="black",
-                        rotation="vertical",
-                        verticalalignment="center",
-                        fontname="Courier New",
+                        0.82,
+                        0.325,
+                        str(ratio)[:5],
+                        fontsize=15,
+                        fontweight="bold",
                         transform=plt.gcf().transFigure,
                     )
 
-                    # Top labels
+                    # scale numbers for top 1536 plot
                     plt.text(
-                        x_letter / 101 + 0.031,
-                        0.64,
-                        xlabels[i][0],
-                        fontsize=25,
-                        color="black",
-                        rotation="vertical",
-                        verticalalignment="center",
-                        fontname="Courier New",
+                        0.82,
+                        0.5,
+                        "0",
+                        fontsize=20,
+                        fontweight="bold",
                         transform=plt.gcf().transFigure,
                     )
                     plt.text(
-                        x_letter / 101 + 0.031,
-                        0.65,
-                        xlabels[i][1],
-                        fontsize=25,
-                        color="black",
-                        rotation="vertical",
-                        verticalalignment="center",
-                        fontname="Courier New",
+                        0.82,
+                        0.56675,
+                        str(ratio_total / 2)[:5],
+                        fontsize=15,
                         fontweight="bold",
                         transform=plt.gcf().transFigure,
                     )
                     plt.text(
-                        x_letter / 101 + 0.031,
-                        0.66,
-                        xlabels[i][2],
-                        fontsize=25,
-                        color="black",
-                        rotation="vertical",
-                        verticalalignment="center",
-                        fontname="Courier New",
+                        0.82,
+                        0.625,
+                        str(ratio_total)[:5],
+                        fontsize=15,
+                        fontweight="bold",
                         transform=plt.gcf().transFigure,
                     )
-                    count += 1
-                    x_letter += 0.76
-
-                    if (i + 1) % 16 == 0 and i != 0:
-                        x_letter += 0.76
-                    if count == 16:
-                        count = 0
-                        m += 1
 
-                # y-axis 1536 bottom plot
-                m = 0
-                count = 0
-                y_letter = 5.2
-                for i in range(0, 16, 1):
+                    # scale numbers for middle 1536 plot
                     plt.text(
-                        0.003,
-                        y_letter / 16,
-                        ylabels[i][0],
-                        fontsize=25,
-                        color="black",
-                        verticalalignment="center",
-                        fontname="Courier New",
+                        0.82,
+                        0.35,
+                        "0",
+                        fontsize=20,
+                        fontweight="bold",
                         transform=plt.gcf().transFigure,
                     )
                     plt.text(
-                        0.008,
-                        y_letter / 16 + 0,
-                        ylabels[i][1:4],
-                        fontsize=25,
-                        color="black",
-                        verticalalignment="center",
-                        fontname="Courier New",
+                        0.82,
+                        0.41675,
+                        str(ratio_total / 2)[:5],
+                        fontsize=15,
                         fontweight="bold",
                         transform=plt.gcf().transFigure,
                     )
                     plt.text(
-                        0.022,
-                        y_letter / 16 + 0,
-                        ylabels[i][4],
-                        fontsize=25,
-                        color="black",
-                        verticalalignment="center",
-                        fontname="Courier New",
+                        0.82,
+                        0.475,
+                        str(ratio_total)[:5],
+                        fontsize=15,
+                        fontweight="bold",
                         transform=plt.gcf().transFigure,
                     )
-                    count += 1
-                    y_letter -= 0.2675
-
-                    if count == 16:
-                        count = 0
-                        m += 1
+                    y = int(ymax * 1.25)
+
+                    x = 0.033
+                    y3 = 0.92
+                    for i in range(0, 6, 1):
+                        panel1.add_patch(
+                            plt.Rectangle(
+                                (x, y3),
+                                0.117,
+                                0.03,
+                                facecolor=colors[i],
+                                clip_on=False,
+                                transform=plt.gcf().transFigure,
+                            )
+                        )
+                        x += 0.1275
 
-                # y-axis 1536 top matrix plot
-                m = 0
-                count = 0
-                y_letter = 9.85
-                for i in range(0, 4, 1):
+                    # Plot the labels for above the SBS96 bar plot
+                    y3 = 0.9
+                    yText = y3 + 0.06
                     plt.text(
-                        0.003,
-                        y_letter / 16,
-                        ylabels_5[i][0],
-                        fontsize=25,
-                        color="black",
-                        verticalalignment="center",
-                        fontname="Courier New",
+                        0.075,
+                        yText,
+                        "C>A",
+                        fontsize=55,
+                        fontweight="bold",
+                        fontname="Arial",
                         transform=plt.gcf().transFigure,
                     )
                     plt.text(
-                        0.008,
-                        y_letter / 16 + 0,
-                        ylabels_5[i][1:4],
-                        fontsize=25,
-                        color="black",
-                        verticalalignment="center",
-                        fontname="Courier New",
+                        0.2025,
+                        yText,
+                        "C>G",
+                        fontsize=55,
                         fontweight="bold",
+                        fontname="Arial",
                         transform=plt.gcf().transFigure,
                     )
                     plt.text(
-                        0.022,
-                        y_letter / 16 + 0,
-                        ylabels_5[i][4],
-                        fontsize=25,
-                        color="black",
-                        verticalalignment="center",
-                        fontname="Courier New",
+                        0.33,
+                        yText,
+                        "C>T",
+                        fontsize=55,
+                        fontweight="bold",
+                        fontname="Arial",
                         transform=plt.gcf().transFigure,
                     )
-                    count += 1
-                    y_letter -= 0.53
-
-                    if count == 16:
-                        count = 0
-                        m += 1
-
-                # y-axis 1536 middle matrix plot
-                m = 0
-                count = 0
-                y_letter = 7.45
-                for i in range(0, 4, 1):
                     plt.text(
-                        0.003,
-                        y_letter / 16,
-                        ylabels_3[i][0],
-                        fontsize=25,
-                        color="black",
-                        verticalalignment="center",
-                        fontname="Courier New",
+                        0.455,
+                        yText,
+                        "T>A",
+                        fontsize=55,
+                        fontweight="bold",
+                        fontname="Arial",
                         transform=plt.gcf().transFigure,
                     )
                     plt.text(
-                        0.008,
-                        y_letter / 16 + 0,
-                        ylabels_3[i][1:4],
-                        fontsize=25,
-                        color="black",
-                        verticalalignment="center",
-                        fontname="Courier New",
+                        0.585,
+                        yText,
+                        "T>C",
+                        fontsize=55,
                         fontweight="bold",
+                        fontname="Arial",
                         transform=plt.gcf().transFigure,
                     )
                     plt.text(
-                        0.022,
-                        y_letter / 16 + 0,
-                        ylabels_3[i][4],
-                        fontsize=25,
-                        color="black",
-                        verticalalignment="center",
-                        fontname="Courier New",
+                        0.71,
+                        yText,
+                        "T>G",
+                        fontsize=55,
+                        fontweight="bold",
+                        fontname="Arial",
                         transform=plt.gcf().transFigure,
                     )
-                    count += 1
-                    y_letter -= 0.53
-
-                    if count == 16:
-                        count = 0
-                        m += 1
 
-                # Set up all parameters for custom text in upper righthand corner
-                custom_text_upper_plot = ""
-                try:
-                    custom_text_upper[sample_count]
-                except:
-                    custom_text_upper = False
-                try:
-                    custom_text_middle[sample_count]
-                except:
-                    custom_text_middle = False
-                try:
-                    custom_text_bottom[sample_count]
-                except:
-                    custom_text_bottom = False
+                    # Set up the parameters for the yscale ticks and labels
+                    y = ymax / 1.025
+                    ytick_offest = float(y / 3)
 
-                x_pos_custom = 0.85
-                y_pos_upper = 0.125
-                y_pos_middle = 0.10
-                y_pos_bottom = 0.075
-                zorder_value = 10
+                    ylabels_96 = []
+                    if percentage:
+                        ylabs = [
+                            0,
+                            round(ytick_offest, 1),
+                            round(ytick_offest * 2, 1),
+                            round(ytick_offest * 3, 1),
+                            round(ytick_offest * 4, 1),
+                        ]
+                        ylabels_96 = [
+                            str(0),
+                            str(round(ytick_offest, 1)) + "%",
+                            str(round(ytick_offest * 2, 1)) + "%",
+                            str(round(ytick_offest * 3, 1)) + "%",
+                            str(round(ytick_offest * 4, 1)) + "%",
+                        ]
+                    else:
+                        ylabs = [
+                            0,
+                            ytick_offest,
+                            ytick_offest * 2,
+                            ytick_offest * 3,
+                            ytick_offest * 4,
+                        ]
+                        ylabels_96 = [
+                            0,
+                            ytick_offest,
+                            ytick_offest * 2,
+                            ytick_offest * 3,
+                            ytick_offest * 4,
+                        ]
 
-                fontsize_custom = 25
-                fontweight_custom = "bold"
-                fontcolor_custom = "black"
-                fontname_custom = "Arial"
-                ha_custom = "left"
+                    # Adjust fontsize if required due to large numbers on y-axis
+                    font_label_size = 25
+                    if not percentage:
+                        if int(ylabels_96[3]) >= 1000:
+                            font_label_size = 20
 
-                if custom_text_upper:
-                    plt.text(
-                        x_pos_custom,
-                        y_pos_upper,
-                        custom_text_upper[sample_count],
-                        fontsize=fontsize_custom,
-                        weight=fontweight_custom,
-                        color=fontcolor_custom,
-                        fontname=fontname_custom,
-                        transform=plt.gcf().transFigure,
-                        ha=ha_custom,
-                        zorder=zorder_value,
-                    )
+                    if percentage:
+                        if len(ylabels_96) > 2:
+                            font_label_size = 20
+
+                    if not percentage:
+                        ylabels_96 = getylabels(ylabels_96)
+
+                    # Set all panel limits
+                    panel1.set_xlim([0, 101])
+                    panel1.set_ylim([0, 16])
+                    panel2.set_xlim([0, 101])
+                    panel2.set_yticks(ylabs)
+                    panel1.set_yticks([])
+                    panel1.set_xticks([])
+                    panel2.set_xticks([])
+                    panel4.set_xlim([0, 101])
+                    panel4.set_ylim([0, 4])
+                    panel3.set_xlim([0, 101])
+                    panel3.set_ylim([0, 4])
+                    panel4.set_yticks([])
+                    panel3.set_yticks([])
+                    panel3.set_xticks([])
+                    panel4.set_xticks([])
+
+                    # x-axis 1536 bottom plot
+                    m = 0
+                    count = 0
+                    x_letter = 0
+                    for i in range(0, 96, 1):
+                        # Bottom labels
+                        plt.text(
+                            x_letter / 101 + 0.031,
+                            0.04,
+                            xlabels[i][0],
+                            fontsize=25,
+                            color="black",
+                            rotation="vertical",
+                            verticalalignment="center",
+                            fontname="Courier New",
+                            transform=plt.gcf().transFigure,
+                        )
+                        plt.text(
+                            x_letter / 101 + 0.031,
+                            0.05,
+                            xlabels[i][1],
+                            fontsize=25,
+                            color="black",
+                            rotation="vertical",
+                            verticalalignment="center",
+                            fontname="Courier New",
+                            fontweight="bold",
+                            transform=plt.gcf().transFigure,
+                        )
+                        plt.text(
+                            x_letter / 101 + 0.031,
+                            0.06,
+                            xlabels[i][2],
+                            fontsize=25,
+                            color="black",
+                            rotation="vertical",
+                            verticalalignment="center",
+                            fontname="Courier New",
+                            transform=plt.gcf().transFigure,
+                        )
 
-                if custom_text_middle:
-                    plt.text(
-                        x_pos_custom,
-                        y_pos_middle,
-                        custom_text_middle[sample_count],
-                        fontsize=fontsize_custom,
-                        weight=fontweight_custom,
-                        color=fontcolor_custom,
-                        fontname=fontname_custom,
-                        transform=plt.gcf().transFigure,
-                        ha=ha_custom,
-                        zorder=zorder_value,
+                        # Top labels
+                        plt.text(
+                            x_letter / 101 + 0.031,
+                            0.64,
+                            xlabels[i][0],
+                            fontsize=25,
+                            color="black",
+                            rotation="vertical",
+                            verticalalignment="center",
+                            fontname="Courier New",
+                            transform=plt.gcf().transFigure,
+                        )
+                        plt.text(
+                            x_letter / 101 + 0.031,
+                            0.65,
+                            xlabels[i][1],
+                            fontsize=25,
+                            color="black",
+                            rotation="vertical",
+                            verticalalignment="center",
+                            fontname="Courier New",
+                            fontweight="bold",
+                            transform=plt.gcf().transFigure,
+                        )
+                        plt.text(
+                            x_letter / 101 + 0.031,
+                            0.66,
+                            xlabels[i][2],
+                            fontsize=25,
+                            color="black",
+                            rotation="vertical",
+                            verticalalignment="center",
+                            fontname="Courier New",
+                            transform=plt.gcf().transFigure,
+                        )
+                        count += 1
+                        x_letter += 0.76
+
+                        if (i + 1) % 16 == 0 and i != 0:
+                            x_letter += 0.76
+                        if count == 16:
+                            count = 0
+                            m += 1
+
+                    # y-axis 1536 bottom plot
+                    m = 0
+                    count = 0
+                    y_letter = 5.2
+                    for i in range(0, 16, 1):
+                        plt.text(
+                            0.003,
+                            y_letter / 16,
+                            ylabels[i][0],
+                            fontsize=25,
+                            color="black",
+                            verticalalignment="center",
+                            fontname="Courier New",
+                            transform=plt.gcf().transFigure,
+                        )
+                        plt.text(
+                            0.008,
+                            y_letter / 16 + 0,
+                            ylabels[i][1:4],
+                            fontsize=25,
+                            color="black",
+                            verticalalignment="center",
+                            fontname="Courier New",
+                            fontweight="bold",
+                            transform=plt.gcf().transFigure,
+                        )
+                        plt.text(
+                            0.022,
+                            y_letter / 16 + 0,
+                            ylabels[i][4],
+                            fontsize=25,
+                            color="black",
+                            verticalalignment="center",
+                            fontname="Courier New",
+                            transform=plt.gcf().transFigure,
+                        )
+                        count += 1
+                        y_letter -= 0.2675
+
+                        if count == 16:
+                            count = 0
+                            m += 1
+
+                    # y-axis 1536 top matrix plot
+                    m = 0
+                    count = 0
+                    y_letter = 9.85
+                    for i in range(0, 4, 1):
+                        plt.text(
+                            0.003,
+                            y_letter / 16,
+                            ylabels_5[i][0],
+                            fontsize=25,
+                            color="black",
+                            verticalalignment="center",
+                            fontname="Courier New",
+                            transform=plt.gcf().transFigure,
+                        )
+                        plt.text(
+                            0.008,
+                            y_letter / 16 + 0,
+                            ylabels_5[i][1:4],
+                            fontsize=25,
+                            color="black",
+                            verticalalignment="center",
+                            fontname="Courier New",
+                            fontweight="bold",
+                            transform=plt.gcf().transFigure,
+                        )
+                        plt.text(
+                            0.022,
+                            y_letter / 16 + 0,
+                            ylabels_5[i][4],
+                            fontsize=25,
+                            color="black",
+                            verticalalignment="center",
+                            fontname="Courier New",
+                            transform=plt.gcf().transFigure,
+                        )
+                        count += 1
+                        y_letter -= 0.53
+
+                        if count == 16:
+                            count = 0
+                            m += 1
+
+                    # y-axis 1536 middle matrix plot
+                    m = 0
+                    count = 0
+                    y_letter = 7.45
+                    for i in range(0, 4, 1):
+                        plt.text(
+                            0.003,
+                            y_letter / 16,
+                            ylabels_3[i][0],
+                            fontsize=25,
+                            color="black",
+                            verticalalignment="center",
+                            fontname="Courier New",
+                            transform=plt.gcf().transFigure,
+                        )
+                        plt.text(
+                            0.008,
+                            y_letter / 16 + 0,
+                            ylabels_3[i][1:4],
+                            fontsize=25,
+                            color="black",
+                            verticalalignment="center",
+                            fontname="Courier New",
+                            fontweight="bold",
+                            transform=plt.gcf().transFigure,
+                        )
+                        plt.text(
+                            0.022,
+                            y_letter / 16 + 0,
+                            ylabels_3[i][4],
+                            fontsize=25,
+                            color="black",
+                            verticalalignment="center",
+                            fontname="Courier New",
+                            transform=plt.gcf().transFigure,
+                        )
+                        count += 1
+                        y_letter -= 0.53
+
+                        if count == 16:
+                            count = 0
+                            m += 1
+
+                    # Set up all parameters for custom text in upper righthand corner
+                    custom_text_upper_plot = ""
+                    try:
+                        custom_text_upper[sample_count]
+                    except:
+                        custom_text_upper = False
+                    try:
+                        custom_text_middle[sample_count]
+                    except:
+                        custom_text_middle = False
+                    try:
+                        custom_text_bottom[sample_count]
+                    except:
+                        custom_text_bottom = False
+
+                    x_pos_custom = 0.85
+                    y_pos_upper = 0.125
+                    y_pos_middle = 0.10
+                    y_pos_bottom = 0.075
+                    zorder_value = 10
+
+                    fontsize_custom = 25
+                    fontweight_custom = "bold"
+                    fontcolor_custom = "black"
+                    fontname_custom = "Arial"
+                    ha_custom = "left"
+
+                    if custom_text_upper:
+                        plt.text(
+                            x_pos_custom,
+                            y_pos_upper,
+                            custom_text_upper[sample_count],
+                            fontsize=fontsize_custom,
+                            weight=fontweight_custom,
+                            color=fontcolor_custom,
+                            fontname=fontname_custom,
+                            transform=plt.gcf().transFigure,
+                            ha=ha_custom,
+                            zorder=zorder_value,
+                        )
+
+                    if custom_text_middle:
+                        plt.text(
+                            x_pos_custom,
+                            y_pos_middle,
+                            custom_text_middle[sample_count],
+                            fontsize=fontsize_custom,
+                            weight=fontweight_custom,
+                            color=fontcolor_custom,
+                            fontname=fontname_custom,
+                            transform=plt.gcf().transFigure,
+                            ha=ha_custom,
+                            zorder=zorder_value,
+                        )
+
+                    if custom_text_bottom:
+                        plt.text(
+                            x_pos_custom,
+                            y_pos_bottom,
+                            custom_text_bottom[sample_count],
+                            fontsize=fontsize_custom,
+                            weight=fontweight_custom,
+                            color=fontcolor_custom,
+                            fontname=fontname_custom,
+                            transform=plt.gcf().transFigure,
+                            ha=ha_custom,
+                            zorder=zorder_value,
+                        )
+
+                    # Plot the sample name in upper left corner of plot
+                    if sig_probs:
+                        panel2.text(
+                            0.04,
+                            0.875,
+                            sample,
+                            fontsize=50,
+                            weight="bold",
+                            color="black",
+                            fontname="Arial",
+                            transform=plt.gcf().transFigure,
+                        )
+                    else:
+                        panel2.text(
+                            0.04,
+                            0.875,
+                            sample
+                            + ": "
+                            + "{:,}".format(int(total_count_sample))
+                            + " subs",
+                            fontsize=50,
+                            weight="bold",
+                            color="black",
+                            fontname="Arial",
+                            transform=plt.gcf().transFigure,
+                        )
+
+                    # Finish setting all axis grids and tick parameters
+                    panel2.grid(
+                        which="major", axis="y", color=[0.93, 0.93, 0.93], zorder=1
                     )
+                    panel1.set_xlabel("")
+                    panel1.set_ylabel("")
+                    panel1.set_yticklabels([])
+                    panel1.set_xticklabels([])
+                    panel2.set_xticklabels([])
 
-                if custom_text_bottom:
-                    plt.text(
-                        x_pos_custom,
-                        y_pos_bottom,
-                        custom_text_bottom[sample_count],
-                        fontsize=fontsize_custom,
-                        weight=fontweight_custom,
-                        color=fontcolor_custom,
-                        fontname=fontname_custom,
-                        transform=plt.gcf().transFigure,
-                        ha=ha_custom,
-                        zorder=zorder_value,
+                    if percentage:
+                        panel2.set_ylabel(
+                            "Percentage of Single Base Substitutions",
+                            fontsize=26,
+                            fontname="Times New Roman",
+                            weight="bold",
+                        )
+                    else:
+                        panel2.set_ylabel(
+                            "Number of Single Base Substitutions",
+                            fontsize=26,
+                            fontname="Times New Roman",
+                            weight="bold",
+                        )
+
+                    panel1.axis("off")
+                    panel1.tick_params(
+                        axis="both",
+                        which="both",
+                        bottom=False,
+                        labelbottom=False,
+                        left=False,
+                        labelleft=False,
+                        right=False,
+                        labelright=False,
+                        top=False,
+                        labeltop=False,
+                        direction="in",
+                        length=25,
+                        colors="white",
+                        width=2,
+                    )
+                    panel2.tick_params(
+                        axis="both",
+                        which="both",
+                        bottom=False,
+                        labelbottom=False,
+                        left=True,
+                        labelleft=True,
+                        right=True,
+                        labelright=False,
+                        top=False,
+                        labeltop=False,
+                        direction="in",
+                        length=25,
+                        colors="white",
+                        width=2,
+                    )
+                    panel3.axis("off")
+                    panel3.tick_params(
+                        axis="both",
+                        which="both",
+                        bottom=False,
+                        labelbottom=False,
+                        left=False,
+                        labelleft=False,
+                        right=True,
+                        labelright=False,
+                        top=False,
+                        labeltop=False,
+                        direction="in",
+                        length=25,
+                        colors="white",
+                        width=2,
+                    )
+                    panel4.axis("off")
+                    panel4.tick_params(
+                        axis="both",
+                        which="both",
+                        bottom=False,
+                        labelbottom=False,
+                        left=False,
+                        labelleft=False,
+                        right=True,
+                        labelright=False,
+                        top=False,
+                        labeltop=False,
+                        direction="in",
+                        length=25,
+                        colors="white",
+                        width=2,
+                    )
+
+                    # Change axis depending if percentage parameter is selected
+                    if percentage:
+                        panel2.set_yticklabels(
+                            ylabels_96, fontsize=font_label_size - 1, color="black"
+                        )
+                    else:
+                        panel2.set_yticklabels(
+                            ylabels_96, fontsize=font_label_size, color="black"
+                        )
+
+                    yp2 = 28
+                    labels = []
+                    y2max = 0
+                    tsbColors = [
+                        [1 / 256, 70 / 256, 102 / 256],
+                        [228 / 256, 41 / 256, 38 / 256],
+                        "green",
+                    ]
+                    for mut in mutations_TSB[sample]:
+                        labels.append(mut)
+                        i = 0
+                        for tsb in mutations_TSB[sample][mut]:
+                            if tsb == "T":
+                                label = "Genic-transcribed"
+                            elif tsb == "U":
+                                label = "Genic-untranscribed"
+                            else:
+                                label = "Intergenic"
+                            if percentage:
+                                if total_count_sample > 0:
+                                    panel5.barh(
+                                        yp2,
+                                        mutations_TSB[sample][mut][tsb]
+                                        / total_count_sample
+                                        * 100,
+                                        color=tsbColors[i],
+                                        label=label,
+                                    )
+                                    if (
+                                        mutations_TSB[sample][mut][tsb]
+                                        / total_count_sample
+                                        * 100
+                                        > y2max
+                                    ):
+                                        y2max = (
+                                            mutations_TSB[sample][mut][tsb]
+                                            / total_count_sample
+                                            * 100
+                                        )
+                            else:
+                                if mutations_TSB[sample][mut][tsb] > y2max:
+                                    y2max = mutations_TSB[sample][mut][tsb]
+
+                                panel5.barh(
+                                    yp2,
+                                    mutations_TSB[sample][mut][tsb],
+                                    color=tsbColors[i],
+                                    label=label,
+                                )
+                            yp2 -= 1
+                            i += 1
+                        yp2 -= 1
+                    y = int(y2max * 1.1)
+                    if y <= 4:
+                        y += 4
+
+                    while y % 4 != 0:
+                        y += 1
+                    ytick_offest = int(y / 4)
+                    if percentage:
+                        xlabs = [
+                            0,
+                            round(ytick_offest, 1),
+                            round(ytick_offest * 2, 1),
+                            round(ytick_offest * 3, 1),
+                            round(ytick_offest * 4, 1),
+                        ]
+                        xlabels = [
+                            str(0),
+                            str(round(ytick_offest, 1)) + "%",
+                            str(round(ytick_offest * 2, 1)) + "%",
+                            str(round(ytick_offest * 3, 1)) + "%",
+                            str(round(ytick_offest * 4, 1)) + "%",
+                        ]
+                    else:
+                        xlabs = [
+                            0,
+                            ytick_offest,
+                            ytick_offest * 2,
+                            ytick_offest * 3,
+                            ytick_offest * 4,
+                        ]
+                        xlabels = [
+                            0,
+                            ytick_offest,
+                            ytick_offest * 2,
+                            ytick_offest * 3,
+                            ytick_offest * 4,
+                        ]
+
+                    if not percentage:
+                        xlabels = getxlabels(xlabels)
+
+                    panel5.spines["right"].set_visible(False)
+                    panel5.spines["top"].set_visible(False)
+                    labels.reverse()
+                    panel5.set_yticks([3, 7, 11, 15, 19, 23, 27])
+                    panel5.set_yticklabels(
+                        labels, fontsize=30, fontname="Arial", weight="bold"
+                    )
+                    panel5.set_xticklabels(xlabels, fontsize=30)
+                    panel5.set_xticks(xlabs)
+                    handles, labels = panel5.get_legend_handles_labels()
+                    panel5.legend(
+                        handles[:3], labels[:3], loc="best", prop={"size": 20}
+                    )
+
+                    errors.stop()
+                    pp.savefig(plot1)
+                    plt.close()
+
+                    progress(sample, path=file_path)
+                except Exception as e:
+                    errors.failed(sample, e)
+                    plt.close()
+                sample_count += 1
+            pp.close()
+        except Exception as e:
+            discard_pdf(pp, output_path + "SBS_4608_plots_" + project + ".pdf")
+            if isinstance(e, PlottingError):
+                raise
+            raise MatrixFormatError(
+                "ERROR: there may be an issue with the formatting of your matrix file."
+            ) from e
+        errors.finish()
+
+    elif plot_type == "288":
+        plot_custom_text = False
+        sig_probs = False
+        pcawg = False
+
+        data = process_input(matrix_path, plot_type, sample_selection, on_error, dtype)
+        cache_keys, skipped = lookup_render_cache(
+            cache,
+            data,
+            "SBS_288",
+            savefig_format,
+            dpi,
+            percentage,
+            custom_text_upper,
+            custom_text_middle,
+            custom_text_bottom,
+            scaling,
+        )
+        skipped |= lookup_appended_samples(
+            append, savefig_format, output_path, project, "SBS_288"
+        )
+        progress = PlotProgress(progress_callback, data.columns)
+        errors = ErrorPolicy(on_error, progress, sample_timeout, cancel)
+
+        sample_count = 0
+
+        data, tsb_mats = reindex_sbs288(data)
+        buf = io.BytesIO()
+        fig_orig = make_pickle_file(
+            context="SBS288", return_plot_template=True, volume=volume
+        )
+        pickle.dump(fig_orig, buf)
+
+        figs = {}
+        buff_list = {}
+        ctx = data.index
+        colors_flat_list = get_context_spec("SBS96").colors
+        stats = cohort_statistics(data, "SBS288", percentage, strands=tsb_mats)
+        normalized = normalize_counts(data) if percentage else None
+
+        for sample in data.columns:
+            if sample in skipped:
+                progress(
+                    sample, "skipped", reason="already in the output or render cache"
+                )
+                sample_count += 1
+                continue
+            try:
+                errors.start(sample)
+                check_sample_counts(data[sample])
+                buf.seek(0)
+                figs[sample] = pickle.load(buf)
+                panel1 = figs[sample].axes[0]
+                panel2 = figs[sample].axes[1]
+
+                scale = sample_scaling(stats, sample, scaling)
+                total_count = scale["total"]
+                muts = sample_counts(data, sample)
+                x = 0.4
+                if percentage:
+                    if total_count > 0:
+                        panel1.bar(
+                            np.arange(len(ctx)) + x,
+                            sample_counts(normalized, sample),
+                            width=0.4,
+                            color=colors_flat_list,
+                            align="center",
+                            zorder=1000,
+                        )
+                    sig_probs = True
+                else:
+                    panel1.bar(
+                        np.arange(len(ctx)) + x,
+                        muts,
+                        width=0.4,
+                        color=colors_flat_list,
+                        align="center",
+                        zorder=1000,
                     )
 
-                # Plot the sample name in upper left corner of plot
+                y = scale["ylim"]
+                ylabs = list(scale["yticks"])
+                ylabels = list(scale["ylabels"])
+
+                font_label_size = 30
+                if percentage or any(int(tick) >= 1000 for tick in ylabs[:4]):
+                    font_label_size = 20
+
+                labs = np.arange(0.375, 96.375, 1)
+
+                panel1.set_xlim([0, 96])
+                panel1.set_ylim([0, y])
+
+                panel1.set_yticks(ylabs)
+
                 if sig_probs:
-                    panel2.text(
-                        0.04,
-                        0.875,
+                    plt.text(
+                        0.045,
+                        0.75,
                         sample,
-                        fontsize=50,
+                        fontsize=60,
                         weight="bold",
                         color="black",
                         fontname="Arial",
                         transform=plt.gcf().transFigure,
                     )
                 else:
-                    panel2.text(
-                        0.04,
-                        0.875,
-                        sample
-                        + ": "
-                        + "{:,}".format(int(total_count_sample))
-                        + " subs",
-                        fontsize=50,
+                    plt.text(
+                        0.045,
+                        0.75,
+                        sample + ": " + "{:,}".format(int(total_count)) + " subs",
+                        fontsize=60,
                         weight="bold",
                         color="black",
                         fontname="Arial",
                         transform=plt.gcf().transFigure,
                     )
 
-                # Finish setting all axis grids and tick parameters
-                panel2.grid(which="major", axis="y", color=[0.93, 0.93, 0.93], zorder=1)
-                panel1.set_xlabel("")
-                panel1.set_ylabel("")
-                panel1.set_yticklabels([])
-                panel1.set_xticklabels([])
-                panel2.set_xticklabels([])
+                custom_text_upper_plot = ""
+                try:
+                    custom_text_upper[sample_count]
+                except:
+                    custom_text_upper = False
+                try:
+                    custom_text_middle[sample_count]
+                except:
+                    custom_text_middle = False
+                try:
+                    custom_text_bottom[sample_count]
+                except:
+                    custom_text_bottom = False
 
-                if percentage:
-                    panel2.set_ylabel(
-                        "Percentage of Single Base Substitutions",
-                        fontsize=26,
+                if custom_text_upper:
+                    plot_custom_text = True
+                    if len(custom_text_upper[sample_count]) > 40:
+                        print(
+                            "To add a custom text, please limit the string to <40 characters including spaces."
+                        )
+                        plot_custom_text = False
+                if custom_text_middle:
+                    if len(custom_text_middle[sample_count]) > 40:
+                        print(
+                            "To add a custom text, please limit the string to <40 characters including spaces."
+                        )
+                        plot_custom_text = False
+
+                if plot_custom_text:
+                    x_pos_custom = 0.73
+                    if custom_text_upper and custom_text_middle:
+                        custom_text_upper_plot = (
+                            custom_text_upper[sample_count]
+                            + "\n"
+                            + custom_text_middle[sample_count]
+                        )
+                        if custom_text_bottom:
+                            custom_text_upper_plot += (
+                                "\n" + custom_text_bottom[sample_count]
+                            )
+
+                    if custom_text_upper and not custom_text_middle:
+                        custom_text_upper_plot = custom_text_upper[sample_count]
+                        panel1.text(
+                            x_pos_custom,
+                            0.78,
+                            custom_text_upper_plot,
+                            fontsize=40,
+                            weight="bold",
+                            color="black",
+                            fontname="Arial",
+                            transform=plt.gcf().transFigure,
+                            ha="right",
+                            zorder=1,
+                        )
+
+                    elif custom_text_upper and custom_text_middle:
+                        if not custom_text_bottom:
+                            panel1.text(
+                                x_pos_custom,
+                                0.72,
+                                custom_text_upper_plot,
+                                fontsize=40,
+                                weight="bold",
+                                color="black",
+                                fontname="Arial",
+                                transform=plt.gcf().transFigure,
+                                ha="right",
+                            )
+                        else:
+                            panel1.text(
+                                x_pos_custom,
+                                0.68,
+                                custom_text_upper_plot,
+                                fontsize=40,
+                                weight="bold",
+                                color="black",
+                                fontname="Arial",
+                                transform=plt.gcf().transFigure,
+                                ha="right",
+                            )
+
+                    elif not custom_text_upper and custom_text_middle:
+                        custom_text_upper_plot = custom_text_middle[sample_count]
+                        panel1.text(
+                            x_pos_custom,
+                            0.78,
+                            custom_text_upper_plot,
+                            fontsize=40,
+                            weight="bold",
+                            color="black",
+                            fontname="Arial",
+                            transform=plt.gcf().transFigure,
+                            ha="right",
+                        )
+
+                panel1.set_yticklabels(ylabels, fontsize=font_label_size)
+                panel1.yaxis.grid(True)
+                panel1.grid(which="major", axis="y", color=[0.93, 0.93, 0.93], zorder=1)
+                panel1.set_xlabel("")
+                panel1.set_ylabel("")
+
+                if percentage:
+                    panel1.set_ylabel(
+                        "Percentage of Single Base Substitutions",
+                        fontsize=35,
                         fontname="Times New Roman",
                         weight="bold",
                     )
                 else:
-                    panel2.set_ylabel(
+                    panel1.set_ylabel(
                         "Number of Single Base Substitutions",
-                        fontsize=26,
+                        fontsize=35,
                         fontname="Times New Roman",
                         weight="bold",
                     )
 
-                panel1.axis("off")
                 panel1.tick_params(
-                    axis="both",
-                    which="both",
-                    bottom=False,
-                    labelbottom=False,
-                    left=False,
-                    labelleft=False,
-                    right=False,
-                    labelright=False,
-                    top=False,
-                    labeltop=False,
-                    direction="in",
-                    length=25,
-                    colors="white",
-                    width=2,
-                )
-                panel2.tick_params(
                     axis="both",
                     which="both",
                     bottom=False,
@@ -7167,608 +8389,139 @@ def plotSBS(
                     labeltop=False,
                     direction="in",
                     length=25,
-                    colors="white",
-                    width=2,
-                )
-                panel3.axis("off")
-                panel3.tick_params(
-                    axis="both",
-                    which="both",
-                    bottom=False,
-                    labelbottom=False,
-                    left=False,
-                    labelleft=False,
-                    right=True,
-                    labelright=False,
-                    top=False,
-                    labeltop=False,
-                    direction="in",
-                    length=25,
-                    colors="white",
-                    width=2,
-                )
-                panel4.axis("off")
-                panel4.tick_params(
-                    axis="both",
-                    which="both",
-                    bottom=False,
-                    labelbottom=False,
-                    left=False,
-                    labelleft=False,
-                    right=True,
-                    labelright=False,
-                    top=False,
-                    labeltop=False,
-                    direction="in",
-                    length=25,
-                    colors="white",
+                    colors="lightgray",
                     width=2,
                 )
 
-                # Change axis depending if percentage parameter is selected
-                if percentage:
-                    panel2.set_yticklabels(
-                        ylabels_96, fontsize=font_label_size - 1, color="black"
-                    )
-                else:
-                    panel2.set_yticklabels(
-                        ylabels_96, fontsize=font_label_size, color="black"
-                    )
+                [i.set_color("black") for i in panel1.get_yticklabels()]
 
                 yp2 = 28
                 labels = []
-                y2max = 0
                 tsbColors = [
                     [1 / 256, 70 / 256, 102 / 256],
                     [228 / 256, 41 / 256, 38 / 256],
                     "green",
                 ]
-                for mut in mutations_TSB[sample]:
-                    labels.append(mut)
-                    i = 0
-                    for tsb in mutations_TSB[sample][mut]:
-                        if tsb == "T":
-                            label = "Genic-transcribed"
-                        elif tsb == "U":
-                            label = "Genic-untranscribed"
-                        else:
-                            label = "Intergenic"
-                        if percentage:
-                            if total_count_sample > 0:
-                                panel5.barh(
-                                    yp2,
-                                    mutations_TSB[sample][mut][tsb]
-                                    / total_count_sample
-                                    * 100,
-                                    color=tsbColors[i],
-                                    label=label,
-                                )
-                                if (
-                                    mutations_TSB[sample][mut][tsb]
-                                    / total_count_sample
-                                    * 100
-                                    > y2max
-                                ):
-                                    y2max = (
-                                        mutations_TSB[sample][mut][tsb]
-                                        / total_count_sample
-                                        * 100
-                                    )
-                        else:
-                            if mutations_TSB[sample][mut][tsb] > y2max:
-                                y2max = mutations_TSB[sample][mut][tsb]
 
-                            panel5.barh(
-                                yp2,
-                                mutations_TSB[sample][mut][tsb],
-                                color=tsbColors[i],
-                                label=label,
-                            )
-                        yp2 -= 1
-                        i += 1
-                    yp2 -= 1
-                y = int(y2max * 1.1)
-                if y <= 4:
-                    y += 4
-
-                while y % 4 != 0:
-                    y += 1
-                ytick_offest = int(y / 4)
                 if percentage:
-                    xlabs = [
-                        0,
-                        round(ytick_offest, 1),
-                        round(ytick_offest * 2, 1),
-                        round(ytick_offest * 3, 1),
-                        round(ytick_offest * 4, 1),
-                    ]
-                    xlabels = [
-                        str(0),
-                        str(round(ytick_offest, 1)) + "%",
-                        str(round(ytick_offest * 2, 1)) + "%",
-                        str(round(ytick_offest * 3, 1)) + "%",
-                        str(round(ytick_offest * 4, 1)) + "%",
-                    ]
+                    panel2.barh(
+                        range(28, 1, -4),
+                        tsb_mats["T"][sample].values / total_count * 100,
+                        color=tsbColors[0],
+                        label="Genic-transcribed",
+                    )
+                    panel2.barh(
+                        range(27, 1, -4),
+                        tsb_mats["U"][sample].values / total_count * 100,
+                        color=tsbColors[1],
+                        label="Genic-untranscribed",
+                    )
+                    panel2.barh(
+                        range(26, 1, -4),
+                        tsb_mats["N"][sample].values / total_count * 100,
+                        color=tsbColors[2],
+                        label="Intergenic",
+                    )
+
                 else:
-                    xlabs = [
-                        0,
-                        ytick_offest,
-                        ytick_offest * 2,
-                        ytick_offest * 3,
-                        ytick_offest * 4,
-                    ]
-                    xlabels = [
-                        0,
-                        ytick_offest,
-                        ytick_offest * 2,
-                        ytick_offest * 3,
-                        ytick_offest * 4,
-                    ]
+                    panel2.barh(
+                        range(28, 1, -4),
+                        tsb_mats["T"][sample].values,
+                        color=tsbColors[0],
+                        label="Genic-transcribed",
+                    )
+                    panel2.barh(
+                        range(27, 1, -4),
+                        tsb_mats["U"][sample].values,
+                        color=tsbColors[1],
+                        label="Genic-untranscribed",
+                    )
+                    panel2.barh(
+                        range(26, 1, -4),
+                        tsb_mats["N"][sample].values,
+                        color=tsbColors[2],
+                        label="Intergenic",
+                    )
+
+                labels = list(tsb_mats["T"][sample].index)
 
-                if not percentage:
-                    xlabels = getxlabels(xlabels)
+                xlabs = list(scale["strand_ticks"])
+                xlabels = list(scale["strand_labels"])
 
-                panel5.spines["right"].set_visible(False)
-                panel5.spines["top"].set_visible(False)
+                panel2.spines["right"].set_visible(False)
+                panel2.spines["top"].set_visible(False)
                 labels.reverse()
-                panel5.set_yticks([3, 7, 11, 15, 19, 23, 27])
-                panel5.set_yticklabels(
+                panel2.set_yticks([3, 7, 11, 15, 19, 23, 27])
+                panel2.set_yticklabels(
                     labels, fontsize=30, fontname="Arial", weight="bold"
                 )
-                panel5.set_xticklabels(xlabels, fontsize=30)
-                panel5.set_xticks(xlabs)
-                handles, labels = panel5.get_legend_handles_labels()
-                panel5.legend(handles[:3], labels[:3], loc="best", prop={"size": 20})
-
-                pp.savefig(plot1)
-                plt.close()
-                sample_count += 1
-            pp.close()
-
-    elif plot_type == "288":
-        plot_custom_text = False
-        sig_probs = False
-        pcawg = False
-
-        data = process_input(matrix_path, plot_type)
-
-        sample_count = 0
+                panel2.set_xticks(xlabs)
+                panel2.set_xticklabels(xlabels, fontsize=30)
+                handles, labels = panel2.get_legend_handles_labels()
+                panel2.legend(handles[:3], labels[:3], loc="best", prop={"size": 30})
+                errors.stop()
+            except Exception as e:
+                errors.failed(sample, e)
+                if sample in figs:
+                    plt.close(figs.pop(sample))
+            sample_count += 1
 
-        data, tsb_mats = reindex_sbs288(data)
-        buf = io.BytesIO()
-        fig_orig = make_pickle_file(
-            context="SBS288", return_plot_template=True, volume=volume
+        return errors.finish(
+            output_results(
+                savefig_format,
+                output_path,
+                project,
+                figs,
+                "SBS_288",
+                dpi=dpi,
+                cache=cache,
+                cache_keys=cache_keys,
+                append=append,
+                archive=archive,
+                compresslevel=compresslevel,
+                progress=progress,
+                errors=errors,
+            )
         )
-        pickle.dump(fig_orig, buf)
-
-        figs = {}
-        buff_list = {}
-        ctx = data.index
-        colors = [
-            [3 / 256, 189 / 256, 239 / 256],
-            [1 / 256, 1 / 256, 1 / 256],
-            [228 / 256, 41 / 256, 38 / 256],
-            [203 / 256, 202 / 256, 202 / 256],
-            [162 / 256, 207 / 256, 99 / 256],
-            [236 / 256, 199 / 256, 197 / 256],
-        ]
-        colorsall = [
-            [colors[j] for i in range(int(len(ctx) / 6))] for j in range(6)
-        ]
-        colors_flat_list = [item for sublist in colorsall for item in sublist]
 
-        for sample in data.columns:
-            buf.seek(0)
-            figs[sample] = pickle.load(buf)
-            panel1 = figs[sample].axes[0]
-            panel2 = figs[sample].axes[1]
-
-            total_count = np.sum(data[sample].values)
-            muts = data[sample].values
-            x = 0.4
-            if percentage:
-                if total_count > 0:
-                    panel1.bar(
-                        np.arange(len(ctx)) + x,
-                        muts / total_count * 100,
-                        width=0.4,
-                        color=colors_flat_list,
-                        align="center",
-                        zorder=1000,
-                    )
-                    ymax = np.max(muts / total_count * 100)
-                sig_probs = True
-            else:
-                panel1.bar(
-                    np.arange(len(ctx)) + x,
-                    muts,
-                    width=0.4,
-                    color=colors_flat_list,
-                    align="center",
-                    zorder=1000,
+    elif plot_type == "288_Normalized":
+        with open(matrix_path) as f:
+            next(f)
+            first_line = f.readline()
+            first_line = first_line.strip().split()
+            if first_line[0][6] == ">" or first_line[0][3] == ">":
+                pcawg = True
+            if (
+                first_line[0][7] != "]"
+                and first_line[0][6] != ">"
+                and first_line[0][3] != ">"
+            ):
+                raise MatrixFormatError(
+                    "ERROR: The matrix does not match the correct SBS288 format. Please check you formatting and rerun this plotting function."
                 )
-                ymax = np.max(muts)
-
-            y = int(ymax * 1.25)
-            if y <= 4:
-                y += 4
-
-            while y % 4 != 0:
-                y += 1
-            y = ymax / 1.025
-            ytick_offest = float(y / 3)
-
-            if percentage:
-                ylabs = [
-                    0,
-                    round(ytick_offest, 1),
-                    round(ytick_offest * 2, 1),
-                    round(ytick_offest * 3, 1),
-                    round(ytick_offest * 4, 1),
-                ]
-                ylabels = [
-                    str(0),
-                    str(round(ytick_offest, 1)) + "%",
-                    str(round(ytick_offest * 2, 1)) + "%",
-                    str(round(ytick_offest * 3, 1)) + "%",
-                    str(round(ytick_offest * 4, 1)) + "%",
-                ]
-
-            else:
-                ylabs = [
-                    0,
-                    ytick_offest,
-                    ytick_offest * 2,
-                    ytick_offest * 3,
-                    ytick_offest * 4,
-                ]
-                ylabels = [
-                    0,
-                    ytick_offest,
-                    ytick_offest * 2,
-                    ytick_offest * 3,
-                    ytick_offest * 4,
-                ]
-
-            font_label_size = 30
-            if not percentage:
-                if int(ylabels[3]) >= 1000:
-                    font_label_size = 20
-
-            if percentage:
-                if len(ylabels) > 2:
-                    font_label_size = 20
-
-            labs = np.arange(0.375, 96.375, 1)
 
-            if not percentage:
-                ylabels = spplt.getylabels(ylabels)
-
-            panel1.set_xlim([0, 96])
-            panel1.set_ylim([0, y])
+        file_path = os.path.join(output_path, f"SBS_288_Normalized_plots_{project}.pdf")
+        pp = PdfPages(file_path)
 
-            panel1.set_yticks(ylabs)
+        mutations = OrderedDict()
+        mutations_TSB = OrderedDict()
+        total_count = []
+        try:
+            with open(matrix_path) as f:
+                first_line = f.readline()
+                if pcawg:
+                    samples = first_line.strip().split(",")
+                    samples = samples[2:]
+                else:
+                    samples = first_line.strip().split("\t")
+                    samples = samples[1:]
 
-            if sig_probs:
-                plt.text(
-                    0.045,
-                    0.75,
-                    sample,
-                    fontsize=60,
-                    weight="bold",
-                    color="black",
-                    fontname="Arial",
-                    transform=plt.gcf().transFigure,
+                sample_columns = select_sample_columns(
+                    samples, sample_selection, 2 if pcawg else 1
                 )
-            else:
-                plt.text(
-                    0.045,
-                    0.75,
-                    sample + ": " + "{:,}".format(int(total_count)) + " subs",
-                    fontsize=60,
-                    weight="bold",
-                    color="black",
-                    fontname="Arial",
-                    transform=plt.gcf().transFigure,
-                )
-
-            custom_text_upper_plot = ""
-            try:
-                custom_text_upper[sample_count]
-            except:
-                custom_text_upper = False
-            try:
-                custom_text_middle[sample_count]
-            except:
-                custom_text_middle = False
-            try:
-                custom_text_bottom[sample_count]
-            except:
-                custom_text_bottom = False
-
-            if custom_text_upper:
-                plot_custom_text = True
-                if len(custom_text_upper[sample_count]) > 40:
-                    print(
-                        "To add a custom text, please limit the string to <40 characters including spaces."
-                    )
-                    plot_custom_text = False
-            if custom_text_middle:
-                if len(custom_text_middle[sample_count]) > 40:
-                    print(
-                        "To add a custom text, please limit the string to <40 characters including spaces."
-                    )
-                    plot_custom_text = False
-
-            if plot_custom_text:
-                x_pos_custom = 0.73
-                if custom_text_upper and custom_text_middle:
-                    custom_text_upper_plot = (
-                        custom_text_upper[sample_count]
-                        + "\n"
-                        + custom_text_middle[sample_count]
-                    )
-                    if custom_text_bottom:
-                        custom_text_upper_plot += (
-                            "\n" + custom_text_bottom[sample_count]
-                        )
-
-                if custom_text_upper and not custom_text_middle:
-                    custom_text_upper_plot = custom_text_upper[sample_count]
-                    panel1.text(
-                        x_pos_custom,
-                        0.78,
-                        custom_text_upper_plot,
-                        fontsize=40,
-                        weight="bold",
-                        color="black",
-                        fontname="Arial",
-                        transform=plt.gcf().transFigure,
-                        ha="right",
-                        zorder=1,
-                    )
-
-                elif custom_text_upper and custom_text_middle:
-                    if not custom_text_bottom:
-                        panel1.text(
-                            x_pos_custom,
-                            0.72,
-                            custom_text_upper_plot,
-                            fontsize=40,
-                            weight="bold",
-                            color="black",
-                            fontname="Arial",
-                            transform=plt.gcf().transFigure,
-                            ha="right",
-                        )
-                    else:
-                        panel1.text(
-                            x_pos_custom,
-                            0.68,
-                            custom_text_upper_plot,
-                            fontsize=40,
-                            weight="bold",
-                            color="black",
-                            fontname="Arial",
-                            transform=plt.gcf().transFigure,
-                            ha="right",
-                        )
-
-                elif not custom_text_upper and custom_text_middle:
-                    custom_text_upper_plot = custom_text_middle[sample_count]
-                    panel1.text(
-                        x_pos_custom,
-                        0.78,
-                        custom_text_upper_plot,
-                        fontsize=40,
-                        weight="bold",
-                        color="black",
-                        fontname="Arial",
-                        transform=plt.gcf().transFigure,
-                        ha="right",
-                    )
-
-            panel1.set_yticklabels(ylabels, fontsize=font_label_size)
-            panel1.yaxis.grid(True)
-            panel1.grid(which="major", axis="y", color=[0.93, 0.93, 0.93], zorder=1)
-            panel1.set_xlabel("")
-            panel1.set_ylabel("")
-
-            if percentage:
-                panel1.set_ylabel(
-                    "Percentage of Single Base Substitutions",
-                    fontsize=35,
-                    fontname="Times New Roman",
-                    weight="bold",
-                )
-            else:
-                panel1.set_ylabel(
-                    "Number of Single Base Substitutions",
-                    fontsize=35,
-                    fontname="Times New Roman",
-                    weight="bold",
-                )
-
-            panel1.tick_params(
-                axis="both",
-                which="both",
-                bottom=False,
-                labelbottom=False,
-                left=True,
-                labelleft=True,
-                right=True,
-                labelright=False,
-                top=False,
-                labeltop=False,
-                direction="in",
-                length=25,
-                colors="lightgray",
-                width=2,
-            )
-
-            [i.set_color("black") for i in panel1.get_yticklabels()]
-
-            yp2 = 28
-            labels = []
-            y2max = 0
-            tsbColors = [
-                [1 / 256, 70 / 256, 102 / 256],
-                [228 / 256, 41 / 256, 38 / 256],
-                "green",
-            ]
-
-            if percentage:
-                y2max = (
-                    np.max(
-                        [
-                            tsb_mats["T"][sample]["All"],
-                            tsb_mats["U"][sample]["All"],
-                            tsb_mats["N"][sample]["All"],
-                        ]
-                    )
-                    / total_count
-                    * 100
-                )
-
-                panel2.barh(
-                    range(28, 1, -4),
-                    tsb_mats["T"][sample].values / total_count * 100,
-                    color=tsbColors[0],
-                    label="Genic-transcribed",
-                )
-                panel2.barh(
-                    range(27, 1, -4),
-                    tsb_mats["U"][sample].values / total_count * 100,
-                    color=tsbColors[1],
-                    label="Genic-untranscribed",
-                )
-                panel2.barh(
-                    range(26, 1, -4),
-                    tsb_mats["N"][sample].values / total_count * 100,
-                    color=tsbColors[2],
-                    label="Intergenic",
-                )
-
-            else:
-                y2max = np.max(
-                    [
-                        tsb_mats["T"][sample]["All"],
-                        tsb_mats["U"][sample]["All"],
-                        tsb_mats["N"][sample]["All"],
-                    ]
-                )
-                panel2.barh(
-                    range(28, 1, -4),
-                    tsb_mats["T"][sample].values,
-                    color=tsbColors[0],
-                    label="Genic-transcribed",
-                )
-                panel2.barh(
-                    range(27, 1, -4),
-                    tsb_mats["U"][sample].values,
-                    color=tsbColors[1],
-                    label="Genic-untranscribed",
-                )
-                panel2.barh(
-                    range(26, 1, -4),
-                    tsb_mats["N"][sample].values,
-                    color=tsbColors[2],
-                    label="Intergenic",
-                )
-
-            labels = list(tsb_mats["T"][sample].index)
-
-            y = int(y2max * 1.1)
-            if y <= 4:
-                y += 4
-            while y % 4 != 0:
-                y += 1
-            ytick_offest = int(y / 4)
-
-            if percentage:
-                xlabs = [
-                    0,
-                    round(ytick_offest, 1),
-                    round(ytick_offest * 2, 1),
-                    round(ytick_offest * 3, 1),
-                    round(ytick_offest * 4, 1),
-                ]
-                xlabels = [
-                    str(0),
-                    str(round(ytick_offest, 1)) + "%",
-                    str(round(ytick_offest * 2, 1)) + "%",
-                    str(round(ytick_offest * 3, 1)) + "%",
-                    str(round(ytick_offest * 4, 1)) + "%",
-                ]
-            else:
-                xlabs = [
-                    0,
-                    ytick_offest,
-                    ytick_offest * 2,
-                    ytick_offest * 3,
-                    ytick_offest * 4,
-                ]
-                xlabels = [
-                    0,
-                    ytick_offest,
-                    ytick_offest * 2,
-                    ytick_offest * 3,
-                    ytick_offest * 4,
-                ]
-
-            if not percentage:
-                xlabels = spplt.getxlabels(xlabels)
-
-            panel2.spines["right"].set_visible(False)
-            panel2.spines["top"].set_visible(False)
-            labels.reverse()
-            panel2.set_yticks([3, 7, 11, 15, 19, 23, 27])
-            panel2.set_yticklabels(
-                labels, fontsize=30, fontname="Arial", weight="bold"
-            )
-            panel2.set_xticks(xlabs)
-            panel2.set_xticklabels(xlabels, fontsize=30)
-            handles, labels = panel2.get_legend_handles_labels()
-            panel2.legend(handles[:3], labels[:3], loc="best", prop={"size": 30})
-            sample_count += 1
-
-        return output_results(
-            savefig_format, output_path, project, figs, "SBS_288", dpi=dpi
-        )
-
-    elif plot_type == "288_Normalized":
-        with open(matrix_path) as f:
-            next(f)
-            first_line = f.readline()
-            first_line = first_line.strip().split()
-            if first_line[0][6] == ">" or first_line[0][3] == ">":
-                pcawg = True
-            if (
-                first_line[0][7] != "]"
-                and first_line[0][6] != ">"
-                and first_line[0][3] != ">"
-            ):
-                sys.exit(
-                    "The matrix does not match the correct SBS288 format. Please check you formatting and rerun this plotting function."
-                )
-
-        file_path = os.path.join(output_path, f"SBS_288_Normalized_plots_{project}.pdf")
-        pp = PdfPages(file_path)
-
-        mutations = OrderedDict()
-        mutations_TSB = OrderedDict()
-        total_count = []
-        if True:
-            # try:
-            with open(matrix_path) as f:
-                first_line = f.readline()
-                if pcawg:
-                    samples = first_line.strip().split(",")
-                    samples = samples[2:]
-                else:
-                    samples = first_line.strip().split("\t")
-                    samples = samples[1:]
-
+                samples = list(sample_columns)
+                progress = PlotProgress(progress_callback, samples)
+                errors = ErrorPolicy(on_error, progress, sample_timeout, cancel)
                 for sample in samples:
                     mutations[sample] = OrderedDict()
                     mutations[sample]["C>A"] = OrderedDict()
@@ -7801,18 +8554,12 @@ def plotSBS(
                         tsb = nuc[0]
 
                     for sample in samples:
-                        if percentage:
-                            mutCount = float(line[sample_index])
-                            if mutCount < 1 and mutCount > 0:
-                                sig_probs = True
-                        else:
-                            try:
-                                mutCount = int(line[sample_index])
-                            except:
-                                print(
-                                    "It appears that the provided matrix does not contain mutation counts.\n\tIf you have provided a signature activity matrix, please change the percentage parameter to True.\n\tOtherwise, ",
-                                    end="",
-                                )
+                        sample_index = sample_columns[sample]
+                        mutCount = read_mutation_count(
+                            line, sample_index, sample, percentage, errors
+                        )
+                        if percentage and mutCount < 1 and mutCount > 0:
+                            sig_probs = True
                         if nuc[2:] not in mutations[sample][mut_type]:
                             mutations[sample][mut_type][nuc[2:]] = mutCount
                         else:
@@ -7824,319 +8571,303 @@ def plotSBS(
             sample_count = 0
 
             for sample in mutations.keys():
-                total_count = sum(
-                    sum(nuc.values()) for nuc in mutations[sample].values()
-                )
-                plt.rcParams["axes.linewidth"] = 2
-                plot1 = plt.figure(figsize=(43.93, 9.92))
-                plt.rc("axes", edgecolor="lightgray")
-                panel1 = plt.axes([0.04, 0.09, 0.7, 0.77])
-                panel2 = plt.axes([0.77, 0.09, 0.21, 0.77])
-                xlabels = []
-
-                x = 0.4
-                ymax = 0
-                colors = [
-                    [3 / 256, 189 / 256, 239 / 256],
-                    [1 / 256, 1 / 256, 1 / 256],
-                    [228 / 256, 41 / 256, 38 / 256],
-                    [203 / 256, 202 / 256, 202 / 256],
-                    [162 / 256, 207 / 256, 99 / 256],
-                    [236 / 256, 199 / 256, 197 / 256],
-                ]
-                i = 0
-                for key in mutations[sample]:
-                    for seq in mutations[sample][key]:
-                        xlabels.append(seq[0] + seq[2] + seq[6])
-                        if percentage:
-                            if total_count > 0:
+                if sample in errors:
+                    continue
+                try:
+                    errors.start(sample)
+                    total_count = sum(
+                        sum(nuc.values()) for nuc in mutations[sample].values()
+                    )
+                    plt.rcParams["axes.linewidth"] = 2
+                    plot1 = plt.figure(figsize=(43.93, 9.92))
+                    plt.rc("axes", edgecolor="lightgray")
+                    panel1 = plt.axes([0.04, 0.09, 0.7, 0.77])
+                    panel2 = plt.axes([0.77, 0.09, 0.21, 0.77])
+                    xlabels = []
+
+                    x = 0.4
+                    ymax = 0
+                    colors = get_context_spec("SBS96").palette
+                    i = 0
+                    for key in mutations[sample]:
+                        for seq in mutations[sample][key]:
+                            xlabels.append(seq[0] + seq[2] + seq[6])
+                            if percentage:
+                                if total_count > 0:
+                                    panel1.bar(
+                                        x,
+                                        mutations[sample][key][seq] / total_count * 100,
+                                        width=0.4,
+                                        color=colors[i],
+                                        align="center",
+                                        zorder=1000,
+                                    )
+                                    if (
+                                        mutations[sample][key][seq] / total_count * 100
+                                        > ymax
+                                    ):
+                                        ymax = (
+                                            mutations[sample][key][seq]
+                                            / total_count
+                                            * 100
+                                        )
+                            else:
                                 panel1.bar(
                                     x,
-                                    mutations[sample][key][seq] / total_count * 100,
+                                    mutations[sample][key][seq],
                                     width=0.4,
                                     color=colors[i],
                                     align="center",
                                     zorder=1000,
                                 )
-                                if (
-                                    mutations[sample][key][seq] / total_count * 100
-                                    > ymax
-                                ):
-                                    ymax = (
-                                        mutations[sample][key][seq] / total_count * 100
-                                    )
-                        else:
-                            panel1.bar(
-                                x,
-                                mutations[sample][key][seq],
-                                width=0.4,
-                                color=colors[i],
-                                align="center",
-                                zorder=1000,
-                            )
-                            if mutations[sample][key][seq] > ymax:
-                                ymax = mutations[sample][key][seq]
-                        x += 1
-                    i += 1
+                                if mutations[sample][key][seq] > ymax:
+                                    ymax = mutations[sample][key][seq]
+                            x += 1
+                        i += 1
 
-                x = 0.043
-                y3 = 0.87
-                y = int(ymax * 1.25)
-                y2 = y + 2
-                for i in range(0, 6, 1):
-                    panel1.add_patch(
-                        plt.Rectangle(
-                            (x, y3),
-                            0.11,
-                            0.05,
-                            facecolor=colors[i],
-                            clip_on=False,
-                            transform=plt.gcf().transFigure,
+                    x = 0.043
+                    y3 = 0.87
+                    y = int(ymax * 1.25)
+                    y2 = y + 2
+                    for i in range(0, 6, 1):
+                        panel1.add_patch(
+                            plt.Rectangle(
+                                (x, y3),
+                                0.11,
+                                0.05,
+                                facecolor=colors[i],
+                                clip_on=False,
+                                transform=plt.gcf().transFigure,
+                            )
                         )
-                    )
-                    x += 0.117
-
-                yText = y3 + 0.06
-
-                plt.text(
-                    0.082,
-                    yText,
-                    "C>A",
-                    fontsize=55,
-                    fontweight="bold",
-                    fontname="Arial",
-                    transform=plt.gcf().transFigure,
-                )
-                plt.text(
-                    0.1975,
-                    yText,
-                    "C>G",
-                    fontsize=55,
-                    fontweight="bold",
-                    fontname="Arial",
-                    transform=plt.gcf().transFigure,
-                )
-                plt.text(
-                    0.315,
-                    yText,
-                    "C>T",
-                    fontsize=55,
-                    fontweight="bold",
-                    fontname="Arial",
-                    transform=plt.gcf().transFigure,
-                )
-                plt.text(
-                    0.43,
-                    yText,
-                    "T>A",
-                    fontsize=55,
-                    fontweight="bold",
-                    fontname="Arial",
-                    transform=plt.gcf().transFigure,
-                )
-                plt.text(
-                    0.55,
-                    yText,
-                    "T>C",
-                    fontsize=55,
-                    fontweight="bold",
-                    fontname="Arial",
-                    transform=plt.gcf().transFigure,
-                )
-                plt.text(
-                    0.665,
-                    yText,
-                    "T>G",
-                    fontsize=55,
-                    fontweight="bold",
-                    fontname="Arial",
-                    transform=plt.gcf().transFigure,
-                )
-
-                if y <= 4:
-                    y += 4
+                        x += 0.117
 
-                while y % 4 != 0:
-                    y += 1
-                # ytick_offest = int(y/4)
-                y = ymax / 1.025
-                ytick_offest = float(y / 3)
+                    yText = y3 + 0.06
 
-                if percentage:
-                    ylabs = [
-                        0,
-                        round(ytick_offest, 1),
-                        round(ytick_offest * 2, 1),
-                        round(ytick_offest * 3, 1),
-                        round(ytick_offest * 4, 1),
-                    ]
-                    ylabels = [
-                        str(0),
-                        str(round(ytick_offest, 1)) + "%",
-                        str(round(ytick_offest * 2, 1)) + "%",
-                        str(round(ytick_offest * 3, 1)) + "%",
-                        str(round(ytick_offest * 4, 1)) + "%",
-                    ]
-                else:
-                    ylabs = [
-                        0,
-                        ytick_offest,
-                        ytick_offest * 2,
-                        ytick_offest * 3,
-                        ytick_offest * 4,
-                    ]
-                    ylabels = [
-                        0,
-                        ytick_offest,
-                        ytick_offest * 2,
-                        ytick_offest * 3,
-                        ytick_offest * 4,
-                    ]
-
-                font_label_size = 30
-                if not percentage:
-                    if int(ylabels[3]) >= 1000:
-                        font_label_size = 20
-
-                if percentage:
-                    if len(ylabels) > 2:
-                        font_label_size = 20
-
-                labs = np.arange(0.375, 96.375, 1)
-
-                if not percentage:
-                    ylabels = getylabels(ylabels)
-
-                panel1.set_xlim([0, 96])
-                panel1.set_ylim([0, y])
-                panel1.set_xticks(labs)
-                panel1.set_yticks(ylabs)
-                count = 0
-                m = 0
-                for i in range(0, 96, 1):
                     plt.text(
-                        i / 137 + 0.04,
-                        0.02,
-                        xlabels[i][0],
-                        fontsize=25,
-                        color="gray",
-                        rotation="vertical",
-                        verticalalignment="center",
-                        fontname="Courier New",
+                        0.082,
+                        yText,
+                        "C>A",
+                        fontsize=55,
+                        fontweight="bold",
+                        fontname="Arial",
                         transform=plt.gcf().transFigure,
                     )
                     plt.text(
-                        i / 137 + 0.04,
-                        0.044,
-                        xlabels[i][1],
-                        fontsize=25,
-                        color=colors[m],
-                        rotation="vertical",
-                        verticalalignment="center",
-                        fontname="Courier New",
+                        0.1975,
+                        yText,
+                        "C>G",
+                        fontsize=55,
                         fontweight="bold",
+                        fontname="Arial",
                         transform=plt.gcf().transFigure,
                     )
                     plt.text(
-                        i / 137 + 0.04,
-                        0.071,
-                        xlabels[i][2],
-                        fontsize=25,
-                        color="gray",
-                        rotation="vertical",
-                        verticalalignment="center",
-                        fontname="Courier New",
+                        0.315,
+                        yText,
+                        "C>T",
+                        fontsize=55,
+                        fontweight="bold",
+                        fontname="Arial",
                         transform=plt.gcf().transFigure,
                     )
-                    count += 1
-                    if count == 16:
-                        count = 0
-                        m += 1
-
-                if sig_probs:
                     plt.text(
-                        0.045,
-                        0.75,
-                        sample,
-                        fontsize=60,
-                        weight="bold",
-                        color="black",
+                        0.43,
+                        yText,
+                        "T>A",
+                        fontsize=55,
+                        fontweight="bold",
                         fontname="Arial",
                         transform=plt.gcf().transFigure,
                     )
-                else:
                     plt.text(
-                        0.045,
-                        0.75,
-                        sample + ": " + "{:,}".format(int(total_count)) + " subs",
-                        fontsize=60,
-                        weight="bold",
-                        color="black",
+                        0.55,
+                        yText,
+                        "T>C",
+                        fontsize=55,
+                        fontweight="bold",
+                        fontname="Arial",
+                        transform=plt.gcf().transFigure,
+                    )
+                    plt.text(
+                        0.665,
+                        yText,
+                        "T>G",
+                        fontsize=55,
+                        fontweight="bold",
                         fontname="Arial",
                         transform=plt.gcf().transFigure,
                     )
 
-                custom_text_upper_plot = ""
-                try:
-                    custom_text_upper[sample_count]
-                except:
-                    custom_text_upper = False
-                try:
-                    custom_text_middle[sample_count]
-                except:
-                    custom_text_middle = False
-                try:
-                    custom_text_bottom[sample_count]
-                except:
-                    custom_text_bottom = False
+                    if y <= 4:
+                        y += 4
 
-                if custom_text_upper:
-                    plot_custom_text = True
-                    if len(custom_text_upper[sample_count]) > 40:
-                        print(
-                            "To add a custom text, please limit the string to <40 characters including spaces."
-                        )
-                        plot_custom_text = False
-                if custom_text_middle:
-                    if len(custom_text_middle[sample_count]) > 40:
-                        print(
-                            "To add a custom text, please limit the string to <40 characters including spaces."
-                        )
-                        plot_custom_text = False
+                    while y % 4 != 0:
+                        y += 1
+                    # ytick_offest = int(y/4)
+                    y = ymax / 1.025
+                    ytick_offest = float(y / 3)
 
-                if plot_custom_text:
-                    x_pos_custom = 0.73
-                    if custom_text_upper and custom_text_middle:
-                        custom_text_upper_plot = (
-                            custom_text_upper[sample_count]
-                            + "\n"
-                            + custom_text_middle[sample_count]
+                    if percentage:
+                        ylabs = [
+                            0,
+                            round(ytick_offest, 1),
+                            round(ytick_offest * 2, 1),
+                            round(ytick_offest * 3, 1),
+                            round(ytick_offest * 4, 1),
+                        ]
+                        ylabels = [
+                            str(0),
+                            str(round(ytick_offest, 1)) + "%",
+                            str(round(ytick_offest * 2, 1)) + "%",
+                            str(round(ytick_offest * 3, 1)) + "%",
+                            str(round(ytick_offest * 4, 1)) + "%",
+                        ]
+                    else:
+                        ylabs = [
+                            0,
+                            ytick_offest,
+                            ytick_offest * 2,
+                            ytick_offest * 3,
+                            ytick_offest * 4,
+                        ]
+                        ylabels = [
+                            0,
+                            ytick_offest,
+                            ytick_offest * 2,
+                            ytick_offest * 3,
+                            ytick_offest * 4,
+                        ]
+
+                    font_label_size = 30
+                    if not percentage:
+                        if int(ylabels[3]) >= 1000:
+                            font_label_size = 20
+
+                    if percentage:
+                        if len(ylabels) > 2:
+                            font_label_size = 20
+
+                    labs = np.arange(0.375, 96.375, 1)
+
+                    if not percentage:
+                        ylabels = getylabels(ylabels)
+
+                    panel1.set_xlim([0, 96])
+                    panel1.set_ylim([0, y])
+                    panel1.set_xticks(labs)
+                    panel1.set_yticks(ylabs)
+                    count = 0
+                    m = 0
+                    for i in range(0, 96, 1):
+                        plt.text(
+                            i / 137 + 0.04,
+                            0.02,
+                            xlabels[i][0],
+                            fontsize=25,
+                            color="gray",
+                            rotation="vertical",
+                            verticalalignment="center",
+                            fontname="Courier New",
+                            transform=plt.gcf().transFigure,
                         )
-                        if custom_text_bottom:
-                            custom_text_upper_plot += (
-                                "\n" + custom_text_bottom[sample_count]
-                            )
+                        plt.text(
+                            i / 137 + 0.04,
+                            0.044,
+                            xlabels[i][1],
+                            fontsize=25,
+                            color=colors[m],
+                            rotation="vertical",
+                            verticalalignment="center",
+                            fontname="Courier New",
+                            fontweight="bold",
+                            transform=plt.gcf().transFigure,
+                        )
+                        plt.text(
+                            i / 137 + 0.04,
+                            0.071,
+                            xlabels[i][2],
+                            fontsize=25,
+                            color="gray",
+                            rotation="vertical",
+                            verticalalignment="center",
+                            fontname="Courier New",
+                            transform=plt.gcf().transFigure,
+                        )
+                        count += 1
+                        if count == 16:
+                            count = 0
+                            m += 1
 
-                    if custom_text_upper and not custom_text_middle:
-                        custom_text_upper_plot = custom_text_upper[sample_count]
-                        panel1.text(
-                            x_pos_custom,
-                            0.78,
-                            custom_text_upper_plot,
-                            fontsize=40,
+                    if sig_probs:
+                        plt.text(
+                            0.045,
+                            0.75,
+                            sample,
+                            fontsize=60,
+                            weight="bold",
+                            color="black",
+                            fontname="Arial",
+                            transform=plt.gcf().transFigure,
+                        )
+                    else:
+                        plt.text(
+                            0.045,
+                            0.75,
+                            sample + ": " + "{:,}".format(int(total_count)) + " subs",
+                            fontsize=60,
                             weight="bold",
                             color="black",
                             fontname="Arial",
                             transform=plt.gcf().transFigure,
-                            ha="right",
-                            zorder=1,
                         )
 
-                    elif custom_text_upper and custom_text_middle:
-                        if not custom_text_bottom:
+                    custom_text_upper_plot = ""
+                    try:
+                        custom_text_upper[sample_count]
+                    except:
+                        custom_text_upper = False
+                    try:
+                        custom_text_middle[sample_count]
+                    except:
+                        custom_text_middle = False
+                    try:
+                        custom_text_bottom[sample_count]
+                    except:
+                        custom_text_bottom = False
+
+                    if custom_text_upper:
+                        plot_custom_text = True
+                        if len(custom_text_upper[sample_count]) > 40:
+                            print(
+                                "To add a custom text, please limit the string to <40 characters including spaces."
+                            )
+                            plot_custom_text = False
+                    if custom_text_middle:
+                        if len(custom_text_middle[sample_count]) > 40:
+                            print(
+                                "To add a custom text, please limit the string to <40 characters including spaces."
+                            )
+                            plot_custom_text = False
+
+                    if plot_custom_text:
+                        x_pos_custom = 0.73
+                        if custom_text_upper and custom_text_middle:
+                            custom_text_upper_plot = (
+                                custom_text_upper[sample_count]
+                                + "\n"
+                                + custom_text_middle[sample_count]
+                            )
+                            if custom_text_bottom:
+                                custom_text_upper_plot += (
+                                    "\n" + custom_text_bottom[sample_count]
+                                )
+
+                        if custom_text_upper and not custom_text_middle:
+                            custom_text_upper_plot = custom_text_upper[sample_count]
                             panel1.text(
                                 x_pos_custom,
-                                0.72,
+                                0.78,
                                 custom_text_upper_plot,
                                 fontsize=40,
                                 weight="bold",
@@ -8144,11 +8875,40 @@ def plotSBS(
                                 fontname="Arial",
                                 transform=plt.gcf().transFigure,
                                 ha="right",
+                                zorder=1,
                             )
-                        else:
+
+                        elif custom_text_upper and custom_text_middle:
+                            if not custom_text_bottom:
+                                panel1.text(
+                                    x_pos_custom,
+                                    0.72,
+                                    custom_text_upper_plot,
+                                    fontsize=40,
+                                    weight="bold",
+                                    color="black",
+                                    fontname="Arial",
+                                    transform=plt.gcf().transFigure,
+                                    ha="right",
+                                )
+                            else:
+                                panel1.text(
+                                    x_pos_custom,
+                                    0.68,
+                                    custom_text_upper_plot,
+                                    fontsize=40,
+                                    weight="bold",
+                                    color="black",
+                                    fontname="Arial",
+                                    transform=plt.gcf().transFigure,
+                                    ha="right",
+                                )
+
+                        elif not custom_text_upper and custom_text_middle:
+                            custom_text_upper_plot = custom_text_middle[sample_count]
                             panel1.text(
                                 x_pos_custom,
-                                0.68,
+                                0.78,
                                 custom_text_upper_plot,
                                 fontsize=40,
                                 weight="bold",
@@ -8158,162 +8918,190 @@ def plotSBS(
                                 ha="right",
                             )
 
-                    elif not custom_text_upper and custom_text_middle:
-                        custom_text_upper_plot = custom_text_middle[sample_count]
-                        panel1.text(
-                            x_pos_custom,
-                            0.78,
-                            custom_text_upper_plot,
-                            fontsize=40,
-                            weight="bold",
-                            color="black",
-                            fontname="Arial",
-                            transform=plt.gcf().transFigure,
-                            ha="right",
-                        )
-
-                panel1.set_yticklabels(ylabels, fontsize=font_label_size)
-                panel1.yaxis.grid(True)
-                panel1.grid(which="major", axis="y", color=[0.93, 0.93, 0.93], zorder=1)
-                panel1.set_xlabel("")
-                panel1.set_ylabel("")
-
-                if percentage:
-                    panel1.set_ylabel(
-                        "Percentage of Single Base Substitutions",
-                        fontsize=35,
-                        fontname="Times New Roman",
-                        weight="bold",
-                    )
-                else:
-                    panel1.set_ylabel(
-                        "Number of Single Base Substitutions",
-                        fontsize=35,
-                        fontname="Times New Roman",
-                        weight="bold",
+                    panel1.set_yticklabels(ylabels, fontsize=font_label_size)
+                    panel1.yaxis.grid(True)
+                    panel1.grid(
+                        which="major", axis="y", color=[0.93, 0.93, 0.93], zorder=1
                     )
+                    panel1.set_xlabel("")
+                    panel1.set_ylabel("")
 
-                panel1.tick_params(
-                    axis="both",
-                    which="both",
-                    bottom=False,
-                    labelbottom=False,
-                    left=True,
-                    labelleft=True,
-                    right=True,
-                    labelright=False,
-                    top=False,
-                    labeltop=False,
-                    direction="in",
-                    length=25,
-                    colors="lightgray",
-                    width=2,
-                )
-
-                [i.set_color("black") for i in panel1.get_yticklabels()]
-
-                yp2 = 25.5
-                labels = []
-                y2max = 0
-                tsbColors = [
-                    [1 / 256, 70 / 256, 102 / 256],
-                    [228 / 256, 41 / 256, 38 / 256],
-                    "green",
-                ]
-                for mut in mutations_TSB[sample]:
-                    labels.append(mut)
-                    if True:
-                        totalMuts = sum(
-                            [
-                                mutations_TSB[sample][mut][x]
-                                for x in mutations_TSB[sample][mut]
-                            ]
-                        )
-                        panel2.barh(
-                            yp2,
-                            mutations_TSB[sample][mut]["N"] / totalMuts * 100,
-                            1.25,
-                            color=tsbColors[2],
-                            label="Intergenic",
-                            zorder=0,
+                    if percentage:
+                        panel1.set_ylabel(
+                            "Percentage of Single Base Substitutions",
+                            fontsize=35,
+                            fontname="Times New Roman",
+                            weight="bold",
                         )
-                        panel2.barh(
-                            yp2,
-                            (
-                                mutations_TSB[sample][mut]["N"]
-                                + mutations_TSB[sample][mut]["T"]
-                                + mutations_TSB[sample][mut]["U"]
-                            )
-                            / totalMuts
-                            * 100,
-                            1.25,
-                            color="purple",
-                            label="Genic-transcribed Regions",
-                            zorder=-1,
+                    else:
+                        panel1.set_ylabel(
+                            "Number of Single Base Substitutions",
+                            fontsize=35,
+                            fontname="Times New Roman",
+                            weight="bold",
                         )
 
-                        yp2 -= 1.25
+                    panel1.tick_params(
+                        axis="both",
+                        which="both",
+                        bottom=False,
+                        labelbottom=False,
+                        left=True,
+                        labelleft=True,
+                        right=True,
+                        labelright=False,
+                        top=False,
+                        labeltop=False,
+                        direction="in",
+                        length=25,
+                        colors="lightgray",
+                        width=2,
+                    )
+
+                    [i.set_color("black") for i in panel1.get_yticklabels()]
+
+                    yp2 = 25.5
+                    labels = []
+                    y2max = 0
+                    tsbColors = [
+                        [1 / 256, 70 / 256, 102 / 256],
+                        [228 / 256, 41 / 256, 38 / 256],
+                        "green",
+                    ]
+                    for mut in mutations_TSB[sample]:
+                        labels.append(mut)
+                        if True:
+                            totalMuts = sum(
+                                [
+                                    mutations_TSB[sample][mut][x]
+                                    for x in mutations_TSB[sample][mut]
+                                ]
+                            )
+                            panel2.barh(
+                                yp2,
+                                mutations_TSB[sample][mut]["N"] / totalMuts * 100,
+                                1.25,
+                                color=tsbColors[2],
+                                label="Intergenic",
+                                zorder=0,
+                            )
+                            panel2.barh(
+                                yp2,
+                                (
+                                    mutations_TSB[sample][mut]["N"]
+                                    + mutations_TSB[sample][mut]["T"]
+                                    + mutations_TSB[sample][mut]["U"]
+                                )
+                                / totalMuts
+                                * 100,
+                                1.25,
+                                color="purple",
+                                label="Genic-transcribed Regions",
+                                zorder=-1,
+                            )
 
-                        transcribedTotal = (
-                            mutations_TSB[sample][mut]["T"]
-                            + mutations_TSB[sample][mut]["U"]
-                        )
-                        panel2.barh(
-                            yp2,
-                            mutations_TSB[sample][mut]["T"] / transcribedTotal * 100,
-                            1.25,
-                            color=tsbColors[0],
-                            label="Transcribed strand",
-                            zorder=0,
-                        )
-                        panel2.barh(
-                            yp2,
-                            (
+                            yp2 -= 1.25
+
+                            transcribedTotal = (
                                 mutations_TSB[sample][mut]["T"]
                                 + mutations_TSB[sample][mut]["U"]
                             )
-                            / transcribedTotal
-                            * 100,
-                            1.25,
-                            color=tsbColors[1],
-                            label="Genic-untranscribed strand",
-                            zorder=-1,
-                        )
+                            panel2.barh(
+                                yp2,
+                                mutations_TSB[sample][mut]["T"]
+                                / transcribedTotal
+                                * 100,
+                                1.25,
+                                color=tsbColors[0],
+                                label="Transcribed strand",
+                                zorder=0,
+                            )
+                            panel2.barh(
+                                yp2,
+                                (
+                                    mutations_TSB[sample][mut]["T"]
+                                    + mutations_TSB[sample][mut]["U"]
+                                )
+                                / transcribedTotal
+                                * 100,
+                                1.25,
+                                color=tsbColors[1],
+                                label="Genic-untranscribed strand",
+                                zorder=-1,
+                            )
 
+                            yp2 -= 1.25
                         yp2 -= 1.25
-                    yp2 -= 1.25
-                panel2.grid(
-                    which="major",
-                    axis="x",
-                    ls="--",
-                    color=[0.95, 0.95, 0.95],
-                    zorder=10000,
-                    lw=2,
-                )
-                xlabels = ["0%", "25%", "50%", "75", "100%"]
-                xlabs = [0, 25, 50, 75, 100]
-                panel2.spines["right"].set_visible(False)
-                panel2.spines["top"].set_visible(False)
-                labels.reverse()
-                panel2.set_yticks([2.5, 6.25, 10, 13.75, 17.75, 21.25, 25])
-                panel2.set_yticklabels(
-                    labels, fontsize=30, fontname="Arial", weight="bold"
-                )
-                panel2.set_xticks(xlabs)
-                panel2.set_xticklabels(xlabels, fontsize=30)
-                handles, labels = panel2.get_legend_handles_labels()
-                panel2.legend(
-                    handles[:4],
-                    labels[:4],
-                    loc="upper right",
-                    prop={"size": 15},
-                    bbox_to_anchor=(0.95, 1.15),
-                )
-                pp.savefig(plot1)
-                plt.close()
+                    panel2.grid(
+                        which="major",
+                        axis="x",
+                        ls="--",
+                        color=[0.95, 0.95, 0.95],
+                        zorder=10000,
+                        lw=2,
+                    )
+                    xlabels = ["0%", "25%", "50%", "75", "100%"]
+                    xlabs = [0, 25, 50, 75, 100]
+                    panel2.spines["right"].set_visible(False)
+                    panel2.spines["top"].set_visible(False)
+                    labels.reverse()
+                    panel2.set_yticks([2.5, 6.25, 10, 13.75, 17.75, 21.25, 25])
+                    panel2.set_yticklabels(
+                        labels, fontsize=30, fontname="Arial", weight="bold"
+                    )
+                    panel2.set_xticks(xlabs)
+                    panel2.set_xticklabels(xlabels, fontsize=30)
+                    handles, labels = panel2.get_legend_handles_labels()
+                    panel2.legend(
+                        handles[:4],
+                        labels[:4],
+                        loc="upper right",
+                        prop={"size": 15},
+                        bbox_to_anchor=(0.95, 1.15),
+                    )
+                    errors.stop()
+                    pp.savefig(plot1)
+                    plt.close()
+                    progress(sample, path=file_path)
+                except Exception as e:
+                    errors.failed(sample, e)
+                    plt.close()
                 sample_count += 1
 
             pp.close()
+        except Exception as e:
+            discard_pdf(pp, output_path + "SBS_288_Normalized_plots_" + project + ".pdf")
+            if isinstance(e, PlottingError):
+                raise
+            raise MatrixFormatError(
+                "ERROR: there may be an issue with the formatting of your matrix file."
+            ) from e
+        errors.finish()
+
+    elif plot_type in HEATMAP_PLOT_TYPES["plotSBS"]:
+        return plot_heatmap_context(
+            "plotSBS",
+            matrix_path,
+            output_path,
+            project,
+            plot_type,
+            percentage,
+            custom_text_upper,
+            custom_text_middle,
+            custom_text_bottom,
+            savefig_format,
+            dpi,
+            cache,
+            append,
+            samples,
+            archive,
+            compresslevel,
+            progress_callback,
+            on_error,
+            sample_timeout,
+            cancel,
+            dtype,
+        )
 
     else:
         print(
@@ -8323,6 +9111,7 @@ def plotSBS(
         )
 
 
+@reported_run
 def plotID(
     matrix_path,
     output_path,
@@ -8335,13 +9124,82 @@ def plotID(
     savefig_format="pdf",
     volume=None,
     dpi=100,
+    cache=None,
+    append=False,
+    samples=None,
+    archive=None,
+    compresslevel=None,
+    dry_run=False,
+    progress_callback=None,
+    on_error="raise",
+    sample_timeout=None,
+    cancel=None,
+    scaling=None,
+    aggregate=False,
+    groups=None,
+    dtype="compact",
+    lazy=False,
 ):
+    check_on_error(on_error)
+    check_sample_timeout(sample_timeout)
+    aggregate = check_aggregate(aggregate)
+    check_append("plotID", plot_type, append)
+    if dry_run:
+        return estimate_run(
+            "plotID",
+            matrix_path,
+            plot_type,
+            savefig_format,
+            dpi,
+            samples,
+            aggregate,
+            groups,
+        )
+    if aggregate:
+        matrix_path = aggregate_matrix(
+            "plotID",
+            matrix_path,
+            plot_type,
+            project,
+            aggregate,
+            groups,
+            samples,
+            on_error,
+        )
+        samples = None
+    if lazy:
+        from sigProfilerPlotting.streaming import iter_plot
+
+        return iter_plot(
+            "plotID",
+            matrix_path,
+            project,
+            plot_type,
+            savefig_format=savefig_format,
+            samples=samples,
+            on_error=on_error,
+            sample_timeout=sample_timeout,
+            cancel=cancel,
+            scaling=scaling,
+            percentage=percentage,
+            custom_text_upper=custom_text_upper,
+            custom_text_middle=custom_text_middle,
+            custom_text_bottom=custom_text_bottom,
+            volume=volume,
+            dpi=dpi,
+            cache=cache,
+            dtype=dtype,
+        )
+
     # create the output directory if it doesn't exist
     if not os.path.exists(output_path) and savefig_format.lower() != "pil_image":
         os.makedirs(output_path)
 
     # load custom fonts for plotting
     load_custom_fonts()
+    cache = get_render_cache(cache)
+    # the file based plot types reuse samples for the sample names of the matrix
+    sample_selection = samples
 
     plot_custom_text = False
     sig_probs = False
@@ -8352,7 +9210,24 @@ def plotID(
         or plot_type == "94ID"
         or plot_type == "83"
     ):
-        data = process_input(matrix_path, plot_type)
+        data = process_input(matrix_path, plot_type, sample_selection, on_error, dtype)
+        cache_keys, skipped = lookup_render_cache(
+            cache,
+            data,
+            "ID_83",
+            savefig_format,
+            dpi,
+            percentage,
+            custom_text_upper,
+            custom_text_middle,
+            custom_text_bottom,
+            scaling,
+        )
+        skipped |= lookup_appended_samples(
+            append, savefig_format, output_path, project, "ID_83"
+        )
+        progress = PlotProgress(progress_callback, data.columns)
+        errors = ErrorPolicy(on_error, progress, sample_timeout, cancel)
 
         try:
             sample_count = 0
@@ -8362,232 +9237,171 @@ def plotID(
             )
             pickle.dump(fig_orig, buf)
             figs = {}
-            colors = [
-                [253 / 256, 190 / 256, 111 / 256],
-                [255 / 256, 128 / 256, 2 / 256],
-                [176 / 256, 221 / 256, 139 / 256],
-                [54 / 256, 161 / 256, 46 / 256],
-                [253 / 256, 202 / 256, 181 / 256],
-                [252 / 256, 138 / 256, 106 / 256],
-                [241 / 256, 68 / 256, 50 / 256],
-                [188 / 256, 25 / 256, 26 / 256],
-                [208 / 256, 225 / 256, 242 / 256],
-                [148 / 256, 196 / 256, 223 / 256],
-                [74 / 256, 152 / 256, 201 / 256],
-                [23 / 256, 100 / 256, 171 / 256],
-                [226 / 256, 226 / 256, 239 / 256],
-                [182 / 256, 182 / 256, 216 / 256],
-                [134 / 256, 131 / 256, 189 / 256],
-                [98 / 256, 64 / 256, 155 / 256],
-            ]
             ctx = data.index
-            xlabels = [
-                i.split(":")[0] + i.split(":")[1] + i.split(":")[2]
-                for i in ctx.to_list()
-            ]
-            xlables_set = [
-                "1DelC",
-                "1DelT",
-                "1InsC",
-                "1InsT",
-                "2DelR",
-                "3DelR",
-                "4DelR",
-                "5DelR",
-                "2InsR",
-                "3InsR",
-                "4InsR",
-                "5InsR",
-                "2DelM",
-                "3DelM",
-                "4DelM",
-                "5DelM",
-            ]
-            colors_idx = copy.deepcopy(xlabels)
-            for ii in range(0, len(xlables_set)):
-                colors_idx = [ii if x == xlables_set[ii] else x for x in colors_idx]
-
-            colors_flat_list = [colors[i] for i in colors_idx]
+            colors_flat_list = get_context_spec("ID83").colors_of(ctx)
+            stats = cohort_statistics(data, "ID83", percentage)
+            normalized = normalize_counts(data) if percentage else None
 
             for sample in data.columns:  # mutations.keys():
-                buf.seek(0)
-                figs[sample] = pickle.load(buf)
-                panel1 = figs[sample].axes[0]
-                muts = data[sample].values
-                total_count = np.sum(muts)
-                x = 0.4
+                if sample in skipped:
+                    progress(
+                        sample,
+                        "skipped",
+                        reason="already in the output or render cache",
+                    )
+                    sample_count += 1
+                    continue
+                try:
+                    errors.start(sample)
+                    check_sample_counts(data[sample])
+                    buf.seek(0)
+                    figs[sample] = pickle.load(buf)
+                    panel1 = figs[sample].axes[0]
+                    scale = sample_scaling(stats, sample, scaling)
+                    total_count = scale["total"]
+                    muts = sample_counts(data, sample)
+                    x = 0.4
 
-                if percentage:
-                    if total_count > 0:
+                    if percentage:
+                        if total_count > 0:
+                            plt.bar(
+                                np.arange(len(ctx)) + x,
+                                sample_counts(normalized, sample),
+                                width=0.4,
+                                color=colors_flat_list,
+                                align="center",
+                                zorder=1000,
+                            )
+                        sig_probs = True
+                    else:
                         plt.bar(
                             np.arange(len(ctx)) + x,
-                            muts / total_count * 100,
+                            muts,
                             width=0.4,
                             color=colors_flat_list,
                             align="center",
                             zorder=1000,
                         )
-                        ymax = np.max(muts / total_count * 100)
-                    sig_probs = True
-                else:
-                    plt.bar(
-                        np.arange(len(ctx)) + x,
-                        muts,
-                        width=0.4,
-                        color=colors_flat_list,
-                        align="center",
-                        zorder=1000,
-                    )
-                    ymax = np.max(muts)
 
-                x = 0.0475
-                y_top = 0.827
-                y_bottom = 0.114
-                y = int(ymax * 1.25)
-                y2 = y + 2
+                    y = scale["ylim"]
+                    ylabs = list(scale["yticks"])
+                    ylabels = list(scale["ylabels"])
 
-                if y <= 4:
-                    y += 4
+                    labs = np.arange(0.375, 83.375, 1)
 
-                while y % 4 != 0:
-                    y += 1
-                ytick_offest = int(y / 4)
+                    panel1.set_xlim([0, 83])
+                    panel1.set_ylim([0, y])
+                    panel1.set_xticks(labs)
+                    panel1.set_yticks(ylabs)
+                    if sig_probs:
+                        plt.text(
+                            0.0475,
+                            0.75,
+                            sample,
+                            fontsize=60,
+                            weight="bold",
+                            color="black",
+                            fontname="Arial",
+                            transform=plt.gcf().transFigure,
+                        )
+                    else:
+                        plt.text(
+                            0.0475,
+                            0.75,
+                            sample + ": " + "{:,}".format(int(total_count)) + " indels",
+                            fontsize=60,
+                            weight="bold",
+                            color="black",
+                            fontname="Arial",
+                            transform=plt.gcf().transFigure,
+                        )
 
-                if percentage:
-                    ylabs = [
-                        0,
-                        round(ytick_offest, 1),
-                        round(ytick_offest * 2, 1),
-                        round(ytick_offest * 3, 1),
-                        round(ytick_offest * 4, 1),
-                    ]
-                    ylabels = [
-                        str(0),
-                        str(round(ytick_offest, 1)) + "%",
-                        str(round(ytick_offest * 2, 1)) + "%",
-                        str(round(ytick_offest * 3, 1)) + "%",
-                        str(round(ytick_offest * 4, 1)) + "%",
-                    ]
-                else:
-                    ylabs = [
-                        0,
-                        ytick_offest,
-                        ytick_offest * 2,
-                        ytick_offest * 3,
-                        ytick_offest * 4,
-                    ]
-                    ylabels = [
-                        0,
-                        ytick_offest,
-                        ytick_offest * 2,
-                        ytick_offest * 3,
-                        ytick_offest * 4,
-                    ]
+                    custom_text_upper_plot = ""
+                    try:
+                        custom_text_upper[sample_count]
+                    except:
+                        custom_text_upper = False
+                    try:
+                        custom_text_middle[sample_count]
+                    except:
+                        custom_text_middle = False
+                    try:
+                        custom_text_bottom[sample_count]
+                    except:
+                        custom_text_bottom = False
+
+                    if custom_text_upper:
+                        plot_custom_text = True
+                        if len(custom_text_upper[sample_count]) > 40:
+                            print(
+                                "To add a custom text, please limit the string to <40 characters including spaces."
+                            )
+                            plot_custom_text = False
+                    if custom_text_middle:
+                        if len(custom_text_middle[sample_count]) > 40:
+                            print(
+                                "To add a custom text, please limit the string to <40 characters including spaces."
+                            )
+                            plot_custom_text = False
+
+                    if plot_custom_text:
+                        x_pos_custom = 0.95
+                        if custom_text_upper and custom_text_middle:
+                            custom_text_upper_plot = (
+                                custom_text_upper[sample_count]
+                                + "\n"
+                                + custom_text_middle[sample_count]
+                            )
+                            if custom_text_bottom:
+                                custom_text_upper_plot += (
+                                    "\n" + custom_text_bottom[sample_count]
+                                )
 
-                labs = np.arange(0.375, 83.375, 1)
+                        if custom_text_upper and not custom_text_middle:
+                            custom_text_upper_plot = custom_text_upper[sample_count]
+                            panel1.text(
+                                x_pos_custom,
+                                0.78,
+                                custom_text_upper_plot,
+                                fontsize=35,
+                                weight="bold",
+                                color="black",
+                                fontname="Arial",
+                                transform=plt.gcf().transFigure,
+                                ha="right",
+                            )
 
-                if not percentage:
-                    ylabels = spplt.getylabels(ylabels)
+                        elif custom_text_upper and custom_text_middle:
+                            if not custom_text_bottom:
+                                panel1.text(
+                                    x_pos_custom,
+                                    0.72,
+                                    custom_text_upper_plot,
+                                    fontsize=35,
+                                    weight="bold",
+                                    color="black",
+                                    fontname="Arial",
+                                    transform=plt.gcf().transFigure,
+                                    ha="right",
+                                )
+                            else:
+                                panel1.text(
+                                    x_pos_custom,
+                                    0.68,
+                                    custom_text_upper_plot,
+                                    fontsize=35,
+                                    weight="bold",
+                                    color="black",
+                                    fontname="Arial",
+                                    transform=plt.gcf().transFigure,
+                                    ha="right",
+                                )
 
-                panel1.set_xlim([0, 83])
-                panel1.set_ylim([0, y])
-                panel1.set_xticks(labs)
-                panel1.set_yticks(ylabs)
-                if sig_probs:
-                    plt.text(
-                        0.0475,
-                        0.75,
-                        sample,
-                        fontsize=60,
-                        weight="bold",
-                        color="black",
-                        fontname="Arial",
-                        transform=plt.gcf().transFigure,
-                    )
-                else:
-                    plt.text(
-                        0.0475,
-                        0.75,
-                        sample + ": " + "{:,}".format(int(total_count)) + " indels",
-                        fontsize=60,
-                        weight="bold",
-                        color="black",
-                        fontname="Arial",
-                        transform=plt.gcf().transFigure,
-                    )
-
-                custom_text_upper_plot = ""
-                try:
-                    custom_text_upper[sample_count]
-                except:
-                    custom_text_upper = False
-                try:
-                    custom_text_middle[sample_count]
-                except:
-                    custom_text_middle = False
-                try:
-                    custom_text_bottom[sample_count]
-                except:
-                    custom_text_bottom = False
-
-                if custom_text_upper:
-                    plot_custom_text = True
-                    if len(custom_text_upper[sample_count]) > 40:
-                        print(
-                            "To add a custom text, please limit the string to <40 characters including spaces."
-                        )
-                        plot_custom_text = False
-                if custom_text_middle:
-                    if len(custom_text_middle[sample_count]) > 40:
-                        print(
-                            "To add a custom text, please limit the string to <40 characters including spaces."
-                        )
-                        plot_custom_text = False
-
-                if plot_custom_text:
-                    x_pos_custom = 0.95
-                    if custom_text_upper and custom_text_middle:
-                        custom_text_upper_plot = (
-                            custom_text_upper[sample_count]
-                            + "\n"
-                            + custom_text_middle[sample_count]
-                        )
-                        if custom_text_bottom:
-                            custom_text_upper_plot += (
-                                "\n" + custom_text_bottom[sample_count]
-                            )
-
-                    if custom_text_upper and not custom_text_middle:
-                        custom_text_upper_plot = custom_text_upper[sample_count]
-                        panel1.text(
-                            x_pos_custom,
-                            0.78,
-                            custom_text_upper_plot,
-                            fontsize=35,
-                            weight="bold",
-                            color="black",
-                            fontname="Arial",
-                            transform=plt.gcf().transFigure,
-                            ha="right",
-                        )
-
-                    elif custom_text_upper and custom_text_middle:
-                        if not custom_text_bottom:
-                            panel1.text(
-                                x_pos_custom,
-                                0.72,
-                                custom_text_upper_plot,
-                                fontsize=35,
-                                weight="bold",
-                                color="black",
-                                fontname="Arial",
-                                transform=plt.gcf().transFigure,
-                                ha="right",
-                            )
-                        else:
+                        elif not custom_text_upper and custom_text_middle:
+                            custom_text_upper_plot = custom_text_middle[sample_count]
                             panel1.text(
                                 x_pos_custom,
-                                0.68,
+                                0.78,
                                 custom_text_upper_plot,
                                 fontsize=35,
                                 weight="bold",
@@ -8597,69 +9411,79 @@ def plotID(
                                 ha="right",
                             )
 
-                    elif not custom_text_upper and custom_text_middle:
-                        custom_text_upper_plot = custom_text_middle[sample_count]
-                        panel1.text(
-                            x_pos_custom,
-                            0.78,
-                            custom_text_upper_plot,
+                    panel1.set_yticklabels(ylabels, fontsize=30)
+                    plt.gca().yaxis.grid(True)
+                    plt.gca().grid(
+                        which="major", axis="y", color=[0.6, 0.6, 0.6], zorder=1
+                    )
+                    panel1.set_xlabel("")
+                    panel1.set_ylabel("")
+
+                    if percentage:
+                        plt.ylabel(
+                            "Percentage of Indels",
                             fontsize=35,
+                            fontname="Times New Roman",
+                            weight="bold",
+                        )
+                    else:
+                        plt.ylabel(
+                            "Number of Indels",
+                            fontsize=35,
+                            fontname="Times New Roman",
                             weight="bold",
-                            color="black",
-                            fontname="Arial",
-                            transform=plt.gcf().transFigure,
-                            ha="right",
                         )
 
-                panel1.set_yticklabels(ylabels, fontsize=30)
-                plt.gca().yaxis.grid(True)
-                plt.gca().grid(which="major", axis="y", color=[0.6, 0.6, 0.6], zorder=1)
-                panel1.set_xlabel("")
-                panel1.set_ylabel("")
-
-                if percentage:
-                    plt.ylabel(
-                        "Percentage of Indels",
-                        fontsize=35,
-                        fontname="Times New Roman",
-                        weight="bold",
-                    )
-                else:
-                    plt.ylabel(
-                        "Number of Indels",
-                        fontsize=35,
-                        fontname="Times New Roman",
-                        weight="bold",
-                    )
-
-                panel1.tick_params(
-                    axis="both",
-                    which="both",
-                    bottom=False,
-                    labelbottom=False,
-                    left=False,
-                    labelleft=True,
-                    right=False,
-                    labelright=False,
-                    top=False,
-                    labeltop=False,
-                    direction="in",
-                    length=25,
-                    colors="gray",
-                    width=2,
-                )
-
-                [i.set_color("black") for i in plt.gca().get_yticklabels()]
+                    panel1.tick_params(
+                        axis="both",
+                        which="both",
+                        bottom=False,
+                        labelbottom=False,
+                        left=False,
+                        labelleft=True,
+                        right=False,
+                        labelright=False,
+                        top=False,
+                        labeltop=False,
+                        direction="in",
+                        length=25,
+                        colors="gray",
+                        width=2,
+                    )
+
+                    [i.set_color("black") for i in plt.gca().get_yticklabels()]
+                    errors.stop()
+                except Exception as e:
+                    errors.failed(sample, e)
+                    if sample in figs:
+                        plt.close(figs.pop(sample))
                 sample_count += 1
 
-            return output_results(
-                savefig_format, output_path, project, figs, "ID_83", dpi=dpi
+            result = output_results(
+                savefig_format,
+                output_path,
+                project,
+                figs,
+                "ID_83",
+                dpi=dpi,
+                cache=cache,
+                cache_keys=cache_keys,
+                append=append,
+                archive=archive,
+                compresslevel=compresslevel,
+                progress=progress,
+                errors=errors,
             )
-        except:
-            print("There may be an issue with the formatting of your matrix file.")
+        except Exception as e:
             pdf_path = output_path + "ID_83_plots_" + project + ".pdf"
             if os.path.isfile(pdf_path):
                 os.remove(pdf_path)
+            if isinstance(e, PlottingError):
+                raise
+            raise MatrixFormatError(
+                "ERROR: there may be an issue with the formatting of your matrix file."
+            ) from e
+        return errors.finish(result)
 
     elif (
         plot_type == "INDEL_simple"
@@ -8675,41 +9499,12 @@ def plotID(
             mutation_type = first_line[0]
             mutation_type_list = mutation_type.split(":")
             if len(mutation_type_list) != 4:
-                sys.exit(
-                    "The matrix does not match the correct SBS96 format. Please check you formatting and rerun this plotting function."
+                raise MatrixFormatError(
+                    "ERROR: The matrix does not match the correct SBS96 format. Please check you formatting and rerun this plotting function."
                 )
         file_path = os.path.join(output_path, f"ID_simple_plots_{project}.pdf")
         pp = PdfPages(file_path)
 
-        indel_types = [
-            "1:Del:C:1",
-            "1:Del:C:2",
-            "1:Del:C:3",
-            "1:Del:C:4",
-            "1:Del:C:5",
-            "1:Del:C:6" "1:Del:T:1",
-            "1:Del:T:2",
-            "1:Del:T:3",
-            "1:Del:T:4",
-            "1:Del:T:5",
-            "1:Del:T:6" "1:Ins:C:0",
-            "1:Ins:C:1",
-            "1:Ins:C:2",
-            "1:Ins:C:3",
-            "1:Ins:C:4",
-            "1:Ins:C:5",
-            "1:Ins:T:0",
-            "1:Ins:T:1",
-            "1:Ins:T:2",
-            "1:Ins:T:3",
-            "1:Ins:T:4",
-            "1:Ins:T:5",
-            "long_Del",
-            "long_Ins",
-            "MH",
-            "complex",
-        ]
-
         mutations = OrderedDict()
 
         try:
@@ -8717,6 +9512,10 @@ def plotID(
                 first_line = f.readline()
                 samples = first_line.strip().split("\t")
                 samples = samples[1:]
+                sample_columns = select_sample_columns(samples, sample_selection, 1)
+                samples = list(sample_columns)
+                progress = PlotProgress(progress_callback, samples)
+                errors = ErrorPolicy(on_error, progress, sample_timeout, cancel)
                 for sample in samples:
                     mutations[sample] = OrderedDict()
                     mutations[sample]["1DelC"] = [0, 0, 0, 0, 0, 0]
@@ -8740,21 +9539,13 @@ def plotID(
                     sample_index = 1
 
                     for sample in samples:
+                        sample_index = sample_columns[sample]
                         # if mut_type in mutations[sample].keys():
-                        if percentage:
-                            mutCount = float(line[sample_index])
-                            if mutCount < 1 and mutCount > 0:
-                                sig_probs = True
-                        else:
-                            try:
-                                mutCount = int(line[sample_index])
-                            except:
-                                print(
-                                    "It appears that the provided matrix does not contain mutation counts.\n\tIf you have provided a signature activity matrix, please change the percentage parameter to True.\n\tOtherwise, ",
-                                    end="",
-                                )
-
-                            # mutCount = int(line[sample_index])
+                        mutCount = read_mutation_count(
+                            line, sample_index, sample, percentage, errors
+                        )
+                        if percentage and mutCount < 1 and mutCount > 0:
+                            sig_probs = True
                         mutations[sample][mut_type][repeat_size] = mutCount
 
                         # else:
@@ -8779,71 +9570,89 @@ def plotID(
                         sample_index += 1
 
             for sample in mutations:
-                total_count = sum(sum(nuc) for nuc in mutations[sample].values())
-                plt.rcParams["axes.linewidth"] = 2
-                plot1 = plt.figure(figsize=(15, 13))
-                plt.rc("axes", edgecolor="black")
-                panel1 = plt.axes([0.12, 0.12, 0.8, 0.77])
-                xlabels = []
-
-                x = 0.4
-                ymax = 0
-                colors = [
-                    [253 / 256, 190 / 256, 111 / 256],
-                    [255 / 256, 128 / 256, 2 / 256],
-                    [176 / 256, 221 / 256, 139 / 256],
-                    [54 / 256, 161 / 256, 46 / 256],
-                    # [188/256,25/256,26/256],
-                    [23 / 256, 100 / 256, 171 / 256],
-                    [98 / 256, 64 / 256, 155 / 256],
-                    [98 / 256, 64 / 256, 155 / 256],
-                ]
+                if sample in errors:
+                    continue
+                try:
+                    errors.start(sample)
+                    total_count = sum(sum(nuc) for nuc in mutations[sample].values())
+                    plt.rcParams["axes.linewidth"] = 2
+                    plot1 = plt.figure(figsize=(15, 13))
+                    plt.rc("axes", edgecolor="black")
+                    panel1 = plt.axes([0.12, 0.12, 0.8, 0.77])
+                    xlabels = []
+
+                    x = 0.4
+                    ymax = 0
+                    colors = get_context_spec("ID28").palette
 
-                i = 0
-                for key in mutations[sample]:
-                    l = 1
-                    for seq in mutations[sample][key]:
-                        xlabels.append(l)
-                        if percentage:
-                            if total_count > 0:
+                    i = 0
+                    for key in mutations[sample]:
+                        l = 1
+                        for seq in mutations[sample][key]:
+                            xlabels.append(l)
+                            if percentage:
+                                if total_count > 0:
+                                    plt.bar(
+                                        x,
+                                        seq / total_count * 100,
+                                        width=0.4,
+                                        color=colors[i],
+                                        align="center",
+                                        zorder=1000,
+                                    )
+                                    if seq / total_count * 100 > ymax:
+                                        ymax = seq / total_count * 100
+                            else:
                                 plt.bar(
                                     x,
-                                    seq / total_count * 100,
+                                    seq,
                                     width=0.4,
                                     color=colors[i],
                                     align="center",
                                     zorder=1000,
                                 )
-                                if seq / total_count * 100 > ymax:
-                                    ymax = seq / total_count * 100
-                        else:
-                            plt.bar(
-                                x,
-                                seq,
-                                width=0.4,
-                                color=colors[i],
-                                align="center",
-                                zorder=1000,
+                                if seq > ymax:
+                                    ymax = seq
+                            x += 1
+                            l += 1
+                        if i < 4:
+                            i += 1
+                    x = 0.126
+                    y_top = 0.9
+                    y_bottom = 0.075
+                    y = int(ymax * 1.25)
+                    y2 = y + 2
+
+                    for i in range(0, 4, 1):
+                        panel1.add_patch(
+                            plt.Rectangle(
+                                (x, y_top),
+                                0.154,
+                                0.037,
+                                facecolor=colors[i],
+                                clip_on=False,
+                                transform=plt.gcf().transFigure,
                             )
-                            if seq > ymax:
-                                ymax = seq
-                        x += 1
-                        l += 1
-                    if i < 4:
-                        i += 1
-                x = 0.126
-                y_top = 0.9
-                y_bottom = 0.075
-                y = int(ymax * 1.25)
-                y2 = y + 2
+                        )
+                        panel1.add_patch(
+                            plt.Rectangle(
+                                (x, y_bottom),
+                                0.154,
+                                0.037,
+                                facecolor=colors[i],
+                                clip_on=False,
+                                transform=plt.gcf().transFigure,
+                            )
+                        )
+                        x += 0.1715
 
-                for i in range(0, 4, 1):
+                    x -= 0.001
                     panel1.add_patch(
                         plt.Rectangle(
                             (x, y_top),
-                            0.154,
+                            0.098,
                             0.037,
-                            facecolor=colors[i],
+                            facecolor=colors[i + 1],
                             clip_on=False,
                             transform=plt.gcf().transFigure,
                         )
@@ -8851,367 +9660,355 @@ def plotID(
                     panel1.add_patch(
                         plt.Rectangle(
                             (x, y_bottom),
-                            0.154,
+                            0.098,
                             0.037,
-                            facecolor=colors[i],
+                            facecolor=colors[i + 1],
                             clip_on=False,
                             transform=plt.gcf().transFigure,
                         )
                     )
-                    x += 0.1715
 
-                x -= 0.001
-                panel1.add_patch(
-                    plt.Rectangle(
-                        (x, y_top),
-                        0.098,
-                        0.037,
-                        facecolor=colors[i + 1],
-                        clip_on=False,
+                    yText = y_top + 0.0055
+                    plt.text(
+                        0.185,
+                        yText,
+                        "C",
+                        fontsize=40,
+                        fontname="Times New Roman",
+                        fontweight="bold",
                         transform=plt.gcf().transFigure,
                     )
-                )
-                panel1.add_patch(
-                    plt.Rectangle(
-                        (x, y_bottom),
-                        0.098,
-                        0.037,
-                        facecolor=colors[i + 1],
-                        clip_on=False,
+                    plt.text(
+                        0.36,
+                        yText,
+                        "T",
+                        fontsize=40,
+                        fontname="Times New Roman",
+                        fontweight="bold",
+                        color="white",
+                        transform=plt.gcf().transFigure,
+                    )
+                    plt.text(
+                        0.53,
+                        yText,
+                        "C",
+                        fontsize=40,
+                        fontname="Times New Roman",
+                        fontweight="bold",
+                        transform=plt.gcf().transFigure,
+                    )
+                    plt.text(
+                        0.705,
+                        yText,
+                        "T",
+                        fontsize=40,
+                        fontname="Times New Roman",
+                        fontweight="bold",
+                        color="white",
                         transform=plt.gcf().transFigure,
                     )
-                )
-
-                yText = y_top + 0.0055
-                plt.text(
-                    0.185,
-                    yText,
-                    "C",
-                    fontsize=40,
-                    fontname="Times New Roman",
-                    fontweight="bold",
-                    transform=plt.gcf().transFigure,
-                )
-                plt.text(
-                    0.36,
-                    yText,
-                    "T",
-                    fontsize=40,
-                    fontname="Times New Roman",
-                    fontweight="bold",
-                    color="white",
-                    transform=plt.gcf().transFigure,
-                )
-                plt.text(
-                    0.53,
-                    yText,
-                    "C",
-                    fontsize=40,
-                    fontname="Times New Roman",
-                    fontweight="bold",
-                    transform=plt.gcf().transFigure,
-                )
-                plt.text(
-                    0.705,
-                    yText,
-                    "T",
-                    fontsize=40,
-                    fontname="Times New Roman",
-                    fontweight="bold",
-                    color="white",
-                    transform=plt.gcf().transFigure,
-                )
-
-                yText_labels_top = yText + 0.045
-                yText_labels_bottom = y_bottom - 0.03
-                yText_labels_bottom_sec = yText_labels_bottom - 0.025
-
-                plt.text(
-                    0.2,
-                    yText_labels_top,
-                    "1bp Deletion",
-                    fontsize=35,
-                    fontname="Times New Roman",
-                    weight="bold",
-                    color="black",
-                    transform=plt.gcf().transFigure,
-                )
-                plt.text(
-                    0.54,
-                    yText_labels_top,
-                    "1bp Insertion",
-                    fontsize=35,
-                    fontweight="bold",
-                    fontname="Times New Roman",
-                    color="black",
-                    transform=plt.gcf().transFigure,
-                )
-                plt.text(
-                    0.155,
-                    yText_labels_bottom_sec,
-                    "Homopolymer Length",
-                    fontsize=30,
-                    fontname="Times New Roman",
-                    weight="bold",
-                    color="black",
-                    transform=plt.gcf().transFigure,
-                )
-                plt.text(
-                    0.505,
-                    yText_labels_bottom_sec,
-                    "Homopolymer Length",
-                    fontsize=30,
-                    fontweight="bold",
-                    fontname="Times New Roman",
-                    color="black",
-                    transform=plt.gcf().transFigure,
-                )
-                plt.text(
-                    0.827,
-                    yText_labels_top,
-                    ">1bp",
-                    fontsize=30,
-                    fontweight="bold",
-                    fontname="Times New Roman",
-                    color="black",
-                    transform=plt.gcf().transFigure,
-                )
-                plt.text(
-                    0.83,
-                    yText_labels_bottom_sec,
-                    "Type",
-                    fontsize=30,
-                    fontweight="bold",
-                    fontname="Times New Roman",
-                    color="black",
-                    transform=plt.gcf().transFigure,
-                )
 
-                x = 0.127
-                yText_labels_bottom = y_bottom - 0.025
+                    yText_labels_top = yText + 0.045
+                    yText_labels_bottom = y_bottom - 0.03
+                    yText_labels_bottom_sec = yText_labels_bottom - 0.025
 
-                for l in range(0, 4, 1):
-                    if l < 2:
-                        for i in range(1, 6, 1):
-                            plt.text(
-                                x,
-                                yText_labels_bottom,
-                                str(i),
+                    plt.text(
+                        0.2,
+                        yText_labels_top,
+                        "1bp Deletion",
+                        fontsize=35,
+                        fontname="Times New Roman",
+                        weight="bold",
+                        color="black",
+                        transform=plt.gcf().transFigure,
+                    )
+                    plt.text(
+                        0.54,
+                        yText_labels_top,
+                        "1bp Insertion",
+                        fontsize=35,
+                        fontweight="bold",
+                        fontname="Times New Roman",
+                        color="black",
+                        transform=plt.gcf().transFigure,
+                    )
+                    plt.text(
+                        0.155,
+                        yText_labels_bottom_sec,
+                        "Homopolymer Length",
+                        fontsize=30,
+                        fontname="Times New Roman",
+                        weight="bold",
+                        color="black",
+                        transform=plt.gcf().transFigure,
+                    )
+                    plt.text(
+                        0.505,
+                        yText_labels_bottom_sec,
+                        "Homopolymer Length",
+                        fontsize=30,
+                        fontweight="bold",
+                        fontname="Times New Roman",
+                        color="black",
+                        transform=plt.gcf().transFigure,
+                    )
+                    plt.text(
+                        0.827,
+                        yText_labels_top,
+                        ">1bp",
+                        fontsize=30,
+                        fontweight="bold",
+                        fontname="Times New Roman",
+                        color="black",
+                        transform=plt.gcf().transFigure,
+                    )
+                    plt.text(
+                        0.83,
+                        yText_labels_bottom_sec,
+                        "Type",
+                        fontsize=30,
+                        fontweight="bold",
+                        fontname="Times New Roman",
+                        color="black",
+                        transform=plt.gcf().transFigure,
+                    )
+
+                    x = 0.127
+                    yText_labels_bottom = y_bottom - 0.025
+
+                    for l in range(0, 4, 1):
+                        if l < 2:
+                            for i in range(1, 6, 1):
+                                plt.text(
+                                    x,
+                                    yText_labels_bottom,
+                                    str(i),
+                                    fontsize=25,
+                                    fontweight="bold",
+                                    fontname="Times New Roman",
+                                    color="black",
+                                    transform=plt.gcf().transFigure,
+                                )
+                                x += 0.028
+                            x -= 0.005
+                            plt.text(
+                                x,
+                                yText_labels_bottom,
+                                "6+",
                                 fontsize=25,
                                 fontweight="bold",
                                 fontname="Times New Roman",
                                 color="black",
                                 transform=plt.gcf().transFigure,
                             )
-                            x += 0.028
-                        x -= 0.005
-                        plt.text(
-                            x,
-                            yText_labels_bottom,
-                            "6+",
-                            fontsize=25,
-                            fontweight="bold",
-                            fontname="Times New Roman",
-                            color="black",
-                            transform=plt.gcf().transFigure,
-                        )
-                        x += 0.037
-                    else:
-                        if l == 2:
-                            x += 0
-                        for i in range(0, 5, 1):
+                            x += 0.037
+                        else:
+                            if l == 2:
+                                x += 0
+                            for i in range(0, 5, 1):
+                                plt.text(
+                                    x,
+                                    yText_labels_bottom,
+                                    str(i),
+                                    fontsize=25,
+                                    fontweight="bold",
+                                    fontname="Times New Roman",
+                                    color="black",
+                                    transform=plt.gcf().transFigure,
+                                )
+                                x += 0.028
+                            x -= 0.005
                             plt.text(
                                 x,
                                 yText_labels_bottom,
-                                str(i),
+                                "5+",
                                 fontsize=25,
                                 fontweight="bold",
                                 fontname="Times New Roman",
                                 color="black",
                                 transform=plt.gcf().transFigure,
                             )
-                            x += 0.028
-                        x -= 0.005
-                        plt.text(
-                            x,
-                            yText_labels_bottom,
-                            "5+",
-                            fontsize=25,
-                            fontweight="bold",
-                            fontname="Times New Roman",
-                            color="black",
-                            transform=plt.gcf().transFigure,
-                        )
-                        x += 0.037
-
-                yText_labels_bottom += 0.0
-                plt.text(
-                    x,
-                    yText_labels_bottom,
-                    "Del",
-                    fontsize=17,
-                    fontweight="bold",
-                    fontname="Times New Roman",
-                    color="black",
-                    transform=plt.gcf().transFigure,
-                    rotation="vertical",
-                )
-                x += 0.026
-                plt.text(
-                    x,
-                    yText_labels_bottom,
-                    "Ins",
-                    fontsize=17,
-                    fontweight="bold",
-                    fontname="Times New Roman",
-                    color="black",
-                    transform=plt.gcf().transFigure,
-                    rotation="vertical",
-                )
-                x += 0.0295
-                yText_labels_bottom -= 0.001
-                plt.text(
-                    x,
-                    yText_labels_bottom,
-                    "MH",
-                    fontsize=17,
-                    fontweight="bold",
-                    fontname="Times New Roman",
-                    color="black",
-                    transform=plt.gcf().transFigure,
-                    rotation="vertical",
-                )
-                x += 0.0295
-                yText_labels_bottom -= 0.002
-                plt.text(
-                    x,
-                    yText_labels_bottom,
-                    "COMP",
-                    fontsize=10,
-                    fontweight="bold",
-                    fontname="Times New Roman",
-                    color="black",
-                    transform=plt.gcf().transFigure,
-                    rotation="vertical",
-                )
-
-                if y <= 4:
-                    y += 4
-
-                while y % 4 != 0:
-                    y += 1
-                ytick_offest = int(y / 4)
-
-                if percentage:
-                    ylabs = [
-                        0,
-                        round(ytick_offest, 1),
-                        round(ytick_offest * 2, 1),
-                        round(ytick_offest * 3, 1),
-                        round(ytick_offest * 4, 1),
-                    ]
-                    ylabels = [
-                        str(0),
-                        str(round(ytick_offest, 1)) + "%",
-                        str(round(ytick_offest * 2, 1)) + "%",
-                        str(round(ytick_offest * 3, 1)) + "%",
-                        str(round(ytick_offest * 4, 1)) + "%",
-                    ]
-                else:
-                    ylabs = [
-                        0,
-                        ytick_offest,
-                        ytick_offest * 2,
-                        ytick_offest * 3,
-                        ytick_offest * 4,
-                    ]
-                    ylabels = [
-                        0,
-                        ytick_offest,
-                        ytick_offest * 2,
-                        ytick_offest * 3,
-                        ytick_offest * 4,
-                    ]
-
-                if not percentage:
-                    ylabels = getylabels(ylabels)
-
-                panel1.set_xlim([0, 28])
-                panel1.set_ylim([0, y])
-                panel1.set_yticks(ylabs)
+                            x += 0.037
 
-                if sig_probs:
+                    yText_labels_bottom += 0.0
                     plt.text(
-                        0.13,
-                        0.85,
-                        sample,
-                        fontsize=40,
-                        weight="bold",
+                        x,
+                        yText_labels_bottom,
+                        "Del",
+                        fontsize=17,
+                        fontweight="bold",
+                        fontname="Times New Roman",
                         color="black",
-                        fontname="Arial",
                         transform=plt.gcf().transFigure,
+                        rotation="vertical",
                     )
-                else:
+                    x += 0.026
                     plt.text(
-                        0.13,
-                        0.85,
-                        sample + ": " + "{:,}".format(int(total_count)) + " indels",
-                        fontsize=40,
-                        weight="bold",
+                        x,
+                        yText_labels_bottom,
+                        "Ins",
+                        fontsize=17,
+                        fontweight="bold",
+                        fontname="Times New Roman",
                         color="black",
-                        fontname="Arial",
                         transform=plt.gcf().transFigure,
+                        rotation="vertical",
                     )
-
-                panel1.set_yticklabels(ylabels, fontsize=30)
-                plt.gca().yaxis.grid(True)
-                plt.gca().grid(which="major", axis="y", color=[0.6, 0.6, 0.6], zorder=1)
-                panel1.set_xlabel("")
-                panel1.set_ylabel("")
-
-                if percentage:
-                    plt.ylabel(
-                        "Percentage of Indels",
-                        fontsize=35,
+                    x += 0.0295
+                    yText_labels_bottom -= 0.001
+                    plt.text(
+                        x,
+                        yText_labels_bottom,
+                        "MH",
+                        fontsize=17,
+                        fontweight="bold",
                         fontname="Times New Roman",
-                        weight="bold",
+                        color="black",
+                        transform=plt.gcf().transFigure,
+                        rotation="vertical",
                     )
-                else:
-                    plt.ylabel(
-                        "Number of Indels",
-                        fontsize=35,
+                    x += 0.0295
+                    yText_labels_bottom -= 0.002
+                    plt.text(
+                        x,
+                        yText_labels_bottom,
+                        "COMP",
+                        fontsize=10,
+                        fontweight="bold",
                         fontname="Times New Roman",
-                        weight="bold",
+                        color="black",
+                        transform=plt.gcf().transFigure,
+                        rotation="vertical",
                     )
 
-                panel1.tick_params(
-                    axis="both",
-                    which="both",
-                    bottom=False,
-                    labelbottom=False,
-                    left=False,
-                    labelleft=True,
-                    right=False,
-                    labelright=False,
-                    top=False,
-                    labeltop=False,
-                    direction="in",
-                    length=25,
-                    colors="gray",
-                    width=2,
-                )
+                    if y <= 4:
+                        y += 4
 
-                [i.set_color("black") for i in plt.gca().get_yticklabels()]
+                    while y % 4 != 0:
+                        y += 1
+                    ytick_offest = int(y / 4)
+
+                    if percentage:
+                        ylabs = [
+                            0,
+                            round(ytick_offest, 1),
+                            round(ytick_offest * 2, 1),
+                            round(ytick_offest * 3, 1),
+                            round(ytick_offest * 4, 1),
+                        ]
+                        ylabels = [
+                            str(0),
+                            str(round(ytick_offest, 1)) + "%",
+                            str(round(ytick_offest * 2, 1)) + "%",
+                            str(round(ytick_offest * 3, 1)) + "%",
+                            str(round(ytick_offest * 4, 1)) + "%",
+                        ]
+                    else:
+                        ylabs = [
+                            0,
+                            ytick_offest,
+                            ytick_offest * 2,
+                            ytick_offest * 3,
+                            ytick_offest * 4,
+                        ]
+                        ylabels = [
+                            0,
+                            ytick_offest,
+                            ytick_offest * 2,
+                            ytick_offest * 3,
+                            ytick_offest * 4,
+                        ]
+
+                    if not percentage:
+                        ylabels = getylabels(ylabels)
+
+                    panel1.set_xlim([0, 28])
+                    panel1.set_ylim([0, y])
+                    panel1.set_yticks(ylabs)
+
+                    if sig_probs:
+                        plt.text(
+                            0.13,
+                            0.85,
+                            sample,
+                            fontsize=40,
+                            weight="bold",
+                            color="black",
+                            fontname="Arial",
+                            transform=plt.gcf().transFigure,
+                        )
+                    else:
+                        plt.text(
+                            0.13,
+                            0.85,
+                            sample + ": " + "{:,}".format(int(total_count)) + " indels",
+                            fontsize=40,
+                            weight="bold",
+                            color="black",
+                            fontname="Arial",
+                            transform=plt.gcf().transFigure,
+                        )
+
+                    panel1.set_yticklabels(ylabels, fontsize=30)
+                    plt.gca().yaxis.grid(True)
+                    plt.gca().grid(
+                        which="major", axis="y", color=[0.6, 0.6, 0.6], zorder=1
+                    )
+                    panel1.set_xlabel("")
+                    panel1.set_ylabel("")
+
+                    if percentage:
+                        plt.ylabel(
+                            "Percentage of Indels",
+                            fontsize=35,
+                            fontname="Times New Roman",
+                            weight="bold",
+                        )
+                    else:
+                        plt.ylabel(
+                            "Number of Indels",
+                            fontsize=35,
+                            fontname="Times New Roman",
+                            weight="bold",
+                        )
 
-                pp.savefig(plot1)
-                plt.close()
+                    panel1.tick_params(
+                        axis="both",
+                        which="both",
+                        bottom=False,
+                        labelbottom=False,
+                        left=False,
+                        labelleft=True,
+                        right=False,
+                        labelright=False,
+                        top=False,
+                        labeltop=False,
+                        direction="in",
+                        length=25,
+                        colors="gray",
+                        width=2,
+                    )
+
+                    [i.set_color("black") for i in plt.gca().get_yticklabels()]
+
+                    errors.stop()
+                    pp.savefig(plot1)
+                    plt.close()
+
+                    progress(sample, path=file_path)
+                except Exception as e:
+                    errors.failed(sample, e)
+                    plt.close()
             pp.close()
 
-        except:
-            print("There may be an issue with the formatting of your matrix file.")
-            pdf_path = output_path + "ID_simple_plots_" + project + ".pdf"
-            if os.path.isfile(pdf_path):
-                os.remove(pdf_path)
+        except Exception as e:
+            discard_pdf(pp, output_path + "ID_simple_plots_" + project + ".pdf")
+            if isinstance(e, PlottingError):
+                raise
+            raise MatrixFormatError(
+                "ERROR: there may be an issue with the formatting of your matrix file."
+            ) from e
+        errors.finish()
 
     elif (
         plot_type == "IDSB"
@@ -9225,106 +10022,14 @@ def plotID(
             mutation_type_list = mutation_type.split(":")
             if len(mutation_type_list) != 5:
                 print(mutation_type_list)
-                sys.exit(
-                    "The matrix does not match the correct ID-96 format. Please check you formatting and rerun this plotting function."
+                raise MatrixFormatError(
+                    "ERROR: The matrix does not match the correct ID-96 format. Please check you formatting and rerun this plotting function."
                 )
 
         file_path = os.path.join(output_path, f"ID_TSB_plots_{project}.pdf")
         pp = PdfPages(file_path)
 
-        indel_types_tsb = []
-        tsb_I = ["T", "U", "N", "B", "Q"]
-        indel_types = [
-            "1:Del:C:0",
-            "1:Del:C:1",
-            "1:Del:C:2",
-            "1:Del:C:3",
-            "1:Del:C:4",
-            "1:Del:C:5",
-            "1:Del:T:0",
-            "1:Del:T:1",
-            "1:Del:T:2",
-            "1:Del:T:3",
-            "1:Del:T:4",
-            "1:Del:T:5",
-            "1:Ins:C:0",
-            "1:Ins:C:1",
-            "1:Ins:C:2",
-            "1:Ins:C:3",
-            "1:Ins:C:4",
-            "1:Ins:C:5",
-            "1:Ins:T:0",
-            "1:Ins:T:1",
-            "1:Ins:T:2",
-            "1:Ins:T:3",
-            "1:Ins:T:4",
-            "1:Ins:T:5",
-            # >1bp INDELS
-            "2:Del:R:0",
-            "2:Del:R:1",
-            "2:Del:R:2",
-            "2:Del:R:3",
-            "2:Del:R:4",
-            "2:Del:R:5",
-            "3:Del:R:0",
-            "3:Del:R:1",
-            "3:Del:R:2",
-            "3:Del:R:3",
-            "3:Del:R:4",
-            "3:Del:R:5",
-            "4:Del:R:0",
-            "4:Del:R:1",
-            "4:Del:R:2",
-            "4:Del:R:3",
-            "4:Del:R:4",
-            "4:Del:R:5",
-            "5:Del:R:0",
-            "5:Del:R:1",
-            "5:Del:R:2",
-            "5:Del:R:3",
-            "5:Del:R:4",
-            "5:Del:R:5",
-            "2:Ins:R:0",
-            "2:Ins:R:1",
-            "2:Ins:R:2",
-            "2:Ins:R:3",
-            "2:Ins:R:4",
-            "2:Ins:R:5",
-            "3:Ins:R:0",
-            "3:Ins:R:1",
-            "3:Ins:R:2",
-            "3:Ins:R:3",
-            "3:Ins:R:4",
-            "3:Ins:R:5",
-            "4:Ins:R:0",
-            "4:Ins:R:1",
-            "4:Ins:R:2",
-            "4:Ins:R:3",
-            "4:Ins:R:4",
-            "4:Ins:R:5",
-            "5:Ins:R:0",
-            "5:Ins:R:1",
-            "5:Ins:R:2",
-            "5:Ins:R:3",
-            "5:Ins:R:4",
-            "5:Ins:R:5",
-            # MicroHomology INDELS
-            "2:Del:M:1",
-            "3:Del:M:1",
-            "3:Del:M:2",
-            "4:Del:M:1",
-            "4:Del:M:2",
-            "4:Del:M:3",
-            "5:Del:M:1",
-            "5:Del:M:2",
-            "5:Del:M:3",
-            "5:Del:M:4",
-            "5:Del:M:5",
-        ]
-
-        for indels in indel_types:
-            for tsbs in tsb_I:
-                indel_types_tsb.append(tsbs + ":" + indels)
+        indel_types_tsb = get_context_spec("ID415").stranded_labels
 
         sig_probs = False
         mutations = OrderedDict()
@@ -9338,6 +10043,12 @@ def plotID(
                 else:
                     samples = first_line.strip().split("\t")
                     samples = samples[1:]
+                sample_columns = select_sample_columns(
+                    samples, sample_selection, 4 if pcawg else 1
+                )
+                samples = list(sample_columns)
+                progress = PlotProgress(progress_callback, samples)
+                errors = ErrorPolicy(on_error, progress, sample_timeout, cancel)
                 for sample in samples:
                     mutations[sample] = OrderedDict()
                     mutations[sample]["1DelC"] = [
@@ -9498,21 +10209,13 @@ def plotID(
                         sample_index = 1
 
                     for sample in samples:
+                        sample_index = sample_columns[sample]
                         if mut_type in mutations[sample].keys():
-                            if percentage:
-                                mutCount = float(line[sample_index])
-                                if mutCount < 1 and mutCount > 0:
-                                    sig_probs = True
-                            else:
-                                try:
-                                    mutCount = int(line[sample_index])
-                                except:
-                                    print(
-                                        "It appears that the provided matrix does not contain mutation counts.\n\tIf you have provided a signature activity matrix, please change the percentage parameter to True.\n\tOtherwise, ",
-                                        end="",
-                                    )
-
-                                # mutCount = int(line[sample_index])
+                            mutCount = read_mutation_count(
+                                line, sample_index, sample, percentage, errors
+                            )
+                            if percentage and mutCount < 1 and mutCount > 0:
+                                sig_probs = True
                             if bias == "T":
                                 mutations[sample][mut_type][repeat_size][0] = mutCount
                             else:
@@ -9523,46 +10226,59 @@ def plotID(
 
             sample_count = 0
             for sample in mutations.keys():
-                total_count = sum(
-                    sum(sum(tsb) for tsb in nuc) for nuc in mutations[sample].values()
-                )
-                plt.rcParams["axes.linewidth"] = 2
-                plot1 = plt.figure(figsize=(43.93, 12))
-                plt.rc("axes", edgecolor="black")
-                panel1 = plt.axes([0.045, 0.17, 0.92, 0.65])
-                xlabels = []
+                if sample in errors:
+                    continue
+                try:
+                    errors.start(sample)
+                    total_count = sum(
+                        sum(sum(tsb) for tsb in nuc)
+                        for nuc in mutations[sample].values()
+                    )
+                    plt.rcParams["axes.linewidth"] = 2
+                    plot1 = plt.figure(figsize=(43.93, 12))
+                    plt.rc("axes", edgecolor="black")
+                    panel1 = plt.axes([0.045, 0.17, 0.92, 0.65])
+                    xlabels = []
 
-                x = 0.4
-                ymax = 0
-                colors = [
-                    [253 / 256, 190 / 256, 111 / 256],
-                    [255 / 256, 128 / 256, 2 / 256],
-                    [176 / 256, 221 / 256, 139 / 256],
-                    [54 / 256, 161 / 256, 46 / 256],
-                    [253 / 256, 202 / 256, 181 / 256],
-                    [252 / 256, 138 / 256, 106 / 256],
-                    [241 / 256, 68 / 256, 50 / 256],
-                    [188 / 256, 25 / 256, 26 / 256],
-                    [208 / 256, 225 / 256, 242 / 256],
-                    [148 / 256, 196 / 256, 223 / 256],
-                    [74 / 256, 152 / 256, 201 / 256],
-                    [23 / 256, 100 / 256, 171 / 256],
-                    [226 / 256, 226 / 256, 239 / 256],
-                    [182 / 256, 182 / 256, 216 / 256],
-                    [134 / 256, 131 / 256, 189 / 256],
-                    [98 / 256, 64 / 256, 155 / 256],
-                ]
+                    x = 0.4
+                    ymax = 0
+                    colors = get_context_spec("ID415").palette
 
-                i = 0
-                for key in mutations[sample]:
-                    l = 1
-                    for seq in mutations[sample][key]:
-                        xlabels.append(l)
-                        if percentage:
-                            if total_count > 0:
+                    i = 0
+                    for key in mutations[sample]:
+                        l = 1
+                        for seq in mutations[sample][key]:
+                            xlabels.append(l)
+                            if percentage:
+                                if total_count > 0:
+                                    trans = plt.bar(
+                                        x,
+                                        seq[0] / total_count * 100,
+                                        width=0.2,
+                                        color=[1 / 256, 70 / 256, 102 / 256],
+                                        align="center",
+                                        zorder=1000,
+                                        label="Genic-transcribed Strand",
+                                    )
+                                    x += 0.2
+                                    untrans = plt.bar(
+                                        x,
+                                        seq[1] / total_count * 100,
+                                        width=0.2,
+                                        color=[228 / 256, 41 / 256, 38 / 256],
+                                        align="center",
+                                        zorder=1000,
+                                        label="Genic-untranscribed Strand",
+                                    )
+                                    if seq[0] / total_count * 100 > ymax:
+                                        ymax = seq[0] / total_count * 100
+                                    if seq[1] / total_count * 100 > ymax:
+                                        ymax = seq[1] / total_count * 100
+
+                            else:
                                 trans = plt.bar(
                                     x,
-                                    seq[0] / total_count * 100,
+                                    seq[0],
                                     width=0.2,
                                     color=[1 / 256, 70 / 256, 102 / 256],
                                     align="center",
@@ -9572,59 +10288,77 @@ def plotID(
                                 x += 0.2
                                 untrans = plt.bar(
                                     x,
-                                    seq[1] / total_count * 100,
+                                    seq[1],
                                     width=0.2,
                                     color=[228 / 256, 41 / 256, 38 / 256],
                                     align="center",
                                     zorder=1000,
                                     label="Genic-untranscribed Strand",
                                 )
-                                if seq[0] / total_count * 100 > ymax:
-                                    ymax = seq[0] / total_count * 100
-                                if seq[1] / total_count * 100 > ymax:
-                                    ymax = seq[1] / total_count * 100
+                                if seq[0] > ymax:
+                                    ymax = seq[0]
+                                if seq[1] > ymax:
+                                    ymax = seq[1]
 
-                        else:
-                            trans = plt.bar(
-                                x,
-                                seq[0],
-                                width=0.2,
-                                color=[1 / 256, 70 / 256, 102 / 256],
-                                align="center",
-                                zorder=1000,
-                                label="Genic-transcribed Strand",
-                            )
-                            x += 0.2
-                            untrans = plt.bar(
-                                x,
-                                seq[1],
-                                width=0.2,
-                                color=[228 / 256, 41 / 256, 38 / 256],
-                                align="center",
-                                zorder=1000,
-                                label="Genic-untranscribed Strand",
+                            x += 0.799
+                            l += 1
+                        i += 1
+
+                    x = 0.0475
+                    y_top = 0.827
+                    y_bottom = 0.114
+                    y = int(ymax * 1.25)
+                    y2 = y + 2
+                    for i in range(0, 12, 1):
+                        panel1.add_patch(
+                            plt.Rectangle(
+                                (x, y_top),
+                                0.0595,
+                                0.05,
+                                facecolor=colors[i],
+                                clip_on=False,
+                                transform=plt.gcf().transFigure,
+                            )
+                        )
+                        panel1.add_patch(
+                            plt.Rectangle(
+                                (x, y_bottom),
+                                0.0595,
+                                0.05,
+                                facecolor=colors[i],
+                                clip_on=False,
+                                transform=plt.gcf().transFigure,
                             )
-                            if seq[0] > ymax:
-                                ymax = seq[0]
-                            if seq[1] > ymax:
-                                ymax = seq[1]
-
-                        x += 0.799
-                        l += 1
-                    i += 1
-
-                x = 0.0475
-                y_top = 0.827
-                y_bottom = 0.114
-                y = int(ymax * 1.25)
-                y2 = y + 2
-                for i in range(0, 12, 1):
+                        )
+                        x += 0.0665
+
+                    panel1.add_patch(
+                        plt.Rectangle(
+                            (x - 0.001, y_top),
+                            0.006,
+                            0.05,
+                            facecolor=colors[12],
+                            clip_on=False,
+                            transform=plt.gcf().transFigure,
+                        )
+                    )
+                    panel1.add_patch(
+                        plt.Rectangle(
+                            (x - 0.001, y_bottom),
+                            0.006,
+                            0.05,
+                            facecolor=colors[12],
+                            clip_on=False,
+                            transform=plt.gcf().transFigure,
+                        )
+                    )
+                    x += 0.011
                     panel1.add_patch(
                         plt.Rectangle(
                             (x, y_top),
-                            0.0595,
+                            0.0155,
                             0.05,
-                            facecolor=colors[i],
+                            facecolor=colors[13],
                             clip_on=False,
                             transform=plt.gcf().transFigure,
                         )
@@ -9632,379 +10366,350 @@ def plotID(
                     panel1.add_patch(
                         plt.Rectangle(
                             (x, y_bottom),
-                            0.0595,
+                            0.0155,
+                            0.05,
+                            facecolor=colors[13],
+                            clip_on=False,
+                            transform=plt.gcf().transFigure,
+                        )
+                    )
+                    x += 0.022
+                    panel1.add_patch(
+                        plt.Rectangle(
+                            (x, y_top),
+                            0.027,
                             0.05,
-                            facecolor=colors[i],
+                            facecolor=colors[14],
+                            clip_on=False,
+                            transform=plt.gcf().transFigure,
+                        )
+                    )
+                    panel1.add_patch(
+                        plt.Rectangle(
+                            (x, y_bottom),
+                            0.027,
+                            0.05,
+                            facecolor=colors[14],
+                            clip_on=False,
+                            transform=plt.gcf().transFigure,
+                        )
+                    )
+                    x += 0.0335
+                    panel1.add_patch(
+                        plt.Rectangle(
+                            (x, y_top),
+                            0.049,
+                            0.05,
+                            facecolor=colors[15],
+                            clip_on=False,
+                            transform=plt.gcf().transFigure,
+                        )
+                    )
+                    panel1.add_patch(
+                        plt.Rectangle(
+                            (x, y_bottom),
+                            0.049,
+                            0.05,
+                            facecolor=colors[15],
                             clip_on=False,
                             transform=plt.gcf().transFigure,
                         )
                     )
-                    x += 0.0665
 
-                panel1.add_patch(
-                    plt.Rectangle(
-                        (x - 0.001, y_top),
-                        0.006,
-                        0.05,
-                        facecolor=colors[12],
-                        clip_on=False,
+                    yText = y_top + 0.01
+                    plt.text(
+                        0.072,
+                        yText,
+                        "C",
+                        fontsize=40,
+                        fontname="Times New Roman",
+                        fontweight="bold",
                         transform=plt.gcf().transFigure,
                     )
-                )
-                panel1.add_patch(
-                    plt.Rectangle(
-                        (x - 0.001, y_bottom),
-                        0.006,
-                        0.05,
-                        facecolor=colors[12],
-                        clip_on=False,
+                    plt.text(
+                        0.1385,
+                        yText,
+                        "T",
+                        fontsize=40,
+                        fontname="Times New Roman",
+                        fontweight="bold",
+                        color="white",
                         transform=plt.gcf().transFigure,
                     )
-                )
-                x += 0.011
-                panel1.add_patch(
-                    plt.Rectangle(
-                        (x, y_top),
-                        0.0155,
-                        0.05,
-                        facecolor=colors[13],
-                        clip_on=False,
+                    plt.text(
+                        0.205,
+                        yText,
+                        "C",
+                        fontsize=40,
+                        fontname="Times New Roman",
+                        fontweight="bold",
                         transform=plt.gcf().transFigure,
                     )
-                )
-                panel1.add_patch(
-                    plt.Rectangle(
-                        (x, y_bottom),
-                        0.0155,
-                        0.05,
-                        facecolor=colors[13],
-                        clip_on=False,
+                    plt.text(
+                        0.2715,
+                        yText,
+                        "T",
+                        fontsize=40,
+                        fontname="Times New Roman",
+                        fontweight="bold",
+                        color="white",
                         transform=plt.gcf().transFigure,
                     )
-                )
-                x += 0.022
-                panel1.add_patch(
-                    plt.Rectangle(
-                        (x, y_top),
-                        0.027,
-                        0.05,
-                        facecolor=colors[14],
-                        clip_on=False,
+                    plt.text(
+                        0.338,
+                        yText,
+                        "2",
+                        fontsize=40,
+                        fontweight="bold",
+                        fontname="Times New Roman",
+                        color="black",
                         transform=plt.gcf().transFigure,
                     )
-                )
-                panel1.add_patch(
-                    plt.Rectangle(
-                        (x, y_bottom),
-                        0.027,
-                        0.05,
-                        facecolor=colors[14],
-                        clip_on=False,
+                    plt.text(
+                        0.4045,
+                        yText,
+                        "3",
+                        fontsize=40,
+                        fontweight="bold",
+                        fontname="Times New Roman",
+                        color="black",
                         transform=plt.gcf().transFigure,
                     )
-                )
-                x += 0.0335
-                panel1.add_patch(
-                    plt.Rectangle(
-                        (x, y_top),
-                        0.049,
-                        0.05,
-                        facecolor=colors[15],
-                        clip_on=False,
+                    plt.text(
+                        0.471,
+                        yText,
+                        "4",
+                        fontsize=40,
+                        fontweight="bold",
+                        fontname="Times New Roman",
+                        color="black",
                         transform=plt.gcf().transFigure,
                     )
-                )
-                panel1.add_patch(
-                    plt.Rectangle(
-                        (x, y_bottom),
-                        0.049,
-                        0.05,
-                        facecolor=colors[15],
-                        clip_on=False,
+                    plt.text(
+                        0.5375,
+                        yText,
+                        "5+",
+                        fontsize=40,
+                        fontweight="bold",
+                        fontname="Times New Roman",
+                        color="white",
+                        transform=plt.gcf().transFigure,
+                    )
+                    plt.text(
+                        0.604,
+                        yText,
+                        "2",
+                        fontsize=40,
+                        fontweight="bold",
+                        fontname="Times New Roman",
+                        color="black",
+                        transform=plt.gcf().transFigure,
+                    )
+                    plt.text(
+                        0.6705,
+                        yText,
+                        "3",
+                        fontsize=40,
+                        fontweight="bold",
+                        fontname="Times New Roman",
+                        color="black",
+                        transform=plt.gcf().transFigure,
+                    )
+                    plt.text(
+                        0.737,
+                        yText,
+                        "4",
+                        fontsize=40,
+                        fontweight="bold",
+                        fontname="Times New Roman",
+                        color="black",
+                        transform=plt.gcf().transFigure,
+                    )
+                    plt.text(
+                        0.8035,
+                        yText,
+                        "5+",
+                        fontsize=40,
+                        fontweight="bold",
+                        fontname="Times New Roman",
+                        color="white",
+                        transform=plt.gcf().transFigure,
+                    )
+                    plt.text(
+                        0.844,
+                        yText,
+                        "2",
+                        fontsize=40,
+                        fontweight="bold",
+                        fontname="Times New Roman",
+                        color="black",
+                        transform=plt.gcf().transFigure,
+                    )
+                    plt.text(
+                        0.861,
+                        yText,
+                        "3",
+                        fontsize=40,
+                        fontweight="bold",
+                        fontname="Times New Roman",
+                        color="black",
+                        transform=plt.gcf().transFigure,
+                    )
+                    plt.text(
+                        0.888,
+                        yText,
+                        "4",
+                        fontsize=40,
+                        fontweight="bold",
+                        fontname="Times New Roman",
+                        color="black",
+                        transform=plt.gcf().transFigure,
+                    )
+                    plt.text(
+                        0.93,
+                        yText,
+                        "5+",
+                        fontsize=40,
+                        fontweight="bold",
+                        fontname="Times New Roman",
+                        color="white",
                         transform=plt.gcf().transFigure,
                     )
-                )
-
-                yText = y_top + 0.01
-                plt.text(
-                    0.072,
-                    yText,
-                    "C",
-                    fontsize=40,
-                    fontname="Times New Roman",
-                    fontweight="bold",
-                    transform=plt.gcf().transFigure,
-                )
-                plt.text(
-                    0.1385,
-                    yText,
-                    "T",
-                    fontsize=40,
-                    fontname="Times New Roman",
-                    fontweight="bold",
-                    color="white",
-                    transform=plt.gcf().transFigure,
-                )
-                plt.text(
-                    0.205,
-                    yText,
-                    "C",
-                    fontsize=40,
-                    fontname="Times New Roman",
-                    fontweight="bold",
-                    transform=plt.gcf().transFigure,
-                )
-                plt.text(
-                    0.2715,
-                    yText,
-                    "T",
-                    fontsize=40,
-                    fontname="Times New Roman",
-                    fontweight="bold",
-                    color="white",
-                    transform=plt.gcf().transFigure,
-                )
-                plt.text(
-                    0.338,
-                    yText,
-                    "2",
-                    fontsize=40,
-                    fontweight="bold",
-                    fontname="Times New Roman",
-                    color="black",
-                    transform=plt.gcf().transFigure,
-                )
-                plt.text(
-                    0.4045,
-                    yText,
-                    "3",
-                    fontsize=40,
-                    fontweight="bold",
-                    fontname="Times New Roman",
-                    color="black",
-                    transform=plt.gcf().transFigure,
-                )
-                plt.text(
-                    0.471,
-                    yText,
-                    "4",
-                    fontsize=40,
-                    fontweight="bold",
-                    fontname="Times New Roman",
-                    color="black",
-                    transform=plt.gcf().transFigure,
-                )
-                plt.text(
-                    0.5375,
-                    yText,
-                    "5+",
-                    fontsize=40,
-                    fontweight="bold",
-                    fontname="Times New Roman",
-                    color="white",
-                    transform=plt.gcf().transFigure,
-                )
-                plt.text(
-                    0.604,
-                    yText,
-                    "2",
-                    fontsize=40,
-                    fontweight="bold",
-                    fontname="Times New Roman",
-                    color="black",
-                    transform=plt.gcf().transFigure,
-                )
-                plt.text(
-                    0.6705,
-                    yText,
-                    "3",
-                    fontsize=40,
-                    fontweight="bold",
-                    fontname="Times New Roman",
-                    color="black",
-                    transform=plt.gcf().transFigure,
-                )
-                plt.text(
-                    0.737,
-                    yText,
-                    "4",
-                    fontsize=40,
-                    fontweight="bold",
-                    fontname="Times New Roman",
-                    color="black",
-                    transform=plt.gcf().transFigure,
-                )
-                plt.text(
-                    0.8035,
-                    yText,
-                    "5+",
-                    fontsize=40,
-                    fontweight="bold",
-                    fontname="Times New Roman",
-                    color="white",
-                    transform=plt.gcf().transFigure,
-                )
-                plt.text(
-                    0.844,
-                    yText,
-                    "2",
-                    fontsize=40,
-                    fontweight="bold",
-                    fontname="Times New Roman",
-                    color="black",
-                    transform=plt.gcf().transFigure,
-                )
-                plt.text(
-                    0.861,
-                    yText,
-                    "3",
-                    fontsize=40,
-                    fontweight="bold",
-                    fontname="Times New Roman",
-                    color="black",
-                    transform=plt.gcf().transFigure,
-                )
-                plt.text(
-                    0.888,
-                    yText,
-                    "4",
-                    fontsize=40,
-                    fontweight="bold",
-                    fontname="Times New Roman",
-                    color="black",
-                    transform=plt.gcf().transFigure,
-                )
-                plt.text(
-                    0.93,
-                    yText,
-                    "5+",
-                    fontsize=40,
-                    fontweight="bold",
-                    fontname="Times New Roman",
-                    color="white",
-                    transform=plt.gcf().transFigure,
-                )
 
-                yText_labels_top = yText + 0.075
-                yText_labels_bottom = y_bottom - 0.03
-                yText_labels_bottom_sec = yText_labels_bottom - 0.045
+                    yText_labels_top = yText + 0.075
+                    yText_labels_bottom = y_bottom - 0.03
+                    yText_labels_bottom_sec = yText_labels_bottom - 0.045
 
-                plt.text(
-                    0.08,
-                    yText_labels_top,
-                    "1bp Deletion",
-                    fontsize=40,
-                    fontname="Times New Roman",
-                    weight="bold",
-                    color="black",
-                    transform=plt.gcf().transFigure,
-                )
-                plt.text(
-                    0.21,
-                    yText_labels_top,
-                    "1bp Insertion",
-                    fontsize=40,
-                    fontweight="bold",
-                    fontname="Times New Roman",
-                    color="black",
-                    transform=plt.gcf().transFigure,
-                )
-                plt.text(
-                    0.375,
-                    yText_labels_top,
-                    ">1bp Deletion at Repeats\n      (Deletion Length)",
-                    fontsize=40,
-                    fontweight="bold",
-                    fontname="Times New Roman",
-                    color="black",
-                    transform=plt.gcf().transFigure,
-                )
-                plt.text(
-                    0.64,
-                    yText_labels_top,
-                    ">1bp Insertion at Repeats\n       (Insertion Length)",
-                    fontsize=40,
-                    fontweight="bold",
-                    fontname="Times New Roman",
-                    color="black",
-                    transform=plt.gcf().transFigure,
-                )
-                plt.text(
-                    0.85,
-                    yText_labels_top,
-                    " Microhomology\n(Deletion Length)",
-                    fontsize=40,
-                    fontweight="bold",
-                    fontname="Times New Roman",
-                    color="black",
-                    transform=plt.gcf().transFigure,
-                )
+                    plt.text(
+                        0.08,
+                        yText_labels_top,
+                        "1bp Deletion",
+                        fontsize=40,
+                        fontname="Times New Roman",
+                        weight="bold",
+                        color="black",
+                        transform=plt.gcf().transFigure,
+                    )
+                    plt.text(
+                        0.21,
+                        yText_labels_top,
+                        "1bp Insertion",
+                        fontsize=40,
+                        fontweight="bold",
+                        fontname="Times New Roman",
+                        color="black",
+                        transform=plt.gcf().transFigure,
+                    )
+                    plt.text(
+                        0.375,
+                        yText_labels_top,
+                        ">1bp Deletion at Repeats\n      (Deletion Length)",
+                        fontsize=40,
+                        fontweight="bold",
+                        fontname="Times New Roman",
+                        color="black",
+                        transform=plt.gcf().transFigure,
+                    )
+                    plt.text(
+                        0.64,
+                        yText_labels_top,
+                        ">1bp Insertion at Repeats\n       (Insertion Length)",
+                        fontsize=40,
+                        fontweight="bold",
+                        fontname="Times New Roman",
+                        color="black",
+                        transform=plt.gcf().transFigure,
+                    )
+                    plt.text(
+                        0.85,
+                        yText_labels_top,
+                        " Microhomology\n(Deletion Length)",
+                        fontsize=40,
+                        fontweight="bold",
+                        fontname="Times New Roman",
+                        color="black",
+                        transform=plt.gcf().transFigure,
+                    )
 
-                plt.text(
-                    0.058,
-                    yText_labels_bottom_sec,
-                    "Homopolymer Length",
-                    fontsize=35,
-                    fontname="Times New Roman",
-                    weight="bold",
-                    color="black",
-                    transform=plt.gcf().transFigure,
-                )
-                plt.text(
-                    0.19,
-                    yText_labels_bottom_sec,
-                    "Homopolymer Length",
-                    fontsize=35,
-                    fontweight="bold",
-                    fontname="Times New Roman",
-                    color="black",
-                    transform=plt.gcf().transFigure,
-                )
-                plt.text(
-                    0.39,
-                    yText_labels_bottom_sec,
-                    "Number of Repeat Units",
-                    fontsize=35,
-                    fontweight="bold",
-                    fontname="Times New Roman",
-                    color="black",
-                    transform=plt.gcf().transFigure,
-                )
-                plt.text(
-                    0.65,
-                    yText_labels_bottom_sec,
-                    "Number of Repeat Units",
-                    fontsize=35,
-                    fontweight="bold",
-                    fontname="Times New Roman",
-                    color="black",
-                    transform=plt.gcf().transFigure,
-                )
-                plt.text(
-                    0.85,
-                    yText_labels_bottom_sec,
-                    "Microhomology Length",
-                    fontsize=35,
-                    fontweight="bold",
-                    fontname="Times New Roman",
-                    color="black",
-                    transform=plt.gcf().transFigure,
-                )
+                    plt.text(
+                        0.058,
+                        yText_labels_bottom_sec,
+                        "Homopolymer Length",
+                        fontsize=35,
+                        fontname="Times New Roman",
+                        weight="bold",
+                        color="black",
+                        transform=plt.gcf().transFigure,
+                    )
+                    plt.text(
+                        0.19,
+                        yText_labels_bottom_sec,
+                        "Homopolymer Length",
+                        fontsize=35,
+                        fontweight="bold",
+                        fontname="Times New Roman",
+                        color="black",
+                        transform=plt.gcf().transFigure,
+                    )
+                    plt.text(
+                        0.39,
+                        yText_labels_bottom_sec,
+                        "Number of Repeat Units",
+                        fontsize=35,
+                        fontweight="bold",
+                        fontname="Times New Roman",
+                        color="black",
+                        transform=plt.gcf().transFigure,
+                    )
+                    plt.text(
+                        0.65,
+                        yText_labels_bottom_sec,
+                        "Number of Repeat Units",
+                        fontsize=35,
+                        fontweight="bold",
+                        fontname="Times New Roman",
+                        color="black",
+                        transform=plt.gcf().transFigure,
+                    )
+                    plt.text(
+                        0.85,
+                        yText_labels_bottom_sec,
+                        "Microhomology Length",
+                        fontsize=35,
+                        fontweight="bold",
+                        fontname="Times New Roman",
+                        color="black",
+                        transform=plt.gcf().transFigure,
+                    )
 
-                x = 0.0477
-                for i in range(0, 8, 1):
-                    if i != 2 and i != 3:
-                        plt.text(
-                            x,
-                            yText_labels_bottom,
-                            "1  2  3  4  5  6+",
-                            fontsize=32,
-                            fontweight="bold",
-                            fontname="Times New Roman",
-                            color="black",
-                            transform=plt.gcf().transFigure,
-                        )
-                    else:
+                    x = 0.0477
+                    for i in range(0, 8, 1):
+                        if i != 2 and i != 3:
+                            plt.text(
+                                x,
+                                yText_labels_bottom,
+                                "1  2  3  4  5  6+",
+                                fontsize=32,
+                                fontweight="bold",
+                                fontname="Times New Roman",
+                                color="black",
+                                transform=plt.gcf().transFigure,
+                            )
+                        else:
+                            plt.text(
+                                x,
+                                yText_labels_bottom,
+                                "0  1  2  3  4  5+",
+                                fontsize=32,
+                                fontweight="bold",
+                                fontname="Times New Roman",
+                                color="black",
+                                transform=plt.gcf().transFigure,
+                            )
+
+                        x += 0.0665
+
+                    for i in range(0, 4, 1):
                         plt.text(
                             x,
                             yText_labels_bottom,
@@ -10015,197 +10720,169 @@ def plotID(
                             color="black",
                             transform=plt.gcf().transFigure,
                         )
+                        x += 0.0665
 
-                    x += 0.0665
-
-                for i in range(0, 4, 1):
                     plt.text(
                         x,
                         yText_labels_bottom,
-                        "0  1  2  3  4  5+",
+                        "1",
                         fontsize=32,
                         fontweight="bold",
                         fontname="Times New Roman",
                         color="black",
                         transform=plt.gcf().transFigure,
                     )
-                    x += 0.0665
-
-                plt.text(
-                    x,
-                    yText_labels_bottom,
-                    "1",
-                    fontsize=32,
-                    fontweight="bold",
-                    fontname="Times New Roman",
-                    color="black",
-                    transform=plt.gcf().transFigure,
-                )
-                x += 0.011
-                plt.text(
-                    x,
-                    yText_labels_bottom,
-                    "1  2",
-                    fontsize=32,
-                    fontweight="bold",
-                    fontname="Times New Roman",
-                    color="black",
-                    transform=plt.gcf().transFigure,
-                )
-                x += 0.022
-                plt.text(
-                    x,
-                    yText_labels_bottom,
-                    "1  2  3",
-                    fontsize=32,
-                    fontweight="bold",
-                    fontname="Times New Roman",
-                    color="black",
-                    transform=plt.gcf().transFigure,
-                )
-                x += 0.0335
-                plt.text(
-                    x,
-                    yText_labels_bottom,
-                    "1  2  3  4  5+",
-                    fontsize=32,
-                    fontweight="bold",
-                    fontname="Times New Roman",
-                    color="black",
-                    transform=plt.gcf().transFigure,
-                )
-
-                if y <= 4:
-                    y += 4
-
-                while y % 4 != 0:
-                    y += 1
-                ytick_offest = int(y / 4)
-
-                if percentage:
-                    ylabs = [
-                        0,
-                        round(ytick_offest, 1),
-                        round(ytick_offest * 2, 1),
-                        round(ytick_offest * 3, 1),
-                        round(ytick_offest * 4, 1),
-                    ]
-                    ylabels = [
-                        str(0),
-                        str(round(ytick_offest, 1)) + "%",
-                        str(round(ytick_offest * 2, 1)) + "%",
-                        str(round(ytick_offest * 3, 1)) + "%",
-                        str(round(ytick_offest * 4, 1)) + "%",
-                    ]
-                else:
-                    ylabs = [
-                        0,
-                        ytick_offest,
-                        ytick_offest * 2,
-                        ytick_offest * 3,
-                        ytick_offest * 4,
-                    ]
-                    ylabels = [
-                        0,
-                        ytick_offest,
-                        ytick_offest * 2,
-                        ytick_offest * 3,
-                        ytick_offest * 4,
-                    ]
-
-                labs = np.arange(0.375, 83.375, 1)
-
-                if not percentage:
-                    ylabels = getylabels(ylabels)
-
-                panel1.set_xlim([0, 83])
-                panel1.set_ylim([0, y])
-                panel1.set_xticks(labs)
-                panel1.set_yticks(ylabs)
-
-                if sig_probs:
+                    x += 0.011
                     plt.text(
-                        0.0475,
-                        0.75,
-                        sample,
-                        fontsize=60,
-                        weight="bold",
+                        x,
+                        yText_labels_bottom,
+                        "1  2",
+                        fontsize=32,
+                        fontweight="bold",
+                        fontname="Times New Roman",
                         color="black",
-                        fontname="Arial",
                         transform=plt.gcf().transFigure,
                     )
-                else:
+                    x += 0.022
                     plt.text(
-                        0.0475,
-                        0.75,
-                        sample + ": " + "{:,}".format(int(total_count)) + " indels",
-                        fontsize=60,
-                        weight="bold",
+                        x,
+                        yText_labels_bottom,
+                        "1  2  3",
+                        fontsize=32,
+                        fontweight="bold",
+                        fontname="Times New Roman",
+                        color="black",
+                        transform=plt.gcf().transFigure,
+                    )
+                    x += 0.0335
+                    plt.text(
+                        x,
+                        yText_labels_bottom,
+                        "1  2  3  4  5+",
+                        fontsize=32,
+                        fontweight="bold",
+                        fontname="Times New Roman",
                         color="black",
-                        fontname="Arial",
                         transform=plt.gcf().transFigure,
                     )
 
-                custom_text_upper_plot = ""
-                try:
-                    custom_text_upper[sample_count]
-                except:
-                    custom_text_upper = False
-                try:
-                    custom_text_middle[sample_count]
-                except:
-                    custom_text_middle = False
-                try:
-                    custom_text_bottom[sample_count]
-                except:
-                    custom_text_bottom = False
+                    if y <= 4:
+                        y += 4
 
-                if custom_text_upper:
-                    plot_custom_text = True
-                    if len(custom_text_upper[sample_count]) > 40:
-                        print(
-                            "To add a custom text, please limit the string to <40 characters including spaces."
-                        )
-                        plot_custom_text = False
-                if custom_text_middle:
-                    if len(custom_text_middle[sample_count]) > 40:
-                        print(
-                            "To add a custom text, please limit the string to <40 characters including spaces."
-                        )
-                        plot_custom_text = False
+                    while y % 4 != 0:
+                        y += 1
+                    ytick_offest = int(y / 4)
 
-                if plot_custom_text:
-                    x_pos_custom = 0.95
-                    if custom_text_upper and custom_text_middle:
-                        custom_text_upper_plot = (
-                            custom_text_upper[sample_count]
-                            + "\n"
-                            + custom_text_middle[sample_count]
-                        )
-                        if custom_text_bottom:
-                            custom_text_upper_plot += (
-                                "\n" + custom_text_bottom[sample_count]
-                            )
+                    if percentage:
+                        ylabs = [
+                            0,
+                            round(ytick_offest, 1),
+                            round(ytick_offest * 2, 1),
+                            round(ytick_offest * 3, 1),
+                            round(ytick_offest * 4, 1),
+                        ]
+                        ylabels = [
+                            str(0),
+                            str(round(ytick_offest, 1)) + "%",
+                            str(round(ytick_offest * 2, 1)) + "%",
+                            str(round(ytick_offest * 3, 1)) + "%",
+                            str(round(ytick_offest * 4, 1)) + "%",
+                        ]
+                    else:
+                        ylabs = [
+                            0,
+                            ytick_offest,
+                            ytick_offest * 2,
+                            ytick_offest * 3,
+                            ytick_offest * 4,
+                        ]
+                        ylabels = [
+                            0,
+                            ytick_offest,
+                            ytick_offest * 2,
+                            ytick_offest * 3,
+                            ytick_offest * 4,
+                        ]
 
-                    if custom_text_upper and not custom_text_middle:
-                        custom_text_upper_plot = custom_text_upper[sample_count]
-                        panel1.text(
-                            x_pos_custom,
-                            0.78,
-                            custom_text_upper_plot,
-                            fontsize=35,
+                    labs = np.arange(0.375, 83.375, 1)
+
+                    if not percentage:
+                        ylabels = getylabels(ylabels)
+
+                    panel1.set_xlim([0, 83])
+                    panel1.set_ylim([0, y])
+                    panel1.set_xticks(labs)
+                    panel1.set_yticks(ylabs)
+
+                    if sig_probs:
+                        plt.text(
+                            0.0475,
+                            0.75,
+                            sample,
+                            fontsize=60,
+                            weight="bold",
+                            color="black",
+                            fontname="Arial",
+                            transform=plt.gcf().transFigure,
+                        )
+                    else:
+                        plt.text(
+                            0.0475,
+                            0.75,
+                            sample + ": " + "{:,}".format(int(total_count)) + " indels",
+                            fontsize=60,
                             weight="bold",
                             color="black",
                             fontname="Arial",
                             transform=plt.gcf().transFigure,
-                            ha="right",
                         )
 
-                    elif custom_text_upper and custom_text_middle:
-                        if not custom_text_bottom:
+                    custom_text_upper_plot = ""
+                    try:
+                        custom_text_upper[sample_count]
+                    except:
+                        custom_text_upper = False
+                    try:
+                        custom_text_middle[sample_count]
+                    except:
+                        custom_text_middle = False
+                    try:
+                        custom_text_bottom[sample_count]
+                    except:
+                        custom_text_bottom = False
+
+                    if custom_text_upper:
+                        plot_custom_text = True
+                        if len(custom_text_upper[sample_count]) > 40:
+                            print(
+                                "To add a custom text, please limit the string to <40 characters including spaces."
+                            )
+                            plot_custom_text = False
+                    if custom_text_middle:
+                        if len(custom_text_middle[sample_count]) > 40:
+                            print(
+                                "To add a custom text, please limit the string to <40 characters including spaces."
+                            )
+                            plot_custom_text = False
+
+                    if plot_custom_text:
+                        x_pos_custom = 0.95
+                        if custom_text_upper and custom_text_middle:
+                            custom_text_upper_plot = (
+                                custom_text_upper[sample_count]
+                                + "\n"
+                                + custom_text_middle[sample_count]
+                            )
+                            if custom_text_bottom:
+                                custom_text_upper_plot += (
+                                    "\n" + custom_text_bottom[sample_count]
+                                )
+
+                        if custom_text_upper and not custom_text_middle:
+                            custom_text_upper_plot = custom_text_upper[sample_count]
                             panel1.text(
                                 x_pos_custom,
-                                0.72,
+                                0.78,
                                 custom_text_upper_plot,
                                 fontsize=35,
                                 weight="bold",
@@ -10214,10 +10891,38 @@ def plotID(
                                 transform=plt.gcf().transFigure,
                                 ha="right",
                             )
-                        else:
+
+                        elif custom_text_upper and custom_text_middle:
+                            if not custom_text_bottom:
+                                panel1.text(
+                                    x_pos_custom,
+                                    0.72,
+                                    custom_text_upper_plot,
+                                    fontsize=35,
+                                    weight="bold",
+                                    color="black",
+                                    fontname="Arial",
+                                    transform=plt.gcf().transFigure,
+                                    ha="right",
+                                )
+                            else:
+                                panel1.text(
+                                    x_pos_custom,
+                                    0.68,
+                                    custom_text_upper_plot,
+                                    fontsize=35,
+                                    weight="bold",
+                                    color="black",
+                                    fontname="Arial",
+                                    transform=plt.gcf().transFigure,
+                                    ha="right",
+                                )
+
+                        elif not custom_text_upper and custom_text_middle:
+                            custom_text_upper_plot = custom_text_middle[sample_count]
                             panel1.text(
                                 x_pos_custom,
-                                0.68,
+                                0.78,
                                 custom_text_upper_plot,
                                 fontsize=35,
                                 weight="bold",
@@ -10227,71 +10932,93 @@ def plotID(
                                 ha="right",
                             )
 
-                    elif not custom_text_upper and custom_text_middle:
-                        custom_text_upper_plot = custom_text_middle[sample_count]
-                        panel1.text(
-                            x_pos_custom,
-                            0.78,
-                            custom_text_upper_plot,
+                    panel1.set_yticklabels(ylabels, fontsize=30)
+                    plt.gca().yaxis.grid(True)
+                    plt.gca().grid(
+                        which="major", axis="y", color=[0.6, 0.6, 0.6], zorder=1
+                    )
+                    panel1.set_xlabel("")
+                    panel1.set_ylabel("")
+                    panel1.legend(handles=[trans, untrans], prop={"size": 30})
+
+                    if percentage:
+                        plt.ylabel(
+                            "Percentage of Indels",
                             fontsize=35,
+                            fontname="Times New Roman",
+                            weight="bold",
+                        )
+                    else:
+                        plt.ylabel(
+                            "Number of Indels",
+                            fontsize=35,
+                            fontname="Times New Roman",
                             weight="bold",
-                            color="black",
-                            fontname="Arial",
-                            transform=plt.gcf().transFigure,
-                            ha="right",
                         )
 
-                panel1.set_yticklabels(ylabels, fontsize=30)
-                plt.gca().yaxis.grid(True)
-                plt.gca().grid(which="major", axis="y", color=[0.6, 0.6, 0.6], zorder=1)
-                panel1.set_xlabel("")
-                panel1.set_ylabel("")
-                panel1.legend(handles=[trans, untrans], prop={"size": 30})
-
-                if percentage:
-                    plt.ylabel(
-                        "Percentage of Indels",
-                        fontsize=35,
-                        fontname="Times New Roman",
-                        weight="bold",
-                    )
-                else:
-                    plt.ylabel(
-                        "Number of Indels",
-                        fontsize=35,
-                        fontname="Times New Roman",
-                        weight="bold",
-                    )
-
-                panel1.tick_params(
-                    axis="both",
-                    which="both",
-                    bottom=False,
-                    labelbottom=False,
-                    left=False,
-                    labelleft=True,
-                    right=False,
-                    labelright=False,
-                    top=False,
-                    labeltop=False,
-                    direction="in",
-                    length=25,
-                    colors="gray",
-                    width=2,
-                )
-
-                [i.set_color("black") for i in plt.gca().get_yticklabels()]
-
-                pp.savefig(plot1)
-                plt.close()
+                    panel1.tick_params(
+                        axis="both",
+                        which="both",
+                        bottom=False,
+                        labelbottom=False,
+                        left=False,
+                        labelleft=True,
+                        right=False,
+                        labelright=False,
+                        top=False,
+                        labeltop=False,
+                        direction="in",
+                        length=25,
+                        colors="gray",
+                        width=2,
+                    )
+
+                    [i.set_color("black") for i in plt.gca().get_yticklabels()]
+
+                    errors.stop()
+                    pp.savefig(plot1)
+                    plt.close()
+
+                    progress(sample, path=file_path)
+                except Exception as e:
+                    errors.failed(sample, e)
+                    plt.close()
                 sample_count += 1
             pp.close()
 
-        except:
-            print("There may be an issue with the formatting of your matrix file.")
-            pdf_path = output_path + "ID_TSB_plots_" + project + ".pdf"
-            if os.path.isfile(pdf_path):
-                os.remove(pdf_path)
+        except Exception as e:
+            discard_pdf(pp, output_path + "ID_TSB_plots_" + project + ".pdf")
+            if isinstance(e, PlottingError):
+                raise
+            raise MatrixFormatError(
+                "ERROR: there may be an issue with the formatting of your matrix file."
+            ) from e
+        errors.finish()
+
+    elif plot_type in HEATMAP_PLOT_TYPES["plotID"]:
+        return plot_heatmap_context(
+            "plotID",
+            matrix_path,
+            output_path,
+            project,
+            plot_type,
+            percentage,
+            custom_text_upper,
+            custom_text_middle,
+            custom_text_bottom,
+            savefig_format,
+            dpi,
+            cache,
+            append,
+            samples,
+            archive,
+            compresslevel,
+            progress_callback,
+            on_error,
+            sample_timeout,
+            cancel,
+            dtype,
+        )
 
     else:
         print(
@@ -10301,6 +11028,7 @@ def plotID(
         )
 
 
+@reported_run
 def plotDBS(
     matrix_path,
     output_path,
@@ -10313,100 +11041,107 @@ def plotDBS(
     savefig_format="pdf",
     volume=None,
     dpi=100,
+    cache=None,
+    append=False,
+    samples=None,
+    archive=None,
+    compresslevel=None,
+    dry_run=False,
+    progress_callback=None,
+    on_error="raise",
+    sample_timeout=None,
+    cancel=None,
+    scaling=None,
+    aggregate=False,
+    groups=None,
+    dtype="compact",
+    lazy=False,
 ):
+    check_on_error(on_error)
+    check_sample_timeout(sample_timeout)
+    aggregate = check_aggregate(aggregate)
+    check_append("plotDBS", plot_type, append)
+    if dry_run:
+        return estimate_run(
+            "plotDBS",
+            matrix_path,
+            plot_type,
+            savefig_format,
+            dpi,
+            samples,
+            aggregate,
+            groups,
+        )
+    if aggregate:
+        matrix_path = aggregate_matrix(
+            "plotDBS",
+            matrix_path,
+            plot_type,
+            project,
+            aggregate,
+            groups,
+            samples,
+            on_error,
+        )
+        samples = None
+    if lazy:
+        from sigProfilerPlotting.streaming import iter_plot
+
+        return iter_plot(
+            "plotDBS",
+            matrix_path,
+            project,
+            plot_type,
+            savefig_format=savefig_format,
+            samples=samples,
+            on_error=on_error,
+            sample_timeout=sample_timeout,
+            cancel=cancel,
+            scaling=scaling,
+            percentage=percentage,
+            custom_text_upper=custom_text_upper,
+            custom_text_middle=custom_text_middle,
+            custom_text_bottom=custom_text_bottom,
+            volume=volume,
+            dpi=dpi,
+            cache=cache,
+            dtype=dtype,
+        )
+
     # create the output directory if it doesn't exist
     if not os.path.exists(output_path) and savefig_format.lower() != "pil_image":
         os.makedirs(output_path)
 
     # load custom fonts for plotting
     load_custom_fonts()
+    cache = get_render_cache(cache)
+    # the file based plot types reuse samples for the sample names of the matrix
+    sample_selection = samples
 
     plot_custom_text = False
     pcawg = False
     sig_probs = False
     if plot_type == "78" or plot_type == "78DBS" or plot_type == "DBS78":
-        data = process_input(matrix_path, plot_type)
-
-        dinucs = [
-            "TT>GG",
-            "TT>CG",
-            "TT>AG",
-            "TT>GC",
-            "TT>CC",
-            "TT>AC",
-            "TT>GA",
-            "TT>CA",
-            "TT>AA",
-            "AC>CA",
-            "AC>CG",
-            "AC>CT",
-            "AC>GA",
-            "AC>GG",
-            "AC>GT",
-            "AC>TA",
-            "AC>TG",
-            "AC>TT",
-            "CT>AA",
-            "CT>AC",
-            "CT>AG",
-            "CT>GA",
-            "CT>GC",
-            "CT>GG",
-            "CT>TG",
-            "CT>TC",
-            "CT>TA",
-            "AT>CA",
-            "AT>CC",
-            "AT>CG",
-            "AT>GA",
-            "AT>GC",
-            "AT>TA",
-            "TG>GT",
-            "TG>CT",
-            "TG>AT",
-            "TG>GC",
-            "TG>CC",
-            "TG>AC",
-            "TG>GA",
-            "TG>CA",
-            "TG>AA",
-            "CC>AA",
-            "CC>AG",
-            "CC>AT",
-            "CC>GA",
-            "CC>GG",
-            "CC>GT",
-            "CC>TA",
-            "CC>TG",
-            "CC>TT",
-            "CG>AT",
-            "CG>GC",
-            "CG>GT",
-            "CG>TC",
-            "CG>TA",
-            "CG>TT",
-            "TC>GT",
-            "TC>CT",
-            "TC>AT",
-            "TC>GG",
-            "TC>CG",
-            "TC>AG",
-            "TC>GA",
-            "TC>CA",
-            "TC>AA",
-            "GC>AA",
-            "GC>AG",
-            "GC>AT",
-            "GC>CA",
-            "GC>CG",
-            "GC>TA",
-            "TA>GT",
-            "TA>CT",
-            "TA>AT",
-            "TA>GG",
-            "TA>CG",
-            "TA>GC",
-        ]
+        data = process_input(matrix_path, plot_type, sample_selection, on_error, dtype)
+        cache_keys, skipped = lookup_render_cache(
+            cache,
+            data,
+            "DBS_78",
+            savefig_format,
+            dpi,
+            percentage,
+            custom_text_upper,
+            custom_text_middle,
+            custom_text_bottom,
+            scaling,
+        )
+        skipped |= lookup_appended_samples(
+            append, savefig_format, output_path, project, "DBS_78"
+        )
+        progress = PlotProgress(progress_callback, data.columns)
+        errors = ErrorPolicy(on_error, progress, sample_timeout, cancel)
+
+        dinucs = get_context_spec("DBS78").labels
 
         revcompl = lambda x: "".join(
             [{"A": "T", "C": "G", "G": "C", "T": "A"}[B] for B in x][::-1]
@@ -10423,22 +11158,9 @@ def plotDBS(
             data = data.sort_index()
             ctx = data.index
             xlabels = [dn.split(">")[1] for dn in ctx]
-            colors = [
-                [3 / 256, 189 / 256, 239 / 256],
-                [3 / 256, 102 / 256, 204 / 256],
-                [162 / 256, 207 / 256, 99 / 256],
-                [1 / 256, 102 / 256, 1 / 256],
-                [255 / 256, 153 / 256, 153 / 256],
-                [228 / 256, 41 / 256, 38 / 256],
-                [255 / 256, 178 / 256, 102 / 256],
-                [255 / 256, 128 / 256, 1 / 256],
-                [204 / 256, 153 / 256, 255 / 256],
-                [76 / 256, 1 / 256, 153 / 256],
-            ]
-            mainlist = [dn.split(">")[0] for dn in ctx]
-            le = LabelEncoder()
-            colors_idxs = le.fit_transform(mainlist)
-            colors_flat_list = [colors[i] for i in colors_idxs]
+            colors_flat_list = get_context_spec("DBS78").colors_of(ctx)
+            stats = cohort_statistics(data, "DBS78", percentage)
+            normalized = normalize_counts(data) if percentage else None
             sample_count = 0
 
             buf = io.BytesIO()
@@ -10450,170 +11172,124 @@ def plotDBS(
             figs = {}
 
             for sample in data.columns:
-                buf.seek(0)
-                figs[sample] = pickle.load(buf)
-                panel1 = figs[sample].axes[0]
-                total_count = np.sum(
-                    data[sample].values
-                )  # sum(sum(nuc.values()) for nuc in mutations[sample].values())
-
-                x = 0.4
-                muts = data[sample].values
-                if percentage:
-                    if total_count > 0:
+                if sample in skipped:
+                    progress(
+                        sample,
+                        "skipped",
+                        reason="already in the output or render cache",
+                    )
+                    sample_count += 1
+                    continue
+                try:
+                    errors.start(sample)
+                    check_sample_counts(data[sample])
+                    buf.seek(0)
+                    figs[sample] = pickle.load(buf)
+                    panel1 = figs[sample].axes[0]
+                    scale = sample_scaling(stats, sample, scaling)
+                    total_count = scale["total"]
+
+                    x = 0.4
+                    muts = sample_counts(data, sample)
+                    if percentage:
+                        if total_count > 0:
+                            plt.bar(
+                                np.asarray(range(len(ctx))) + x,
+                                sample_counts(normalized, sample),
+                                width=0.4,
+                                color=colors_flat_list,
+                                align="center",
+                                zorder=1000,
+                            )
+                        sig_probs = True
+                    else:
                         plt.bar(
                             np.asarray(range(len(ctx))) + x,
-                            muts / total_count * 100,
+                            muts,
                             width=0.4,
                             color=colors_flat_list,
                             align="center",
                             zorder=1000,
                         )
-                        ymax = np.max(muts / total_count * 100)
-                    sig_probs = True
-                else:
-                    plt.bar(
-                        np.asarray(range(len(ctx))) + x,
-                        muts,
-                        width=0.4,
-                        color=colors_flat_list,
-                        align="center",
-                        zorder=1000,
-                    )
-                    ymax = np.max(muts)
-                # for i in range(len(xlabels)):
-                #     print(xlabels[i],muts[i])
-
-                x = 0.043
-                y3 = 0.87
-                y = int(ymax * 1.25)
-                y2 = y + 2
-                i = 0
-
-                if y <= 4:
-                    y += 4
-
-                while y % 4 != 0:
-                    y += 1
-                ytick_offest = int(y / 4)
-
-                if percentage:
-                    ylabs = [
-                        0,
-                        round(ytick_offest, 1),
-                        round(ytick_offest * 2, 1),
-                        round(ytick_offest * 3, 1),
-                        round(ytick_offest * 4, 1),
-                    ]
-                    ylabels = [
-                        str(0),
-                        str(round(ytick_offest, 1)) + "%",
-                        str(round(ytick_offest * 2, 1)) + "%",
-                        str(round(ytick_offest * 3, 1)) + "%",
-                        str(round(ytick_offest * 4, 1)) + "%",
-                    ]
-                else:
-                    ylabs = [
-                        0,
-                        ytick_offest,
-                        ytick_offest * 2,
-                        ytick_offest * 3,
-                        ytick_offest * 4,
-                    ]
-                    ylabels = [
-                        0,
-                        ytick_offest,
-                        ytick_offest * 2,
-                        ytick_offest * 3,
-                        ytick_offest * 4,
-                    ]
-
-                if sig_probs:
-                    plt.text(
-                        0.045,
-                        0.75,
-                        sample,
-                        fontsize=60,
-                        weight="bold",
-                        color="black",
-                        fontname="Arial",
-                        transform=plt.gcf().transFigure,
-                    )
-                else:
-                    plt.text(
-                        0.045,
-                        0.75,
-                        sample
-                        + ": "
-                        + "{:,}".format(int(total_count))
-                        + " double subs",
-                        fontsize=60,
-                        weight="bold",
-                        color="black",
-                        fontname="Arial",
-                        transform=plt.gcf().transFigure,
-                    )
-
-                custom_text_upper_plot = ""
-                try:
-                    custom_text_upper[sample_count]
-                except:
-                    custom_text_upper = False
-                try:
-                    custom_text_middle[sample_count]
-                except:
-                    custom_text_middle = False
-                try:
-                    custom_text_bottom[sample_count]
-                except:
-                    custom_text_bottom = False
+                    # for i in range(len(xlabels)):
+                    #     print(xlabels[i],muts[i])
 
-                if custom_text_upper:
-                    plot_custom_text = True
-                    if len(custom_text_upper[sample_count]) > 40:
-                        print(
-                            "To add a custom text, please limit the string to <40 characters including spaces."
-                        )
-                        plot_custom_text = False
-                if custom_text_bottom:
-                    if len(custom_text_bottom[sample_count]) > 40:
-                        print(
-                            "To add a custom text, please limit the string to <40 characters including spaces."
-                        )
-                        plot_custom_text = False
+                    y = scale["ylim"]
+                    ylabs = list(scale["yticks"])
+                    ylabels = list(scale["ylabels"])
 
-                if plot_custom_text:
-                    x_pos_custom = 0.98
-                    if custom_text_upper and custom_text_middle:
-                        custom_text_upper_plot = (
-                            custom_text_upper[sample_count]
-                            + "\n"
-                            + custom_text_middle[sample_count]
+                    if sig_probs:
+                        plt.text(
+                            0.045,
+                            0.75,
+                            sample,
+                            fontsize=60,
+                            weight="bold",
+                            color="black",
+                            fontname="Arial",
+                            transform=plt.gcf().transFigure,
                         )
-                        if custom_text_bottom:
-                            custom_text_upper_plot += (
-                                "\n" + custom_text_bottom[sample_count]
-                            )
-
-                    if custom_text_upper and not custom_text_middle:
-                        custom_text_upper_plot = custom_text_upper[sample_count]
-                        panel1.text(
-                            x_pos_custom,
-                            0.78,
-                            custom_text_upper_plot,
-                            fontsize=35,
+                    else:
+                        plt.text(
+                            0.045,
+                            0.75,
+                            sample
+                            + ": "
+                            + "{:,}".format(int(total_count))
+                            + " double subs",
+                            fontsize=60,
                             weight="bold",
                             color="black",
                             fontname="Arial",
                             transform=plt.gcf().transFigure,
-                            ha="right",
                         )
 
-                    elif custom_text_upper and custom_text_middle:
-                        if not custom_text_bottom:
+                    custom_text_upper_plot = ""
+                    try:
+                        custom_text_upper[sample_count]
+                    except:
+                        custom_text_upper = False
+                    try:
+                        custom_text_middle[sample_count]
+                    except:
+                        custom_text_middle = False
+                    try:
+                        custom_text_bottom[sample_count]
+                    except:
+                        custom_text_bottom = False
+
+                    if custom_text_upper:
+                        plot_custom_text = True
+                        if len(custom_text_upper[sample_count]) > 40:
+                            print(
+                                "To add a custom text, please limit the string to <40 characters including spaces."
+                            )
+                            plot_custom_text = False
+                    if custom_text_bottom:
+                        if len(custom_text_bottom[sample_count]) > 40:
+                            print(
+                                "To add a custom text, please limit the string to <40 characters including spaces."
+                            )
+                            plot_custom_text = False
+
+                    if plot_custom_text:
+                        x_pos_custom = 0.98
+                        if custom_text_upper and custom_text_middle:
+                            custom_text_upper_plot = (
+                                custom_text_upper[sample_count]
+                                + "\n"
+                                + custom_text_middle[sample_count]
+                            )
+                            if custom_text_bottom:
+                                custom_text_upper_plot += (
+                                    "\n" + custom_text_bottom[sample_count]
+                                )
+
+                        if custom_text_upper and not custom_text_middle:
+                            custom_text_upper_plot = custom_text_upper[sample_count]
                             panel1.text(
                                 x_pos_custom,
-                                0.75,
+                                0.78,
                                 custom_text_upper_plot,
                                 fontsize=35,
                                 weight="bold",
@@ -10622,10 +11298,38 @@ def plotDBS(
                                 transform=plt.gcf().transFigure,
                                 ha="right",
                             )
-                        else:
+
+                        elif custom_text_upper and custom_text_middle:
+                            if not custom_text_bottom:
+                                panel1.text(
+                                    x_pos_custom,
+                                    0.75,
+                                    custom_text_upper_plot,
+                                    fontsize=35,
+                                    weight="bold",
+                                    color="black",
+                                    fontname="Arial",
+                                    transform=plt.gcf().transFigure,
+                                    ha="right",
+                                )
+                            else:
+                                panel1.text(
+                                    x_pos_custom,
+                                    0.7,
+                                    custom_text_upper_plot,
+                                    fontsize=35,
+                                    weight="bold",
+                                    color="black",
+                                    fontname="Arial",
+                                    transform=plt.gcf().transFigure,
+                                    ha="right",
+                                )
+
+                        elif not custom_text_upper and custom_text_middle:
+                            custom_text_upper_plot = custom_text_middle[sample_count]
                             panel1.text(
                                 x_pos_custom,
-                                0.7,
+                                0.78,
                                 custom_text_upper_plot,
                                 fontsize=35,
                                 weight="bold",
@@ -10635,91 +11339,96 @@ def plotDBS(
                                 ha="right",
                             )
 
-                    elif not custom_text_upper and custom_text_middle:
-                        custom_text_upper_plot = custom_text_middle[sample_count]
-                        panel1.text(
-                            x_pos_custom,
-                            0.78,
-                            custom_text_upper_plot,
-                            fontsize=35,
-                            weight="bold",
-                            color="black",
-                            fontname="Arial",
-                            transform=plt.gcf().transFigure,
-                            ha="right",
-                        )
-
-                if not percentage:
-                    ylabels = spplt.getylabels(ylabels)
-
-                labs = np.arange(0.44, 78.44, 1)
-                panel1.set_xlim([0, 78])
-                panel1.set_ylim([0, y])
-                panel1.set_xticks(labs)
-                panel1.set_yticks(ylabs)
-                panel1.set_xticklabels(
-                    xlabels,
-                    rotation="vertical",
-                    fontsize=30,
-                    color="grey",
-                    fontname="Courier New",
-                    verticalalignment="top",
-                    fontweight="bold",
-                )
-
-                panel1.set_yticklabels(ylabels, fontsize=25)
-                plt.gca().yaxis.grid(True)
-                plt.gca().grid(
-                    which="major", axis="y", color=[0.93, 0.93, 0.93], zorder=1
-                )
-                panel1.set_xlabel("")
-                panel1.set_ylabel("")
-
-                if percentage:
-                    plt.ylabel(
-                        "Percentage of Double Base Substitutions",
-                        fontsize=35,
-                        fontname="Times New Roman",
-                        weight="bold",
+                    labs = np.arange(0.44, 78.44, 1)
+                    panel1.set_xlim([0, 78])
+                    panel1.set_ylim([0, y])
+                    panel1.set_xticks(labs)
+                    panel1.set_yticks(ylabs)
+                    panel1.set_xticklabels(
+                        xlabels,
+                        rotation="vertical",
+                        fontsize=30,
+                        color="grey",
+                        fontname="Courier New",
+                        verticalalignment="top",
+                        fontweight="bold",
                     )
-                else:
-                    plt.ylabel(
-                        "Number of Double Base Substitutions",
-                        fontsize=35,
-                        fontname="Times New Roman",
-                        weight="bold",
+
+                    panel1.set_yticklabels(ylabels, fontsize=25)
+                    plt.gca().yaxis.grid(True)
+                    plt.gca().grid(
+                        which="major", axis="y", color=[0.93, 0.93, 0.93], zorder=1
                     )
+                    panel1.set_xlabel("")
+                    panel1.set_ylabel("")
 
-                panel1.tick_params(
-                    axis="both",
-                    which="both",
-                    bottom=False,
-                    labelbottom=True,
-                    left=True,
-                    labelleft=True,
-                    right=True,
-                    labelright=False,
-                    top=False,
-                    labeltop=False,
-                    direction="in",
-                    length=25,
-                    colors="lightgray",
-                    width=2,
-                )
+                    if percentage:
+                        plt.ylabel(
+                            "Percentage of Double Base Substitutions",
+                            fontsize=35,
+                            fontname="Times New Roman",
+                            weight="bold",
+                        )
+                    else:
+                        plt.ylabel(
+                            "Number of Double Base Substitutions",
+                            fontsize=35,
+                            fontname="Times New Roman",
+                            weight="bold",
+                        )
 
-                [i.set_color("black") for i in plt.gca().get_yticklabels()]
-                [i.set_color("grey") for i in plt.gca().get_xticklabels()]
+                    panel1.tick_params(
+                        axis="both",
+                        which="both",
+                        bottom=False,
+                        labelbottom=True,
+                        left=True,
+                        labelleft=True,
+                        right=True,
+                        labelright=False,
+                        top=False,
+                        labeltop=False,
+                        direction="in",
+                        length=25,
+                        colors="lightgray",
+                        width=2,
+                    )
+
+                    [i.set_color("black") for i in plt.gca().get_yticklabels()]
+                    [i.set_color("grey") for i in plt.gca().get_xticklabels()]
+                    errors.stop()
+                except Exception as e:
+                    errors.failed(sample, e)
+                    if sample in figs:
+                        plt.close(figs.pop(sample))
                 sample_count += 1
 
-            return output_results(
-                savefig_format, output_path, project, figs, "DBS_78", dpi=dpi
+            result = output_results(
+                savefig_format,
+                output_path,
+                project,
+                figs,
+                "DBS_78",
+                dpi=dpi,
+                cache=cache,
+                cache_keys=cache_keys,
+                append=append,
+                archive=archive,
+                compresslevel=compresslevel,
+                progress=progress,
+                errors=errors,
             )
 
-        except:
-            print("There may be an issue with the formatting of your matrix file.")
+        except Exception as e:
             pdf_path = output_path + "DBS_78_plots_" + project + ".pdf"
             if os.path.isfile(pdf_path):
                 os.remove(pdf_path)
+            if isinstance(e, PlottingError):
+                raise
+            raise MatrixFormatError(
+                "ERROR: there may be an issue with the formatting of your matrix file."
+            ) from e
+        return errors.finish(result)
 
     elif (
         plot_type == "312"
@@ -10733,51 +11442,14 @@ def plotDBS(
             first_line = first_line.strip().split()
             mutation_type = first_line[0]
             if len(mutation_type) != 7 and mutation_type[1] != ":":
-                sys.exit(
-                    "The matrix does not match the correct SBS96 format. Please check you formatting and rerun this plotting function."
+                raise MatrixFormatError(
+                    "ERROR: The matrix does not match the correct SBS96 format. Please check you formatting and rerun this plotting function."
                 )
 
         file_path = os.path.join(output_path, f"DBS_186_plots_{project}.pdf")
         pp = PdfPages(file_path)
 
-        dinucs = [
-            "TT>GG",
-            "TT>CG",
-            "TT>AG",
-            "TT>GC",
-            "TT>CC",
-            "TT>AC",
-            "TT>GA",
-            "TT>CA",
-            "TT>AA",
-            "CT>AA",
-            "CT>AC",
-            "CT>AG",
-            "CT>GA",
-            "CT>GC",
-            "CT>GG",
-            "CT>TG",
-            "CT>TC",
-            "CT>TA",
-            "CC>AA",
-            "CC>AG",
-            "CC>AT",
-            "CC>GA",
-            "CC>GG",
-            "CC>GT",
-            "CC>TA",
-            "CC>TG",
-            "CC>TT",
-            "TC>GT",
-            "TC>CT",
-            "TC>AT",
-            "TC>GG",
-            "TC>CG",
-            "TC>AG",
-            "TC>GA",
-            "TC>CA",
-            "TC>AA",
-        ]
+        dinucs = get_context_spec("DBS186").labels
 
         revcompl = lambda x: "".join(
             [{"A": "T", "C": "G", "G": "C", "T": "A", ">": ">"}[B] for B in x][::-1]
@@ -10789,6 +11461,10 @@ def plotDBS(
                 first_line = f.readline()
                 samples = first_line.strip().split("\t")
                 samples = samples[1:]
+                sample_columns = select_sample_columns(samples, sample_selection, 1)
+                samples = list(sample_columns)
+                progress = PlotProgress(progress_callback, samples)
+                errors = ErrorPolicy(on_error, progress, sample_timeout, cancel)
                 for sample in samples:
                     mutations[sample] = OrderedDict()
                     mutations[sample]["CC"] = OrderedDict()
@@ -10811,416 +11487,443 @@ def plotDBS(
                             nuc = revcompl(nuc)
                             mut_type = revcompl(mut_type)
                         sample_index = 1
-
-                        for sample in samples:
-                            if percentage:
-                                mutCount = float(line[sample_index])
-                                if mutCount < 1 and mutCount > 0:
-                                    sig_probs = True
-                            else:
-                                # mutCount = int(line[sample_index])
-                                try:
-                                    mutCount = int(line[sample_index])
-                                except:
-                                    print(
-                                        "It appears that the provided matrix does not contain mutation counts.\n\tIf you have provided a signature activity matrix, please change the percentage parameter to True.\n\tOtherwise, ",
-                                        end="",
-                                    )
-
-                            if nuc not in mutations[sample][mut_type]:
-                                mutations[sample][mut_type][nuc] = [0, 0]
-                            if bias == "T":
-                                mutations[sample][mut_type][nuc][0] = mutCount
-                            else:
-                                mutations[sample][mut_type][nuc][1] = mutCount
-                            sample_index += 1
-
-            for sample in mutations.keys():
-                total_count = sum(
-                    sum(sum(tsb) for tsb in nuc.values())
-                    for nuc in mutations[sample].values()
-                )
-                plt.rcParams["axes.linewidth"] = 2
-                plot1 = plt.figure(figsize=(21, 9.92))
-                plt.rc("axes", edgecolor="lightgray")
-                panel1 = plt.axes([0.07, 0.09, 0.92, 0.77])
-                xlabels = []
-
-                x = 0.3
-                ymax = 0
-                i = 0
-                colors = [
-                    [3 / 256, 189 / 256, 239 / 256],
-                    [3 / 256, 102 / 256, 204 / 256],
-                    [162 / 256, 207 / 256, 99 / 256],
-                    [1 / 256, 102 / 256, 1 / 256],
-                    [255 / 256, 153 / 256, 153 / 256],
-                    [228 / 256, 41 / 256, 38 / 256],
-                    [255 / 256, 178 / 256, 102 / 256],
-                    [255 / 256, 128 / 256, 1 / 256],
-                    [204 / 256, 153 / 256, 255 / 256],
-                    [76 / 256, 1 / 256, 153 / 256],
-                ]
-                for key in mutations[sample]:
-                    muts = mutations[sample][key].keys()
-                    muts = sorted(muts)
-                    for seq in muts:
-                        xlabels.append(seq)
-                        if percentage:
-                            try:
-                                trans = plt.bar(
-                                    x,
-                                    mutations[sample][key][seq][0] / total_count * 100,
-                                    width=0.2,
-                                    color=[1 / 256, 70 / 256, 102 / 256],
-                                    align="center",
-                                    zorder=1000,
-                                    label="Genic-transcribed Strand",
-                                )
-                                x += 0.2
-                                untrans = plt.bar(
-                                    x,
-                                    mutations[sample][key][seq][1] / total_count * 100,
-                                    width=0.2,
-                                    color=[228 / 256, 41 / 256, 38 / 256],
-                                    align="center",
-                                    zorder=1000,
-                                    label="Genic-untranscribed Strand",
-                                )
-                                x += 0.8
-                                if (
-                                    mutations[sample][key][seq][0] / total_count * 100
-                                    > ymax
-                                ):
-                                    ymax = (
+
+                        for sample in samples:
+                            sample_index = sample_columns[sample]
+                            mutCount = read_mutation_count(
+                                line, sample_index, sample, percentage, errors
+                            )
+                            if percentage and mutCount < 1 and mutCount > 0:
+                                sig_probs = True
+
+                            if nuc not in mutations[sample][mut_type]:
+                                mutations[sample][mut_type][nuc] = [0, 0]
+                            if bias == "T":
+                                mutations[sample][mut_type][nuc][0] = mutCount
+                            else:
+                                mutations[sample][mut_type][nuc][1] = mutCount
+                            sample_index += 1
+
+            for sample in mutations.keys():
+                if sample in errors:
+                    continue
+                try:
+                    errors.start(sample)
+                    total_count = sum(
+                        sum(sum(tsb) for tsb in nuc.values())
+                        for nuc in mutations[sample].values()
+                    )
+                    plt.rcParams["axes.linewidth"] = 2
+                    plot1 = plt.figure(figsize=(21, 9.92))
+                    plt.rc("axes", edgecolor="lightgray")
+                    panel1 = plt.axes([0.07, 0.09, 0.92, 0.77])
+                    xlabels = []
+
+                    x = 0.3
+                    ymax = 0
+                    i = 0
+                    colors = get_context_spec("DBS186").palette
+                    for key in mutations[sample]:
+                        muts = mutations[sample][key].keys()
+                        muts = sorted(muts)
+                        for seq in muts:
+                            xlabels.append(seq)
+                            if percentage:
+                                try:
+                                    trans = plt.bar(
+                                        x,
                                         mutations[sample][key][seq][0]
                                         / total_count
-                                        * 100
+                                        * 100,
+                                        width=0.2,
+                                        color=[1 / 256, 70 / 256, 102 / 256],
+                                        align="center",
+                                        zorder=1000,
+                                        label="Genic-transcribed Strand",
                                     )
-                                if (
-                                    mutations[sample][key][seq][1] / total_count * 100
-                                    > ymax
-                                ):
-                                    ymax = (
+                                    x += 0.2
+                                    untrans = plt.bar(
+                                        x,
+                                        mutations[sample][key][seq][1]
+                                        / total_count
+                                        * 100,
+                                        width=0.2,
+                                        color=[228 / 256, 41 / 256, 38 / 256],
+                                        align="center",
+                                        zorder=1000,
+                                        label="Genic-untranscribed Strand",
+                                    )
+                                    x += 0.8
+                                    if (
+                                        mutations[sample][key][seq][0]
+                                        / total_count
+                                        * 100
+                                        > ymax
+                                    ):
+                                        ymax = (
+                                            mutations[sample][key][seq][0]
+                                            / total_count
+                                            * 100
+                                        )
+                                    if (
                                         mutations[sample][key][seq][1]
                                         / total_count
                                         * 100
+                                        > ymax
+                                    ):
+                                        ymax = (
+                                            mutations[sample][key][seq][1]
+                                            / total_count
+                                            * 100
+                                        )
+                                except:
+                                    trans = plt.bar(
+                                        x,
+                                        0,
+                                        width=0.2,
+                                        color=[1 / 256, 70 / 256, 102 / 256],
+                                        align="center",
+                                        zorder=1000,
+                                        label="Genic-transcribed Strand",
+                                    )
+                                    untrans = plt.bar(
+                                        x,
+                                        0,
+                                        width=0.2,
+                                        color=[228 / 256, 41 / 256, 38 / 256],
+                                        align="center",
+                                        zorder=1000,
+                                        label="Genic-untranscribed Strand",
                                     )
-                            except:
+
+                            else:
                                 trans = plt.bar(
                                     x,
-                                    0,
+                                    mutations[sample][key][seq][0],
                                     width=0.2,
                                     color=[1 / 256, 70 / 256, 102 / 256],
                                     align="center",
                                     zorder=1000,
                                     label="Genic-transcribed Strand",
                                 )
+                                x += 0.2
                                 untrans = plt.bar(
                                     x,
-                                    0,
+                                    mutations[sample][key][seq][1],
                                     width=0.2,
                                     color=[228 / 256, 41 / 256, 38 / 256],
                                     align="center",
                                     zorder=1000,
                                     label="Genic-untranscribed Strand",
                                 )
+                                x += 0.8
+                                if mutations[sample][key][seq][0] > ymax:
+                                    ymax = mutations[sample][key][seq][0]
+                                if mutations[sample][key][seq][1] > ymax:
+                                    ymax = mutations[sample][key][seq][1]
+                        i += 1
 
-                        else:
-                            trans = plt.bar(
-                                x,
-                                mutations[sample][key][seq][0],
-                                width=0.2,
-                                color=[1 / 256, 70 / 256, 102 / 256],
-                                align="center",
-                                zorder=1000,
-                                label="Genic-transcribed Strand",
-                            )
-                            x += 0.2
-                            untrans = plt.bar(
-                                x,
-                                mutations[sample][key][seq][1],
-                                width=0.2,
-                                color=[228 / 256, 41 / 256, 38 / 256],
-                                align="center",
-                                zorder=1000,
-                                label="Genic-untranscribed Strand",
-                            )
-                            x += 0.8
-                            if mutations[sample][key][seq][0] > ymax:
-                                ymax = mutations[sample][key][seq][0]
-                            if mutations[sample][key][seq][1] > ymax:
-                                ymax = mutations[sample][key][seq][1]
-                    i += 1
-
-                y3 = 0.87
-                y = int(ymax * 1.25)
-
-                panel1.add_patch(
-                    plt.Rectangle(
-                        (0.075, y3),
-                        0.218,
-                        0.05,
-                        facecolor=colors[0],
-                        clip_on=False,
-                        transform=plt.gcf().transFigure,
+                    y3 = 0.87
+                    y = int(ymax * 1.25)
+
+                    panel1.add_patch(
+                        plt.Rectangle(
+                            (0.075, y3),
+                            0.218,
+                            0.05,
+                            facecolor=colors[0],
+                            clip_on=False,
+                            transform=plt.gcf().transFigure,
+                        )
                     )
-                )
-                panel1.add_patch(
-                    plt.Rectangle(
-                        (0.302, y3),
-                        0.218,
-                        0.05,
-                        facecolor=colors[2],
-                        clip_on=False,
-                        transform=plt.gcf().transFigure,
+                    panel1.add_patch(
+                        plt.Rectangle(
+                            (0.302, y3),
+                            0.218,
+                            0.05,
+                            facecolor=colors[2],
+                            clip_on=False,
+                            transform=plt.gcf().transFigure,
+                        )
                     )
-                )
-                panel1.add_patch(
-                    plt.Rectangle(
-                        (0.532, y3),
-                        0.218,
-                        0.05,
-                        facecolor=colors[4],
-                        clip_on=False,
-                        transform=plt.gcf().transFigure,
+                    panel1.add_patch(
+                        plt.Rectangle(
+                            (0.532, y3),
+                            0.218,
+                            0.05,
+                            facecolor=colors[4],
+                            clip_on=False,
+                            transform=plt.gcf().transFigure,
+                        )
                     )
-                )
-                panel1.add_patch(
-                    plt.Rectangle(
-                        (0.765, y3),
-                        0.218,
-                        0.05,
-                        facecolor=colors[7],
-                        clip_on=False,
-                        transform=plt.gcf().transFigure,
+                    panel1.add_patch(
+                        plt.Rectangle(
+                            (0.765, y3),
+                            0.218,
+                            0.05,
+                            facecolor=colors[7],
+                            clip_on=False,
+                            transform=plt.gcf().transFigure,
+                        )
                     )
-                )
-
-                yText = y3 + 0.06
-                plt.text(
-                    0.13,
-                    yText,
-                    "CC>NN",
-                    fontsize=40,
-                    fontweight="bold",
-                    fontname="Arial",
-                    transform=plt.gcf().transFigure,
-                )
-                plt.text(
-                    0.37,
-                    yText,
-                    "CT>NN",
-                    fontsize=40,
-                    fontweight="bold",
-                    fontname="Arial",
-                    transform=plt.gcf().transFigure,
-                )
-                plt.text(
-                    0.59,
-                    yText,
-                    "TC>NN",
-                    fontsize=40,
-                    fontweight="bold",
-                    fontname="Arial",
-                    transform=plt.gcf().transFigure,
-                )
-                plt.text(
-                    0.83,
-                    yText,
-                    "TT>NN",
-                    fontsize=40,
-                    fontweight="bold",
-                    fontname="Arial",
-                    transform=plt.gcf().transFigure,
-                )
-
-                if y <= 4:
-                    y += 4
-
-                while y % 4 != 0:
-                    y += 1
-                ytick_offest = int(y / 4)
 
-                x_shaded = 0
-                panel1.add_patch(
-                    plt.Rectangle(
-                        (x_shaded, 0),
-                        8.9,
-                        y,
-                        facecolor=colors[0],
-                        zorder=0,
-                        alpha=0.25,
-                        edgecolor="grey",
-                    )
-                )
-                x_shaded += 8.9
-                panel1.add_patch(
-                    plt.Rectangle(
-                        (x_shaded, 0),
-                        9,
-                        y,
-                        facecolor=colors[2],
-                        zorder=0,
-                        alpha=0.25,
-                        edgecolor="grey",
-                    )
-                )
-                x_shaded += 9
-                panel1.add_patch(
-                    plt.Rectangle(
-                        (x_shaded, 0),
-                        9,
-                        y,
-                        facecolor=colors[4],
-                        zorder=0,
-                        alpha=0.25,
-                        edgecolor="grey",
+                    yText = y3 + 0.06
+                    plt.text(
+                        0.13,
+                        yText,
+                        "CC>NN",
+                        fontsize=40,
+                        fontweight="bold",
+                        fontname="Arial",
+                        transform=plt.gcf().transFigure,
                     )
-                )
-                x_shaded += 9
-                panel1.add_patch(
-                    plt.Rectangle(
-                        (x_shaded, 0),
-                        9.1,
-                        y,
-                        facecolor=colors[7],
-                        zorder=0,
-                        alpha=0.25,
-                        edgecolor="grey",
+                    plt.text(
+                        0.37,
+                        yText,
+                        "CT>NN",
+                        fontsize=40,
+                        fontweight="bold",
+                        fontname="Arial",
+                        transform=plt.gcf().transFigure,
                     )
-                )
-
-                if percentage:
-                    ylabs = [
-                        0,
-                        round(ytick_offest, 1),
-                        round(ytick_offest * 2, 1),
-                        round(ytick_offest * 3, 1),
-                        round(ytick_offest * 4, 1),
-                    ]
-                    ylabels = [
-                        str(0),
-                        str(round(ytick_offest, 1)) + "%",
-                        str(round(ytick_offest * 2, 1)) + "%",
-                        str(round(ytick_offest * 3, 1)) + "%",
-                        str(round(ytick_offest * 4, 1)) + "%",
-                    ]
-                else:
-                    if ytick_offest == 0:
-                        ytick_offest = 1
-                    ylabs = [
-                        0,
-                        ytick_offest,
-                        ytick_offest * 2,
-                        ytick_offest * 3,
-                        ytick_offest * 4,
-                    ]
-                    ylabels = [
-                        0,
-                        ytick_offest,
-                        ytick_offest * 2,
-                        ytick_offest * 3,
-                        ytick_offest * 4,
-                    ]
-
-                if sig_probs:
                     plt.text(
-                        0.08,
-                        0.8,
-                        sample,
-                        fontsize=35,
-                        weight="bold",
-                        color="black",
+                        0.59,
+                        yText,
+                        "TC>NN",
+                        fontsize=40,
+                        fontweight="bold",
                         fontname="Arial",
                         transform=plt.gcf().transFigure,
                     )
-                else:
                     plt.text(
-                        0.08,
-                        0.8,
-                        sample
-                        + ": "
-                        + "{:,}".format(int(total_count))
-                        + " transcribed double subs",
-                        fontsize=35,
-                        weight="bold",
-                        color="black",
+                        0.83,
+                        yText,
+                        "TT>NN",
+                        fontsize=40,
+                        fontweight="bold",
                         fontname="Arial",
                         transform=plt.gcf().transFigure,
                     )
 
-                if not percentage:
-                    ylabels = getylabels(ylabels)
-
-                labs = np.arange(0.55, 36.44, 1)
-                panel1.set_xlim([0, 36])
-                panel1.set_ylim([0, y])
-                panel1.set_xticks(labs)
-                panel1.set_yticks(ylabs)
-                panel1.set_xticklabels(
-                    xlabels,
-                    rotation="vertical",
-                    fontsize=30,
-                    color="grey",
-                    fontname="Courier New",
-                    verticalalignment="top",
-                    fontweight="bold",
-                )
+                    if y <= 4:
+                        y += 4
 
-                panel1.set_yticklabels(ylabels, fontsize=25)
-                plt.gca().yaxis.grid(True)
-                plt.gca().grid(
-                    which="major", axis="y", color=[0.93, 0.93, 0.93], zorder=1
-                )
-                panel1.set_xlabel("")
-                panel1.set_ylabel("")
-                panel1.legend(handles=[trans, untrans], prop={"size": 30})
+                    while y % 4 != 0:
+                        y += 1
+                    ytick_offest = int(y / 4)
 
-                if percentage:
-                    plt.ylabel(
-                        "Percentage of Double Base Substitutions",
-                        fontsize=35,
-                        fontname="Times New Roman",
-                        weight="bold",
+                    x_shaded = 0
+                    panel1.add_patch(
+                        plt.Rectangle(
+                            (x_shaded, 0),
+                            8.9,
+                            y,
+                            facecolor=colors[0],
+                            zorder=0,
+                            alpha=0.25,
+                            edgecolor="grey",
+                        )
                     )
-                else:
-                    plt.ylabel(
-                        "Number of Double Base Substitutions",
-                        fontsize=35,
-                        fontname="Times New Roman",
-                        weight="bold",
+                    x_shaded += 8.9
+                    panel1.add_patch(
+                        plt.Rectangle(
+                            (x_shaded, 0),
+                            9,
+                            y,
+                            facecolor=colors[2],
+                            zorder=0,
+                            alpha=0.25,
+                            edgecolor="grey",
+                        )
+                    )
+                    x_shaded += 9
+                    panel1.add_patch(
+                        plt.Rectangle(
+                            (x_shaded, 0),
+                            9,
+                            y,
+                            facecolor=colors[4],
+                            zorder=0,
+                            alpha=0.25,
+                            edgecolor="grey",
+                        )
+                    )
+                    x_shaded += 9
+                    panel1.add_patch(
+                        plt.Rectangle(
+                            (x_shaded, 0),
+                            9.1,
+                            y,
+                            facecolor=colors[7],
+                            zorder=0,
+                            alpha=0.25,
+                            edgecolor="grey",
+                        )
                     )
 
-                panel1.tick_params(
-                    axis="both",
-                    which="both",
-                    bottom=False,
-                    labelbottom=True,
-                    left=True,
-                    labelleft=True,
-                    right=True,
-                    labelright=False,
-                    top=False,
-                    labeltop=False,
-                    direction="in",
-                    length=25,
-                    colors="lightgray",
-                    width=2,
-                )
+                    if percentage:
+                        ylabs = [
+                            0,
+                            round(ytick_offest, 1),
+                            round(ytick_offest * 2, 1),
+                            round(ytick_offest * 3, 1),
+                            round(ytick_offest * 4, 1),
+                        ]
+                        ylabels = [
+                            str(0),
+                            str(round(ytick_offest, 1)) + "%",
+                            str(round(ytick_offest * 2, 1)) + "%",
+                            str(round(ytick_offest * 3, 1)) + "%",
+                            str(round(ytick_offest * 4, 1)) + "%",
+                        ]
+                    else:
+                        if ytick_offest == 0:
+                            ytick_offest = 1
+                        ylabs = [
+                            0,
+                            ytick_offest,
+                            ytick_offest * 2,
+                            ytick_offest * 3,
+                            ytick_offest * 4,
+                        ]
+                        ylabels = [
+                            0,
+                            ytick_offest,
+                            ytick_offest * 2,
+                            ytick_offest * 3,
+                            ytick_offest * 4,
+                        ]
 
-                [i.set_color("black") for i in plt.gca().get_yticklabels()]
-                [i.set_color("grey") for i in plt.gca().get_xticklabels()]
+                    if sig_probs:
+                        plt.text(
+                            0.08,
+                            0.8,
+                            sample,
+                            fontsize=35,
+                            weight="bold",
+                            color="black",
+                            fontname="Arial",
+                            transform=plt.gcf().transFigure,
+                        )
+                    else:
+                        plt.text(
+                            0.08,
+                            0.8,
+                            sample
+                            + ": "
+                            + "{:,}".format(int(total_count))
+                            + " transcribed double subs",
+                            fontsize=35,
+                            weight="bold",
+                            color="black",
+                            fontname="Arial",
+                            transform=plt.gcf().transFigure,
+                        )
+
+                    if not percentage:
+                        ylabels = getylabels(ylabels)
+
+                    labs = np.arange(0.55, 36.44, 1)
+                    panel1.set_xlim([0, 36])
+                    panel1.set_ylim([0, y])
+                    panel1.set_xticks(labs)
+                    panel1.set_yticks(ylabs)
+                    panel1.set_xticklabels(
+                        xlabels,
+                        rotation="vertical",
+                        fontsize=30,
+                        color="grey",
+                        fontname="Courier New",
+                        verticalalignment="top",
+                        fontweight="bold",
+                    )
+
+                    panel1.set_yticklabels(ylabels, fontsize=25)
+                    plt.gca().yaxis.grid(True)
+                    plt.gca().grid(
+                        which="major", axis="y", color=[0.93, 0.93, 0.93], zorder=1
+                    )
+                    panel1.set_xlabel("")
+                    panel1.set_ylabel("")
+                    panel1.legend(handles=[trans, untrans], prop={"size": 30})
+
+                    if percentage:
+                        plt.ylabel(
+                            "Percentage of Double Base Substitutions",
+                            fontsize=35,
+                            fontname="Times New Roman",
+                            weight="bold",
+                        )
+                    else:
+                        plt.ylabel(
+                            "Number of Double Base Substitutions",
+                            fontsize=35,
+                            fontname="Times New Roman",
+                            weight="bold",
+                        )
 
-                panel1.set_xlim([0, 36])
-                pp.savefig(plot1)
-                plt.close()
+                    panel1.tick_params(
+                        axis="both",
+                        which="both",
+                        bottom=False,
+                        labelbottom=True,
+                        left=True,
+                        labelleft=True,
+                        right=True,
+                        labelright=False,
+                        top=False,
+                        labeltop=False,
+                        direction="in",
+                        length=25,
+                        colors="lightgray",
+                        width=2,
+                    )
+
+                    [i.set_color("black") for i in plt.gca().get_yticklabels()]
+                    [i.set_color("grey") for i in plt.gca().get_xticklabels()]
+
+                    panel1.set_xlim([0, 36])
+                    errors.stop()
+                    pp.savefig(plot1)
+                    plt.close()
+                    progress(sample, path=file_path)
+                except Exception as e:
+                    errors.failed(sample, e)
+                    plt.close()
             pp.close()
-        except:
-            print("There may be an issue with the formatting of your matrix file.")
-            pdf_path = output_path + "DBS_186_plots_" + project + ".pdf"
-            if os.path.isfile(pdf_path):
-                os.remove(pdf_path)
+        except Exception as e:
+            discard_pdf(pp, output_path + "DBS_186_plots_" + project + ".pdf")
+            if isinstance(e, PlottingError):
+                raise
+            raise MatrixFormatError(
+                "ERROR: there may be an issue with the formatting of your matrix file."
+            ) from e
+        errors.finish()
+
+    elif plot_type in HEATMAP_PLOT_TYPES["plotDBS"]:
+        return plot_heatmap_context(
+            "plotDBS",
+            matrix_path,
+            output_path,
+            project,
+            plot_type,
+            percentage,
+            custom_text_upper,
+            custom_text_middle,
+            custom_text_bottom,
+            savefig_format,
+            dpi,
+            cache,
+            append,
+            samples,
+            archive,
+            compresslevel,
+            progress_callback,
+            on_error,
+            sample_timeout,
+            cancel,
+            dtype,
+        )
 
     else:
         print(
@@ -12,6 +12,8 @@ def main_function():
         "plotDBS": "Plot Doublet Base Substitutions.",
         "plotSV": "Plot Structural Variations.",
         "plotCNV": "Plot Copy Number Variations.",
+        "batch": "Run the plotting jobs of a manifest file.",
+        "serve": "Run a local render server with warm workers.",
     }
 
     if len(sys.argv) < 2 or sys.argv[1] not in commands.keys():
@@ -22,7 +24,15 @@ def main_function():
     args = sys.argv[1:]
 
     controller = cli_controller.CliController()
-    valid_commands = {"plotSBS", "plotID", "plotDBS", "plotSV", "plotCNV"}
+    valid_commands = {
+        "plotSBS",
+        "plotID",
+        "plotDBS",
+        "plotSV",
+        "plotCNV",
+        "batch",
+        "serve",
+    }
 
     if command in valid_commands:
         controller.dispatch(args)
@@ -0,0 +1,55 @@
+import sys
+
+import pandas as pd
+
+from sigProfilerPlotting.dtypes import widened
+
+
+def is_sparse_matrix(matrix):
+    """Checks whether matrix is a scipy.sparse matrix or array.
+
+    scipy is not imported by this check: a sparse matrix can only have been
+    made once scipy.sparse is loaded.
+    """
+    scipy_sparse = sys.modules.get("scipy.sparse")
+    return scipy_sparse is not None and scipy_sparse.issparse(matrix)
+
+
+def is_sparse_frame(data):
+    """Checks whether any column of a DataFrame is sparse."""
+    return any(isinstance(dtype, pd.SparseDtype) for dtype in data.dtypes)
+
+
+def sparse_frame(matrix):
+    """Returns a scipy.sparse matrix (channels by samples) as a sparse DataFrame."""
+    return zero_filled(pd.DataFrame.sparse.from_spmatrix(matrix))
+
+
+def zero_filled(data):
+    """Returns data with the sparse columns filled with zeros.
+
+    The entries that a sparse matrix does not store are samples without
+    mutations of that channel, whatever the fill value of the columns was
+    (pandas fills the float columns of scipy matrices with Nans). The columns
+    stay sparse.
+    """
+    dtypes = {
+        column: pd.SparseDtype(dtype.subtype, 0)
+        for column, dtype in data.dtypes.items()
+        if isinstance(dtype, pd.SparseDtype) and dtype.fill_value != 0
+    }
+    if not dtypes:
+        return data
+    return data.astype(dtypes)
+
+
+def sample_counts(data, sample):
+    """Returns the counts of a sample as a dense int64 or float64 array.
+
+    The columns of sparse DataFrames are only made dense, and the columns of
+    compact matrices only widened, here, one sample at a time.
+    """
+    column = data[sample]
+    if isinstance(column.dtype, pd.SparseDtype):
+        return widened(column.sparse.to_dense().to_numpy())
+    return widened(column.values)
@@ -0,0 +1,328 @@
+import asyncio
+import itertools
+import os
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+
+from sigProfilerPlotting import sigProfilerPlotting as spp
+from sigProfilerPlotting.errors import ErrorPolicy, check_on_error
+
+# Plot types drawn one sample at a time, by plotting function. The other plot
+# types are drawn directly from a matrix file into a single pdf. plotSV and
+# plotCNV have a single plot type.
+PER_SAMPLE_PLOT_TYPES = {
+    "plotSBS": ["96", "288", "6144", "SBS6144"],
+    "plotID": ["94", "ID94", "94ID", "83", "ID96", "332", "ID332", "8628", "ID8628"],
+    "plotDBS": [
+        "78",
+        "78DBS",
+        "DBS78",
+        "1248",
+        "DBS1248",
+        "2400",
+        "DBS2400",
+        "2976",
+        "DBS2976",
+    ],
+    "plotSV": ["32"],
+    "plotCNV": ["48"],
+}
+
+# Output formats that can be streamed, and the savefig_format rendering them
+STREAMED_FORMATS = {"png": "png", "pdf": "pdf_per_sample", "pil_image": "PIL_Image"}
+
+# Arguments that hold one value per sample
+PER_SAMPLE_ARGUMENTS = ("custom_text_upper", "custom_text_middle", "custom_text_bottom")
+
+_EXECUTOR = None
+
+
+class MemoryArchive:
+    """Collects the files of a plotting run in memory (see the archive argument)."""
+
+    def __init__(self):
+        self.files = {}
+
+    def add(self, name, data):
+        self.files[name] = data
+
+
+def default_executor():
+    """Returns the process pool shared by the asynchronous plotting functions.
+
+    The pool is started on first use, with one worker per cpu. Every worker
+    loads the fonts, plot templates and reference formats once.
+    """
+    global _EXECUTOR
+    if _EXECUTOR is None:
+        from sigProfilerPlotting.server import warm_up
+
+        _EXECUTOR = ProcessPoolExecutor(initializer=warm_up)
+    return _EXECUTOR
+
+
+def read_sample_matrix(command, matrix_path, plot_type, samples=None):
+    """Reads the matrix of a per-sample plot type, in the order of its context.
+
+    Returns:
+            DataFrame with a column of counts for every selected sample.
+    """
+    if plot_type not in PER_SAMPLE_PLOT_TYPES[command]:
+        raise ValueError(
+            "ERROR: "
+            + command
+            + " cannot draw plot_type "
+            + str(plot_type)
+            + " one sample at a time. Use one of "
+            + ", ".join(PER_SAMPLE_PLOT_TYPES[command])
+            + "."
+        )
+    return spp.process_input(matrix_path, plot_type, samples)
+
+
+def sample_arguments(kwargs, index):
+    """Returns the plotting arguments of the index-th sample of a matrix."""
+    kwargs = dict(kwargs)
+    for name in PER_SAMPLE_ARGUMENTS:
+        if isinstance(kwargs.get(name), (list, tuple)):
+            values = kwargs[name]
+            kwargs[name] = [values[index]] if index < len(values) else None
+    return kwargs
+
+
+def check_streamed_format(savefig_format):
+    if savefig_format.lower() not in STREAMED_FORMATS:
+        raise ValueError("ERROR: savefig_format must be 'png', 'pdf', or 'PIL_Image'.")
+
+
+def render_sample(command, counts, project, plot_type, savefig_format, kwargs):
+    """Renders the plot of a single sample.
+
+    Args:
+            command: Name of the plotting function.
+            counts: DataFrame with the counts of the sample as its only column.
+            project, plot_type, kwargs: The arguments of the plotting function.
+            savefig_format: "png", "pdf" or "PIL_Image".
+    Returns:
+            The bytes of the png or pdf file, or the PIL image of the sample.
+    """
+    savefig_format = savefig_format.lower()
+    kwargs = dict(kwargs)
+    if command in ("plotSBS", "plotID", "plotDBS"):
+        kwargs["plot_type"] = plot_type
+    if command == "plotCNV":
+        kwargs["read_from_file"] = False
+    if savefig_format == "pil_image":
+        images = getattr(spp, command)(
+            counts, "", project, savefig_format="PIL_Image", **kwargs
+        )
+        return images[counts.columns[0]]
+
+    kwargs["archive"] = MemoryArchive()
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        getattr(spp, command)(
+            counts,
+            os.path.join(tmp_dir, "output") + os.sep,
+            project,
+            savefig_format=STREAMED_FORMATS[savefig_format],
+            **kwargs,
+        )
+    return next(iter(kwargs["archive"].files.values()))
+
+
+async def plot_async(
+    command,
+    matrix_path,
+    project,
+    plot_type,
+    savefig_format="png",
+    samples=None,
+    executor=None,
+    on_error="raise",
+    **kwargs,
+):
+    """Renders the samples of a matrix in an executor as an async iterator.
+
+    The matrix is read once, in the default executor of the event loop so that
+    the loop is not blocked. Every sample is then rendered as a separate task of
+    the executor, and (sample, bytes) pairs are yielded in the order in which
+    the samples complete. At most two samples per worker of the executor are
+    submitted ahead of the consumer, so the memory of the pending tasks does not
+    grow with the number of samples. Closing the iterator (e.g. leaving an async
+    for loop early) or cancelling the task consuming it cancels the samples that
+    have not started yet.
+
+    Args:
+            command: Name of the plotting function (plotSBS, plotID, plotDBS, plotSV
+                    or plotCNV).
+            matrix_path: The path to a text file or a pandas DataFrame.
+            project: Name of unique sample set.
+            plot_type: Context of the mutational matrix. Only the plot types that
+                    are drawn one sample at a time can be streamed (see
+                    PER_SAMPLE_PLOT_TYPES).
+            savefig_format: "png" or "pdf", the format of the yielded bytes, or
+                    "PIL_Image" to yield PIL images.
+            samples: Samples to plot (see plotSBS). All samples by default.
+            executor: A concurrent.futures executor that renders the samples. By
+                    default, a shared process pool (see default_executor). Thread
+                    pools must have a single worker, since pyplot is not thread safe.
+            on_error: "raise" raises the SampleError of the first sample that cannot
+                    be rendered, "skip" leaves it out, and "collect" leaves it out
+                    and raises a SampleErrors once all other samples are yielded.
+            kwargs: Further arguments of the plotting function, such as percentage,
+                    dpi, custom_text_upper or volume.
+    Yields:
+            Tuples of the sample name and the bytes of its png or pdf file.
+    """
+    check_on_error(on_error)
+    check_streamed_format(savefig_format)
+    data = await asyncio.get_running_loop().run_in_executor(
+        None, read_sample_matrix, command, matrix_path, plot_type, samples
+    )
+    executor = executor or default_executor()
+    errors = ErrorPolicy(on_error)
+    window = 2 * (getattr(executor, "_max_workers", None) or os.cpu_count() or 1)
+    columns = enumerate(data.columns)
+
+    # the matrix position and the name of the sample of every task in flight
+    futures = {}
+
+    def submit(count):
+        for index, sample in itertools.islice(columns, count):
+            future = asyncio.wrap_future(
+                executor.submit(
+                    render_sample,
+                    command,
+                    data[[sample]],
+                    project,
+                    plot_type,
+                    savefig_format,
+                    sample_arguments(kwargs, index),
+                )
+            )
+            futures[future] = (index, sample)
+
+    try:
+        submit(window)
+        while futures:
+            done, _ = await asyncio.wait(futures, return_when=asyncio.FIRST_COMPLETED)
+            # yield the samples completing together in the order of the matrix
+            done = [
+                (futures.pop(future)[1], future)
+                for future in sorted(done, key=futures.get)
+            ]
+            for sample, future in done:
+                submit(1)
+                try:
+                    result = future.result()
+                except Exception as e:
+                    errors.failed(sample, e)
+                    continue
+                yield sample, result
+    finally:
+        for future in futures:
+            future.cancel()
+    errors.finish()
+
+
+def iter_plot(
+    command,
+    matrix_path,
+    project,
+    plot_type,
+    savefig_format="PIL_Image",
+    samples=None,
+    on_error="raise",
+    sample_timeout=None,
+    cancel=None,
+    **kwargs,
+):
+    """Renders the samples of a matrix one at a time, as the caller asks for them.
+
+    Unlike plotting with savefig_format="PIL_Image", which returns the images of
+    all samples at once, only the sample being drawn is held in memory besides
+    the matrix counts, however many samples the matrix has. The matrix is read
+    once, when the first sample is requested.
+
+    Args:
+            command, matrix_path, project, plot_type, samples, on_error, kwargs: See
+                    plot_async.
+            savefig_format: "PIL_Image" to yield PIL images, or "png" or "pdf" to
+                    yield the bytes of the files.
+            sample_timeout, cancel: The time limit of every sample and the
+                    CancellationToken of the run (see plotSBS).
+    Yields:
+            Tuples of the sample name and its image (or file bytes), in the order
+            of the matrix.
+    """
+    check_on_error(on_error)
+    check_streamed_format(savefig_format)
+    data = read_sample_matrix(command, matrix_path, plot_type, samples)
+    errors = ErrorPolicy(on_error, None, sample_timeout, cancel)
+    for index, sample in enumerate(data.columns):
+        try:
+            errors.start(sample)
+            image = render_sample(
+                command,
+                data[[sample]],
+                project,
+                plot_type,
+                savefig_format,
+                sample_arguments(kwargs, index),
+            )
+            errors.stop()
+        except Exception as e:
+            errors.failed(sample, e)
+            continue
+        yield sample, image
+    errors.finish()
+
+
+def iter_plotSBS(matrix_path, project, plot_type, **kwargs):
+    """Renders the samples of an SBS matrix on demand (see iter_plot)."""
+    return iter_plot("plotSBS", matrix_path, project, plot_type, **kwargs)
+
+
+def iter_plotID(matrix_path, project, plot_type, **kwargs):
+    """Renders the samples of an ID matrix on demand (see iter_plot)."""
+    return iter_plot("plotID", matrix_path, project, plot_type, **kwargs)
+
+
+def iter_plotDBS(matrix_path, project, plot_type, **kwargs):
+    """Renders the samples of a DBS matrix on demand (see iter_plot)."""
+    return iter_plot("plotDBS", matrix_path, project, plot_type, **kwargs)
+
+
+def iter_plotSV(matrix_path, project, **kwargs):
+    """Renders the samples of an SV matrix on demand (see iter_plot)."""
+    return iter_plot("plotSV", matrix_path, project, "32", **kwargs)
+
+
+def iter_plotCNV(matrix_path, project, **kwargs):
+    """Renders the samples of a CNV matrix on demand (see iter_plot)."""
+    return iter_plot("plotCNV", matrix_path, project, "48", **kwargs)
+
+
+def plotSBS_async(matrix_path, project, plot_type, **kwargs):
+    """Renders the samples of an SBS matrix as an async iterator (see plot_async)."""
+    return plot_async("plotSBS", matrix_path, project, plot_type, **kwargs)
+
+
+def plotID_async(matrix_path, project, plot_type, **kwargs):
+    """Renders the samples of an ID matrix as an async iterator (see plot_async)."""
+    return plot_async("plotID", matrix_path, project, plot_type, **kwargs)
+
+
+def plotDBS_async(matrix_path, project, plot_type, **kwargs):
+    """Renders the samples of a DBS matrix as an async iterator (see plot_async)."""
+    return plot_async("plotDBS", matrix_path, project, plot_type, **kwargs)
+
+
+def plotSV_async(matrix_path, project, **kwargs):
+    """Renders the samples of an SV matrix as an async iterator (see plot_async)."""
+    return plot_async("plotSV", matrix_path, project, "32", **kwargs)
+
+
+def plotCNV_async(matrix_path, project, **kwargs):
+    """Renders the samples of a CNV matrix as an async iterator (see plot_async)."""
+    return plot_async("plotCNV", matrix_path, project, "48", **kwargs)
@@ -0,0 +1,69 @@
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import sigProfilerPlotting as sigPlt
+from sigProfilerPlotting import aggregate
+from sigProfilerPlotting.aggregate import aggregate_matrix, check_aggregate
+
+SPP_TEST_PATH = os.path.dirname(os.path.abspath(__file__))
+SBS_PATH = os.path.join(SPP_TEST_PATH, "input", "SBS", "ordered", "example.SBS96.all")
+
+
+@pytest.fixture
+def matrix(tmp_path):
+    data = pd.read_csv(SBS_PATH, sep="\t", index_col=0)
+    rng = np.random.default_rng(0)
+    for i in range(5):
+        data["S" + str(i)] = rng.poisson(5, size=len(data))
+    path = tmp_path / "cohort.SBS96.all"
+    data.to_csv(path, sep="\t")
+    groups = {sample: "odd" if i % 2 else "even" for i, sample in enumerate(data)}
+    return data, str(path), groups
+
+
+@pytest.mark.parametrize("how", ["sum", "mean", "median"])
+def test_aggregate_matrix(matrix, monkeypatch, how):
+    # several chunks, the last one shorter
+    monkeypatch.setattr(aggregate, "CHUNK_ROWS", 10)
+    data, path, groups = matrix
+    expected = data.T.groupby(pd.Series(groups), sort=False).agg(how).T
+    for matrix_path in (path, data):
+        profiles = aggregate_matrix("plotSBS", matrix_path, "96", "test", how, groups)
+        assert list(profiles.columns) == ["even", "odd"]
+        assert np.allclose(profiles, expected.loc[profiles.index])
+
+    profiles = aggregate_matrix("plotSBS", path, "96", "test", samples=["S1", "S2"])
+    assert list(profiles.columns) == ["test"]
+    assert np.allclose(profiles["test"], data[["S1", "S2"]].mean(axis=1))
+
+
+def test_aggregate_errors(matrix):
+    data, path, groups = matrix
+    assert check_aggregate(True) == "mean" and check_aggregate(False) is None
+    with pytest.raises(ValueError):
+        check_aggregate("max")
+    with pytest.raises(ValueError):
+        aggregate_matrix("plotSBS", path, "96", "test", groups={"missing": "A"})
+    with pytest.raises(ValueError):
+        aggregate_matrix("plotSBS", path, "1536", "test")
+
+
+def test_plot_aggregate(matrix):
+    data, path, groups = matrix
+    images = sigPlt.plotSBS(
+        path,
+        "",
+        "test",
+        "96",
+        savefig_format="PIL_Image",
+        aggregate="sum",
+        groups=groups,
+    )
+    assert list(images) == ["even", "odd"]
+    estimate = sigPlt.plotSBS(
+        path, "", "test", "96", dry_run=True, aggregate=True, groups=groups
+    )
+    assert estimate["pages"] == 2
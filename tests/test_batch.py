@@ -0,0 +1,99 @@
+import json
+import os
+
+import pytest
+
+from sigProfilerPlotting import batch
+from sigProfilerPlotting.cancellation import CancellationToken
+from sigProfilerPlotting.controllers import cli_controller
+
+SPP_TEST_PATH = os.path.dirname(os.path.abspath(__file__))
+SBS96_PATH = os.path.join(SPP_TEST_PATH, "input", "SBS", "ordered", "example.SBS96.all")
+ID83_PATH = os.path.join(SPP_TEST_PATH, "input", "ID", "ordered", "example.ID83.all")
+
+
+@pytest.fixture
+def manifest(tmp_path):
+    output_path = str(tmp_path / "output") + os.sep
+    jobs = [
+        {
+            "command": "plotSBS",
+            "matrix_path": SBS96_PATH,
+            "output_path": output_path,
+            "project": "test",
+            "plot_type": "96",
+            "savefig_format": "png",
+        },
+        {
+            "command": "plotID",
+            "matrix_path": ID83_PATH,
+            "output_path": output_path,
+            "project": "test",
+            "plot_type": "83",
+            "savefig_format": "png",
+        },
+        {
+            "command": "plotSBS",
+            "matrix_path": str(tmp_path / "missing.SBS96.all"),
+            "output_path": output_path,
+            "project": "test",
+            "plot_type": "96",
+        },
+    ]
+    manifest_path = tmp_path / "jobs.jsonl"
+    manifest_path.write_text("\n".join(json.dumps(job) for job in jobs) + "\n")
+    return str(manifest_path), output_path
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_run_batch(manifest, workers):
+    manifest_path, output_path = manifest
+    summary = batch.run_batch(batch.load_jobs(manifest_path), workers=workers)
+
+    assert [job["status"] for job in summary["jobs"]] == ["ok", "ok", "error"]
+    assert summary["succeeded"] == 2
+    assert summary["failed"] == 1
+    assert sorted(os.listdir(output_path)) == [
+        "ID_83_plots_Random.png",
+        "SBS_96_plots_Random.png",
+    ]
+
+
+def test_batch_cli(manifest, tmp_path):
+    manifest_path, _ = manifest
+    summary_path = str(tmp_path / "summary.json")
+    with pytest.raises(SystemExit):
+        cli_controller.CliController().dispatch(
+            ["batch", manifest_path, "--summary", summary_path]
+        )
+    with open(summary_path) as f:
+        assert json.load(f)["failed"] == 1
+
+
+def test_load_yaml_jobs(manifest, tmp_path):
+    yaml = pytest.importorskip("yaml")
+    manifest_path, _ = manifest
+    jobs = batch.load_jobs(manifest_path)
+    for name, document in (("list", jobs), ("mapping", {"jobs": jobs})):
+        yaml_path = tmp_path / (name + ".yaml")
+        yaml_path.write_text(yaml.safe_dump(document))
+        assert batch.load_jobs(str(yaml_path)) == jobs
+
+def test_load_jobs_rejects_unknown_commands(tmp_path):
+    manifest_path = tmp_path / "jobs.jsonl"
+    manifest_path.write_text(json.dumps({"command": "plotXYZ"}) + "\n")
+    with pytest.raises(ValueError, match="must be a mapping with a command"):
+        batch.load_jobs(str(manifest_path))
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_run_batch_cancelled(manifest, workers):
+    manifest_path, output_path = manifest
+    cancel = CancellationToken()
+    cancel.cancel()
+    summary = batch.run_batch(
+        batch.load_jobs(manifest_path), workers=workers, cancel=cancel
+    )
+    assert [job["status"] for job in summary["jobs"]] == ["cancelled"] * 3
+    assert summary["cancelled"] == 3
+    assert not os.path.exists(output_path) or os.listdir(output_path) == []
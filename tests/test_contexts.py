@@ -0,0 +1,55 @@
+import dataclasses
+
+import pytest
+
+from sigProfilerPlotting import sigProfilerPlotting as spp
+from sigProfilerPlotting.contexts import (
+    DBS_COLORS,
+    ID_COLORS,
+    SBS_COLORS,
+    get_context_spec,
+)
+
+
+@pytest.mark.parametrize("name,plot_type", [("SBS96", "96"), ("ID83", "83")])
+def test_context_spec_labels(name, plot_type):
+    spec = get_context_spec(name)
+    assert sorted(spec.labels) == sorted(spp.get_context_reference(plot_type))
+    assert len(spec.colors) == len(spec.positions) == len(spec.labels)
+    # built once per process
+    assert get_context_spec(name) is spec
+
+
+def test_context_spec_layout():
+    sbs96 = get_context_spec("SBS96")
+    assert [group[1:] for group in sbs96.groups] == [
+        (i, i + 16) for i in range(0, 96, 16)
+    ]
+    assert tuple(sbs96.colors[16]) == SBS_COLORS[1]
+    assert sbs96.xlabels[:2] == ("ACA", "ACC")
+
+    id83 = get_context_spec("ID83")
+    assert len(id83.groups) == 16
+    assert tuple(id83.colors_of(["2:Del:M:1"])[0]) == ID_COLORS[12]
+
+    dbs78 = get_context_spec("DBS78")
+    assert list(dbs78.labels) == sorted(dbs78.labels)
+    assert tuple(dbs78.colors[-1]) == DBS_COLORS[-1]
+
+    assert len(get_context_spec("ID415").stranded_labels) == 415
+    assert len(get_context_spec("DBS186").labels) == 36
+
+
+def test_context_spec_is_immutable():
+    spec = get_context_spec("SBS96")
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        spec.labels = ()
+    with pytest.raises(ValueError):
+        spec.colors[0] = 0
+    with pytest.raises(TypeError):
+        spec.color_index["A[C>A]A"] = 1
+
+
+def test_unknown_context_spec():
+    with pytest.raises(ValueError, match="no context spec"):
+        get_context_spec("SBS12")
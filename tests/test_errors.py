@@ -0,0 +1,233 @@
+import os
+import time
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import sigProfilerPlotting as sigPlt
+from sigProfilerPlotting import sigProfilerPlotting as spp
+from sigProfilerPlotting.errors import (
+    MatrixFormatError,
+    RunCancelled,
+    SampleError,
+    SampleErrors,
+    SampleSelectionError,
+    SampleTimeout,
+)
+
+SPP_TEST_PATH = os.path.dirname(os.path.abspath(__file__))
+SBS_PATH = os.path.join(SPP_TEST_PATH, "input", "SBS", "ordered")
+
+
+def write_matrix(tmp_path, plot_type, bad_value, context=None):
+    # sample B holds a bad value in its first row
+    data = pd.read_csv(
+        os.path.join(SBS_PATH, f"example.SBS{context or plot_type}.all"),
+        sep="\t",
+        index_col=0,
+    )
+    for i, sample in enumerate(["A", "B", "C"]):
+        data[sample] = (data["Random"] + i).astype(object)
+    data = data.drop(columns="Random")
+    data.iloc[0, 1] = bad_value
+    matrix_path = str(tmp_path / f"test.SBS{plot_type}.all")
+    data.to_csv(matrix_path, sep="\t")
+    return matrix_path
+
+
+@pytest.mark.parametrize(
+    "plot_type,bad_value,error",
+    [("96", np.nan, MatrixFormatError), ("6", "x", SampleError)],
+)
+def test_on_error_raise(tmp_path, plot_type, bad_value, error):
+    # the matrix is validated before anything is written
+    output_path = str(tmp_path / "output") + os.sep
+    with pytest.raises(error):
+        sigPlt.plotSBS(
+            write_matrix(tmp_path, plot_type, bad_value),
+            output_path,
+            "test",
+            plot_type,
+            savefig_format="png",
+        )
+    assert os.listdir(output_path) == []
+
+
+def test_failed_pdf_closed(tmp_path, monkeypatch):
+    # the partial pdf of a failed run is closed before it is removed
+    opened = []
+
+    class PdfPages(spp.PdfPages):
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            self.closed = False
+            opened.append(self)
+
+        def close(self):
+            super().close()
+            self.closed = True
+
+    monkeypatch.setattr(spp, "PdfPages", PdfPages)
+    output_path = str(tmp_path / "output") + os.sep
+    with pytest.raises(SampleError):
+        sigPlt.plotSBS(write_matrix(tmp_path, "6", "x"), output_path, "test", "6")
+    assert opened and all(pp.closed for pp in opened)
+    assert os.listdir(output_path) == []
+
+
+@pytest.mark.parametrize(
+    "plot_type,context", [("4608", "4608"), ("288_Normalized", "288")]
+)
+def test_failed_pdf_removed(tmp_path, monkeypatch, plot_type, context):
+    # the second sample fails once the page of the first one is written
+    stops = []
+
+    def stop(self):
+        stops.append(1)
+        if len(stops) == 2:
+            raise RuntimeError("drawing failed")
+
+    monkeypatch.setattr(spp.ErrorPolicy, "stop", stop)
+    output_path = str(tmp_path / "output") + os.sep
+    with pytest.raises(SampleError):
+        sigPlt.plotSBS(
+            write_matrix(tmp_path, plot_type, 1, context),
+            output_path,
+            "test",
+            plot_type,
+        )
+    # with on_error="raise", a failed run leaves no partial pdf behind
+    assert os.listdir(output_path) == []
+
+
+@pytest.mark.parametrize("plot_type", ["6", "4608"])
+def test_sample_selection_error(tmp_path, plot_type):
+    # selection errors are raised as they are, not as matrix format errors
+    with pytest.raises(SampleSelectionError, match="not in the matrix"):
+        sigPlt.plotSBS(
+            os.path.join(SBS_PATH, f"example.SBS{plot_type}.all"),
+            str(tmp_path) + os.sep,
+            "test",
+            plot_type,
+            samples=["missing"],
+        )
+
+
+def test_on_error_skip(tmp_path):
+    output_path = str(tmp_path / "output") + os.sep
+    sigPlt.plotSBS(
+        write_matrix(tmp_path, "96", np.nan),
+        output_path,
+        "test",
+        "96",
+        savefig_format="png",
+        on_error="skip",
+    )
+    assert sorted(os.listdir(output_path)) == [
+        "SBS_96_plots_A.png",
+        "SBS_96_plots_C.png",
+    ]
+
+
+def test_on_error_collect(tmp_path):
+    pypdf = pytest.importorskip("pypdf")
+    output_path = str(tmp_path / "output") + os.sep
+    with pytest.raises(SampleErrors) as e:
+        sigPlt.plotSBS(
+            write_matrix(tmp_path, "6", "x"),
+            output_path,
+            "test",
+            "6",
+            on_error="collect",
+        )
+    assert list(e.value.errors) == ["B"]
+    assert isinstance(e.value.errors["B"], SampleError)
+    # the pages of the other samples are kept
+    pdf_path = os.path.join(output_path, "SBS_6_plots_test.pdf")
+    assert len(pypdf.PdfReader(pdf_path).pages) == 2
+
+
+def test_malformed_matrix(tmp_path):
+    # an SBS96 matrix is not an SBS6 matrix, whatever the error policy
+    output_path = str(tmp_path / "output") + os.sep
+    with pytest.raises(MatrixFormatError, match="SBS6 format"):
+        sigPlt.plotSBS(
+            os.path.join(SBS_PATH, "example.SBS96.all"),
+            output_path,
+            "test",
+            "6",
+            on_error="skip",
+        )
+    assert os.listdir(output_path) == []
+
+
+def test_invalid_on_error():
+    with pytest.raises(ValueError, match="on_error must be"):
+        sigPlt.plotSBS(
+            os.path.join(SBS_PATH, "example.SBS96.all"),
+            "output",
+            "test",
+            "96",
+            on_error="ignore",
+        )
+
+
+def test_sample_timeout(tmp_path, monkeypatch):
+    render_figure = spp.render_figure
+    rendered = []
+
+    def slow_render_figure(*args):
+        # the figure of the second sample (B) takes minutes
+        rendered.append(None)
+        if len(rendered) == 2:
+            time.sleep(60)
+        return render_figure(*args)
+
+    monkeypatch.setattr(spp, "render_figure", slow_render_figure)
+    output_path = str(tmp_path / "output") + os.sep
+    start = time.time()
+    with pytest.raises(SampleErrors) as e:
+        sigPlt.plotSBS(
+            write_matrix(tmp_path, "96", 1),
+            output_path,
+            "test",
+            "96",
+            savefig_format="png",
+            sample_timeout=1,
+        )
+    assert time.time() - start < 30
+    assert list(e.value.errors) == ["B"]
+    assert isinstance(e.value.errors["B"], SampleTimeout)
+    # the run went on with the next sample
+    assert sorted(os.listdir(output_path)) == [
+        "SBS_96_plots_A.png",
+        "SBS_96_plots_C.png",
+    ]
+
+
+def test_cancel(tmp_path):
+    cancel = sigPlt.CancellationToken()
+    output_path = str(tmp_path / "output") + os.sep
+    with pytest.raises(RunCancelled) as e:
+        sigPlt.plotSBS(
+            write_matrix(tmp_path, "6", 1),
+            output_path,
+            "test",
+            "6",
+            cancel=cancel,
+            progress_callback=lambda done, total, sample, elapsed: cancel.cancel(),
+            on_error="skip",
+        )
+    assert e.value.samples == ["B", "C"]
+
+
+def test_invalid_sample_timeout():
+    with pytest.raises(ValueError, match="sample_timeout must be"):
+        sigPlt.plotSBS(
+            os.path.join(SBS_PATH, "example.SBS96.all"),
+            "output",
+            "test",
+            "96",
+            sample_timeout=0,
+        )
@@ -0,0 +1,87 @@
+import json
+import os
+
+import pytest
+
+import sigProfilerPlotting as sigPlt
+from sigProfilerPlotting.controllers import cli_controller
+from sigProfilerPlotting.estimate import CONTEXTS, load_calibration, read_matrix_shape
+
+SPP_TEST_PATH = os.path.dirname(os.path.abspath(__file__))
+SBS_PATH = os.path.join(SPP_TEST_PATH, "input", "SBS", "ordered")
+
+
+def test_read_matrix_shape():
+    samples, rows = read_matrix_shape(os.path.join(SBS_PATH, "example.SBS96.all"))
+    assert samples == ["Random"]
+    assert rows == 96
+
+
+def test_dry_run(tmp_path):
+    output_path = str(tmp_path / "output") + os.sep
+    estimate = sigPlt.plotSBS(
+        os.path.join(SBS_PATH, "example.SBS96.all"),
+        output_path,
+        "test",
+        "96",
+        savefig_format="png",
+        dpi=200,
+        dry_run=True,
+    )
+    assert not os.path.exists(output_path)
+    assert estimate["context"] == "SBS_96"
+    assert estimate["samples"] == estimate["pages"] == estimate["files"] == 1
+    assert estimate["output_bytes"] > 0
+    assert estimate["peak_memory_bytes"] > 0
+    assert estimate["wall_time_seconds"] > 0
+
+    # more pixels cost more bytes
+    low_dpi = sigPlt.plotSBS(
+        os.path.join(SBS_PATH, "example.SBS96.all"),
+        output_path,
+        "test",
+        "96",
+        savefig_format="png",
+        dry_run=True,
+    )
+    assert low_dpi["output_bytes"] < estimate["output_bytes"]
+
+
+def test_calibrated_contexts():
+    # every plot type of the plotting functions can be estimated
+    contexts = load_calibration()["contexts"]
+    for command, plot_types in CONTEXTS.items():
+        for plot_type, context in plot_types.items():
+            assert context in contexts, (command, plot_type)
+
+
+def test_dry_run_file_based_plot_type(capsys):
+    # the file based plot types always write a single pdf
+    cli_controller.CliController().dispatch(
+        [
+            "plotSBS",
+            os.path.join(SBS_PATH, "example.SBS4608.all"),
+            "output",
+            "test",
+            "4608",
+            "--savefig_format",
+            "png",
+            "--dry_run",
+        ]
+    )
+    estimate = json.loads(capsys.readouterr().out)
+    assert estimate["context"] == "SBS_4608"
+    assert estimate["savefig_format"] == "pdf"
+    assert estimate["files"] == 1
+
+
+def test_dry_run_unknown_samples():
+    with pytest.raises(ValueError, match="not in the matrix"):
+        sigPlt.plotID(
+            os.path.join(SPP_TEST_PATH, "input", "ID", "ordered", "example.ID83.all"),
+            "output",
+            "test",
+            "83",
+            samples=["missing"],
+            dry_run=True,
+        )
@@ -0,0 +1,125 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+import sigProfilerPlotting as sigPlt
+from sigProfilerPlotting import sigProfilerPlotting as spp
+from sigProfilerPlotting.contexts import get_context_spec
+from sigProfilerPlotting.heatmaps import (
+    HEATMAP_PLOT_TYPES,
+    fit_group_labels,
+    get_heatmap_layout,
+    is_dark,
+    label_width,
+)
+
+
+def random_matrix(plot_type, columns=("S1", "S2")):
+    labels = spp.get_context_reference(plot_type)
+    rng = np.random.default_rng(0)
+    return pd.DataFrame(
+        rng.poisson(1, size=(len(labels), len(columns))),
+        index=pd.Index(labels, name="MutationType"),
+        columns=list(columns),
+    )
+
+
+@pytest.mark.parametrize(
+    "name",
+    sorted({name for types in HEATMAP_PLOT_TYPES.values() for name in types.values()}),
+)
+def test_heatmap_layout(name):
+    layout = get_heatmap_layout(name)
+    assert list(layout.labels) == spp.get_context_reference(name)
+    counts = np.arange(len(layout.labels), dtype=float)
+    assert layout.collapse(counts).sum() == counts.sum()
+    assert len(layout.collapse(counts)) == len(layout.spec.labels)
+    if layout.rows:
+        grid = layout.grid(counts)
+        assert grid.shape == (len(layout.rows), len(layout.columns))
+        assert np.nansum(grid) == counts.sum()
+        assert layout.row_totals(counts).sum() == counts.sum()
+        # every channel has its own cell
+        cells = set(zip(layout.row_index, layout.column_index))
+        assert len(cells) == len(layout.labels)
+    # built once per process
+    assert get_heatmap_layout(name) is layout
+
+
+def test_sbs6144_collapse():
+    data = random_matrix("6144")
+    layout = get_heatmap_layout("SBS6144")
+    marginal = layout.collapse(data["S1"].values)
+    # SBS6144 channels are strand:5' flank[ref>alt]3' flank
+    sbs96 = (
+        data["S1"]
+        .groupby([label[2:] for label in data.index])
+        .sum()
+        .groupby(lambda label: label[1:-1])
+        .sum()
+    )
+    assert dict(zip(layout.spec.labels, marginal)) == sbs96.to_dict()
+
+
+@pytest.mark.parametrize(
+    "function,plot_type",
+    [(sigPlt.plotSBS, "6144"), (sigPlt.plotID, "ID8628"), (sigPlt.plotDBS, "2976")],
+)
+def test_plot_heatmap_context(function, plot_type):
+    data = random_matrix(plot_type)
+    images = function(
+        data.iloc[::-1],
+        "",
+        "test",
+        plot_type,
+        savefig_format="PIL_Image",
+        custom_text_upper=["upper"],
+    )
+    assert list(images) == ["S1", "S2"]
+    assert images["S1"].size == images["S2"].size
+    assert images["S1"].tobytes() != images["S2"].tobytes()
+
+
+def test_fit_group_labels():
+    # 2DelM to 4DelM are too narrow for their own labels
+    groups = get_context_spec("ID96").groups
+    labels = fit_group_labels(groups, 13.5, 12)
+    assert [label for label, _, _ in labels][-5:] == [
+        "5InsR",
+        "2-4DelM",
+        "5DelM",
+        "2-4InsM",
+        "5InsM",
+    ]
+    # no two labels overlap
+    for (left, left_center, left_size), (right, right_center, right_size) in zip(
+        labels, labels[1:]
+    ):
+        gap = (right_center - left_center) * 13.5
+        assert (
+            gap > (label_width(left) * left_size + label_width(right) * right_size) / 2
+        )
+    # the columns of 1bp and 2bp indels of ID8628 are too narrow for a label
+    layout = get_heatmap_layout("ID8628")
+    assert [
+        label for label, _, _ in fit_group_labels(layout.column_groups, 1.5, 12)
+    ] == ["3bp", "4bp", "5bp"]
+    # SBS6144 rows are labelled by strand
+    layout = get_heatmap_layout("SBS6144")
+    assert [label for label, _, _ in fit_group_labels(layout.row_groups, 5, 12)] == [
+        "T",
+        "U",
+        "B",
+        "N",
+    ]
+
+
+def test_class_band_colors():
+    # the class labels are white on the dark classes, e.g. the black C>G
+    spec = get_context_spec("SBS96")
+    dark = [
+        group
+        for group, start, _ in spec.groups
+        if is_dark(spec.palette[spec.color_index[spec.labels[start]]])
+    ]
+    assert "C>G" in dark and "T>G" not in dark
@@ -3,6 +3,7 @@ import sigProfilerPlotting as sigPlt
 import pytest
 import os
 from sigProfilerPlotting import process_input, get_context_reference
+from sigProfilerPlotting import dtypes as dtypes_module
 import pkg_resources
 
 
@@ -193,3 +194,144 @@ def test_process_input_SV(plot_type, path):
         ordered_input_data_index = ordered_input_data.index.tolist()
         expected_index = get_context_reference(plot_type)
         assert ordered_input_data_index == expected_index
+
+
+################samples#############
+@pytest.fixture
+def cohort_path(tmp_path):
+    file_path = os.path.join(SPP_SBS, "ordered", "example.SBS96.all")
+    data = pd.read_csv(file_path, sep="\t", index_col=0)
+    for i, sample in enumerate(["TCGA-01", "TCGA-02", "PCAWG-01"]):
+        data[sample] = data["Random"] + i
+    cohort_path = str(tmp_path / "cohort.SBS96.all")
+    data.drop(columns="Random").to_csv(cohort_path, sep="\t")
+    return cohort_path
+
+
+@pytest.mark.parametrize(
+    "samples, expected",
+    [
+        (None, ["TCGA-01", "TCGA-02", "PCAWG-01"]),
+        (["PCAWG-01", "TCGA-01"], ["TCGA-01", "PCAWG-01"]),
+        ("TCGA-*", ["TCGA-01", "TCGA-02"]),
+        ("re:-0[2-9]$", ["TCGA-02"]),
+    ],
+)
+def test_process_input_samples(cohort_path, samples, expected):
+    assert process_input(cohort_path, "96", samples).columns.tolist() == expected
+    data = pd.read_csv(cohort_path, sep="\t")
+    assert process_input(data, "96", samples).columns.tolist() == expected
+
+
+def test_process_input_unknown_samples(cohort_path):
+    with pytest.raises(ValueError, match="not in the matrix: TCGA-03"):
+        process_input(cohort_path, "96", ["TCGA-01", "TCGA-03"])
+    with pytest.raises(ValueError, match="no samples of the matrix match"):
+        process_input(cohort_path, "96", "MSK-*")
+
+
+################sparse#############
+def test_process_input_scipy_sparse():
+    sparse = pytest.importorskip("scipy.sparse")
+    file_path = os.path.join(SPP_ID, "ordered", "example.ID83.all")
+    data = pd.read_csv(file_path, sep="\t", index_col=0)
+    matrix = sparse.csc_matrix(data.to_numpy(dtype=float))
+
+    sparse_data = process_input(matrix, "83")
+    assert sparse_data.index.tolist() == get_context_reference("83")
+    assert all(isinstance(dtype, pd.SparseDtype) for dtype in sparse_data.dtypes)
+    # the zeros that are not stored are counts, not Nans
+    assert not sparse_data.isnull().any().any()
+    assert (sparse_data[0].sparse.to_dense().values == data.iloc[:, 0].values).all()
+
+
+def test_process_input_sparse_dataframe():
+    file_path = os.path.join(SPP_SBS, "unordered", "example.SBS96.all")
+    data = pd.read_csv(file_path, sep="\t", index_col=0)
+    sparse_data = process_input(data.astype(pd.SparseDtype(float)), "96")
+    assert sparse_data.index.tolist() == get_context_reference("96")
+    assert isinstance(sparse_data["Random"].dtype, pd.SparseDtype)
+
+    dense = sigPlt.plotSBS(data, "", "test", "96", savefig_format="PIL_Image")
+    images = sigPlt.plotSBS(
+        data.astype(pd.SparseDtype(int, 0)),
+        "",
+        "test",
+        "96",
+        savefig_format="PIL_Image",
+    )
+    assert images["Random"].tobytes() == dense["Random"].tobytes()
+
+
+def test_process_input_compact_dtype():
+    file_path = os.path.join(SPP_SBS, "ordered", "example.SBS288.all")
+    data = pd.read_csv(file_path, sep="\t", index_col=0)
+    # the counts of the example matrix are at most 100
+    assert process_input(file_path, "288")["Random"].dtype == "int8"
+    assert process_input(file_path, "288", dtype=None)["Random"].dtype == "int64"
+    assert process_input(data / 4, "288")["Random"].dtype == "float32"
+    # counts that float32 cannot hold exactly stay float64
+    assert process_input(data / 3, "288")["Random"].dtype == "float64"
+
+    for percentage in (False, True):
+        images = [
+            sigPlt.plotSBS(
+                data / 4,
+                "",
+                "test",
+                "288",
+                percentage=percentage,
+                savefig_format="PIL_Image",
+                dtype=dtype,
+            )["Random"]
+            for dtype in ("compact", None)
+        ]
+        assert images[0].tobytes() == images[1].tobytes()
+
+
+def test_read_compact_counts(tmp_path, monkeypatch):
+    data = pd.DataFrame(
+        {
+            "S1": [1, 2, 100],
+            "S2": [1, 300, 2],
+            "S3": [1, 70000, 3],
+            "S4": [0.5, 1.25, 2.0],
+            "S5": [0.1, 0.2, 0.3],
+            "S6": [1, 2, 2**40],
+        },
+        index=pd.Index(["A[C>A]A", "A[C>A]C", "A[C>A]G"], name="MutationType"),
+    )
+    # the narrowest dtype of every sample
+    dtypes = ["int8", "int16", "int32", "float32", "float64", "int64"]
+    assert list(dtypes_module.compact_counts(data).dtypes) == dtypes
+
+    # a matrix file is compacted a row at a time
+    file_path = tmp_path / "matrix.all"
+    data.to_csv(file_path, sep="\t")
+    monkeypatch.setattr(dtypes_module, "CHUNK_BYTES", 1)
+    read = dtypes_module.read_counts(file_path)
+    assert list(read.dtypes) == dtypes
+    assert (read.astype(float) == data.astype(float)).all().all()
+    assert list(dtypes_module.read_counts(file_path, dtype=None).dtypes) == list(
+        data.dtypes
+    )
+
+
+@pytest.mark.parametrize("plot_type", ["96", "288"])
+def test_plot_int8_counts(plot_type):
+    # int8 counts are drawn like the int64 counts of the input
+    file_path = os.path.join(SPP_SBS, "ordered", "example.SBS" + plot_type + ".all")
+    for percentage in (False, True):
+        images = [
+            sigPlt.plotSBS(
+                file_path,
+                "",
+                "test",
+                plot_type,
+                percentage=percentage,
+                savefig_format="PIL_Image",
+                dtype=dtype,
+            )["Random"]
+            for dtype in ("compact", None)
+        ]
+        assert images[0].tobytes() == images[1].tobytes()
@@ -0,0 +1,354 @@
+import contextlib
+import hashlib
+import io
+import json
+import os
+import sys
+import tarfile
+import zipfile
+
+import pandas as pd
+import pytest
+
+import sigProfilerPlotting as sigPlt
+from sigProfilerPlotting import archive
+from sigProfilerPlotting import sigProfilerPlotting as spp
+from sigProfilerPlotting.archive import PlotArchive, read_png_archive_index
+from sigProfilerPlotting.controllers import cli_controller
+from sigProfilerPlotting.progress import ProgressBar
+from sigProfilerPlotting.sigProfilerPlotting import read_pdf_samples
+
+SPP_TEST_PATH = os.path.dirname(os.path.abspath(__file__))
+SBS96_PATH = os.path.join(SPP_TEST_PATH, "input", "SBS", "ordered", "example.SBS96.all")
+
+
+def sbs96_samples(*samples):
+    data = pd.read_csv(SBS96_PATH, sep="\t", index_col=0)
+    return pd.DataFrame(
+        {sample: data["Random"] + i for i, sample in enumerate(samples)},
+        index=data.index,
+    )
+
+
+def test_pdf_append(tmp_path):
+    pypdf = pytest.importorskip("pypdf")
+    output_path = str(tmp_path) + os.sep
+    pdf_path = os.path.join(output_path, "SBS_96_plots_test.pdf")
+
+    sigPlt.plotSBS(sbs96_samples("A", "B"), output_path, "test", "96")
+    assert read_pdf_samples(pdf_path) == ["A", "B"]
+
+    # existing samples are skipped
+    sigPlt.plotSBS(sbs96_samples("B", "C"), output_path, "test", "96", append=True)
+    assert read_pdf_samples(pdf_path) == ["A", "B", "C"]
+    assert len(pypdf.PdfReader(pdf_path).pages) == 3
+
+    # replaced samples keep their position
+    sigPlt.plotSBS(sbs96_samples("D", "A"), output_path, "test", "96", append="replace")
+    assert read_pdf_samples(pdf_path) == ["A", "B", "C", "D"]
+    assert len(pypdf.PdfReader(pdf_path).pages) == 4
+
+
+def test_pdf_append_file_plot_type(tmp_path):
+    output_path = str(tmp_path) + os.sep
+    pdf_path = os.path.join(output_path, "SBS_6_plots_test.pdf")
+    with open(pdf_path, "wb") as f:
+        f.write(b"%PDF-1.4 existing pages")
+
+    # plot types drawn straight from the matrix file cannot be appended to
+    with pytest.raises(ValueError):
+        sigPlt.plotSBS(
+            os.path.join(SPP_TEST_PATH, "input", "SBS", "ordered", "example.SBS6.all"),
+            output_path,
+            "test",
+            "6",
+            append=True,
+        )
+    with open(pdf_path, "rb") as f:
+        assert f.read() == b"%PDF-1.4 existing pages"
+
+
+def test_pdf_per_sample(tmp_path):
+    output_path = str(tmp_path) + os.sep
+    sigPlt.plotSBS(
+        sbs96_samples("A", "B"),
+        output_path,
+        "test",
+        "96",
+        savefig_format="pdf_per_sample",
+    )
+    assert sorted(os.listdir(output_path)) == [
+        "SBS_96_plots_A.pdf",
+        "SBS_96_plots_B.pdf",
+    ]
+    for name in os.listdir(output_path):
+        with open(os.path.join(output_path, name), "rb") as f:
+            assert f.read(5) == b"%PDF-"
+
+
+@pytest.mark.parametrize("plot_type", ["96", "6"])
+def test_plot_samples(tmp_path, plot_type):
+    # SBS6 is read by the file based plotting code
+    file_name = f"example.SBS{plot_type}.all"
+    data = pd.read_csv(
+        os.path.join(SPP_TEST_PATH, "input", "SBS", "ordered", file_name),
+        sep="\t",
+        index_col=0,
+    )
+    for i, sample in enumerate(["A", "B", "C"]):
+        data[sample] = data["Random"] + i
+    matrix_path = str(tmp_path / f"test.SBS{plot_type}.all")
+    data.drop(columns="Random").to_csv(matrix_path, sep="\t")
+
+    output_path = str(tmp_path / "output") + os.sep
+    sigPlt.plotSBS(
+        matrix_path,
+        output_path,
+        "test",
+        plot_type,
+        savefig_format="pdf",
+        samples=["C", "A"],
+    )
+    pypdf = pytest.importorskip("pypdf")
+    pdf_path = os.path.join(output_path, f"SBS_{plot_type}_plots_test.pdf")
+    assert len(pypdf.PdfReader(pdf_path).pages) == 2
+
+
+def test_archive(tmp_path):
+    archive_path = str(tmp_path / "plots.zip")
+    with PlotArchive(archive_path) as archive:
+        sigPlt.plotSBS(
+            sbs96_samples("A", "B"),
+            str(tmp_path / "output") + os.sep,
+            "test",
+            "96",
+            savefig_format="png",
+            archive=archive,
+        )
+    with zipfile.ZipFile(archive_path) as f:
+        assert f.namelist() == ["SBS_96_plots_A.png", "SBS_96_plots_B.png"]
+    assert os.listdir(str(tmp_path / "output")) == []
+
+
+@pytest.mark.parametrize("plot_type", ["96", "6"])
+def test_cli_stdin_to_stdout(monkeypatch, plot_type):
+    file_name = f"example.SBS{plot_type}.all"
+    with open(os.path.join(SPP_TEST_PATH, "input", "SBS", "ordered", file_name)) as f:
+        matrix = f.read().encode()
+    stdout = io.BytesIO()
+    monkeypatch.setattr(sys, "stdin", io.TextIOWrapper(io.BytesIO(matrix)))
+    monkeypatch.setattr(sys, "stdout", io.TextIOWrapper(stdout))
+    cli_controller.CliController().dispatch(
+        ["plotSBS", "-", "-", "test", plot_type, "--savefig_format", "pdf"]
+    )
+    with tarfile.open(fileobj=io.BytesIO(stdout.getvalue())) as f:
+        assert f.getnames() == [f"SBS_{plot_type}_plots_test.pdf"]
+        assert f.extractfile(f.getmembers()[0]).read(5) == b"%PDF-"
+
+
+@pytest.mark.parametrize("savefig_format", ["png_zip", "png_tar"])
+def test_png_archive(tmp_path, savefig_format):
+    output_path = str(tmp_path) + os.sep
+    archive_path = os.path.join(output_path, "SBS_96_plots_test." + savefig_format[4:])
+    sigPlt.plotSBS(
+        sbs96_samples("A", "B"),
+        output_path,
+        "test",
+        "96",
+        savefig_format=savefig_format,
+    )
+    # a second (e.g. parallel) run adds its samples to the same archive
+    sigPlt.plotSBS(
+        sbs96_samples("B", "C"),
+        output_path,
+        "test",
+        "96",
+        savefig_format=savefig_format,
+        append=True,
+    )
+    assert sorted(os.listdir(output_path)) == sorted(
+        [os.path.basename(archive_path), os.path.basename(archive_path) + ".index.tsv"]
+    )
+
+    index = read_png_archive_index(archive_path)
+    assert list(index) == ["A", "B", "C"]
+    with open(archive_path, "rb") as f:
+        for member, offset, size in index.values():
+            f.seek(offset)
+            assert f.read(size).startswith(b"\x89PNG")
+    if savefig_format == "png_zip":
+        with zipfile.ZipFile(archive_path) as f:
+            assert len(f.namelist()) == 3
+    else:
+        with tarfile.open(archive_path) as f:
+            assert len(f.getnames()) == 3
+
+    # replaced samples are written again, in place of their zip member
+    def read_png(sample):
+        member, offset, size = read_png_archive_index(archive_path)[sample]
+        with open(archive_path, "rb") as f:
+            f.seek(offset)
+            return f.read(size)
+
+    pngs = {sample: read_png(sample) for sample in index}
+    sigPlt.plotSBS(
+        sbs96_samples("C", "A"),
+        output_path,
+        "test",
+        "96",
+        savefig_format=savefig_format,
+        append="replace",
+    )
+    assert list(read_png_archive_index(archive_path)) == ["A", "B", "C"]
+    assert read_png("A") != pngs["A"] and read_png("C") != pngs["C"]
+    assert read_png("B") == pngs["B"]
+    if savefig_format == "png_zip":
+        with zipfile.ZipFile(archive_path) as f:
+            assert f.namelist() == [
+                "SBS_96_plots_A.png",
+                "SBS_96_plots_B.png",
+                "SBS_96_plots_C.png",
+            ]
+
+
+def test_png_archive_renders_unlocked(tmp_path, monkeypatch):
+    # the pngs are rendered before the archive index is locked
+    locked = []
+    rendered_locked = []
+    locked_index = archive.locked_index
+    render_sample_figure = spp.render_sample_figure
+
+    @contextlib.contextmanager
+    def tracked_index(*args):
+        with locked_index(*args) as index:
+            locked.append(True)
+            yield index
+            locked.pop()
+
+    def tracked_render(*args):
+        rendered_locked.append(bool(locked))
+        return render_sample_figure(*args)
+
+    monkeypatch.setattr(archive, "locked_index", tracked_index)
+    monkeypatch.setattr(spp, "render_sample_figure", tracked_render)
+    sigPlt.plotSBS(
+        sbs96_samples("A", "B"),
+        str(tmp_path) + os.sep,
+        "test",
+        "96",
+        savefig_format="png_zip",
+    )
+    assert rendered_locked == [False, False]
+    assert list(read_png_archive_index(str(tmp_path / "SBS_96_plots_test.zip"))) == [
+        "A",
+        "B",
+    ]
+
+
+@pytest.mark.parametrize("plot_type", ["96", "6"])
+def test_progress_callback(tmp_path, plot_type):
+    file_name = f"example.SBS{plot_type}.all"
+    data = pd.read_csv(
+        os.path.join(SPP_TEST_PATH, "input", "SBS", "ordered", file_name),
+        sep="\t",
+        index_col=0,
+    )
+    for i, sample in enumerate(["A", "B", "C"]):
+        data[sample] = data["Random"] + i
+    matrix_path = str(tmp_path / f"test.SBS{plot_type}.all")
+    data.drop(columns="Random").to_csv(matrix_path, sep="\t")
+
+    calls = []
+    sigPlt.plotSBS(
+        matrix_path,
+        str(tmp_path / "output") + os.sep,
+        "test",
+        plot_type,
+        progress_callback=lambda *args: calls.append(args),
+    )
+    assert [call[:3] for call in calls] == [(1, 3, "A"), (2, 3, "B"), (3, 3, "C")]
+    assert all(elapsed >= 0 for *_, elapsed in calls)
+
+
+def test_progress_bar():
+    stream = io.StringIO()
+    bar = ProgressBar(stream)
+    bar(1, 2, "S" * 100, 2.0)
+    bar(2, 2, "B", 4.0)
+    lines = stream.getvalue().rstrip("\n").split("\r")[1:]
+    # every line is truncated or padded to 80 columns
+    assert [len(line) for line in lines] == [80, 80]
+    assert lines[1].rstrip().endswith("2/2 0.50 samples/s ETA 00:00:00 B")
+
+
+@pytest.mark.parametrize(
+    "plot_type,savefig_format", [("96", "png"), ("96", "pdf"), ("6", "pdf")]
+)
+def test_run_report(tmp_path, plot_type, savefig_format):
+    file_name = f"example.SBS{plot_type}.all"
+    data = pd.read_csv(
+        os.path.join(SPP_TEST_PATH, "input", "SBS", "ordered", file_name),
+        sep="\t",
+        index_col=0,
+    )
+    for i, sample in enumerate(["A", "B"]):
+        data[sample] = data["Random"] + i
+    matrix_path = str(tmp_path / f"test.SBS{plot_type}.all")
+    data.drop(columns="Random").to_csv(matrix_path, sep="\t")
+
+    report_path = str(tmp_path / "report.json")
+    sigPlt.plotSBS(
+        matrix_path,
+        str(tmp_path / "output") + os.sep,
+        "test",
+        plot_type,
+        savefig_format=savefig_format,
+        report=report_path,
+    )
+    with open(report_path) as f:
+        report = json.load(f)
+    with open(matrix_path, "rb") as f:
+        assert report["input"]["sha256"] == hashlib.sha256(f.read()).hexdigest()
+    assert report["status"] == "ok"
+    assert report["version"] == sigPlt.__version__
+    assert report["counts"] == {"rendered": 2, "skipped": 0, "error": 0}
+    assert list(report["samples"]) == ["A", "B"]
+    for entry in report["samples"].values():
+        assert entry["status"] == "rendered"
+        assert os.path.isfile(entry["path"])
+        # the pages of a pdf share a single output file
+        assert ("bytes" in entry) == (savefig_format == "png")
+    assert sum(output["bytes"] for output in report["outputs"]) == sum(
+        os.path.getsize(os.path.join(tmp_path, "output", name))
+        for name in os.listdir(tmp_path / "output")
+    )
+
+
+def test_run_report_error(tmp_path):
+    report_path = str(tmp_path / "report.json")
+    with pytest.raises(ValueError):
+        sigPlt.plotSBS(
+            sbs96_samples("A"),
+            str(tmp_path) + os.sep,
+            "test",
+            "96",
+            savefig_format="svg",
+            report=report_path,
+        )
+    with open(report_path) as f:
+        report = json.load(f)
+    assert report["status"] == "error"
+    assert report["errors"]
+    assert report["samples"]["A"]["status"] == "error"
+
+    # lazy runs return before drawing any sample
+    with pytest.raises(ValueError):
+        sigPlt.plotSBS(
+            sbs96_samples("A"),
+            str(tmp_path) + os.sep,
+            "test",
+            "96",
+            lazy=True,
+            report=str(tmp_path / "lazy.json"),
+        )
+    assert not os.path.exists(tmp_path / "lazy.json")
@@ -0,0 +1,62 @@
+import os
+
+import sigProfilerPlotting as sigPlt
+from sigProfilerPlotting.render_cache import RenderCache
+
+SPP_TEST_PATH = os.path.dirname(os.path.abspath(__file__))
+SBS96_PATH = os.path.join(SPP_TEST_PATH, "input", "SBS", "ordered", "example.SBS96.all")
+
+
+def test_render_cache_reuses_cached_plots(tmp_path):
+    cache_dir = str(tmp_path / "cache")
+    output_path = str(tmp_path / "output") + os.sep
+
+    sigPlt.plotSBS(
+        SBS96_PATH, output_path, "test", "96", savefig_format="png", cache=cache_dir
+    )
+    png_path = os.path.join(output_path, "SBS_96_plots_Random.png")
+    with open(png_path, "rb") as f:
+        rendered = f.read()
+
+    cache = RenderCache(cache_dir)
+    entries = [
+        os.path.join(root, name)
+        for root, _, names in os.walk(cache_dir)
+        for name in names
+    ]
+    assert len(entries) == 1
+    with open(entries[0], "rb") as f:
+        assert f.read() == rendered
+
+    # a second run copies the cached bytes instead of drawing the sample again
+    with open(entries[0], "wb") as f:
+        f.write(b"cached")
+    sigPlt.plotSBS(
+        SBS96_PATH, output_path, "test", "96", savefig_format="png", cache=cache
+    )
+    with open(png_path, "rb") as f:
+        assert f.read() == b"cached"
+
+    # changing a plotting option produces a different cache entry
+    images = sigPlt.plotSBS(
+        SBS96_PATH,
+        output_path,
+        "test",
+        "96",
+        percentage=True,
+        savefig_format="PIL_Image",
+        cache=cache,
+    )
+    assert list(images) == ["Random"]
+    assert sum(len(names) for _, _, names in os.walk(cache_dir)) == 2
+
+
+def test_render_cache_evicts_least_recently_used(tmp_path):
+    cache = RenderCache(str(tmp_path), max_size=10)
+    for i, key in enumerate(["aa1.png", "bb2.png", "cc3.png"]):
+        cache.put(key, b"12345")
+        os.utime(cache._path(key), (i, i))
+    cache.evict()
+    assert cache.get("aa1.png") is None
+    assert cache.get("bb2.png") == b"12345"
+    assert cache.get("cc3.png") == b"12345"
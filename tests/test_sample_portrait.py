@@ -0,0 +1,179 @@
+import io
+import os
+
+import matplotlib.pyplot as plt
+import numpy as np
+import pandas as pd
+import pypdf
+import pytest
+
+from sigProfilerPlotting import sample_portrait as sP
+from sigProfilerPlotting import sigProfilerPlotting as spp
+
+
+@pytest.fixture
+def matrices_path(tmp_path):
+    rng = np.random.default_rng(0)
+    for context, directory in sP.PORTRAIT_MATRICES.items():
+        labels = pd.read_csv(
+            os.path.join(spp.SPP_REFERENCE, context + ".txt"), header=None
+        )[0]
+        data = pd.DataFrame(
+            rng.poisson(5, size=(len(labels), 2)),
+            index=pd.Index(labels, name="MutationType"),
+            columns=["S1", "S2"],
+        )
+        os.makedirs(tmp_path / "output" / directory, exist_ok=True)
+        data.to_csv(
+            tmp_path / "output" / directory / ("test." + context + ".all"), sep="\t"
+        )
+    return tmp_path
+
+
+def test_portrait_counts(matrices_path):
+    matrices = sP.read_portrait_matrices(str(matrices_path / "output"), "test")
+    panels = sP.portrait_panels(matrices)
+    # the counts of every sample are indexed from the arrays of all samples
+    for sample in ("S1", "S2"):
+        counts = sP.portrait_counts(panels, sample)
+        for context in ("SBS96", "DBS78"):
+            total = sum(sum(group.values()) for group in counts[context].values())
+            assert total == matrices[context][sample].sum()
+        assert (
+            counts["SBS96"]["C>A"]["A[C>A]A"]
+            == matrices["SBS96"].loc["A[C>A]A", sample]
+        )
+    sbs1536 = matrices["SBS1536"]["S2"]
+    mutations_1536, mutations_5, mutations_3, max_all, max_5, max_3 = (
+        sP.portrait_counts(panels, "S2")["SBS1536"]
+    )
+    assert max_all == sbs1536.max()
+    # the 5' context sums the channels by mutation, 5' flank and trinucleotide
+    expected_5 = sbs1536.groupby(
+        [label[3:6] + label[0] + label[1] + label[-2] for label in sbs1536.index]
+    ).sum()
+    expected_3 = sbs1536.groupby(
+        [label[3:6] + label[-1] + label[1] + label[-2] for label in sbs1536.index]
+    ).sum()
+    for flanks, expected in ((mutations_5, expected_5), (mutations_3, expected_3)):
+        assert {
+            mut + flank + tri: count
+            for mut in flanks
+            for flank in flanks[mut]
+            for tri, count in flanks[mut][flank].items()
+        } == expected.to_dict()
+    assert max_5 == expected_5.max() and max_3 == expected_3.max()
+
+    # the SBS96, SBS6, SBS24 and ID83 matrices are collapsed when missing
+    collapsed = sP.derive_portrait_matrices(
+        dict(matrices, SBS96=None, SBS6=None, SBS24=None, ID83=None)
+    )
+    sources = {
+        "SBS96": "SBS1536",
+        "SBS6": "SBS1536",
+        "SBS24": "SBS384",
+        "ID83": "ID415",
+    }
+    for context, source in sources.items():
+        assert list(collapsed[context].index) == list(matrices[context].index)
+        assert (collapsed[context].sum() == matrices[source].sum()).all()
+
+
+def test_sample_portrait(matrices_path):
+    texts = []
+    for workers in (1, 2):
+        output_path = str(matrices_path / str(workers)) + "/"
+        os.makedirs(output_path)
+        sP.samplePortrait(str(matrices_path), output_path, "test", workers=workers)
+        pages = pypdf.PdfReader(output_path + "sample_portrait_test.pdf").pages
+        texts.append([page.extract_text() for page in pages])
+    # the workers' pages are written in the order of the samples
+    assert len(texts[0]) == 2 and texts[0][0] != texts[0][1]
+    assert texts[1] == texts[0]
+
+
+def test_write_portrait_pages(tmp_path):
+    # the same characters on every page, and so the same font subset
+    texts = ["page 012", "page 120", "page 201"]
+    pages = []
+    for i, text in enumerate(texts):
+        figure = plt.figure()
+        figure.text(0.5, 0.5, text)
+        data = io.BytesIO()
+        figure.savefig(data, format="pdf")
+        plt.close(figure)
+        pages.append((f"S{i}", data.getvalue()))
+    file_path = str(tmp_path / "pages.pdf")
+    sP.write_portrait_pages(file_path, iter(pages))
+    reader = pypdf.PdfReader(file_path, strict=True)
+    assert [page.extract_text() for page in reader.pages] == texts
+    # the font the pages have in common is written once
+    fonts = {
+        font.idnum
+        for page in reader.pages
+        for font in page["/Resources"]["/Font"].values()
+    }
+    assert len(fonts) == 1
+    assert not os.path.exists(file_path + ".tmp")
+
+
+def test_portrait_in_memory(matrices_path):
+    matrices = sP.read_portrait_matrices(str(matrices_path / "output"), "test")
+    # DataFrames in any order of their channels, and arrays in reference order
+    given = {
+        "SBS96": matrices["SBS96"].iloc[::-1],
+        "ID83": matrices["ID83"].reset_index(),
+        "DBS78": matrices["DBS78"].to_numpy(),
+        "SBS1536": str(matrices_path / "output" / "SBS" / "test.SBS1536.all"),
+    }
+    loaded = sP.load_portrait_matrices(given)
+    for context in given:
+        assert np.array_equal(loaded[context], matrices[context])
+    assert list(loaded["DBS78"].columns) == ["0", "1"]
+    assert loaded["SBS6"] is None
+    with pytest.raises(ValueError):
+        sP.load_portrait_matrices({"SBS6144": matrices["SBS96"]})
+    with pytest.raises(ValueError):
+        sP.load_portrait_matrices({"SBS96": matrices["SBS96"].iloc[1:]})
+
+    # only some of the contexts, without the SBS1536 heatmaps
+    sP.samplePortrait(
+        {"SBS96": matrices["SBS96"][["S1"]], "DBS78": matrices["DBS78"]},
+        str(matrices_path) + "/",
+        "memory",
+    )
+    pages = pypdf.PdfReader(matrices_path / "sample_portrait_memory.pdf").pages
+    assert len(pages) == 1
+
+
+def test_sample_portrait_formats(matrices_path):
+    matrices = {
+        context: os.path.join(
+            matrices_path, "output", directory, "test." + context + ".all"
+        )
+        for context, directory in sP.PORTRAIT_MATRICES.items()
+    }
+    images = sP.samplePortrait(matrices, "", "test", savefig_format="PIL_Image", dpi=30)
+    assert list(images) == ["S1", "S2"]
+    # rasterized at the dpi of the run
+    assert images["S1"].size == (396, 250)
+
+    pooled = sP.samplePortrait(
+        matrices, "", "test", workers=2, savefig_format="PIL_Image", dpi=30
+    )
+    assert list(pooled) == ["S1", "S2"]
+    assert [image.tobytes() for image in pooled.values()] == [
+        image.tobytes() for image in images.values()
+    ]
+
+    output_path = matrices_path / "png"
+    os.makedirs(output_path)
+    sP.samplePortrait(
+        matrices, str(output_path) + "/", "test", workers=2, savefig_format="png"
+    )
+    assert sorted(os.listdir(output_path)) == [
+        "sample_portrait_plots_S1.png",
+        "sample_portrait_plots_S2.png",
+    ]
+    with pytest.raises(ValueError):
+        sP.samplePortrait(matrices, "", "test", savefig_format="svg")
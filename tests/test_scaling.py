@@ -0,0 +1,118 @@
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import sigProfilerPlotting as sigPlt
+from sigProfilerPlotting import sigProfilerPlotting as spp
+from sigProfilerPlotting.scaling import (
+    cohort_statistics,
+    normalize_counts,
+    sample_scaling,
+)
+
+SPP_TEST_PATH = os.path.dirname(os.path.abspath(__file__))
+SBS_PATH = os.path.join(SPP_TEST_PATH, "input", "SBS", "ordered")
+ID_PATH = os.path.join(SPP_TEST_PATH, "input", "ID", "ordered")
+
+
+def read_matrix(path):
+    data = pd.read_csv(path, sep="\t", index_col=0)
+    data["Double"] = data.iloc[:, 0] * 2
+    data["Empty"] = 0
+    return data
+
+
+@pytest.mark.parametrize("percentage", [False, True])
+def test_cohort_statistics_fit(percentage):
+    data = read_matrix(os.path.join(SBS_PATH, "example.SBS96.all"))
+    stats = cohort_statistics(data, "SBS96", percentage)
+    assert list(stats.index) == list(data.columns)
+    for sample in data.columns:
+        muts = data[sample].values
+        total = np.sum(muts)
+        assert stats.loc[sample, "total"] == total
+        if percentage:
+            ymax = np.max(muts / total * 100) if total > 0 else 0
+        else:
+            ymax = np.max(muts)
+        offset = float(ymax / 1.025 / 3)
+        assert stats.loc[sample, "ylim"] == ymax / 1.025
+        assert stats.loc[sample, "yticks"][1] == (
+            round(offset, 1) if percentage else offset
+        )
+    assert stats.loc["Double", "total"] == 2 * stats.iloc[0]["total"]
+
+
+@pytest.mark.parametrize("percentage", [False, True])
+def test_cohort_statistics_rounded(percentage):
+    data = read_matrix(os.path.join(ID_PATH, "example.ID83.all"))
+    stats = cohort_statistics(data, "ID83", percentage)
+    for sample in data.columns:
+        muts = data[sample].values
+        total = np.sum(muts)
+        if percentage:
+            ymax = np.max(muts / total * 100) if total > 0 else 0
+        else:
+            ymax = np.max(muts)
+        y = int(ymax * 1.25)
+        if y <= 4:
+            y += 4
+        while y % 4 != 0:
+            y += 1
+        assert stats.loc[sample, "ylim"] == y
+        assert stats.loc[sample, "yticks"] == tuple(y // 4 * i for i in range(5))
+    assert stats.loc["Empty", "ylabels"][1] == ("1%" if percentage else "1")
+
+
+def test_cohort_statistics_strands():
+    data = pd.read_csv(
+        os.path.join(SBS_PATH, "example.SBS288.all"), sep="\t", index_col=0
+    )
+    data, tsb_mats = spp.reindex_sbs288(data)
+    stats = cohort_statistics(data, "SBS288", strands=tsb_mats)
+    for sample in data.columns:
+        y2max = max(tsb_mats[strand][sample]["All"] for strand in "TUN")
+        y = int(y2max * 1.1)
+        if y <= 4:
+            y += 4
+        while y % 4 != 0:
+            y += 1
+        assert stats.loc[sample, "strand_ticks"][1] == int(y / 4)
+        assert stats.loc[sample, "T"] == tsb_mats["T"][sample]["All"]
+
+
+def test_normalize_counts():
+    data = read_matrix(os.path.join(SBS_PATH, "example.SBS96.all"))
+    normalized = normalize_counts(data)
+    assert np.allclose(normalized.iloc[:, 0], normalized["Double"])
+    assert np.allclose(normalized.iloc[:, 0].sum(), 100)
+    assert normalized["Empty"].isnull().all()
+
+
+def test_scaling_override():
+    data = read_matrix(os.path.join(SBS_PATH, "example.SBS96.all"))
+    stats = cohort_statistics(data, "SBS96", ymax=100)
+    assert (stats["ylim"] == 100 / 1.025).all()
+
+    scaling = pd.DataFrame(
+        {"ylim": [50], "yticks": [(0, 25, 50)], "ylabels": [("0", "25", "50")]},
+        index=["Double"],
+    )
+    row = sample_scaling(stats, "Double", scaling)
+    assert row["ylim"] == 50 and row["yticks"] == (0, 25, 50)
+    assert sample_scaling(stats, "Empty", scaling)["ylim"] == 100 / 1.025
+
+    images = [
+        sigPlt.plotSBS(
+            data[["Double"]],
+            "",
+            "test",
+            "96",
+            savefig_format="PIL_Image",
+            scaling=sample_scaling_df,
+        )["Double"]
+        for sample_scaling_df in (None, scaling)
+    ]
+    assert images[0].tobytes() != images[1].tobytes()
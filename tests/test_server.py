@@ -0,0 +1,92 @@
+import base64
+import json
+import os
+import threading
+import urllib.error
+import urllib.request
+from http.server import ThreadingHTTPServer
+
+import pytest
+
+from sigProfilerPlotting import server
+
+SPP_TEST_PATH = os.path.dirname(os.path.abspath(__file__))
+SBS96_PATH = os.path.join(SPP_TEST_PATH, "input", "SBS", "ordered", "example.SBS96.all")
+
+
+@pytest.fixture(scope="module")
+def server_url():
+    plot_server = server.PlotServer(workers=1, max_queue=1)
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), server.PlotRequestHandler)
+    httpd.plot_server = plot_server
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield "http://127.0.0.1:" + str(httpd.server_address[1])
+    httpd.shutdown()
+    httpd.server_close()
+    plot_server.shutdown()
+
+
+def post(url, request):
+    data = json.dumps(request).encode("utf-8")
+    request = urllib.request.Request(
+        url + "/plot", data=data, headers={"Content-Type": "application/json"}
+    )
+    with urllib.request.urlopen(request) as response:
+        return json.load(response)
+
+
+def test_plot_request(server_url):
+    with open(SBS96_PATH) as f:
+        matrix = f.read()
+    response = post(
+        server_url, {"command": "plotSBS", "matrix": matrix, "plot_type": "96"}
+    )
+    assert list(response["files"]) == ["SBS_96_plots_Random.png"]
+    png = base64.b64decode(response["files"]["SBS_96_plots_Random.png"])
+    assert png.startswith(b"\x89PNG")
+
+    with urllib.request.urlopen(server_url + "/health") as response:
+        health = json.load(response)
+    assert health["requests"] >= 1
+    assert health["errors"] == 0
+    assert "p95" in health["latency"]
+
+
+def test_bad_request(server_url):
+    with pytest.raises(urllib.error.HTTPError) as e:
+        post(server_url, {"command": "plotXYZ", "matrix": ""})
+    assert e.value.code == 400
+
+
+def test_unsafe_request(server_url, tmp_path):
+    with open(SBS96_PATH) as f:
+        matrix = f.read()
+    for key in ("report", "cache", "volume", "archive", "output_path"):
+        with pytest.raises(urllib.error.HTTPError) as e:
+            post(
+                server_url,
+                {
+                    "command": "plotSBS",
+                    "matrix": matrix,
+                    "plot_type": "96",
+                    key: str(tmp_path / key),
+                },
+            )
+        assert e.value.code == 400
+    assert os.listdir(tmp_path) == []
+
+    # forms of web pages cannot post json
+    data = json.dumps({"command": "plotSBS", "matrix": matrix}).encode("utf-8")
+    with pytest.raises(urllib.error.HTTPError) as e:
+        urllib.request.urlopen(server_url + "/plot", data=data)
+    assert e.value.code == 415
+
+
+def test_socket_path_not_a_socket(tmp_path):
+    # a mistyped socket path never removes a regular file
+    path = tmp_path / "matrix.all"
+    path.write_text("counts")
+    with pytest.raises(ValueError, match="not a unix socket"):
+        server.serve(socket_path=str(path))
+    assert path.read_text() == "counts"
@@ -0,0 +1,139 @@
+import asyncio
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pandas as pd
+import pytest
+
+import sigProfilerPlotting as sigPlt
+from sigProfilerPlotting import streaming
+
+SPP_TEST_PATH = os.path.dirname(os.path.abspath(__file__))
+SBS96_PATH = os.path.join(SPP_TEST_PATH, "input", "SBS", "ordered", "example.SBS96.all")
+
+
+def sbs96_samples(*samples):
+    data = pd.read_csv(SBS96_PATH, sep="\t", index_col=0)
+    return pd.DataFrame(
+        {sample: data["Random"] + i for i, sample in enumerate(samples)},
+        index=data.index,
+    )
+
+
+async def collect(iterator):
+    return [item async for item in iterator]
+
+
+def test_plot_async(tmp_path):
+    matrix = sbs96_samples("A", "B", "C")
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        results = asyncio.run(
+            collect(sigPlt.plotSBS_async(matrix, "test", "96", executor=executor))
+        )
+    assert [sample for sample, _ in results] == ["A", "B", "C"]
+
+    # the same pngs as plotSBS
+    output_path = str(tmp_path) + os.sep
+    sigPlt.plotSBS(matrix, output_path, "test", "96", savefig_format="png")
+    for sample, data in results:
+        with open(os.path.join(output_path, f"SBS_96_plots_{sample}.png"), "rb") as f:
+            assert f.read() == data
+
+
+def test_plot_async_cancel(monkeypatch):
+    rendered = []
+
+    def render_sample(command, counts, *args):
+        rendered.append(counts.columns[0])
+        time.sleep(0.1)
+        return b""
+
+    monkeypatch.setattr(streaming, "render_sample", render_sample)
+
+    async def first(executor):
+        iterator = sigPlt.plotSBS_async(
+            sbs96_samples(*"ABCDEFGH"), "test", "96", executor=executor
+        )
+        async for sample, _ in iterator:
+            await iterator.aclose()
+            return sample
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        assert asyncio.run(first(executor)) == "A"
+    # the samples that had not started are not rendered
+    assert len(rendered) < 8
+
+
+def test_plot_async_bounded(monkeypatch):
+    class CountingExecutor(ThreadPoolExecutor):
+        submitted = 0
+
+        def submit(self, *args, **kwargs):
+            CountingExecutor.submitted += 1
+            return super().submit(*args, **kwargs)
+
+    monkeypatch.setattr(streaming, "render_sample", lambda *args: b"")
+    threads = []
+    read_sample_matrix = streaming.read_sample_matrix
+
+    def read_in_thread(*args):
+        threads.append(threading.current_thread())
+        return read_sample_matrix(*args)
+
+    monkeypatch.setattr(streaming, "read_sample_matrix", read_in_thread)
+
+    async def consume(executor):
+        yielded = 0
+        async for _ in sigPlt.plotSBS_async(
+            sbs96_samples(*"ABCDEFGH"), "test", "96", executor=executor
+        ):
+            yielded += 1
+            # two samples per worker are rendered ahead of the consumer
+            assert CountingExecutor.submitted <= yielded + 2
+        return yielded
+
+    with CountingExecutor(max_workers=1) as executor:
+        assert asyncio.run(consume(executor)) == 8
+    # the matrix is not read in the thread of the event loop
+    assert threads and threads[0] is not threading.main_thread()
+
+
+def test_plot_async_file_based_plot_type():
+    with pytest.raises(ValueError, match="one sample at a time"):
+        asyncio.run(
+            collect(
+                sigPlt.plotSBS_async(
+                    os.path.join(SPP_TEST_PATH, "input", "SBS", "ordered", "x"),
+                    "test",
+                    "6",
+                )
+            )
+        )
+
+
+def test_iter_plot(monkeypatch):
+    matrix = sbs96_samples("A", "B", "C")
+    images = sigPlt.plotSBS(matrix, "", "test", "96", savefig_format="PIL_Image")
+    iterator = sigPlt.plotSBS(
+        matrix, "", "test", "96", savefig_format="PIL_Image", lazy=True
+    )
+    for sample, image in iterator:
+        assert image.size == images[sample].size
+        assert image.tobytes() == images[sample].tobytes()
+
+    # samples are drawn when they are requested
+    rendered = []
+    render_sample = streaming.render_sample
+    monkeypatch.setattr(
+        streaming,
+        "render_sample",
+        lambda command, counts, *args: rendered.append(counts.columns[0])
+        or render_sample(command, counts, *args),
+    )
+    iterator = sigPlt.iter_plotSBS(matrix, "test", "96", savefig_format="png")
+    assert rendered == []
+    sample, data = next(iterator)
+    assert sample == "A" and data[:4] == b"\x89PNG"
+    assert rendered == ["A"]
@@ -0,0 +1,173 @@
+import argparse
+import json
+import os
+import platform
+import re
+import subprocess
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+from sigProfilerPlotting.estimate import CALIBRATION_PATH
+from sigProfilerPlotting.version import short_version
+
+REFERENCE_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    "sigProfilerPlotting",
+    "reference_formats",
+)
+
+# (context, plotting function, plot_type, reference format, output formats)
+BENCHMARKS = [
+    ("SBS_96", "plotSBS", "96", "SBS96", ["pdf", "pdf_per_sample", "png"]),
+    ("SBS_288", "plotSBS", "288", "SBS288", ["pdf", "pdf_per_sample", "png"]),
+    ("SBS_384", "plotSBS", "384", "SBS384", ["pdf"]),
+    ("SBS_384_extended", "plotSBS", "384_extended", "SBS384", ["pdf"]),
+    ("SBS_6", "plotSBS", "6", "SBS6", ["pdf"]),
+    ("SBS_24", "plotSBS", "24", "SBS24", ["pdf"]),
+    ("SBS_1536", "plotSBS", "1536", "SBS1536", ["pdf"]),
+    ("SBS_4608", "plotSBS", "4608", "SBS4608", ["pdf"]),
+    ("SBS_288_Normalized", "plotSBS", "288_Normalized", "SBS288", ["pdf"]),
+    ("ID_83", "plotID", "83", "ID83", ["pdf", "pdf_per_sample", "png"]),
+    ("ID_simple", "plotID", "28", "ID28", ["pdf"]),
+    ("ID_TSB", "plotID", "415", "ID415", ["pdf"]),
+    ("DBS_78", "plotDBS", "78", "DBS78", ["pdf", "pdf_per_sample", "png"]),
+    ("DBS_186", "plotDBS", "186", "DBS186", ["pdf"]),
+    ("SBS_6144", "plotSBS", "6144", "SBS6144", ["pdf", "pdf_per_sample", "png"]),
+    ("ID_96", "plotID", "ID96", "ID96", ["pdf", "pdf_per_sample", "png"]),
+    ("ID_332", "plotID", "332", "ID332", ["pdf", "pdf_per_sample", "png"]),
+    ("ID_8628", "plotID", "8628", "ID8628", ["pdf", "pdf_per_sample", "png"]),
+    ("DBS_1248", "plotDBS", "1248", "DBS1248", ["pdf", "pdf_per_sample", "png"]),
+    ("DBS_2400", "plotDBS", "2400", "DBS2400", ["pdf", "pdf_per_sample", "png"]),
+    ("DBS_2976", "plotDBS", "2976", "DBS2976", ["pdf", "pdf_per_sample", "png"]),
+    ("SV_32", "plotSV", None, "SV32", ["pdf", "pdf_per_sample", "png"]),
+    ("CNV_48", "plotCNV", None, "CNV48", ["pdf", "pdf_per_sample", "png"]),
+]
+
+# Runs one plotting call and prints its peak resident memory in bytes
+RUN_SCRIPT = """
+import resource, sys
+import sigProfilerPlotting as sigPlt
+command, matrix_path, output_path, plot_type, savefig_format, dpi = sys.argv[1:]
+kwargs = {"savefig_format": savefig_format, "dpi": int(dpi)}
+if plot_type != "None":
+    kwargs["plot_type"] = plot_type
+getattr(sigPlt, command)(matrix_path, output_path, "benchmark", **kwargs)
+print(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024)
+"""
+
+
+def write_matrix(file_path, reference, n_samples, seed=0):
+    with open(os.path.join(REFERENCE_DIR, reference + ".txt")) as f:
+        rows = [line.strip() for line in f if line.strip()]
+    counts = np.random.default_rng(seed).integers(0, 200, (len(rows), n_samples))
+    with open(file_path, "w") as f:
+        f.write(
+            "\t".join(["MutationType"] + [f"S{i}" for i in range(n_samples)]) + "\n"
+        )
+        for row, row_counts in zip(rows, counts):
+            f.write("\t".join([row] + [str(count) for count in row_counts]) + "\n")
+
+
+def measure(command, reference, plot_type, savefig_format, n_samples, dpi):
+    """Returns the wall time, output bytes and peak memory of a plotting run."""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        matrix_path = os.path.join(tmp_dir, "benchmark.all")
+        output_path = os.path.join(tmp_dir, "output") + os.sep
+        write_matrix(matrix_path, reference, n_samples)
+        start = time.time()
+        result = subprocess.run(
+            [sys.executable, "-c", RUN_SCRIPT, command, matrix_path, output_path]
+            + [str(plot_type), savefig_format, str(dpi)],
+            check=True,
+            capture_output=True,
+            text=True,
+        )
+        seconds = time.time() - start
+        output_bytes = sum(
+            os.path.getsize(os.path.join(output_path, name))
+            for name in os.listdir(output_path)
+        )
+    memory = int(result.stdout.strip().splitlines()[-1])
+    return {"seconds": seconds, "bytes": output_bytes, "memory": memory}
+
+
+def fit(small, large, n_small, n_large, large_hires=None, hires_scale=None):
+    """Fits [fixed, per sample, per sample and pixel scale] to the measurements."""
+    model = {}
+    for name in ("seconds", "bytes", "memory"):
+        per_sample = max((large[name] - small[name]) / (n_large - n_small), 0)
+        fixed = max(small[name] - n_small * per_sample, 0)
+        per_pixel = 0
+        if large_hires is not None:
+            hires_per_sample = max((large_hires[name] - fixed) / n_large, 0)
+            per_pixel = max((hires_per_sample - per_sample) / (hires_scale - 1), 0)
+            per_sample = max(per_sample - per_pixel, 0)
+        digits = 3 if name == "seconds" else None
+        model[name] = [round(value, digits) for value in (fixed, per_sample, per_pixel)]
+    return model
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Benchmark every plot context and write the calibration data "
+        + "of the run estimates (plotting with dry_run=True)."
+    )
+    parser.add_argument("--output", default=CALIBRATION_PATH)
+    parser.add_argument("--small", type=int, default=2)
+    parser.add_argument("--large", type=int, default=10)
+    parser.add_argument("--dpi", type=int, default=100)
+    parser.add_argument(
+        "--contexts",
+        nargs="+",
+        help="Benchmark only these contexts, and keep the calibration data of the "
+        + "others from the existing output file.",
+    )
+    args = parser.parse_args()
+
+    hires_dpi = 2 * args.dpi
+    hires_scale = (hires_dpi / args.dpi) ** 2
+    calibration = {
+        "version": short_version,
+        "dpi": args.dpi,
+        "machine": platform.platform(),
+        "contexts": {},
+    }
+    if args.contexts:
+        with open(args.output) as f:
+            calibration["contexts"] = json.load(f)["contexts"]
+    for context, command, plot_type, reference, formats in BENCHMARKS:
+        if args.contexts and context not in args.contexts:
+            continue
+        calibration["contexts"][context] = {}
+        for savefig_format in formats:
+            runs = [
+                measure(command, reference, plot_type, savefig_format, n, args.dpi)
+                for n in (args.small, args.large)
+            ]
+            if savefig_format == "png":
+                runs.append(
+                    measure(
+                        command, reference, plot_type, "png", args.large, hires_dpi
+                    )
+                )
+                model = fit(*runs[:2], args.small, args.large, runs[2], hires_scale)
+            else:
+                model = fit(*runs, args.small, args.large)
+            calibration["contexts"][context][savefig_format] = model
+            print(context, savefig_format, model, flush=True)
+
+    # one line per model
+    text = re.sub(
+        r"\[\s+([^\[\]]*?)\s+\]",
+        lambda match: "[" + " ".join(match.group(1).split()) + "]",
+        json.dumps(calibration, indent=1),
+    )
+    with open(args.output, "w") as f:
+        f.write(text + "\n")
+
+
+if __name__ == "__main__":
+    main()